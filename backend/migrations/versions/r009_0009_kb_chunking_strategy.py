@@ -0,0 +1,43 @@
+"""Add chunking_strategy column to knowledge_bases.
+
+Revision ID: r009_0009
+Revises: r009_0008
+Create Date: 2026-10-16
+
+Per-KB selection of the structure-aware chunker (fixed, sentence, paragraph,
+markdown, token_budget). Nullable; null means "use SHU_DEFAULT_CHUNKING_STRATEGY",
+which defaults to the original fixed-width chunker, so existing KBs keep their
+current chunk layout. No data backfill is required.
+
+Policy: idempotent per docs/policies/DB_MIGRATION_POLICY.md §Policy.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "r009_0009"
+down_revision = "r009_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the chunking_strategy column (idempotent)."""
+    op.execute(
+        """
+        ALTER TABLE knowledge_bases
+            ADD COLUMN IF NOT EXISTS chunking_strategy VARCHAR(20);
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the chunking_strategy column (idempotent)."""
+    op.execute(
+        """
+        ALTER TABLE knowledge_bases
+            DROP COLUMN IF EXISTS chunking_strategy;
+        """
+    )
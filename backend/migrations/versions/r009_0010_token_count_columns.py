@@ -0,0 +1,48 @@
+"""Add token_count columns to messages and documents.
+
+Revision ID: r009_0010
+Revises: r009_0009
+Create Date: 2026-10-17
+
+Token counts are computed once with the shared tokenizer when a message or
+document is written, so context-window and full-document budgets read the
+stored value instead of re-tokenizing stored text. document_chunks already
+has a token_count column. Nullable; rows written before this revision are
+counted on demand, so no data backfill is required.
+
+Policy: idempotent per docs/policies/DB_MIGRATION_POLICY.md §Policy.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "r009_0010"
+down_revision = "r009_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the token_count columns (idempotent)."""
+    op.execute(
+        """
+        ALTER TABLE messages
+            ADD COLUMN IF NOT EXISTS token_count INTEGER;
+        ALTER TABLE documents
+            ADD COLUMN IF NOT EXISTS token_count INTEGER;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the token_count columns (idempotent)."""
+    op.execute(
+        """
+        ALTER TABLE messages
+            DROP COLUMN IF EXISTS token_count;
+        ALTER TABLE documents
+            DROP COLUMN IF EXISTS token_count;
+        """
+    )
@@ -6,6 +6,7 @@ messages, and LLM interactions.
 
 import traceback
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from pathlib import Path as PathlibPath
 from typing import Any, Literal
@@ -24,6 +25,7 @@ from ..core.config import ConfigurationManager, get_config_manager_dependency, g
 from ..core.exceptions import ShuException
 from ..core.logging import get_logger
 from ..core.response import ShuResponse, create_error_response, create_success_response
+from ..core.stream_replay import StreamReplayLog, get_stream_replay_log, start_replay_pump, tail_replay
 from ..core.streaming import create_sse_stream_generator
 from ..core.tenant import tenant_context_for_tenant_id
 from ..models.attachment import Attachment
@@ -59,6 +61,56 @@ def _ensure_in_flight_streams(app: Any) -> dict[str, StreamLifecycle]:
     return in_flight
 
 
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Connection": "keep-alive"}
+
+
+async def _replay_log_and_meta(stream_id: str) -> tuple[StreamReplayLog | None, dict[str, Any] | None]:
+    """Return the replay log and ``stream_id``'s metadata, or ``(None, None)`` if unavailable."""
+    try:
+        replay_log = await get_stream_replay_log()
+        if not replay_log.enabled:
+            return None, None
+        return replay_log, await replay_log.get_meta(stream_id)
+    except Exception as e:
+        logger.warning(f"Stream replay log unavailable for {stream_id}: {e}")
+        return None, None
+
+
+async def _sse_response(lifecycle: StreamLifecycle, frames: AsyncIterator[str]) -> StreamingResponse:
+    """Build the SSE response for a chat stream, routed through the replay log.
+
+    With replay enabled the frames are pumped into the log by a task
+    detached from this connection and the response tails the log, so a
+    client that drops can resume from any node via
+    ``GET /chat/streams/{stream_id}/events`` with ``Last-Event-ID``, and a
+    terminate request on another node reaches this one through the log's
+    stop flag. If the log cannot be opened the frames stream straight to the
+    connection, as they did before replay existed.
+    """
+    body: AsyncIterator[str] = frames
+    try:
+        replay_log = await get_stream_replay_log()
+        if replay_log.enabled:
+            await replay_log.open(
+                lifecycle.stream_id,
+                {"user_id": lifecycle.user_id, "conversation_id": lifecycle.conversation_id},
+            )
+            start_replay_pump(
+                replay_log,
+                lifecycle.stream_id,
+                frames,
+                on_stop=lambda: lifecycle.signal("user_terminated"),
+            )
+            body = tail_replay(
+                replay_log,
+                lifecycle.stream_id,
+                on_disconnect=lambda: lifecycle.signal("client_disconnected"),
+            )
+    except Exception as e:
+        logger.warning(f"Stream replay unavailable for {lifecycle.stream_id}, streaming directly: {e}")
+    return StreamingResponse(body, media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
 # Pydantic models for API requests/responses
 class ConversationCreate(BaseModel):
     """Schema for creating conversations with model configuration."""
@@ -984,11 +1036,7 @@ async def send_message(
                 if lifecycle.supervise_task is None:
                     in_flight_streams.pop(lifecycle.stream_id, None)
 
-        return StreamingResponse(
-            stream_generator(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Connection": "keep-alive"},
-        )
+        return await _sse_response(lifecycle, stream_generator())
 
     except ShuException as e:
         logger.error(f"Error sending message: {e}")
@@ -1022,7 +1070,10 @@ async def terminate_stream(
     Returns:
         202: signal accepted; the in-flight stream's variants will short-circuit and persist partial content.
         403: the requester does not own this stream.
-        410 Gone (`code="STREAM_NOT_ACTIVE"`): the stream is not in the registry — either the stream_id is unknown, or the stream has already finalized.
+        410 Gone (`code="STREAM_NOT_ACTIVE"`): the stream is neither in this node's registry nor open in the replay log — either the stream_id is unknown, or the stream has already finalized.
+
+    A stream produced on another node is stopped through its replay log's
+    stop flag, which that node polls; the 202 is returned once the flag is set.
 
     """
     # Use the lazy-init helper for symmetry with send_message / regenerate_message.
@@ -1032,6 +1083,25 @@ async def terminate_stream(
     in_flight_streams = _ensure_in_flight_streams(http_request.app)
     lifecycle = in_flight_streams.get(stream_id)
     if lifecycle is None:
+        # Not produced on this node: a stream still open in the replay log is
+        # running elsewhere, so raise its stop flag for that node's pump.
+        replay_log, meta = await _replay_log_and_meta(stream_id)
+        if replay_log is not None and meta is not None and not meta.get("complete"):
+            if meta.get("user_id") != str(current_user.id):
+                return create_error_response(
+                    code="FORBIDDEN",
+                    message="You do not own this stream",
+                    status_code=403,
+                )
+            await replay_log.request_stop(stream_id)
+            logger.info(
+                "Stream terminate forwarded to producing node",
+                extra={"stream_id": stream_id, "user_id": meta.get("user_id")},
+            )
+            return create_success_response(
+                data={"stream_id": stream_id, "reason": "user_terminated"},
+                status_code=202,
+            )
         # 410 over 404: the stream may have existed but completed already.
         # The client UI typically races a Stop click against the final
         # `final_message` event; "the stream is no longer active" is a more
@@ -1075,6 +1145,57 @@ async def terminate_stream(
     )
 
 
+@router.get(
+    "/streams/{stream_id}/events",
+    response_class=StreamingResponse,
+    summary="Resume a chat stream",
+    description=(
+        "Reattach to a chat stream after a dropped connection, from any node. "
+        "Replays every SSE event after `Last-Event-ID` (header, or the `last_event_id` "
+        "query parameter) from the stream's replay log, then follows the live stream "
+        "until `data: [DONE]`."
+    ),
+)
+async def resume_stream(
+    http_request: Request,
+    stream_id: str = Path(..., description="The stream_id from the stream_start SSE event"),
+    last_event_id: int | None = Query(None, ge=0, description="Resume after this event id (overrides the header)"),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream the events of ``stream_id`` after the client's last seen event id.
+
+    Returns:
+        200: SSE stream of the remaining events, each carrying its `id:`.
+        403: the requester does not own this stream.
+        410 Gone (`code="STREAM_NOT_ACTIVE"`): the stream is unknown or its replay log has expired.
+
+    """
+    if last_event_id is None:
+        try:
+            last_event_id = max(0, int(http_request.headers.get("last-event-id", "0")))
+        except ValueError:
+            last_event_id = 0
+
+    replay_log, meta = await _replay_log_and_meta(stream_id)
+    if replay_log is None or meta is None:
+        return create_error_response(
+            code="STREAM_NOT_ACTIVE",
+            message="Stream is not resumable (unknown or expired)",
+            status_code=410,
+        )
+    if meta.get("user_id") != str(current_user.id):
+        return create_error_response(
+            code="FORBIDDEN",
+            message="You do not own this stream",
+            status_code=403,
+        )
+    return StreamingResponse(
+        tail_replay(replay_log, stream_id, last_event_id),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
 class ModelSwitchRequest(BaseModel):
     """Schema for switching conversation models."""
 
@@ -1296,11 +1417,7 @@ async def regenerate_message(
                 if lifecycle.supervise_task is None:
                     in_flight_streams.pop(lifecycle.stream_id, None)
 
-        return StreamingResponse(
-            stream_generator(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Connection": "keep-alive"},
-        )
+        return await _sse_response(lifecycle, stream_generator())
 
     except ShuException as e:
         logger.error(f"Error regenerating message: {e}")
@@ -103,6 +103,7 @@ async def list_knowledge_bases(
                     "embedding_model": kb.embedding_model,
                     "chunk_size": kb.chunk_size,
                     "chunk_overlap": kb.chunk_overlap,
+                    "chunking_strategy": kb.chunking_strategy,
                     "status": kb.status or "active",
                     "embedding_status": kb.embedding_status or "current",
                     "re_embedding_progress": kb.re_embedding_progress,
@@ -235,6 +236,7 @@ async def get_knowledge_base(
             "embedding_model": result.embedding_model,
             "chunk_size": result.chunk_size,
             "chunk_overlap": result.chunk_overlap,
+            "chunking_strategy": result.chunking_strategy,
             "status": result.status,
             "document_count": stats["document_count"],
             "total_chunks": stats["total_chunks"],
@@ -268,6 +270,7 @@ def _serialize_kb_create_response(result) -> dict:
         "embedding_model": result.embedding_model,
         "chunk_size": result.chunk_size,
         "chunk_overlap": result.chunk_overlap,
+        "chunking_strategy": result.chunking_strategy,
         "status": result.status,
         "document_count": result.document_count or 0,
         "total_chunks": result.total_chunks or 0,
@@ -387,6 +390,7 @@ async def update_knowledge_base(
             "embedding_model": result.embedding_model,
             "chunk_size": result.chunk_size,
             "chunk_overlap": result.chunk_overlap,
+            "chunking_strategy": result.chunking_strategy,
             "status": result.status,
             "document_count": stats["document_count"],
             "total_chunks": stats["total_chunks"],
@@ -11,12 +11,15 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from shu.core.logging import get_logger
 
 from ..auth.models import User
+from ..auth.password_hashing import get_password_hasher
 from ..auth.rbac import get_current_user, require_admin
+from ..core.database import get_round_trip_stats
 from ..core.embedding_service import (
     cleanup_embedding_services,
     clear_embedding_service_cache,
     get_embedding_service_stats,
 )
+from ..core.http_client import get_provider_client_pool
 from ..core.memory_tools import (
     asyncio_task_inventory,
     current_rss_bytes,
@@ -24,7 +27,9 @@ from ..core.memory_tools import (
     top_object_types,
     trim_memory,
 )
+from ..core.query_embedding_cache import query_embedding_cache_stats
 from ..core.response import ShuResponse
+from ..services.usage_recording import get_usage_recorder
 
 logger = get_logger(__name__)
 
@@ -52,8 +57,14 @@ async def get_resource_stats(current_user: User = Depends(require_admin)):
             logger.warning(f"Could not get cache statistics: {e}")
             cache_stats = {"error": "Cache statistics unavailable"}
 
+        usage_write_buffer = get_usage_recorder().write_buffer
         stats = {
             "embedding_services": embedding_stats,
+            "llm_http_pools": get_provider_client_pool().stats(),
+            "password_hashing": get_password_hasher().stats(),
+            "database_round_trips": get_round_trip_stats(),
+            "query_embedding_cache": query_embedding_cache_stats(),
+            "usage_write_buffer": usage_write_buffer.stats() if usage_write_buffer is not None else None,
             "caches": cache_stats,
             "resource_management": {"cleanup_available": True, "clear_cache_available": True},
         }
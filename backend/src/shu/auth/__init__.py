@@ -1,5 +1,6 @@
 """Authentication module for Shu"""
 
+from . import principal_cache  # registers the session listeners that invalidate cached principals
 from .google_sso import GoogleSSOAuth
 from .jwt_manager import JWTManager
 from .models import User, UserRole
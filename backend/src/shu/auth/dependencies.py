@@ -36,6 +36,7 @@ from ..core.tenant import (
 )
 from .jwt_manager import JWTManager
 from .models import User
+from .principal_cache import get_principal_cache
 
 CredentialSource = Literal["jwt", "api_key"]
 
@@ -149,19 +150,35 @@ async def resolve_tenant(
 
 
 async def fetch_user(
+    request: Request,
     cred: CredentialResolution = Depends(decode_credential),
     _tid: str = Depends(resolve_tenant),  # ordering: tenant_context set before this runs
     db: AsyncSession = Depends(get_db),
 ) -> User:
-    """Return the authenticated user row, read under RLS-active tenant context."""
-    if cred.user_id is not None:
-        stmt = select(User).where(User.id == cred.user_id).options(selectinload(User.preferences))
+    """Return the authenticated user row, read under RLS-active tenant context.
+
+    When ``AuthenticationMiddleware`` (or an earlier request) left a cached
+    principal snapshot for this credential, it is merged into the request
+    session without a SELECT; otherwise the row is read and cached.
+    """
+    principal_cache = get_principal_cache()
+    snapshot = getattr(request.state, "principal", None)
+    if snapshot is None or not _snapshot_matches(snapshot, cred):
+        snapshot = await principal_cache.get(_tid, user_id=cred.user_id, email=cred.email)
+
+    if snapshot is not None:
+        user = await principal_cache.attach(snapshot, db)
     else:
-        # API key path — look up by configured email under the now-active tenant.
-        assert cred.email is not None, "CredentialResolution.email required on api_key path"
-        stmt = select(User).where(User.email == cred.email).options(selectinload(User.preferences))
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+        if cred.user_id is not None:
+            stmt = select(User).where(User.id == cred.user_id).options(selectinload(User.preferences))
+        else:
+            # API key path — look up by configured email under the now-active tenant.
+            assert cred.email is not None, "CredentialResolution.email required on api_key path"
+            stmt = select(User).where(User.email == cred.email).options(selectinload(User.preferences))
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user is not None:
+            await principal_cache.set(_tid, user, email=cred.email)
     if user is None or not getattr(user, "is_active", True):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -171,6 +188,14 @@ async def fetch_user(
     return user
 
 
+def _snapshot_matches(snapshot: dict, cred: CredentialResolution) -> bool:
+    """Whether a principal snapshot belongs to the credential being resolved."""
+    cached = snapshot.get("user", {})
+    if cred.user_id is not None:
+        return cached.get("id") == cred.user_id
+    return str(cached.get("email", "")).lower() == (cred.email or "").lower()
+
+
 # Alias kept so existing `from ..auth.rbac import get_current_user` imports
 # continue to work via re-export from rbac.py.
 get_current_user = fetch_user
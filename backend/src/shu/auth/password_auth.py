@@ -8,15 +8,15 @@ import secrets
 import string
 from datetime import UTC, datetime
 
-import bcrypt
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shu.core.logging import get_logger
 
 from ..core.config import get_settings_instance
 from .models import User, UserRole
+from .password_hashing import get_password_hasher
 
 logger = get_logger(__name__)
 
@@ -27,20 +27,10 @@ class PasswordAuthService:
     def __init__(self) -> None:
         self.settings = get_settings_instance()
         self.special_chars: str = self.settings.password_special_chars
-        # Dummy hash for constant-time authentication (prevents timing attacks)
-        # This is a bcrypt hash of "dummy_password_for_timing_attack_prevention"
-        self._dummy_hash = "$2b$12$rQx8vQx8vQx8vQx8vQx8vOx8vQx8vQx8vQx8vQx8vQx8vQx8vQx8vQ"
 
-    def _hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt."""
-        # Generate salt and hash password
-        salt = bcrypt.gensalt()
-        password_hash = bcrypt.hashpw(password.encode("utf-8"), salt)
-        return password_hash.decode("utf-8")
-
-    def _verify_password(self, password: str, password_hash: str) -> bool:
-        """Verify a password against its hash."""
-        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password on the bounded hashing pool."""
+        return await get_password_hasher().hash(password)
 
     def validate_password(self, password: str) -> list[str]:
         """Validate a password against the configured password policy.
@@ -201,7 +191,7 @@ class PasswordAuthService:
             email_verified = False
 
         # Hash password
-        password_hash = self._hash_password(password)
+        password_hash = await self.hash_password_async(password)
 
         # Create user. last_login reflects actual logins, not creation —
         # leave NULL for verification-pending accounts (they cannot log in
@@ -242,12 +232,10 @@ class PasswordAuthService:
         result = await db.execute(stmt)
         user = result.scalar_one_or_none()
 
-        # Always perform password verification to prevent timing attacks
-        # Use dummy hash if user doesn't exist or doesn't have password hash
-        password_hash = user.password_hash if user and user.password_hash else self._dummy_hash
-
-        # Always perform bcrypt verification (constant time regardless of user existence)
-        password_valid = self._verify_password(password, password_hash)
+        # Always perform bcrypt verification (constant time regardless of user
+        # existence): with no stored hash the pool checks a full-cost dummy.
+        hasher = get_password_hasher()
+        password_valid = await hasher.verify(password, user.password_hash if user else None)
 
         # Now check all conditions and provide consistent error message
         if not user:
@@ -296,6 +284,9 @@ class PasswordAuthService:
                 detail="Please verify your email address. Check your inbox or use the resend link.",
             )
 
+        if hasher.needs_rehash(user.password_hash):
+            await self._upgrade_password_hash(user, password, db)
+
         # Update last login
         user.last_login = datetime.now(UTC)
         await db.commit()
@@ -304,6 +295,24 @@ class PasswordAuthService:
         logger.info(f"Password authentication successful for user: {email}")
         return user
 
+    async def _upgrade_password_hash(self, user: User, password: str, db: AsyncSession) -> None:
+        """Re-hash a just-verified password at the configured bcrypt cost.
+
+        Written with a Core UPDATE so the ``password_hash`` validator does not
+        bump ``password_changed_at`` — a cost upgrade is not a password change
+        and must not sign the user out elsewhere. The WHERE on the old hash
+        leaves a concurrent real password change untouched.
+        """
+        old_hash = user.password_hash
+        new_hash = await get_password_hasher().upgrade(password)
+        await db.execute(
+            update(User)
+            .where(User.id == user.id, User.password_hash == old_hash)
+            .values(password_hash=new_hash)
+            .execution_options(synchronize_session=False)
+        )
+        logger.info("Upgraded password hash cost for user %s", user.id)
+
     async def _get_password_user(self, user_id: str, db: AsyncSession) -> User:
         """Look up a user by ID and verify they use password authentication.
 
@@ -355,7 +364,7 @@ class PasswordAuthService:
         if validation_errors:
             raise ValueError("; ".join(validation_errors))
 
-        user.password_hash = self._hash_password(new_password)
+        user.password_hash = await self.hash_password_async(new_password)
         user.must_change_password = must_change
         await db.commit()
 
@@ -363,12 +372,14 @@ class PasswordAuthService:
         """Change a user's password."""
         user = await self._get_password_user(user_id, db)
 
+        hasher = get_password_hasher()
+
         # Verify current password
-        if not user.password_hash or not self._verify_password(old_password, user.password_hash):
+        if not user.password_hash or not await hasher.verify(old_password, user.password_hash):
             raise ValueError("Current password is incorrect")
 
         # Ensure new password differs from current password
-        if self._verify_password(new_password, user.password_hash):
+        if await hasher.verify(new_password, user.password_hash):
             raise ValueError("New password must be different from current password")
 
         await self._apply_new_password(user, new_password, db, must_change=False)
@@ -0,0 +1,170 @@
+"""Bounded worker pool for bcrypt password hashing and verification.
+
+bcrypt is deliberately slow (hundreds of milliseconds per call at the default
+cost) and releases the GIL while it works, so every hash/verify runs on a small
+dedicated thread pool instead of on the event loop or the shared default
+executor. Admission is bounded: at most ``workers + max_queue`` operations may
+be pending at once. Past that, callers get ``PasswordHashingBusyError`` (503
+with ``Retry-After``) immediately rather than piling up behind a login storm.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from ..core.config import get_settings_instance
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_RETRY_AFTER_SECONDS = 1
+
+
+class PasswordHashingBusyError(HTTPException):
+    """Raised when the hashing pool is saturated; surfaces as 503 + Retry-After."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is temporarily busy. Please try again shortly.",
+            headers={"Retry-After": str(_RETRY_AFTER_SECONDS)},
+        )
+
+
+def hash_password(password: str, rounds: int) -> str:
+    """Hash ``password`` with bcrypt at the given cost factor (blocking)."""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Check ``password`` against a bcrypt hash in constant time (blocking)."""
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def hash_cost(password_hash: str) -> int | None:
+    """Return the cost factor encoded in a ``$2b$NN$...`` hash, or None if unparseable."""
+    parts = password_hash.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded thread pool with queue-depth accounting."""
+
+    def __init__(self, *, rounds: int, workers: int, max_queue: int) -> None:
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = workers + max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._dummy_hash: str | None = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._upgraded = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            logger.warning(
+                "Password hashing pool saturated; rejecting request",
+                extra={"pending": self._pending, "max_pending": self.max_pending, "rejected": self._rejected},
+            )
+            raise PasswordHashingBusyError()
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+
+    async def hash(self, password: str) -> str:
+        """Hash ``password`` at the configured cost factor."""
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, password_hash: str | None) -> bool:
+        """Verify ``password``; with no hash, burn a full-cost check and return False.
+
+        The fallback compares against a throwaway hash minted at the configured
+        cost, so unknown accounts take as long as real ones at that cost.
+        """
+        if password_hash:
+            return await self._run(verify_password, password, password_hash)
+        await self._run(self._verify_dummy, password)
+        return False
+
+    def _verify_dummy(self, password: str) -> None:
+        # Runs on a worker thread; minting the dummy hash there keeps it off the loop.
+        if self._dummy_hash is None:
+            self._dummy_hash = hash_password(secrets.token_urlsafe(24), self.rounds)
+        verify_password(password, self._dummy_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Report whether ``password_hash`` was produced at a lower cost than configured."""
+        cost = hash_cost(password_hash)
+        return cost is not None and cost < self.rounds
+
+    async def upgrade(self, password: str) -> str:
+        """Re-hash a just-verified password at the configured cost."""
+        new_hash = await self.hash(password)
+        self._upgraded += 1
+        return new_hash
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool metrics: in-flight and queued work, capacity and counters."""
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": min(self._pending, self.workers),
+            "queued": max(self._pending - self.workers, 0),
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "upgraded": self._upgraded,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (tests, process teardown)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide password hasher, built from settings on first use."""
+    global _hasher  # noqa: PLW0603
+    if _hasher is None:
+        settings = get_settings_instance()
+        _hasher = PasswordHasher(
+            rounds=settings.password_bcrypt_rounds,
+            workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
+    return _hasher
+
+
+def reset_password_hasher() -> None:
+    """Drop the process-wide hasher so the next call rebuilds it (tests)."""
+    global _hasher  # noqa: PLW0603
+    if _hasher is not None:
+        _hasher.shutdown()
+    _hasher = None
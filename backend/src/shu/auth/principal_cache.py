@@ -0,0 +1,333 @@
+"""Authenticated-principal cache for the request auth path.
+
+Every authenticated request used to read its ``users`` row twice — once in
+``AuthenticationMiddleware`` and again in the ``fetch_user`` dependency —
+each time on a fresh pooled connection. This module keeps a short-lived
+snapshot of that row (plus the eagerly loaded preferences) in the shared
+CacheBackend so a warm request needs no DB round-trip to authenticate.
+
+Key namespaces:
+- Principal snapshot: auth:principal:{tenant_id}:user:{user_id}
+- API-key email pointer: auth:principal:{tenant_id}:email:{email}
+
+Secret columns (password and verification-token hashes) are never written
+to the cache. Snapshots are dropped after any commit that changes the
+user's auth-relevant columns or preferences (see the session listeners at
+the bottom of this module; Core ``update(User)`` statements bypass them and
+must call ``invalidate_on_commit``), and otherwise expire after
+``SHU_AUTH_PRINCIPAL_CACHE_TTL`` seconds. With the in-memory backend the
+invalidation is per-process, so other workers converge within the TTL; a
+Redis backend shares it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..core.cache_backend import CacheBackend, get_cache_backend
+from ..core.config import get_settings_instance
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columns that must never leave the database, even into a private cache.
+_SECRET_COLUMNS = frozenset({"password_hash", "email_verification_token_hash"})
+
+# User columns whose changes do not affect authentication or the request's
+# view of the user; writing them (e.g. the daily last_login bump) must not
+# flush the snapshot.
+_VOLATILE_COLUMNS = frozenset({"last_login", "updated_at"})
+
+_INVALIDATIONS_KEY = "shu_principal_invalidations"
+
+# Strong references to in-flight invalidation tasks so they are not
+# garbage-collected before they run.
+_pending_invalidations: set[asyncio.Task] = set()
+
+
+def _dump_row(obj: Any) -> dict[str, Any]:
+    """Return the loaded, non-secret column values of an ORM instance."""
+    state = inspect(obj)
+    values: dict[str, Any] = {}
+    for attr in state.mapper.column_attrs:
+        key = attr.key
+        if key in _SECRET_COLUMNS or key not in state.dict:
+            continue
+        value = state.dict[key]
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        values[key] = value
+    return values
+
+
+def _load_row(model: type, values: dict[str, Any]) -> Any:
+    """Build a detached instance of ``model`` from a ``_dump_row`` snapshot."""
+    mapper = inspect(model)
+    obj = mapper.class_manager.new_instance()
+    for key, raw in values.items():
+        value = raw
+        if raw is not None and key in mapper.columns:
+            python_type = _python_type(mapper.columns[key])
+            if python_type is datetime:
+                value = datetime.fromisoformat(raw)
+            elif python_type is date:
+                value = date.fromisoformat(raw)
+        set_committed_value(obj, key, value)
+    return obj
+
+
+def _python_type(column: Any) -> type | None:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+class PrincipalCache:
+    """Cache of authenticated user rows keyed by tenant and user id.
+
+    Snapshots are plain JSON: ``{"user": {...}, "preferences": {...} | None}``.
+    ``materialize`` turns one back into a detached ``User`` for read-only use;
+    ``attach`` merges it into a session without issuing a SELECT.
+    """
+
+    def __init__(self, cache_backend: CacheBackend | None = None, ttl_seconds: int | None = None) -> None:
+        """Initialize PrincipalCache with optional CacheBackend dependency injection.
+
+        Args:
+            cache_backend: Optional CacheBackend instance for dependency injection.
+                If None, will use get_cache_backend() to obtain the backend.
+            ttl_seconds: Snapshot lifetime. Defaults to
+                ``SHU_AUTH_PRINCIPAL_CACHE_TTL``; 0 disables the cache.
+
+        """
+        self._cache_backend = cache_backend
+        self._ttl_override = ttl_seconds
+
+    @property
+    def _ttl(self) -> int:
+        if self._ttl_override is not None:
+            return self._ttl_override
+        return get_settings_instance().auth_principal_cache_ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether snapshots are read and written at all."""
+        return self._ttl > 0
+
+    async def _get_backend(self) -> CacheBackend:
+        """Get the cache backend instance."""
+        if self._cache_backend is not None:
+            return self._cache_backend
+        return await get_cache_backend()
+
+    def _make_user_key(self, tenant_id: str, user_id: str) -> str:
+        """Create namespaced key for a principal snapshot."""
+        return f"auth:principal:{tenant_id}:user:{user_id}"
+
+    def _make_email_key(self, tenant_id: str, email: str) -> str:
+        """Create namespaced key for an email -> user_id pointer."""
+        return f"auth:principal:{tenant_id}:email:{email.lower()}"
+
+    async def get(
+        self,
+        tenant_id: str | None,
+        *,
+        user_id: str | None = None,
+        email: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the cached snapshot for a user, by id or (API-key path) email.
+
+        Args:
+            tenant_id: Tenant the user was resolved under.
+            user_id: User id from a verified JWT.
+            email: Configured API-key user email, used when ``user_id`` is None.
+
+        Returns:
+            The snapshot dict, or None on a miss or when the cache is disabled.
+
+        """
+        if not self.enabled or not tenant_id or (user_id is None and email is None):
+            return None
+        try:
+            backend = await self._get_backend()
+            if user_id is None:
+                user_id = await backend.get(self._make_email_key(tenant_id, email))
+                if user_id is None:
+                    return None
+            cached_value = await backend.get(self._make_user_key(tenant_id, user_id))
+            if cached_value is None:
+                logger.debug(f"Cache miss for principal: {user_id}")
+                return None
+            snapshot = json.loads(cached_value)
+            if email is not None and str(snapshot["user"].get("email", "")).lower() != email.lower():
+                return None
+            logger.debug(f"Cache hit for principal: {user_id}")
+            return snapshot
+        except Exception as e:
+            logger.warning(f"Failed to get principal from cache for {user_id or email}: {e}")
+            return None
+
+    async def set(self, tenant_id: str | None, user: Any, *, email: str | None = None) -> dict[str, Any] | None:
+        """Snapshot a freshly loaded user row and cache it.
+
+        Preferences are included only when the relationship is already
+        loaded, so callers that did not eager-load them get a snapshot that
+        lazy-loads them on demand after ``attach``.
+
+        Args:
+            tenant_id: Tenant the user was resolved under.
+            user: The ``User`` instance just read from the database.
+            email: Also record an email pointer for the API-key lookup.
+
+        Returns:
+            The snapshot that was cached, or None if caching is disabled or failed.
+
+        """
+        if not self.enabled or not tenant_id:
+            return None
+        try:
+            snapshot = self.snapshot(user)
+            await self.store(tenant_id, snapshot, email=email)
+            return snapshot
+        except Exception as e:
+            logger.warning(f"Failed to cache principal for {getattr(user, 'id', None)}: {e}")
+            return None
+
+    async def store(self, tenant_id: str, snapshot: dict[str, Any], *, email: str | None = None) -> None:
+        """Write an existing snapshot back, e.g. after updating last_login."""
+        if not self.enabled or not tenant_id:
+            return
+        try:
+            backend = await self._get_backend()
+            user_id = snapshot["user"]["id"]
+            await backend.set(self._make_user_key(tenant_id, user_id), json.dumps(snapshot), ttl_seconds=self._ttl)
+            if email is not None:
+                await backend.set(self._make_email_key(tenant_id, email), user_id, ttl_seconds=self._ttl)
+            logger.debug(f"Cached principal: {user_id}")
+        except Exception as e:
+            logger.warning(f"Failed to store principal in cache: {e}")
+
+    async def invalidate(self, tenant_id: str, user_id: str) -> None:
+        """Drop a user's snapshot. Email pointers are left to dangle harmlessly."""
+        try:
+            backend = await self._get_backend()
+            await backend.delete(self._make_user_key(tenant_id, user_id))
+            logger.debug(f"Invalidated cached principal: {user_id}")
+        except Exception as e:
+            logger.warning(f"Failed to invalidate cached principal for {user_id}: {e}")
+
+    async def invalidate_many(self, pairs: set[tuple[str, str]]) -> None:
+        """Drop the snapshots for several ``(tenant_id, user_id)`` pairs."""
+        for tenant_id, user_id in pairs:
+            await self.invalidate(tenant_id, user_id)
+
+    @staticmethod
+    def snapshot(user: Any) -> dict[str, Any]:
+        """Return the JSON-serializable snapshot of a loaded ``User``."""
+        state = inspect(user)
+        snapshot: dict[str, Any] = {"user": _dump_row(user)}
+        if "preferences" in state.dict:
+            preferences = state.dict["preferences"]
+            snapshot["preferences"] = _dump_row(preferences) if preferences is not None else None
+        return snapshot
+
+    @staticmethod
+    def materialize(snapshot: dict[str, Any]) -> Any:
+        """Rebuild a detached ``User`` (and its preferences) from a snapshot.
+
+        Columns that were not cached (the secrets) are left unloaded; they
+        load on access once the instance is attached to a session.
+        """
+        from ..models.user_preferences import UserPreferences
+        from .models import User
+
+        user = _load_row(User, snapshot["user"])
+        preferences = None
+        if "preferences" in snapshot:
+            if snapshot["preferences"] is not None:
+                preferences = _load_row(UserPreferences, snapshot["preferences"])
+                set_committed_value(preferences, "user", user)
+            set_committed_value(user, "preferences", preferences)
+        make_transient_to_detached(user)
+        if preferences is not None:
+            make_transient_to_detached(preferences)
+        return user
+
+    async def attach(self, snapshot: dict[str, Any], db: Any) -> Any:
+        """Return the snapshot's user as a persistent instance of ``db``, without a SELECT."""
+        return await db.merge(self.materialize(snapshot), load=False)
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the global principal cache instance."""
+    return principal_cache
+
+
+def invalidate_on_commit(session: Any, pairs: Iterable[tuple[str, str]]) -> None:
+    """Drop the snapshots for ``(tenant_id, user_id)`` pairs when ``session`` commits.
+
+    For Core ``update(User)`` statements, which do not pass through the
+    flush listeners below. A rollback discards the pairs like any other.
+    """
+    pairs = set(pairs)
+    if pairs:
+        session.info.setdefault(_INVALIDATIONS_KEY, set()).update(pairs)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_principal_invalidations(session, flush_context) -> None:
+    from ..models.user_preferences import UserPreferences
+    from .models import User
+
+    pairs: set[tuple[str, str]] = session.info.setdefault(_INVALIDATIONS_KEY, set())
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            pairs.add((obj.tenant_id, obj.id))
+        elif isinstance(obj, UserPreferences):
+            pairs.add((obj.tenant_id, obj.user_id))
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            state = inspect(obj)
+            changed = {attr.key for attr in state.attrs if attr.history.has_changes()}
+            if changed - _VOLATILE_COLUMNS:
+                pairs.add((obj.tenant_id, obj.id))
+        elif isinstance(obj, UserPreferences) and session.is_modified(obj):
+            pairs.add((obj.tenant_id, obj.user_id))
+    for obj in session.new:
+        if isinstance(obj, UserPreferences):
+            pairs.add((obj.tenant_id, obj.user_id))
+    if not pairs:
+        session.info.pop(_INVALIDATIONS_KEY, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _schedule_principal_invalidations(session) -> None:
+    pairs = session.info.pop(_INVALIDATIONS_KEY, None)
+    if not pairs or not get_principal_cache().enabled:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug("No running event loop; cached principals expire by TTL instead")
+        return
+    task = loop.create_task(get_principal_cache().invalidate_many(pairs))
+    _pending_invalidations.add(task)
+    task.add_done_callback(_pending_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_principal_invalidations(session) -> None:
+    session.info.pop(_INVALIDATIONS_KEY, None)
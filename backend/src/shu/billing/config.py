@@ -64,6 +64,15 @@ class BillingSettings(BaseSettings):
     # tiered pricing without a flat unit_amount_decimal, etc.).
     usage_markup_multiplier_default: Decimal = Field(Decimal("1.3"), alias="SHU_USAGE_MARKUP_MULTIPLIER_DEFAULT")
 
+    # Running usage ledger for hard-cap enforcement (see shu.billing.usage_ledger).
+    # The ledger is re-seeded from llm_usage this often; 0 disables it and
+    # aggregates the whole billing period on every billable call instead.
+    usage_ledger_reconcile_seconds: int = Field(300, alias="SHU_USAGE_LEDGER_RECONCILE_SECONDS")
+
+    # How long a tenant below half its cap reuses its last known spend
+    # in-process before reading the shared ledger again.
+    usage_ledger_fast_path_seconds: float = Field(5.0, alias="SHU_USAGE_LEDGER_FAST_PATH_SECONDS")
+
     # Tenant identifiers — set by the operator at deploy time.
     # These seed billing_state on first boot so webhook handlers and
     # scheduler jobs have a customer/subscription to work with immediately.
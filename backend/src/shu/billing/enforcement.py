@@ -21,6 +21,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
+from shu.billing import usage_ledger
 from shu.billing.adapters import (
     UsageProviderImpl,
     get_active_user_count,
@@ -155,7 +156,8 @@ async def assert_subscription_active() -> None:
     if not state.hard_cap:
         return
 
-    # Hard-cap path: precise per-period DB query rather than reading
+    # Hard-cap path: precise per-period spend (the running usage ledger,
+    # reconciled against llm_usage) rather than reading
     # `state.remaining_grant_amount` from the cache. The cache value is
     # the snapshot CP held at last poll — too loose for cap-spend
     # enforcement where minutes of overage are real cost the company eats.
@@ -169,17 +171,28 @@ async def assert_subscription_active() -> None:
             period_end=state.current_period_end,
             total_grant_amount=state.total_grant_amount,
         )
-    session_local = get_async_session_local()
-    async with session_local() as db:
-        summary = await UsageProviderImpl(db).get_usage_summary(
-            state.current_period_start,
-            datetime.now(UTC),
-        )
-    # `total_cost_usd` is raw provider cost; `total_grant_amount` is
+    period_start = state.current_period_start
+    markup = resolve_markup(state)
+
+    async def _aggregate_period_cost() -> Decimal:
+        session_local = get_async_session_local()
+        async with session_local() as db:
+            summary = await UsageProviderImpl(db).get_usage_summary(period_start, datetime.now(UTC))
+        return summary.total_cost_usd
+
+    # The running ledger keeps this constant-cost as llm_usage grows; it
+    # falls back to the aggregate above on a cold or stale seed.
+    raw_cost = await usage_ledger.period_cost(
+        period_start,
+        _aggregate_period_cost,
+        cap=state.total_grant_amount,
+        markup=markup,
+    )
+    # `raw_cost` is raw provider cost; `total_grant_amount` is
     # customer-billed (from CP/Stripe credit grant). Apply the markup
     # before comparing so the cap triggers on the billed dollar the
     # customer would have been charged, not the raw provider dollar.
-    billed_cost = summary.total_cost_usd * resolve_markup(state)
+    billed_cost = raw_cost * markup
     if billed_cost >= state.total_grant_amount:
         raise HardCapExhaustedError(
             period_end=state.current_period_end,
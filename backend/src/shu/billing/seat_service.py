@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from stripe import Subscription
 
 from shu.auth.models import User
+from shu.auth.principal_cache import invalidate_on_commit
 from shu.billing.adapters import get_active_user_count
 from shu.billing.config import BillingSettings, get_billing_settings_dependency
 from shu.billing.enforcement import UserLimitStatus, check_user_limit
@@ -250,9 +251,12 @@ class SeatService:
             update(User)
             .where(User.deactivation_scheduled_at.is_not(None))
             .values(deactivation_scheduled_at=None)
+            .returning(User.tenant_id, User.id)
             .execution_options(synchronize_session=False)
         )
-        await db.execute(clear_stmt)
+        cleared = (await db.execute(clear_stmt)).all()
+        # Core UPDATEs skip the ORM flush events that evict cached principals.
+        invalidate_on_commit(db, ((row.tenant_id, row.id) for row in cleared))
         await db.commit()
         return await check_user_limit(db, self.stripe_client)
 
@@ -333,9 +337,11 @@ class SeatService:
             update(User)
             .where(User.deactivation_scheduled_at.is_not(None))
             .values(deactivation_scheduled_at=None)
+            .returning(User.tenant_id, User.id)
             .execution_options(synchronize_session=False)
         )
-        await db.execute(clear_stmt)
+        cleared = (await db.execute(clear_stmt)).all()
+        invalidate_on_commit(db, ((row.tenant_id, row.id) for row in cleared))
 
         await db.commit()
 
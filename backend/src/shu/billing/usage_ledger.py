@@ -0,0 +1,161 @@
+"""Running per-tenant spend ledger for hard-cap enforcement.
+
+``assert_subscription_active`` used to aggregate the whole billing period of
+``llm_usage`` on every billable call, so enforcement got slower as the month
+went on. The ledger keeps that check at constant cost:
+
+- ``UsageRecorder`` atomically ``INCR``s a per-tenant counter in the shared
+  CacheBackend by each billable row's raw cost, in integer nano-dollars
+  rounded up, so the counter never under-counts a row.
+- A seed record ties the counter to ``llm_usage``: the period's aggregated
+  cost at reconciliation time plus the counter value read just *before* that
+  aggregate ran. Current spend is ``base + (counter - counter_at_seed)``.
+- The seed expires after ``SHU_USAGE_LEDGER_RECONCILE_SECONDS`` and is
+  rebuilt from ``llm_usage``. A new period anchor or a counter that went
+  backwards (cache flush / eviction) forces an immediate rebuild.
+- Tenants whose last known billed spend is under half their cap reuse it
+  in-process for ``SHU_USAGE_LEDGER_FAST_PATH_SECONDS`` without touching the
+  cache at all.
+
+Races only over-count: a row committed between the counter read and the
+aggregate lands in both, and a caller-owned transaction that rolls back after
+bumping the counter is corrected at the next reconcile. A cache outage falls
+back to the direct aggregate. ``SHU_USAGE_LEDGER_RECONCILE_SECONDS=0``
+disables the ledger entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from decimal import ROUND_CEILING, Decimal
+
+from shu.billing.config import get_billing_settings
+from shu.core.cache_backend import get_cache_backend
+from shu.core.logging import get_logger
+from shu.core.tenant import tenant_context
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "billing:ledger"
+_NANOS_PER_USD = Decimal(10**9)
+
+# Billed spend must sit under this fraction of the cap before the in-process
+# fast path may skip the shared read.
+_FAST_PATH_CAP_FRACTION = Decimal("0.5")
+
+# tenant -> (period anchor, raw spend, monotonic time it was read)
+_fast_path: dict[str, tuple[str, Decimal, float]] = {}
+
+
+def _tenant() -> str:
+    return tenant_context.get(None) or "global"
+
+
+def _counter_key(tenant: str) -> str:
+    return f"{_KEY_PREFIX}:{tenant}:spend"
+
+
+def _seed_key(tenant: str) -> str:
+    return f"{_KEY_PREFIX}:{tenant}:seed"
+
+
+def to_nanos(cost: Decimal) -> int:
+    """Convert a USD amount to integer nano-dollars, rounding up."""
+    return int((cost * _NANOS_PER_USD).to_integral_value(rounding=ROUND_CEILING))
+
+
+def ledger_enabled() -> bool:
+    """Return whether the running ledger is in use."""
+    return get_billing_settings().usage_ledger_reconcile_seconds > 0
+
+
+async def record_billable_cost(cost: Decimal) -> None:
+    """Add a billable row's raw cost to the current tenant's counter.
+
+    Never raises: a missed increment only under-counts until the next
+    reconcile, and billing-record callers must not fail on the ledger.
+    """
+    if cost <= 0 or not ledger_enabled():
+        return
+    try:
+        backend = await get_cache_backend()
+        await backend.incr(_counter_key(_tenant()), to_nanos(cost))
+    except Exception as e:
+        logger.warning("Failed to update usage ledger: %s", e)
+
+
+def _parse_seed(raw: str | None) -> dict | None:
+    if raw is None:
+        return None
+    try:
+        seed = json.loads(raw)
+        Decimal(seed["base"])
+        int(seed["counter"])
+    except (ValueError, KeyError, TypeError, ArithmeticError):
+        return None
+    return seed
+
+
+async def period_cost(
+    period_start: datetime,
+    aggregate: Callable[[], Awaitable[Decimal]],
+    *,
+    cap: Decimal,
+    markup: Decimal,
+) -> Decimal:
+    """Return the current tenant's raw provider spend since ``period_start``.
+
+    ``aggregate`` runs the authoritative ``llm_usage`` aggregate; it is only
+    awaited to (re)seed the ledger or when the cache is unreachable. ``cap``
+    (billed dollars) and ``markup`` decide whether the result may be served
+    from the in-process fast path on the next call.
+    """
+    settings = get_billing_settings()
+    if settings.usage_ledger_reconcile_seconds <= 0:
+        return await aggregate()
+
+    tenant = _tenant()
+    period = period_start.isoformat()
+    now = time.monotonic()
+    cached = _fast_path.get(tenant)
+    if cached is not None and cached[0] == period and now - cached[2] < settings.usage_ledger_fast_path_seconds:
+        return cached[1]
+
+    try:
+        backend = await get_cache_backend()
+        counter = int(await backend.get(_counter_key(tenant)) or 0)
+        seed = _parse_seed(await backend.get(_seed_key(tenant)))
+    except Exception as e:
+        logger.warning("Usage ledger unavailable, aggregating llm_usage: %s", e)
+        return await aggregate()
+
+    if seed is None or seed.get("period") != period or counter < int(seed["counter"]):
+        # The counter was read above, before the aggregate, so anything the
+        # aggregate sees that also bumps the counter is double-counted rather
+        # than missed.
+        spend = await aggregate()
+        seed = {"period": period, "base": str(spend), "counter": counter}
+        try:
+            await backend.set(
+                _seed_key(tenant),
+                json.dumps(seed),
+                ttl_seconds=settings.usage_ledger_reconcile_seconds,
+            )
+        except Exception as e:
+            logger.warning("Failed to store usage ledger seed: %s", e)
+    else:
+        spend = Decimal(seed["base"]) + Decimal(counter - int(seed["counter"])) / _NANOS_PER_USD
+
+    if spend * markup < cap * _FAST_PATH_CAP_FRACTION:
+        _fast_path[tenant] = (period, spend, now)
+    else:
+        _fast_path.pop(tenant, None)
+    return spend
+
+
+def reset_usage_ledger_fast_path() -> None:
+    """Drop the in-process fast-path entries (tests)."""
+    _fast_path.clear()
@@ -66,6 +66,15 @@ class Settings(BaseSettings):
     # Managed Postgres on port 6543). Disables asyncpg's prepared statement
     # cache, which is incompatible with transaction-level connection reuse.
     use_pgbouncer: bool = Field(False, alias="SHU_USE_PGBOUNCER")
+    # How app.tenant_id is stamped on app-engine connections. "transaction"
+    # runs set_config(..., true) at every transaction begin. "connection" keeps
+    # it session-wide per pooled connection and skips the call while the
+    # tenant is unchanged; ignored (falls back to "transaction") when
+    # use_pgbouncer is set, since PgBouncer transaction mode shares backends.
+    db_tenant_binding: str = Field("transaction", alias="SHU_DB_TENANT_BINDING")
+    # Ping a pooled connection on checkout only once it has been idle this
+    # many seconds. 0 restores SQLAlchemy's ping-on-every-checkout.
+    database_pre_ping_idle_seconds: float = Field(30.0, ge=0, alias="SHU_DATABASE_PRE_PING_IDLE_SECONDS")
 
     # Deployment mode determines tenant isolation strategy at startup.
     # See DeploymentMode enum; cross-field constraints with tenant_id are enforced
@@ -122,6 +131,10 @@ class Settings(BaseSettings):
     jwt_secret_key: str | None = Field(None, alias="JWT_SECRET_KEY")
     jwt_access_token_expire_minutes: int = Field(60, alias="JWT_ACCESS_TOKEN_EXPIRE_MINUTES")
     jwt_refresh_token_expire_days: int = Field(30, alias="JWT_REFRESH_TOKEN_EXPIRE_DAYS")
+    # Seconds an authenticated user's row (active flag, role, password_changed_at,
+    # preferences) is served from the CacheBackend before auth re-reads it.
+    # Writes to the user invalidate it on commit; 0 disables the cache.
+    auth_principal_cache_ttl: int = Field(60, ge=0, alias="SHU_AUTH_PRINCIPAL_CACHE_TTL")
 
     # Admin configuration
     admin_emails: list[str] = Field(default_factory=list, alias="ADMIN_EMAILS")
@@ -195,13 +208,37 @@ class Settings(BaseSettings):
     # Explicit values fail fast if the device is unavailable.
     embedding_device: str = Field("auto", alias="SHU_EMBEDDING_DEVICE")
     embedding_batch_size: int = Field(32, alias="SHU_EMBEDDING_BATCH_SIZE")
+    # Embed jobs running concurrently in one worker process coalesce their chunk
+    # texts into full SHU_EMBEDDING_BATCH_SIZE batches, waiting at most this long
+    # for a batch to fill. 0 disables coalescing (one embed call per document).
+    embedding_batch_max_wait_ms: int = Field(25, alias="SHU_EMBEDDING_BATCH_MAX_WAIT_MS")
     # Model precision: "auto" (default), "float32", or "float16".
     # "auto" picks float16 on GPU (cuda/mps) and float32 on CPU.
     # WARNING: float16 on CPU is ~9x slower due to lack of native fp16 compute.
     embedding_dtype: str = Field("auto", alias="SHU_EMBEDDING_DTYPE")
+    # Query embeddings are cached by (model, normalized text): a per-process
+    # LRU of this many entries in front of the shared cache backend, where
+    # packed float32 vectors live for the TTL (0 keeps them process-local).
+    query_embedding_cache_enabled: bool = Field(True, alias="SHU_QUERY_EMBEDDING_CACHE_ENABLED")
+    query_embedding_cache_size: int = Field(2048, ge=0, alias="SHU_QUERY_EMBEDDING_CACHE_SIZE")
+    query_embedding_cache_ttl: int = Field(86400, ge=0, alias="SHU_QUERY_EMBEDDING_CACHE_TTL")
+    # Fire-and-forget usage rows (no caller-owned session) are buffered and
+    # written as one multi-row insert once max_rows are pending or the oldest
+    # has waited flush_interval seconds. Provider/model rows used for name
+    # snapshots and DB-rate cost fallback are cached for lookup_ttl seconds.
+    usage_write_buffer_enabled: bool = Field(True, alias="SHU_USAGE_WRITE_BUFFER_ENABLED")
+    usage_write_buffer_max_rows: int = Field(200, ge=1, alias="SHU_USAGE_WRITE_BUFFER_MAX_ROWS")
+    usage_write_buffer_flush_interval: float = Field(1.0, gt=0, alias="SHU_USAGE_WRITE_BUFFER_FLUSH_INTERVAL")
+    usage_write_buffer_lookup_ttl: int = Field(60, ge=0, alias="SHU_USAGE_WRITE_BUFFER_LOOKUP_TTL")
     # Text processing configuration
     default_chunk_size: int = Field(1000, alias="SHU_DEFAULT_CHUNK_SIZE")
     default_chunk_overlap: int = Field(200, alias="SHU_DEFAULT_CHUNK_OVERLAP")
+    # Chunker used for KBs without an explicit chunking_strategy:
+    # "fixed", "sentence", "paragraph", "markdown" or "token_budget".
+    default_chunking_strategy: str = Field("fixed", alias="SHU_DEFAULT_CHUNKING_STRATEGY")
+    # Re-syncs diff the new chunk layout against stored chunks and only re-embed
+    # chunks whose text or position changed. Disable to always re-embed everything.
+    incremental_chunk_embedding: bool = Field(True, alias="SHU_INCREMENTAL_CHUNK_EMBEDDING")
     max_chunk_size: int = 2000
     # OCR per-page timeout (seconds)
     ocr_page_timeout: int = Field(180, alias="SHU_OCR_PAGE_TIMEOUT")
@@ -263,6 +300,13 @@ class Settings(BaseSettings):
     password_policy: str = Field("moderate", alias="SHU_PASSWORD_POLICY")
     password_min_length: int = Field(8, alias="SHU_PASSWORD_MIN_LENGTH")
     password_special_chars: str = Field("!@#$%^&*()-_+=", alias="SHU_PASSWORD_SPECIAL_CHARS")
+    # bcrypt cost factor for new hashes. Raising it upgrades existing hashes
+    # transparently on each user's next successful login.
+    password_bcrypt_rounds: int = Field(12, ge=4, le=31, alias="SHU_PASSWORD_BCRYPT_ROUNDS")
+    # Dedicated hashing threads, plus how many more operations may wait for
+    # one before logins are shed with 503 + Retry-After.
+    password_hash_workers: int = Field(4, ge=1, alias="SHU_PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(64, ge=0, alias="SHU_PASSWORD_HASH_MAX_QUEUE")
     # When using the global API key (Tier 0), map it to this user's identity for RBAC
     api_key_user_email: str | None = Field(None, alias="SHU_API_KEY_USER_EMAIL")
     secret_key: str | None = Field(None, alias="SHU_SECRET_KEY")
@@ -285,6 +329,20 @@ class Settings(BaseSettings):
     worker_concurrency: int = Field(10, alias="SHU_WORKER_CONCURRENCY")  # Number of concurrent worker tasks per process
     worker_poll_interval: float = Field(1.0, alias="SHU_WORKER_POLL_INTERVAL")  # seconds
     worker_shutdown_timeout: float = Field(30.0, alias="SHU_WORKER_SHUTDOWN_TIMEOUT")  # seconds
+    # Jobs each worker task runs concurrently as asyncio tasks (1 = one job at a time)
+    worker_jobs_per_worker: int = Field(1, alias="SHU_WORKER_JOBS_PER_WORKER")
+    # Per-workload cap on a worker's concurrent jobs, e.g. "PROFILING=8,INGESTION=4"
+    worker_workload_slots: str = Field("", alias="SHU_WORKER_WORKLOAD_SLOTS")
+    # Minimum seconds between Redis queue sweeps (restoring jobs whose visibility
+    # timeout expired and promoting due scheduled jobs), per queue and process.
+    queue_sweep_interval_seconds: float = Field(1.0, alias="SHU_QUEUE_SWEEP_INTERVAL_SECONDS")
+    # Redis data structure behind the work queues: "lists" (list + sorted sets)
+    # or "streams" (one Redis Stream and consumer group per queue)
+    queue_redis_structure: str = Field("lists", alias="SHU_QUEUE_REDIS_STRUCTURE")
+    # Streams only: minimum seconds an unacknowledged delivery may sit idle
+    # before another worker reclaims it as abandoned (jobs with a longer
+    # visibility timeout wait for that instead)
+    queue_stream_claim_idle_seconds: int = Field(600, alias="SHU_QUEUE_STREAM_CLAIM_IDLE_SECONDS")
 
     # Memory tuning (SHU-731)
     # Interval between background malloc_trim(0) calls that return freed glibc
@@ -565,6 +623,12 @@ class Settings(BaseSettings):
     # Global LLM limits
     llm_global_timeout: int = Field(30, alias="SHU_LLM_GLOBAL_TIMEOUT")
     llm_streaming_read_timeout: int = Field(120, alias="SHU_LLM_STREAMING_READ_TIMEOUT")
+    # Pooled provider HTTP clients shared by every LLM client for the same provider
+    llm_http_max_connections: int = Field(100, alias="SHU_LLM_HTTP_MAX_CONNECTIONS")
+    llm_http_max_keepalive_connections: int = Field(20, alias="SHU_LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    llm_http_keepalive_expiry: float = Field(60.0, alias="SHU_LLM_HTTP_KEEPALIVE_EXPIRY")  # seconds
+    # Multiplex provider requests over HTTP/2 (requires the optional 'h2' package)
+    llm_http2_enabled: bool = Field(False, alias="SHU_LLM_HTTP2_ENABLED")
     llm_max_tokens_default: int = Field(50_000, alias="SHU_LLM_MAX_TOKENS_DEFAULT")
     llm_temperature_default: float = Field(0.7, alias="SHU_LLM_TEMPERATURE_DEFAULT")
 
@@ -588,6 +652,12 @@ class Settings(BaseSettings):
     # shutdown cleanup (scheduler cancel, OCR teardown, embedding cache, etc.).
     stream_drain_timeout_s: int = Field(5, alias="SHU_STREAM_DRAIN_TIMEOUT_S")
 
+    # Resumable chat streams: seconds a stream's replay log stays readable
+    # after its last frame (0 disables replay and streams straight to the
+    # connection), and the max frames kept per stream.
+    chat_stream_replay_ttl_seconds: int = Field(600, ge=0, alias="SHU_CHAT_STREAM_REPLAY_TTL_SECONDS")
+    chat_stream_replay_max_events: int = Field(10000, ge=1, alias="SHU_CHAT_STREAM_REPLAY_MAX_EVENTS")
+
     # RAG Configuration Defaults (global fallbacks)
     rag_search_threshold_default: float = Field(0.3, alias="SHU_RAG_SEARCH_THRESHOLD_DEFAULT")
     rag_max_chunks_default: int = Field(10, alias="SHU_RAG_MAX_CHUNKS_DEFAULT")
@@ -618,6 +688,10 @@ class Settings(BaseSettings):
     rag_full_doc_max_docs_default: int = Field(2, alias="SHU_RAG_FULL_DOC_MAX_DOCS_DEFAULT")
     rag_full_doc_token_cap_default: int = Field(80000, alias="SHU_RAG_FULL_DOC_TOKEN_CAP_DEFAULT")
 
+    # Multi-KB retrieval: max knowledge bases queried concurrently (each on its
+    # own DB session, sharing one query embedding). 1 queries them one at a time.
+    rag_kb_query_concurrency: int = Field(4, alias="SHU_RAG_KB_QUERY_CONCURRENCY")
+
     # Personal Knowledge KB Defaults (SHU-742) — applied at create time when
     # KnowledgeBaseCreate.is_personal=True. These intentionally diverge from
     # the global RAG defaults above; Personal KBs are small, user-owned, and
@@ -679,6 +753,16 @@ class Settings(BaseSettings):
             "Default 2.0 renders at 2x resolution."
         ),
     )
+    ocr_page_concurrency: int = Field(
+        default=2,
+        ge=1,
+        alias="SHU_OCR_PAGE_CONCURRENCY",
+        description=(
+            "Pages of one document OCR'd concurrently by EasyOCR. Rendering of the next page "
+            "overlaps OCR of in-flight pages; each in-flight page holds one rendered image in "
+            "memory. Set to 1 for strictly sequential pages."
+        ),
+    )
     # Note: No page limits - OCR processes all pages in document
 
     # Service backend configuration
@@ -861,6 +945,24 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("db_tenant_binding")
+    @classmethod
+    def validate_db_tenant_binding(cls, v: str) -> str:
+        """Validate the tenant GUC binding mode."""
+        valid_modes = ["transaction", "connection"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"DB tenant binding must be one of: {valid_modes}")
+        return v.lower()
+
+    @field_validator("queue_redis_structure")
+    @classmethod
+    def validate_queue_redis_structure(cls, v: str) -> str:
+        """Validate the Redis queue structure."""
+        valid_structures = ["lists", "streams"]
+        if v.lower() not in valid_structures:
+            raise ValueError(f"Queue Redis structure must be one of: {valid_structures}")
+        return v.lower()
+
     @field_validator("password_policy")
     @classmethod
     def validate_password_policy(cls, v: str) -> str:
@@ -895,6 +997,14 @@ class Settings(BaseSettings):
             raise ValueError("embedding_batch_size must be a positive integer")
         return v
 
+    @field_validator("embedding_batch_max_wait_ms")
+    @classmethod
+    def validate_embedding_batch_max_wait_ms(cls, v: int) -> int:
+        """Validate embedding batch max wait is non-negative."""
+        if v < 0:
+            raise ValueError("embedding_batch_max_wait_ms must be non-negative")
+        return v
+
     @field_validator("worker_concurrency")
     @classmethod
     def validate_worker_concurrency(cls, v: int) -> int:
@@ -903,6 +1013,14 @@ class Settings(BaseSettings):
             raise ValueError("worker_concurrency must be a positive integer")
         return v
 
+    @field_validator("worker_jobs_per_worker")
+    @classmethod
+    def validate_worker_jobs_per_worker(cls, v: int) -> int:
+        """Validate jobs per worker is positive."""
+        if v <= 0:
+            raise ValueError("worker_jobs_per_worker must be a positive integer")
+        return v
+
     @field_validator("vector_index_type")
     @classmethod
     def validate_vector_index_type(cls, v: str) -> str:
@@ -7,12 +7,13 @@ and utilities for database operations.
 import ast
 import os
 import re
+import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
 from sqlalchemy import event, text
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import DisconnectionError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base
 
@@ -73,6 +74,8 @@ def get_settings():
             database_pool_recycle = 3600
             debug = False
             use_pgbouncer = False
+            db_tenant_binding = "transaction"
+            database_pre_ping_idle_seconds = 30.0
             # Defaulting to self_hosted keeps the fallback path safe: callers that
             # branch on deployment_mode get the most permissive non-tenant mode
             # rather than crashing on a missing attribute.
@@ -125,16 +128,82 @@ def get_async_engine():
                 max_overflow=settings.database_max_overflow,
                 pool_timeout=settings.database_pool_timeout,
                 pool_recycle=settings.database_pool_recycle,
-                pool_pre_ping=True,
+                pool_pre_ping=not settings.database_pre_ping_idle_seconds,
                 echo=False,
                 connect_args=connect_args,
             )
+            if settings.database_pre_ping_idle_seconds:
+                _install_idle_pre_ping(_async_engine, settings.database_pre_ping_idle_seconds)
+            _configure_tenant_binding(_async_engine, settings)
         except Exception as e:
             logger.error(f"Failed to create async database engine: {e!s}")
             raise DatabaseConnectionError(f"engine creation: {e!s}")
     return _async_engine
 
 
+# =============================================================================
+# Round-trip accounting
+#
+# Counts the statements the app engine sends plus the extra round trips the
+# hooks below add (tenant GUC writes, checkout pings) and avoid. Exposed via
+# get_round_trip_stats() so the effect of connection-level tenant binding and
+# idle-based pre-ping is measurable on a live process.
+# =============================================================================
+
+_round_trips: dict[str, int] = dict.fromkeys(
+    ("statements", "tenant_guc_set", "tenant_guc_skipped", "pings", "pings_skipped"), 0
+)
+
+
+def get_round_trip_stats() -> dict[str, int]:
+    """Return a snapshot of the database round-trip counters."""
+    return dict(_round_trips)
+
+
+def reset_round_trip_stats() -> None:
+    """Zero the round-trip counters (tests, before/after measurements)."""
+    for key in _round_trips:
+        _round_trips[key] = 0
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    _round_trips["statements"] += 1
+
+
+# Key in the DBAPI connection's info dict recording when it was last checked
+# in. The pool clears that dict whenever the connection is replaced.
+_LAST_CHECKIN_KEY = "shu_last_checkin"
+
+
+def _install_idle_pre_ping(engine, idle_seconds: float) -> None:
+    """Ping pooled connections on checkout only after they sat idle ``idle_seconds``.
+
+    Stands in for ``pool_pre_ping=True``, which spends a round trip on every
+    checkout — several per request once auth, dependencies and searches each
+    open a session. A connection returned moments ago is almost certainly
+    alive; a stale one is still pinged, and a failed ping raises
+    ``DisconnectionError`` so the pool discards it and retries with a fresh one.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine.pool, "checkin")
+    def _record_checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info[_LAST_CHECKIN_KEY] = time.monotonic()
+
+    @event.listens_for(sync_engine.pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy) -> None:
+        last_checkin = connection_record.info.get(_LAST_CHECKIN_KEY)
+        if last_checkin is None or time.monotonic() - last_checkin < idle_seconds:
+            _round_trips["pings_skipped"] += 1
+            return
+        _round_trips["pings"] += 1
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError(f"pre-ping failed after {time.monotonic() - last_checkin:.0f}s idle") from e
+
+
 def get_async_session_local():
     global _AsyncSessionLocal  # noqa: PLW0603 # This is currently working, so we'll leave it as is
     if _AsyncSessionLocal is None:
@@ -172,6 +241,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 # Three listeners wire `tenant_context` into the SQLAlchemy machinery:
 #   - Engine "begin": stamps app.tenant_id on every new transaction via
 #     set_config(..., true). Bind-parameter-safe; PgBouncer-transaction-mode-safe.
+#     In connection binding mode (SHU_DB_TENANT_BINDING=connection, direct
+#     Postgres only) the GUC is session-wide instead and only rewritten when
+#     the pooled connection switches tenant.
 #   - Session "before_flush": auto-stamps tenant_id on new tenant-scoped
 #     objects from the session's context; raises on mismatch.
 #   - Engine "before_cursor_execute" (debug only): rejects raw SET on
@@ -180,6 +252,63 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 # =============================================================================
 
 
+# The engine whose connections carry app.tenant_id session-wide (connection
+# binding mode), or None when every engine uses per-transaction set_config.
+_connection_bound_engine = None
+
+# Key in the DBAPI connection's info dict holding the tenant id last written
+# to its session-level app.tenant_id (connection binding mode only).
+_TENANT_GUC_KEY = "shu_tenant_guc"
+
+
+def _configure_tenant_binding(engine, settings) -> None:
+    """Select how the begin hook stamps ``app.tenant_id`` on ``engine``'s connections.
+
+    ``transaction`` (default) issues ``set_config(..., true)`` at every
+    transaction begin. ``connection`` sets the GUC session-wide and skips the
+    write while a pooled connection keeps serving the same tenant. Connection
+    binding is unsafe behind PgBouncer in transaction mode — the server
+    backend behind a client connection changes between transactions, so a
+    session GUC would leak to whoever gets it next — and falls back to
+    per-transaction binding there.
+    """
+    global _connection_bound_engine  # noqa: PLW0603
+    _connection_bound_engine = None
+    if settings.db_tenant_binding != "connection":
+        return
+    if settings.use_pgbouncer:
+        logger.warning("SHU_DB_TENANT_BINDING=connection is ignored with SHU_USE_PGBOUNCER; using transaction binding")
+        return
+    if engine.sync_engine.dialect.driver != "asyncpg":
+        logger.warning("SHU_DB_TENANT_BINDING=connection requires asyncpg; using transaction binding")
+        return
+    _connection_bound_engine = engine.sync_engine
+
+
+def _bind_tenant_to_connection(conn, tid: str | None) -> None:
+    """Bring the connection's session-level ``app.tenant_id`` in line with ``tid``.
+
+    The value last written is remembered on the DBAPI connection, so a
+    connection that keeps serving the same tenant costs no extra round trip.
+    The write goes to the asyncpg driver directly, before the adapter opens
+    the transaction (it does so lazily on the first statement): run outside
+    any transaction, a later ROLLBACK cannot undo it behind the cache's back.
+    Switching to "no tenant" RESETs the GUC rather than leaving the previous
+    tenant's id in place.
+    """
+    info = conn.connection.info
+    if info.get(_TENANT_GUC_KEY) == tid:
+        _round_trips["tenant_guc_skipped"] += 1
+        return
+    dbapi_connection = conn.connection.dbapi_connection
+    if tid is None:
+        dbapi_connection.run_async(lambda driver: driver.execute("RESET app.tenant_id"))
+    else:
+        dbapi_connection.run_async(lambda driver: driver.execute("SELECT set_config('app.tenant_id', $1, false)", tid))
+    info[_TENANT_GUC_KEY] = tid
+    _round_trips["tenant_guc_set"] += 1
+
+
 def _is_admin_connection(conn) -> bool:
     """Evaluate, true iff this connection belongs to the lazy admin engine.
 
@@ -211,6 +340,11 @@ def _set_tenant_on_begin(conn) -> None:
     if _is_admin_connection(conn):
         return
     tid = tenant_context.get(None)
+    if _connection_bound_engine is not None and conn.engine is _connection_bound_engine:
+        if not tid:
+            logger.debug("transaction begun without tenant context")
+        _bind_tenant_to_connection(conn, str(tid) if tid else None)
+        return
     if not tid:
         # Falsy (None or "") => no tenant. Never write an empty string into the
         # GUC: ``current_setting('app.tenant_id', true)`` then returns '' instead
@@ -224,6 +358,7 @@ def _set_tenant_on_begin(conn) -> None:
         text("SELECT set_config('app.tenant_id', :tid, true)"),
         {"tid": str(tid)},
     )
+    _round_trips["tenant_guc_set"] += 1
 
 
 def _is_tenant_scoped(obj: object) -> bool:
@@ -335,10 +470,12 @@ def get_admin_engine():
             max_overflow=settings.database_max_overflow,
             pool_timeout=settings.database_pool_timeout,
             pool_recycle=settings.database_pool_recycle,
-            pool_pre_ping=True,
+            pool_pre_ping=not settings.database_pre_ping_idle_seconds,
             echo=False,
             connect_args=connect_args,
         )
+        if settings.database_pre_ping_idle_seconds:
+            _install_idle_pre_ping(_admin_engine, settings.database_pre_ping_idle_seconds)
     return _admin_engine
 
 
@@ -0,0 +1,188 @@
+"""Cross-request embedding micro-batcher.
+
+Concurrent INGESTION_EMBED jobs each embed one document's chunks. For feeds
+made of many short documents (emails, chat messages) that means a stream of
+tiny ``embed_texts`` calls, which wastes sentence-transformers throughput and
+pays per-request overhead on external embedding APIs.
+
+``EmbeddingBatcher`` wraps an ``EmbeddingService`` and coalesces pending
+``embed_texts`` calls into batches of up to ``batch_size`` texts. A batch is
+dispatched as soon as it is full, or ``max_wait`` seconds after its first
+request arrived, and each caller receives exactly the vectors for its own
+texts.
+
+Requests are only coalesced with others from the same tenant and user, so
+usage rows written by billable external providers keep their attribution.
+Calls that already fill a batch on their own bypass the queue entirely.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+from .config import get_settings_instance
+from .embedding_protocol import EmbeddingService
+from .logging import get_logger
+from .tenant import tenant_context
+
+logger = get_logger(__name__)
+
+# (tenant_id, user_id) — requests are only batched within one attribution scope.
+_GroupKey = tuple[str | None, str | None]
+
+
+@dataclass(slots=True)
+class _PendingRequest:
+    texts: list[str]
+    future: asyncio.Future
+
+
+@dataclass(slots=True)
+class _PendingGroup:
+    requests: list[_PendingRequest] = field(default_factory=list)
+    size: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+class EmbeddingBatcher:
+    """EmbeddingService wrapper that coalesces ``embed_texts`` calls into full batches.
+
+    Query embedding (``embed_query`` / ``embed_queries``) is latency-sensitive
+    and passes straight through to the wrapped service.
+    """
+
+    def __init__(self, service: EmbeddingService, batch_size: int, max_wait: float) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if max_wait < 0:
+            raise ValueError("max_wait must be non-negative")
+        self._service = service
+        self._batch_size = batch_size
+        self._max_wait = max_wait
+        self._groups: dict[_GroupKey, _PendingGroup] = {}
+        # Strong references to in-flight batch tasks so they are not garbage collected.
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def service(self) -> EmbeddingService:
+        """The wrapped embedding service."""
+        return self._service
+
+    @property
+    def dimension(self) -> int:
+        return self._service.dimension
+
+    @property
+    def model_name(self) -> str:
+        return self._service.model_name
+
+    async def embed_texts(self, texts: list[str], *, user_id: str | None = None) -> list[list[float]]:
+        if not texts:
+            return []
+        if len(texts) >= self._batch_size:
+            return await self._service.embed_texts(texts, user_id=user_id)
+
+        key: _GroupKey = (tenant_context.get(), user_id)
+        group = self._groups.get(key)
+        if group is not None and group.size + len(texts) > self._batch_size:
+            # Adding these texts would overflow the pending batch; send it now.
+            self._dispatch(key)
+            group = None
+        if group is None:
+            group = self._groups[key] = _PendingGroup()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        group.requests.append(_PendingRequest(texts, future))
+        group.size += len(texts)
+
+        if group.size >= self._batch_size:
+            self._dispatch(key)
+        elif group.timer is None:
+            group.timer = loop.call_later(self._max_wait, self._dispatch, key)
+
+        return await future
+
+    async def embed_query(self, text: str, *, user_id: str | None = None) -> list[float]:
+        return await self._service.embed_query(text, user_id=user_id)
+
+    async def embed_queries(self, texts: list[str], *, user_id: str | None = None) -> list[list[float]]:
+        return await self._service.embed_queries(texts, user_id=user_id)
+
+    def _dispatch(self, key: _GroupKey) -> None:
+        """Close the pending batch for ``key`` and start embedding it."""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        if group.timer is not None:
+            group.timer.cancel()
+        # Runs in the context of the request that triggered dispatch, which
+        # shares this group's tenant; user_id is passed explicitly.
+        task = asyncio.get_running_loop().create_task(self._run_batch(group.requests, key[1]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, requests: list[_PendingRequest], user_id: str | None) -> None:
+        texts = [text for request in requests for text in request.texts]
+        try:
+            embeddings = await self._service.embed_texts(texts, user_id=user_id)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Embedding count mismatch: got {len(embeddings)} embeddings for {len(texts)} texts")
+        except asyncio.CancelledError:
+            for request in requests:
+                request.future.cancel()
+            raise
+        except Exception as e:
+            if len(requests) == 1:
+                if not requests[0].future.done():
+                    requests[0].future.set_exception(e)
+                return
+            # Retry each request on its own so one bad document (e.g. input
+            # rejected by the provider) does not fail the jobs batched with it.
+            logger.warning(
+                "Batched embedding failed, retrying requests individually",
+                extra={"requests": len(requests), "texts": len(texts), "error": str(e)},
+            )
+            await asyncio.gather(*(self._run_batch([request], user_id) for request in requests))
+            return
+
+        logger.debug("Embedded coalesced batch", extra={"requests": len(requests), "texts": len(texts)})
+        offset = 0
+        for request in requests:
+            count = len(request.texts)
+            if not request.future.done():
+                request.future.set_result(embeddings[offset : offset + count])
+            offset += count
+
+
+_batcher: EmbeddingBatcher | None = None
+
+
+async def get_batching_embedding_service() -> EmbeddingService:
+    """Return the embedding service for ingestion workers, wrapped in the shared batcher.
+
+    Returns the plain service when ``SHU_EMBEDDING_BATCH_MAX_WAIT_MS`` is 0.
+    The batcher is rebuilt whenever the underlying embedding service
+    singleton changes (e.g. after ``reset_embedding_service()``).
+    """
+    from .embedding_service import get_embedding_service
+
+    global _batcher  # noqa: PLW0603
+
+    service = await get_embedding_service()
+    settings = get_settings_instance()
+    if settings.embedding_batch_max_wait_ms <= 0:
+        return service
+
+    if _batcher is None or _batcher.service is not service:
+        _batcher = EmbeddingBatcher(
+            service,
+            batch_size=settings.embedding_batch_size,
+            max_wait=settings.embedding_batch_max_wait_ms / 1000,
+        )
+    return _batcher
+
+
+def reset_embedding_batcher() -> None:
+    """Drop the shared batcher (for testing only)."""
+    global _batcher  # noqa: PLW0603
+    _batcher = None
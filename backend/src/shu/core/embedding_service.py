@@ -6,6 +6,7 @@ loading sentence-transformers (~2GB) when only the protocol is needed.
 
 DI wiring:
     - get_embedding_service()           — async singleton factory (workers, services)
+    - shared_query_embeddings()         — scope embedding each query text once
     - get_embedding_service_dependency() — sync DI helper for FastAPI Depends()
     - initialize_embedding_service()    — app startup initializer
     - reset_embedding_service()         — test teardown
@@ -14,7 +15,11 @@ DI wiring:
 import asyncio
 import os
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
 
 from ..models.llm_provider import ModelType
 from .config import get_settings_instance
@@ -22,6 +27,7 @@ from .embedding_protocol import EmbeddingService
 from .exceptions import LLMConfigurationError
 from .external_model_resolver import resolve_external_model
 from .logging import get_logger
+from .query_embedding_cache import cached_query_embedding
 
 logger = get_logger(__name__)
 
@@ -207,6 +213,10 @@ class LocalEmbeddingService:
         return [e.tolist() for e in embeddings]
 
     async def embed_query(self, text: str, *, user_id: str | None = None) -> list[float]:
+        model_key = f"local:{self._model_name}:{self._dimension}:{self._query_prompt_name or ''}"
+        return await cached_query_embedding(model_key, text, lambda: self._encode_query(text))
+
+    async def _encode_query(self, text: str) -> list[float]:
         loop = asyncio.get_running_loop()
         embedding = await loop.run_in_executor(
             self._executor,
@@ -391,9 +401,69 @@ _service_manager = _EmbeddingServiceManager()
 _embedding_service: EmbeddingService | None = None
 
 
+# Query embeddings memoized within a shared_query_embeddings() scope, by text
+_query_embedding_scope: ContextVar[dict[str, asyncio.Future] | None] = ContextVar("query_embedding_scope", default=None)
+
+
+@contextmanager
+def shared_query_embeddings() -> Iterator[None]:
+    """Embed each distinct query text at most once within this scope.
+
+    While active, get_embedding_service() returns a wrapper whose
+    embed_query() shares one in-flight embedding per text across every
+    caller in the scope, including concurrent tasks spawned inside it.
+    Used when the same query is retrieved against several knowledge bases.
+    """
+    token = _query_embedding_scope.set({})
+    try:
+        yield
+    finally:
+        _query_embedding_scope.reset(token)
+
+
+class _SharedQueryEmbeddingService:
+    """EmbeddingService wrapper that memoizes embed_query() per scope."""
+
+    def __init__(self, service: EmbeddingService, memo: dict[str, asyncio.Future]) -> None:
+        self._service = service
+        self._memo = memo
+
+    @property
+    def dimension(self) -> int:
+        return self._service.dimension
+
+    @property
+    def model_name(self) -> str:
+        return self._service.model_name
+
+    async def embed_texts(self, texts: list[str], *, user_id: str | None = None) -> list[list[float]]:
+        return await self._service.embed_texts(texts, user_id=user_id)
+
+    async def embed_query(self, text: str, *, user_id: str | None = None) -> list[float]:
+        future = self._memo.get(text)
+        if future is None:
+            future = asyncio.ensure_future(self._service.embed_query(text, user_id=user_id))
+            self._memo[text] = future
+            # A failed embedding is not shared; the next caller retries it
+            future.add_done_callback(
+                lambda f: self._memo.pop(text, None) if not f.cancelled() and f.exception() else None
+            )
+        # Shield so one cancelled caller does not cancel the shared embedding
+        return await asyncio.shield(future)
+
+    async def embed_queries(self, texts: list[str], *, user_id: str | None = None) -> list[list[float]]:
+        return await self._service.embed_queries(texts, user_id=user_id)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
+
+
 async def get_embedding_service() -> EmbeddingService:
     """Get the configured embedding service (singleton).
 
+    Inside a shared_query_embeddings() scope the singleton is wrapped so
+    repeated embed_query() calls for the same text are computed once.
+
     Resolution order:
     1. Return cached singleton if already initialized.
     2. If SHU_LOCAL_EMBEDDING_ENABLED=true, create a LocalEmbeddingService
@@ -407,6 +477,15 @@ async def get_embedding_service() -> EmbeddingService:
     Suitable for use in background tasks, workers, and services. For
     FastAPI endpoints, prefer get_embedding_service_dependency().
     """
+    service = await _get_embedding_service_singleton()
+    memo = _query_embedding_scope.get()
+    if memo is None:
+        return service
+    return _SharedQueryEmbeddingService(service, memo)
+
+
+async def _get_embedding_service_singleton() -> EmbeddingService:
+    """Resolve and cache the embedding service singleton."""
     global _embedding_service  # noqa: PLW0603
 
     if _embedding_service is not None:
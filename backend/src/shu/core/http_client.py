@@ -1,9 +1,15 @@
 """HTTP client management for Shu RAG Backend.
 
 This module provides a centralized HTTP client with connection pooling
-for external API calls (Google Drive, LLM providers, etc.).
+for external API calls (Google Drive, LLM providers, etc.), plus a registry
+of pooled per-provider clients that LLM clients and provider adapters
+borrow so chat turns reuse warm keep-alive connections.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import time
 from functools import lru_cache
 from typing import Any
 
@@ -55,6 +61,134 @@ class HTTPClientManager:
         await self.close()
 
 
+class ProviderClientPool:
+    """Process-wide registry of pooled HTTP clients for LLM provider APIs.
+
+    Clients are keyed by base URL, default headers (which carry the
+    provider credentials) and timeout, so every UnifiedLLMClient for the
+    same provider shares one connection pool instead of paying a fresh
+    TCP+TLS handshake per instance. Keys are hashed so credentials are
+    never held in the registry itself.
+
+    httpx clients are bound to the event loop they first connect on. If the
+    registry is used from a new loop (e.g. a fresh ``asyncio.run``), clients
+    from the old loop are closed (on that loop if it is still running) and
+    rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._stats: dict[str, dict[str, Any]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._settings = get_settings_instance()
+        self._http2_warned = False
+        # Strong references to in-flight closes of clients left by an old loop
+        self._closing: set[asyncio.Task] = set()
+
+    @staticmethod
+    def _pool_key(base_url: str, headers: dict[str, str], timeout: httpx.Timeout) -> str:
+        parts = [str(base_url), repr(timeout), *(f"{k.lower()}={v}" for k, v in sorted(headers.items()))]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _http2_enabled(self) -> bool:
+        if not self._settings.llm_http2_enabled:
+            return False
+        if importlib.util.find_spec("h2") is not None:
+            return True
+        if not self._http2_warned:
+            logger.warning("SHU_LLM_HTTP2_ENABLED is set but the 'h2' package is not installed; using HTTP/1.1")
+            self._http2_warned = True
+        return False
+
+    def _check_loop(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            if self._clients:
+                logger.debug("Event loop changed; closing %d pooled provider client(s)", len(self._clients))
+                self._close_stale(list(self._clients.values()), loop)
+            self._clients.clear()
+            self._stats.clear()
+            self._loop = loop
+
+    def _close_stale(self, clients: list[httpx.AsyncClient], loop: asyncio.AbstractEventLoop) -> None:
+        """Close clients left behind by the previous loop without blocking ``loop``."""
+        old_loop = self._loop
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            # Still serving another thread: close the clients where they live.
+            asyncio.run_coroutine_threadsafe(self._aclose_all(clients), old_loop)
+            return
+        # The old loop is gone; release what can be released from this one.
+        task = loop.create_task(self._aclose_all(clients))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _aclose_all(clients: list[httpx.AsyncClient]) -> None:
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled provider client: {e}")
+
+    def get_client(self, base_url: str, headers: dict[str, str], timeout: httpx.Timeout) -> httpx.AsyncClient:
+        """Borrow the shared client for a provider, creating it on first use.
+
+        Args:
+            base_url: Provider API base URL.
+            headers: Default headers, including authorization.
+            timeout: Default timeout for requests on the client.
+
+        Returns:
+            A pooled httpx.AsyncClient. Callers must not close it.
+
+        """
+        self._check_loop()
+        key = self._pool_key(base_url, headers, timeout)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            settings = self._settings
+            http2 = self._http2_enabled()
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                headers=headers,
+                timeout=timeout,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.llm_http_max_connections,
+                    max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+                    keepalive_expiry=settings.llm_http_keepalive_expiry,
+                ),
+            )
+            self._clients[key] = client
+            self._stats[key] = {"base_url": base_url, "http2": http2, "created_at": time.time(), "borrows": 0}
+            logger.debug("Created pooled provider client", extra={"base_url": base_url, "http2": http2})
+        self._stats[key]["borrows"] += 1
+        return client
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-pool metrics: base URL, borrow count and open connections."""
+        result = []
+        for key, client in self._clients.items():
+            entry = dict(self._stats[key])
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = getattr(pool, "connections", None)
+            if connections is not None:
+                entry["connections"] = len(connections)
+                entry["idle_connections"] = sum(1 for c in connections if c.is_idle())
+            result.append(entry)
+        return result
+
+    async def close(self) -> None:
+        """Close every pooled provider client."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._stats.clear()
+        await self._aclose_all(clients)
+
+
 # Global HTTP client manager instance
 http_client_manager = HTTPClientManager()
 
@@ -72,6 +206,13 @@ async def get_http_client() -> httpx.AsyncClient:
 
 
 async def close_http_client() -> None:
-    """Close HTTP client (call during shutdown)."""
+    """Close HTTP clients, including pooled provider clients (call during shutdown)."""
     manager = get_http_client_manager()
     await manager.close()
+    await get_provider_client_pool().close()
+
+
+@lru_cache(maxsize=1)
+def get_provider_client_pool() -> ProviderClientPool:
+    """Get the process-wide provider client pool."""
+    return ProviderClientPool()
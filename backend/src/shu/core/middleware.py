@@ -2,6 +2,12 @@
 
 This module provides middleware for request tracking, timing, and other
 cross-cutting concerns.
+
+All middleware here is pure ASGI (see ``ASGIMiddleware``) rather than
+Starlette's ``BaseHTTPMiddleware``: each ``BaseHTTPMiddleware`` layer runs
+the downstream app in a separate task and re-streams the response body
+through an in-memory channel, which added per-request overhead on every
+API call and per-chunk overhead on ``/chat`` SSE streams.
 """
 
 from __future__ import annotations
@@ -12,9 +18,10 @@ from collections.abc import Callable
 from datetime import UTC
 from typing import TYPE_CHECKING, ClassVar
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from shu.core.logging import get_logger
 
@@ -32,46 +39,96 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to add unique request IDs to all requests."""
+class ASGIMiddleware:
+    """Base class for Shu's pure-ASGI HTTP middleware.
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+    Subclasses implement up to two hooks:
 
-        # Store request ID in request state
-        request.state.request_id = request_id
+    - ``before_request`` inspects the request and returns a Response to
+      short-circuit, or None to continue down the stack.
+    - ``on_response_start`` edits the status line's headers as the
+      downstream response starts. The body is never touched, so streaming
+      responses pass through chunk by chunk.
 
-        # Call the next middleware/route handler
-        response = await call_next(request)
+    Request state is shared between layers through the ASGI scope, exactly
+    as it was with ``BaseHTTPMiddleware``. A short-circuit response still
+    flows through the outer layers' hooks but not through this layer's
+    own ``on_response_start``.
+    """
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope, receive)
+        response = await self.before_request(request)
+        if response is not None:
+            await response(scope, receive, send)
+            return
 
-class TimingMiddleware(BaseHTTPMiddleware):
-    """Enhanced timing middleware with query performance tracking."""
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self.on_response_start(request, message["status"], MutableHeaders(scope=message))
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Record start time
-        start_time = time.time()
+        await self.app(scope, receive, send_wrapper)
 
-        # Track database operations for query endpoints
-        db_operations = []
-        if "/query/" in request.url.path:
-            # We could track database operations here if needed
-            pass
+    async def before_request(self, request: Request) -> Response | None:
+        """Handle the incoming request; return a Response to short-circuit."""
+        return None
+
+    def on_response_start(self, request: Request, status_code: int, headers: MutableHeaders) -> None:
+        """Adjust the downstream response's headers before they are sent."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Run both hooks around an explicit ``call_next``.
 
-        # Call the next middleware/route handler
+        Mirrors the ``BaseHTTPMiddleware.dispatch`` signature so a single
+        layer can be exercised directly in unit tests and benchmarks.
+        """
+        response = await self.before_request(request)
+        if response is not None:
+            return response
         response = await call_next(request)
+        self.on_response_start(request, response.status_code, response.headers)
+        return response
+
+
+class RequestIDMiddleware(ASGIMiddleware):
+    """Middleware to add unique request IDs to all requests."""
+
+    async def before_request(self, request: Request) -> Response | None:
+        # Generate or extract request ID, and store it in request state
+        request.state.request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        return None
+
+    def on_response_start(self, request: Request, status_code: int, headers: MutableHeaders) -> None:
+        # Add request ID to response headers
+        headers["X-Request-ID"] = request.state.request_id
+
+
+class TimingMiddleware(ASGIMiddleware):
+    """Enhanced timing middleware with query performance tracking.
+
+    The duration covers the time until the response starts; for streaming
+    responses that is the time to the first byte, not the whole stream.
+    """
+
+    async def before_request(self, request: Request) -> Response | None:
+        # Record start time
+        request.state.request_start_time = time.time()
+        return None
 
+    def on_response_start(self, request: Request, status_code: int, headers: MutableHeaders) -> None:
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.time() - request.state.request_start_time
 
         # Add timing header
-        response.headers["X-Response-Time"] = f"{duration:.3f}s"
+        headers["X-Response-Time"] = f"{duration:.3f}s"
 
         # Enhanced logging for query endpoints
         if "/query/" in request.url.path:
@@ -80,11 +137,11 @@ class TimingMiddleware(BaseHTTPMiddleware):
                 extra={
                     "method": request.method,
                     "path": request.url.path,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "duration_ms": round(duration * 1000, 2),
                     "request_id": getattr(request.state, "request_id", "unknown"),
                     "user_id": getattr(request.state, "user", {}).get("user_id", "anonymous"),
-                    "db_operations": len(db_operations) if db_operations else 0,
+                    "db_operations": 0,
                 },
             )
         else:
@@ -94,42 +151,36 @@ class TimingMiddleware(BaseHTTPMiddleware):
                 extra={
                     "method": request.method,
                     "path": request.url.path,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "duration_ms": round(duration * 1000, 2),
                     "request_id": getattr(request.state, "request_id", "unknown"),
                     "user_id": getattr(request.state, "user", {}).get("user_id", "anonymous"),
                 },
             )
 
-        return response
-
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware(ASGIMiddleware):
     """Middleware to add security headers."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-
+    def on_response_start(self, request: Request, status_code: int, headers: MutableHeaders) -> None:
         # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        headers["X-Content-Type-Options"] = "nosniff"
+        headers["X-Frame-Options"] = "DENY"
+        headers["X-XSS-Protection"] = "1; mode=block"
+        headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
         # Enable FedCM API for same-origin contexts
         # Note: This is intentionally narrow; we only enable identity-credentials-get for self.
-        response.headers["Permissions-Policy"] = "identity-credentials-get=(self)"
+        headers["Permissions-Policy"] = "identity-credentials-get=(self)"
 
         # Prevent browser caching of API responses to ensure fresh data
         if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = "no-store"
-
-        return response
+            headers["Cache-Control"] = "no-store"
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+class AuthenticationMiddleware(ASGIMiddleware):
     """Global authentication middleware to enforce auth on protected endpoints."""
 
-    def __init__(self, app) -> None:
+    def __init__(self, app: ASGIApp) -> None:
         super().__init__(app)
         self.jwt_manager = JWTManager()
 
@@ -192,39 +243,88 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         ]
         return any(path.startswith(prefix) for prefix in public_prefixes)
 
-    async def _update_daily_login(self, db, user) -> None:
+    async def _load_principal(
+        self,
+        tenant_id: str | None,
+        lookup_stmt,
+        *,
+        user_id: str | None = None,
+        email: str | None = None,
+    ):
+        """Return ``(user, snapshot)`` for the request, from the principal cache when warm.
+
+        On a miss the row is read (with the preferences ``fetch_user`` needs)
+        on a short-lived session and cached. ``user`` is None when the row
+        does not exist; ``snapshot`` is None when it could not be cached.
+        """
+        from sqlalchemy.orm import selectinload
+
+        from ..auth.models import User
+        from ..auth.principal_cache import get_principal_cache
+        from ..core.database import get_async_session_local
+
+        principal_cache = get_principal_cache()
+        snapshot = await principal_cache.get(tenant_id, user_id=user_id, email=email)
+        if snapshot is not None:
+            return principal_cache.materialize(snapshot), snapshot
+
+        # ``async with`` guarantees a synchronous close on every exit path.
+        # The previous ``async for db in get_db(): ... break`` idiom
+        # suspended the generator and deferred close() to the asyncgen GC
+        # finalizer, which under load orphaned connections (main commit
+        # 76e9a28; pinned by test_auth_middleware_session_lifecycle).
+        async with get_async_session_local()() as db:
+            result = await db.execute(lookup_stmt.options(selectinload(User.preferences)))
+            current_user = result.scalar_one_or_none()
+        if current_user is None:
+            return None, None
+        return current_user, await principal_cache.set(tenant_id, current_user, email=email)
+
+    async def _update_daily_login(self, tenant_id: str | None, user, snapshot) -> None:
         """Update last_login if this is the user's first request of the day.
 
         This treats the first authenticated request each calendar day (in UTC)
         as a "login" event, providing accurate activity tracking even when
-        OAuth tokens are silently refreshed.
+        OAuth tokens are silently refreshed. The cached snapshot is refreshed
+        in place so the rest of the day's requests stay DB-free.
         """
         from datetime import datetime
 
+        from sqlalchemy import update
+
+        from ..auth.models import User
+        from ..auth.principal_cache import get_principal_cache
+        from ..core.database import get_async_session_local
+
         now = datetime.now(UTC)
 
         # Check if last_login is null or from a previous day
         if user.last_login is None or user.last_login.date() < now.date():
+            async with get_async_session_local()() as db:
+                await db.execute(update(User).where(User.id == user.id).values(last_login=now))
+                await db.commit()
             user.last_login = now
-            await db.commit()
             logger.debug(f"Updated daily login for user {user.id}")
+            if snapshot is not None:
+                snapshot["user"]["last_login"] = now.isoformat()
+                await get_principal_cache().store(tenant_id, snapshot)
 
     # TODO: Refactor this function. It's too complex (number of branches and statements).
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:  # noqa: PLR0912, PLR0915
+    async def before_request(self, request: Request) -> Response | None:  # noqa: PLR0912, PLR0915
         # Skip authentication for public endpoints
         """Authenticate incoming requests, validate user status against the database, and attach the resolved user context to request.state for downstream authorization.
 
-        Supports "Bearer <jwt>" and "ApiKey <key>" authorization. For Bearer tokens, validates the JWT and marks the request for a token refresh if the token is near expiry. For ApiKey auth, validates the configured global API key, marks the request.state.api_key_authenticated flag, and maps the API key to a configured user email. In all authenticated flows, verifies the corresponding user exists and is active in the database, then stores up-to-date user information on request.state.user. If authentication succeeds, forwards the request to the next handler; if authentication fails, returns an appropriate JSON error response. When a token refresh is required, the response will include the "X-Token-Refresh-Needed": "true" header.
+        Supports "Bearer <jwt>" and "ApiKey <key>" authorization. For Bearer tokens, validates the JWT and marks the request for a token refresh if the token is near expiry. For ApiKey auth, validates the configured global API key, marks the request.state.api_key_authenticated flag, and maps the API key to a configured user email. In all authenticated flows, verifies the corresponding user exists and is active in the database, then stores up-to-date user information on request.state.user. If authentication succeeds, the request continues down the stack; if authentication fails, an appropriate JSON error response is returned. When a token refresh is required, the response will include the "X-Token-Refresh-Needed": "true" header (see ``on_response_start``).
 
         Returns:
-            Response: The downstream handler's response on successful authentication, or a JSON error response with one of:
+            Response | None: None on successful authentication (or a public path), or a JSON error response with one of:
               - 401 Unauthorized for missing/invalid credentials or missing user mapping,
               - 400 Bad Request if the user account is inactive,
               - 500 Internal Server Error for database/validation errors.
 
         """
         if self._is_public_path(request.url.path):
-            return await call_next(request)
+            return None
 
         # Extract Authorization header
         auth_header = request.headers.get("Authorization")
@@ -287,7 +387,6 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             from sqlalchemy import select
 
             from ..auth.models import User
-            from ..core.database import get_async_session_local
 
             # Pick the tenant-resolution context shape that matches the auth
             # mode. The contextmanagers reset tenant_context on exit so the
@@ -307,19 +406,20 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 _tenant_ctx = tenant_context_for_user_id(user_data["user_id"])
                 _lookup_stmt = select(User).where(User.id == user_data["user_id"])
 
-            # Get database session — use async with to guarantee synchronous
-            # close on every exit path. The previous `async for db in get_db():
-            # ... break` idiom suspended the generator and deferred close() to
-            # the asyncgen GC finalizer, which under load orphaned connections
-            # (main commit 76e9a28; pinned by test_auth_middleware_session_lifecycle).
-            #
-            # The tenant_ctx wraps every DB op inside — the SELECT above, plus
-            # the last_login UPDATE below — so both run under the right RLS
-            # scope. Resetting on exit lets the FastAPI dep tree later set its
-            # own context cleanly.
-            async with get_async_session_local()() as db, _tenant_ctx:
-                result = await db.execute(_lookup_stmt)
-                current_user = result.scalar_one_or_none()
+            # The tenant_ctx wraps every DB op inside — the SELECT in
+            # _load_principal, plus the last_login UPDATE below — so both run
+            # under the right RLS scope. Resetting on exit lets the FastAPI dep
+            # tree later set its own context cleanly. A warm principal-cache
+            # entry skips the SELECT (and the session) entirely.
+            async with _tenant_ctx as tenant_id:
+                if getattr(request.state, "api_key_authenticated", False):
+                    current_user, principal = await self._load_principal(
+                        tenant_id, _lookup_stmt, email=settings.api_key_user_email
+                    )
+                else:
+                    current_user, principal = await self._load_principal(
+                        tenant_id, _lookup_stmt, user_id=user_data["user_id"]
+                    )
 
                 if not current_user:
                     missing = (
@@ -379,7 +479,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                         )
 
                 # Update last_login on first request of the day
-                await self._update_daily_login(db, current_user)
+                await self._update_daily_login(tenant_id, current_user, principal)
 
                 # Build user context for RBAC
                 if getattr(request.state, "api_key_authenticated", False):
@@ -416,24 +516,23 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             logger.error(f"Database error during user validation: {e}")
             return JSONResponse(status_code=500, content={"detail": "Authentication validation failed"})
 
-        # Store user data in request state for role-based authorization
+        # Store user data in request state for role-based authorization, and
+        # the principal snapshot so fetch_user can reuse it without a SELECT.
         request.state.user = user_data
+        request.state.principal = principal
 
         logger.debug(
             f"Authenticated user {user_data['email']} ({user_data['role']}) for {request.method} {request.url.path}"
         )
+        return None
 
-        # Process the request
-        response = await call_next(request)
-
+    def on_response_start(self, request: Request, status_code: int, headers: MutableHeaders) -> None:
         # Add refresh header if token needs refresh
-        if hasattr(request.state, "token_needs_refresh") and request.state.token_needs_refresh:
-            response.headers["X-Token-Refresh-Needed"] = "true"
-
-        return response
+        if getattr(request.state, "token_needs_refresh", False):
+            headers["X-Token-Refresh-Needed"] = "true"
 
 
-class MustChangePasswordMiddleware(BaseHTTPMiddleware):
+class MustChangePasswordMiddleware(ASGIMiddleware):
     """Middleware to enforce the must_change_password flag server-side.
 
     When an authenticated user has must_change_password=True, rejects all
@@ -453,7 +552,7 @@ class MustChangePasswordMiddleware(BaseHTTPMiddleware):
         "/api/v1/auth/refresh",
     }
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def before_request(self, request: Request) -> Response | None:
         """Check must_change_password flag and block disallowed requests."""
         user = getattr(request.state, "user", None)
 
@@ -473,10 +572,10 @@ class MustChangePasswordMiddleware(BaseHTTPMiddleware):
                     content={"detail": "Password change required. Please change your password before continuing."},
                 )
 
-        return await call_next(request)
+        return None
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware(ASGIMiddleware):
     """Middleware to apply rate limiting to API endpoints.
 
     Applies per-user rate limiting with configurable exclusions for
@@ -489,7 +588,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     - Retry-After: Seconds to wait (only on 429 responses)
     """
 
-    def __init__(self, app, excluded_paths: set[str] | None = None) -> None:
+    def __init__(self, app: ASGIApp, excluded_paths: set[str] | None = None) -> None:
         """Initialize the RateLimitMiddleware and configure paths excluded from rate limiting.
 
         Sets up a lazy holder for the rate limit service, a default set of public endpoints that bypass rate limiting, and a list of path prefixes to exclude.
@@ -574,30 +673,29 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return get_client_ip(request.headers, request.client.host if request.client else None)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def before_request(self, request: Request) -> Response | None:
         # Skip rate limiting for excluded paths
         """Enforce per-user or IP-based rate limits for incoming requests.
 
-        Skips enforcement for configured excluded paths or when the rate limit service is disabled. Determines an identifier from the authenticated user ID, falling back to the client IP. If the request exceeds the allowed rate, returns a 429 JSON response containing a retry_after value and rate-limit headers. Otherwise forwards the request to the next handler and attaches rate-limit headers from the rate limit service to the returned response.
+        Skips enforcement for configured excluded paths or when the rate limit service is disabled. Determines an identifier from the authenticated user ID, falling back to the client IP. If the request exceeds the allowed rate, returns a 429 JSON response containing a retry_after value and rate-limit headers. Otherwise the request continues and ``on_response_start`` attaches the rate-limit headers to the downstream response.
 
         Parameters
         ----------
             request (Request): The incoming HTTP request.
-            call_next (Callable): The next request handler to invoke.
 
         Returns
         -------
-            Response: A 429 JSON error response when the rate limit is exceeded, or the downstream response with rate-limit headers added.
+            Response | None: A 429 JSON error response when the rate limit is exceeded, otherwise None.
 
         """
         if self._is_excluded(request.url.path):
-            return await call_next(request)
+            return None
 
         rate_limit_service = self._get_rate_limit_service()
 
         # Skip if rate limiting is disabled
         if not rate_limit_service.enabled:
-            return await call_next(request)
+            return None
 
         # Get identifier (user ID or IP for anonymous)
         user_id = self._get_user_id(request)
@@ -631,14 +729,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 headers=result.to_headers(),
             )
 
-        # Process request
-        response = await call_next(request)
+        request.state.rate_limit_headers = result.to_headers()
+        return None
 
+    def on_response_start(self, request: Request, status_code: int, headers: MutableHeaders) -> None:
         # Add rate limit headers to successful responses only.
         # Don't overwrite headers on 429 responses - they may contain
         # rate limit info from a downstream handler (e.g., per-plugin limits).
-        if response.status_code != 429:
-            for header, value in result.to_headers().items():
-                response.headers[header] = value
-
-        return response
+        if status_code != 429:
+            for header, value in getattr(request.state, "rate_limit_headers", {}).items():
+                headers[header] = value
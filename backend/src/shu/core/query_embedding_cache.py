@@ -0,0 +1,144 @@
+"""Two-tier cache for query embeddings.
+
+Search, RAG rewrites and plugin KB searches embed the same short query texts
+over and over; each miss costs a local forward pass or a paid API round trip.
+Entries are keyed by (tenant, model variant, normalized text) and stored as
+packed little-endian float32 vectors:
+
+- Tier 1: a per-process LRU (``SHU_QUERY_EMBEDDING_CACHE_SIZE`` entries).
+- Tier 2: the shared CacheBackend under ``embed:query:{tenant}:{digest}``
+  for ``SHU_QUERY_EMBEDDING_CACHE_TTL`` seconds, so other workers and pods
+  reuse the vector.
+
+Shared-tier failures are logged and treated as misses; a cache outage never
+fails a query.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from .cache_backend import get_cache_backend
+from .config import get_settings_instance
+from .logging import get_logger
+from .tenant import tenant_context
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "embed:query"
+
+_local: OrderedDict[str, bytes] = OrderedDict()
+_local_lock = threading.Lock()
+_stats = dict.fromkeys(("local_hits", "shared_hits", "misses"), 0)
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize a query for cache keying: NFC, whitespace runs collapsed, trimmed."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _cache_key(model_key: str, text: str) -> str:
+    digest = hashlib.sha256(f"{model_key}\x00{normalize_query_text(text)}".encode()).hexdigest()
+    return f"{_KEY_PREFIX}:{tenant_context.get(None) or 'global'}:{digest}"
+
+
+def pack_vector(vector: list[float]) -> bytes:
+    """Pack an embedding as little-endian float32."""
+    packed = array("f", vector)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(data: bytes) -> list[float]:
+    """Inverse of ``pack_vector``."""
+    packed = array("f")
+    packed.frombytes(data)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _local_get(key: str) -> bytes | None:
+    with _local_lock:
+        data = _local.get(key)
+        if data is not None:
+            _local.move_to_end(key)
+        return data
+
+
+def _local_put(key: str, data: bytes, capacity: int) -> None:
+    if capacity <= 0:
+        return
+    with _local_lock:
+        _local[key] = data
+        _local.move_to_end(key)
+        while len(_local) > capacity:
+            _local.popitem(last=False)
+
+
+async def cached_query_embedding(
+    model_key: str,
+    text: str,
+    embed: Callable[[], Awaitable[list[float]]],
+) -> list[float]:
+    """Return the embedding of ``text`` under ``model_key``, calling ``embed`` on a miss.
+
+    ``model_key`` must capture everything that changes the vector for the
+    same text: model name, dimension, and any query prefix or prompt.
+    """
+    settings = get_settings_instance()
+    if not settings.query_embedding_cache_enabled:
+        return await embed()
+
+    key = _cache_key(model_key, text)
+    capacity = settings.query_embedding_cache_size
+    ttl = settings.query_embedding_cache_ttl
+
+    data = _local_get(key)
+    if data is not None:
+        _stats["local_hits"] += 1
+        return unpack_vector(data)
+
+    if ttl > 0:
+        try:
+            data = await (await get_cache_backend()).get_bytes(key)
+        except Exception as e:
+            logger.debug("Query embedding cache read failed: %s", e)
+            data = None
+        if data is not None:
+            _stats["shared_hits"] += 1
+            _local_put(key, data, capacity)
+            return unpack_vector(data)
+
+    _stats["misses"] += 1
+    vector = await embed()
+    data = pack_vector(vector)
+    _local_put(key, data, capacity)
+    if ttl > 0:
+        try:
+            await (await get_cache_backend()).set_bytes(key, data, ttl_seconds=ttl)
+        except Exception as e:
+            logger.debug("Query embedding cache write failed: %s", e)
+    return vector
+
+
+def query_embedding_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters and the local tier's current size."""
+    with _local_lock:
+        size = len(_local)
+    return {**_stats, "local_entries": size}
+
+
+def clear_query_embedding_cache() -> None:
+    """Drop the local tier and zero the counters (tests, model swaps)."""
+    with _local_lock:
+        _local.clear()
+    for key in _stats:
+        _stats[key] = 0
@@ -2,11 +2,13 @@
 
 This module defines the QueueBackend protocol that provides a unified interface
 for work queue operations implementing the Competing Consumers pattern. It supports
-two interchangeable implementations:
+three interchangeable implementations:
 - RedisQueueBackend: For horizontally-scaled deployments with multiple worker replicas
+- RedisStreamsQueueBackend: The same on Redis Streams and consumer groups
 - InMemoryQueueBackend: For single-node/development deployments
 
-Backend selection is automatic based on the SHU_REDIS_URL configuration.
+Backend selection is automatic based on the SHU_REDIS_URL configuration;
+SHU_QUEUE_REDIS_STRUCTURE=streams picks the streams backend.
 
 Example usage:
     # In FastAPI endpoints (preferred - dependency injection):
@@ -28,6 +30,8 @@ Example usage:
 
 import asyncio
 import json
+import os
+import socket
 import threading
 import time
 import uuid
@@ -285,6 +289,19 @@ class Job:
             ) from e
 
 
+def _serialize_by_queue(jobs: list[Job]) -> dict[str, list[str]]:
+    """Serialize ``jobs`` grouped by queue name, preserving order within each queue."""
+    grouped: dict[str, list[str]] = defaultdict(list)
+    for job in jobs:
+        try:
+            grouped[job.queue_name].append(job.to_json())
+        except JobSerializationError as e:
+            raise QueueOperationError(
+                f"Failed to enqueue job: {e.message}", details={"job_id": job.id, "error": str(e)}
+            ) from e
+    return grouped
+
+
 # =============================================================================
 # QueueBackend Protocol
 # =============================================================================
@@ -348,6 +365,26 @@ class QueueBackend(Protocol):
         """
         ...
 
+    async def enqueue_many(self, jobs: list[Job]) -> int:
+        """Add several jobs in as few backend round trips as possible.
+
+        Jobs keep their relative order within each queue. Every job is
+        serialized before anything is pushed, so a serialization failure
+        enqueues nothing.
+
+        Args:
+            jobs: The jobs to enqueue; they may target different queues.
+
+        Returns:
+            The number of jobs enqueued.
+
+        Raises:
+            QueueConnectionError: If the backend is unreachable.
+            QueueOperationError: If a job cannot be serialized.
+
+        """
+        ...
+
     async def dequeue(
         self,
         queue_name: str,
@@ -388,6 +425,27 @@ class QueueBackend(Protocol):
         """
         ...
 
+    async def wait_for_jobs(self, queue_names: list[str], timeout_seconds: float) -> bool:
+        """Block until any of the given queues may have a job, without claiming it.
+
+        Lets a consumer of several queues sleep on all of them at once and
+        then claim through dequeue(), so capacity checks and fair ordering
+        stay in the caller's hands. A True result is a hint, not a
+        reservation: a competing consumer may claim the job first.
+
+        Args:
+            queue_names: The queues to wait on.
+            timeout_seconds: Maximum seconds to wait. Must be positive.
+
+        Returns:
+            True if woken by new work, False if the timeout elapsed.
+
+        Raises:
+            QueueConnectionError: If the backend is unreachable.
+
+        """
+        ...
+
     async def acknowledge(self, job: Job) -> bool:
         """Acknowledge successful processing of a job.
 
@@ -820,6 +878,32 @@ class InMemoryQueueBackend:
         logger.debug("Job enqueued", extra={"job_id": job.id, "queue_name": job.queue_name})
         return True
 
+    async def enqueue_many(self, jobs: list[Job]) -> int:
+        """Add several jobs under a single lock acquisition.
+
+        Args:
+            jobs: The jobs to enqueue; they may target different queues.
+
+        Returns:
+            The number of jobs enqueued.
+
+        Raises:
+            QueueOperationError: If a job cannot be serialized (nothing is enqueued).
+
+        """
+        grouped = _serialize_by_queue(jobs)
+        with self._lock:
+            for queue_name, payloads in grouped.items():
+                self._queues[queue_name].extend(payloads)
+            events = [self._get_event(queue_name) for queue_name in grouped]
+
+        for event in events:
+            event.set()
+
+        if grouped:
+            logger.debug("Jobs enqueued", extra={"count": len(jobs), "queues": list(grouped)})
+        return len(jobs)
+
     async def dequeue(
         self,
         queue_name: str,
@@ -902,6 +986,38 @@ class InMemoryQueueBackend:
             except TimeoutError:
                 return None
 
+    async def wait_for_jobs(self, queue_names: list[str], timeout_seconds: float) -> bool:
+        """Block until any of the given queues has a job, without claiming it.
+
+        Waits on the per-queue events that enqueue() sets.
+
+        Args:
+            queue_names: The queues to wait on.
+            timeout_seconds: Maximum seconds to wait.
+
+        Returns:
+            True if a job is (or became) available, False on timeout.
+
+        """
+        with self._lock:
+            events = []
+            for queue_name in queue_names:
+                self._restore_expired_jobs(queue_name)
+                self._move_scheduled_jobs(queue_name)
+                if self._queues[queue_name]:
+                    return True
+                event = self._get_event(queue_name)
+                event.clear()
+                events.append(event)
+
+        waiters = [asyncio.ensure_future(event.wait()) for event in events]
+        try:
+            done, _ = await asyncio.wait(waiters, timeout=timeout_seconds, return_when=asyncio.FIRST_COMPLETED)
+            return bool(done)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
     async def acknowledge(self, job: Job) -> bool:
         """Acknowledge successful processing of a job.
 
@@ -1135,6 +1251,103 @@ class InMemoryQueueBackend:
 # =============================================================================
 
 
+# Pops the oldest job, registers it in the processing set and stores its
+# redelivery copy in one atomic step, so a crash can no longer lose a job
+# between the pop and the visibility bookkeeping.
+#
+# KEYS[1] = queue list, KEYS[2] = processing zset
+# ARGV[1] = now (epoch seconds), ARGV[2] = job-data key prefix
+# Returns nil when the queue is empty, {0, raw} for a payload that cannot be
+# parsed (dropped, as before), or {1, job_json} with attempts incremented.
+_DEQUEUE_SCRIPT = """
+local raw = redis.call('RPOP', KEYS[1])
+if not raw then
+  return nil
+end
+-- Decode arrays with cjson's array metatable where the server supports it
+-- (Redis 7+), so re-encoding keeps empty payload arrays as [] instead of {}.
+local array_mt = cjson.decode_array_with_array_mt
+if array_mt then array_mt(true) end
+local ok, job = pcall(cjson.decode, raw)
+if array_mt then array_mt(false) end
+if not ok or type(job) ~= 'table' or type(job['id']) ~= 'string' then
+  return {0, raw}
+end
+job['attempts'] = (tonumber(job['attempts']) or 0) + 1
+local job_json = cjson.encode(job)
+local visibility = tonumber(job['visibility_timeout']) or 300
+redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + visibility, job['id'])
+redis.call('SET', ARGV[2] .. job['id'], job_json, 'EX', visibility + 60)
+return {1, job_json}
+"""
+
+# Pushes a job and drops a wake-up token on the queue's ready list, which idle
+# workers block on across all of their queues (see wait_for_jobs). Tokens are
+# capped at ARGV[2] so they cannot pile up while every worker is busy.
+#
+# KEYS[1] = queue list, KEYS[2] = ready list
+# ARGV[1] = job JSON, ARGV[2] = token cap
+_ENQUEUE_SCRIPT = """
+redis.call('LPUSH', KEYS[1], ARGV[1])
+redis.call('LPUSH', KEYS[2], 1)
+redis.call('LTRIM', KEYS[2], 0, tonumber(ARGV[2]) - 1)
+return 1
+"""
+
+# Batch form of _ENQUEUE_SCRIPT: pushes every job in order and drops one wake-up
+# token per job, up to the cap.
+#
+# KEYS[1] = queue list, KEYS[2] = ready list
+# ARGV[1] = token cap, ARGV[2..] = job JSON
+_ENQUEUE_MANY_SCRIPT = """
+local cap = tonumber(ARGV[1])
+for i = 2, #ARGV do
+  redis.call('LPUSH', KEYS[1], ARGV[i])
+end
+for i = 1, math.min(#ARGV - 1, cap) do
+  redis.call('LPUSH', KEYS[2], 1)
+end
+redis.call('LTRIM', KEYS[2], 0, cap - 1)
+return #ARGV - 1
+"""
+
+# Restores in-flight jobs whose visibility timeout expired (to the front of the
+# queue) and promotes scheduled jobs that are due, at most ARGV[3] of each.
+#
+# KEYS[1] = queue list, KEYS[2] = processing zset, KEYS[3] = scheduled zset,
+# KEYS[4] = ready list
+# ARGV[1] = now (epoch seconds), ARGV[2] = job-data key prefix, ARGV[3] = limit,
+# ARGV[4] = ready token cap
+# Returns {restored, promoted}.
+_SWEEP_SCRIPT = """
+local restored = 0
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, id in ipairs(expired) do
+  local key = ARGV[2] .. id
+  local job_json = redis.call('GET', key)
+  if job_json then
+    redis.call('RPUSH', KEYS[1], job_json)
+    restored = restored + 1
+  end
+  redis.call('ZREM', KEYS[2], id)
+  redis.call('DEL', key)
+end
+local ready = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, job_json in ipairs(ready) do
+  redis.call('LPUSH', KEYS[1], job_json)
+  redis.call('ZREM', KEYS[3], job_json)
+end
+local moved = math.min(restored + #ready, tonumber(ARGV[4]))
+if moved > 0 then
+  for _ = 1, moved do
+    redis.call('LPUSH', KEYS[4], 1)
+  end
+  redis.call('LTRIM', KEYS[4], 0, tonumber(ARGV[4]) - 1)
+end
+return {restored, #ready}
+"""
+
+
 class RedisQueueBackend:
     """Redis-backed queue implementation for horizontally-scaled deployments.
 
@@ -1150,6 +1363,7 @@ class RedisQueueBackend:
         - queue:{name}:scheduled - Sorted set for delayed jobs
           (score = execute_at timestamp)
         - queue:{name}:job:{id} - Hash storing job data while in processing
+        - queue:{name}:ready - List of wake-up tokens for idle workers
 
     This backend is suitable for:
         - Multi-node deployments with multiple worker replicas
@@ -1158,10 +1372,13 @@ class RedisQueueBackend:
         - Deployments requiring job persistence across restarts
 
     Features:
-        - BRPOP for efficient blocking wait without polling
-        - Atomic operations prevent race conditions
+        - Single-round-trip atomic dequeue (server-side script pops the job,
+          registers its visibility timeout and stores its redelivery copy)
+        - Blocking wait without polling
         - Visibility timeout with automatic redelivery
         - Scheduled job support with sorted sets
+        - Expired-job restore and scheduled-job promotion run as a
+          rate-limited sweep rather than on every dequeue
 
     Thread Safety:
         Redis handles concurrency natively. Multiple workers can safely
@@ -1191,11 +1408,15 @@ class RedisQueueBackend:
 
     """
 
+    _SWEEP_BATCH_SIZE = 100  # Max expired and max scheduled jobs moved per sweep
+    _READY_TOKEN_CAP = 64  # Max wake-up tokens kept per queue
+
     def __init__(
         self,
         redis_client: Any,
         *,
         namespace: str | None = None,
+        sweep_interval_seconds: float = 0.0,
     ) -> None:
         """Initialize with an existing Redis client.
 
@@ -1214,10 +1435,19 @@ class RedisQueueBackend:
                 is collision avoidance between **deployments** sharing one
                 Redis; tenant isolation comes from RLS and the dispatch
                 wrapper's per-job ``tenant_context.set``.
+            sweep_interval_seconds: Minimum seconds between sweeps of a queue
+                (restoring expired in-flight jobs and promoting due scheduled
+                jobs). ``0`` sweeps before every read; production wires
+                ``SHU_QUEUE_SWEEP_INTERVAL_SECONDS``.
 
         """
         self._client = redis_client
         self._prefix = f"{namespace}:" if namespace else ""
+        self._sweep_interval = sweep_interval_seconds
+        # Monotonic timestamp of the last sweep per queue name
+        self._last_sweep: dict[str, float] = {}
+        # Registered server-side scripts, keyed by source (loaded lazily)
+        self._scripts: dict[str, Any] = {}
 
     def _queue_key(self, queue_name: str) -> str:
         """Get the Redis key for the main queue list."""
@@ -1235,114 +1465,106 @@ class RedisQueueBackend:
         """Get the Redis key for storing job data while in processing."""
         return f"{self._prefix}queue:{queue_name}:job:{job_id}"
 
-    async def _restore_expired_jobs(self, queue_name: str) -> int:
-        """Move expired processing jobs back to the queue.
+    def _ready_key(self, queue_name: str) -> str:
+        """Get the Redis key for the wake-up token list."""
+        return f"{self._prefix}queue:{queue_name}:ready"
 
-        Jobs that have exceeded their visibility timeout are restored
-        to the front of the queue for reprocessing.
+    def _script(self, source: str) -> Any:
+        """Return the registered script for ``source``, registering it on first use."""
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = self._client.register_script(source)
+        return script
+
+    async def _sweep(self, queue_name: str) -> tuple[int, int]:
+        """Restore expired in-flight jobs and promote due scheduled jobs.
+
+        Expired jobs go to the front of the queue for priority reprocessing;
+        scheduled jobs whose execute_at has passed go to the back. Runs as a
+        single server-side script, bounded to ``_SWEEP_BATCH_SIZE`` jobs of each
+        kind per call.
 
         Args:
-            queue_name: The queue to check for expired jobs.
+            queue_name: The queue to sweep.
 
         Returns:
-            Number of jobs restored.
+            Tuple of (jobs restored, jobs promoted).
 
         """
-        now = time.time()
-        processing_key = self._processing_key(queue_name)
-        queue_key = self._queue_key(queue_name)
-
         try:
-            # Get all expired jobs (score <= now)
-            expired_job_ids = await self._client.zrangebyscore(
-                processing_key,
-                "-inf",
-                now,
+            restored, promoted = await self._script(_SWEEP_SCRIPT)(
+                keys=[
+                    self._queue_key(queue_name),
+                    self._processing_key(queue_name),
+                    self._scheduled_key(queue_name),
+                    self._ready_key(queue_name),
+                ],
+                args=[time.time(), self._job_key(queue_name, ""), self._SWEEP_BATCH_SIZE, self._READY_TOKEN_CAP],
             )
-
-            if not expired_job_ids:
-                return 0
-
-            restored_count = 0
-            for job_id in expired_job_ids:
-                # Get the job data
-                job_key = self._job_key(queue_name, job_id)
-                job_json = await self._client.get(job_key)
-
-                if job_json:
-                    # Use RPUSH to add to end (will be dequeued first with RPOP)
-                    # This gives expired jobs priority reprocessing
-                    await self._client.rpush(queue_key, job_json)
-                    restored_count += 1
-                    logger.debug(
-                        "Restored expired job to queue",
-                        extra={"job_id": job_id, "queue_name": queue_name},
-                    )
-
-                # Remove from processing set and delete job data
-                await self._client.zrem(processing_key, job_id)
-                await self._client.delete(job_key)
-
-            return restored_count
-
         except Exception as e:
             logger.error(
-                f"Failed to restore expired jobs: {e}",
+                f"Failed to sweep queue: {e}",
                 extra={"queue_name": queue_name, "error": str(e)},
             )
-            return 0
+            return 0, 0
 
-    async def _move_scheduled_jobs(self, queue_name: str) -> int:
-        """Move scheduled jobs that are ready to the main queue.
+        if restored or promoted:
+            logger.debug(
+                "Swept queue",
+                extra={"queue_name": queue_name, "restored": restored, "promoted": promoted},
+            )
+        return int(restored), int(promoted)
 
-        Jobs whose execute_at timestamp has passed are moved from the
-        scheduled sorted set to the main queue.
+    async def _maybe_sweep(self, queue_name: str) -> None:
+        """Sweep ``queue_name`` if ``sweep_interval_seconds`` has elapsed since its last sweep."""
+        now = time.monotonic()
+        last = self._last_sweep.get(queue_name)
+        if last is not None and now - last < self._sweep_interval:
+            return
+        self._last_sweep[queue_name] = now
+        await self._sweep(queue_name)
+
+    async def _push(self, queue_name: str, job_json: str) -> None:
+        """Push a serialized job onto the queue and wake one idle worker."""
+        await self._script(_ENQUEUE_SCRIPT)(
+            keys=[self._queue_key(queue_name), self._ready_key(queue_name)],
+            args=[job_json, self._READY_TOKEN_CAP],
+        )
 
-        Args:
-            queue_name: The queue to check for ready scheduled jobs.
+    async def _pop(self, queue_name: str) -> tuple[bool, Job | None]:
+        """Atomically pop the next job and register it as in flight.
 
         Returns:
-            Number of jobs moved.
+            ``(False, None)`` if the queue is empty, ``(True, None)`` if a
+            malformed payload was popped and dropped, else ``(True, job)``.
 
         """
-        now = time.time()
-        scheduled_key = self._scheduled_key(queue_name)
-        queue_key = self._queue_key(queue_name)
+        result = await self._script(_DEQUEUE_SCRIPT)(
+            keys=[self._queue_key(queue_name), self._processing_key(queue_name)],
+            args=[time.time(), self._job_key(queue_name, "")],
+        )
+        if not result:
+            return False, None
 
+        parsed, job_json = result
         try:
-            # Get all ready jobs (score <= now)
-            ready_jobs = await self._client.zrangebyscore(
-                scheduled_key,
-                "-inf",
-                now,
-            )
-
-            if not ready_jobs:
-                return 0
-
-            moved_count = 0
-            for job_json in ready_jobs:
-                # Add to main queue
-                await self._client.lpush(queue_key, job_json)
-                # Remove from scheduled set
-                await self._client.zrem(scheduled_key, job_json)
-                moved_count += 1
-                logger.debug("Moved scheduled job to queue", extra={"queue_name": queue_name})
-
-            return moved_count
-
-        except Exception as e:
+            if not int(parsed):
+                raise JobSerializationError("Job payload is not a JSON object with an id")
+            return True, Job.from_json(job_json)
+        except JobSerializationError as e:
             logger.error(
-                f"Failed to move scheduled jobs: {e}",
+                f"Failed to deserialize job from queue: {e}",
                 extra={"queue_name": queue_name, "error": str(e)},
             )
-            return 0
+            # Skip this malformed job
+            return True, None
 
     async def enqueue(self, job: Job) -> bool:
         """Add a job to the queue.
 
-        Places the job at the end of the specified queue using LPUSH.
-        Jobs are dequeued from the other end using BRPOP (FIFO order).
+        Places the job at the end of the specified queue using LPUSH and
+        drops a wake-up token for workers blocked in wait_for_jobs(). Jobs
+        are dequeued from the other end (FIFO order).
 
         Args:
             job: The job to enqueue.
@@ -1362,15 +1584,13 @@ class RedisQueueBackend:
                 f"Failed to enqueue job: {e.message}", details={"job_id": job.id, "error": str(e)}
             ) from e
 
-        queue_key = self._queue_key(job.queue_name)
-
         try:
-            await self._client.lpush(queue_key, job_json)
+            await self._push(job.queue_name, job_json)
             logger.debug("Job enqueued", extra={"job_id": job.id, "queue_name": job.queue_name})
             return True
         except Exception as e:
             logger.error(
-                f"Redis LPUSH failed for queue '{job.queue_name}': {e}",
+                f"Redis enqueue failed for queue '{job.queue_name}': {e}",
                 extra={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
             )
             raise QueueConnectionError(
@@ -1378,6 +1598,39 @@ class RedisQueueBackend:
                 details={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
             ) from e
 
+    async def enqueue_many(self, jobs: list[Job]) -> int:
+        """Add several jobs with one server-side script call per target queue.
+
+        Args:
+            jobs: The jobs to enqueue; they may target different queues.
+
+        Returns:
+            The number of jobs enqueued.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+            QueueOperationError: If a job cannot be serialized (nothing is enqueued).
+
+        """
+        grouped = _serialize_by_queue(jobs)
+        for queue_name, payloads in grouped.items():
+            try:
+                await self._script(_ENQUEUE_MANY_SCRIPT)(
+                    keys=[self._queue_key(queue_name), self._ready_key(queue_name)],
+                    args=[self._READY_TOKEN_CAP, *payloads],
+                )
+            except Exception as e:
+                logger.error(
+                    f"Redis batch enqueue failed for queue '{queue_name}': {e}",
+                    extra={"queue_name": queue_name, "count": len(payloads), "error": str(e)},
+                )
+                raise QueueConnectionError(
+                    f"Failed to enqueue {len(payloads)} jobs to queue '{queue_name}'",
+                    details={"queue_name": queue_name, "count": len(payloads), "error": str(e)},
+                ) from e
+            logger.debug("Jobs enqueued", extra={"queue_name": queue_name, "count": len(payloads)})
+        return len(jobs)
+
     async def dequeue(
         self,
         queue_name: str,
@@ -1385,9 +1638,10 @@ class RedisQueueBackend:
     ) -> Job | None:
         """Remove and return the next job from the queue.
 
-        Uses BRPOP for efficient blocking wait. When a job is dequeued,
-        it is added to the processing sorted set with a score equal to
-        the visibility timeout expiration timestamp.
+        The pop, the processing-set registration (score = visibility timeout
+        expiration timestamp) and the redelivery copy are written by a single
+        server-side script in one round trip. Blocking waits use BLMOVE on the
+        queue onto itself, which wakes on the next push without removing it.
 
         Args:
             queue_name: The queue to dequeue from.
@@ -1405,57 +1659,33 @@ class RedisQueueBackend:
 
         """
         queue_key = self._queue_key(queue_name)
-        processing_key = self._processing_key(queue_name)
+        deadline = None if not timeout_seconds else time.monotonic() + timeout_seconds
 
         try:
-            # First, restore any expired jobs and move scheduled jobs
-            await self._restore_expired_jobs(queue_name)
-            await self._move_scheduled_jobs(queue_name)
+            await self._maybe_sweep(queue_name)
 
-            # Dequeue using BRPOP or RPOP
-            if timeout_seconds is None:
-                # Non-blocking: use RPOP
-                result = await self._client.rpop(queue_key)
-            elif timeout_seconds == 0:
-                # Block indefinitely: use BRPOP with 0 timeout
-                result = await self._client.brpop(queue_key, timeout=0)
-                if result:
-                    result = result[1]  # BRPOP returns (key, value)
-            else:
-                # Block with timeout: use BRPOP
-                result = await self._client.brpop(queue_key, timeout=timeout_seconds)
-                if result:
-                    result = result[1]  # BRPOP returns (key, value)
+            while True:
+                popped, job = await self._pop(queue_name)
+                if popped:
+                    break
+                if timeout_seconds is None:
+                    return None
 
-            if not result:
-                return None
+                remaining = 0.0
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                # Block until the queue is non-empty without taking anything:
+                # moving the tail element back onto the tail of the same list is
+                # a no-op. The job itself is then claimed by the atomic pop, so
+                # a consumer that dies while waiting can never strand a job.
+                if await self._client.blmove(queue_key, queue_key, remaining, "RIGHT", "RIGHT") is None:
+                    return None
 
-            # Parse the job
-            try:
-                job = Job.from_json(result)
-            except JobSerializationError as e:
-                logger.error(
-                    f"Failed to deserialize job from queue: {e}",
-                    extra={"queue_name": queue_name, "error": str(e)},
-                )
-                # Skip this malformed job
+            if job is None:
                 return None
 
-            # Increment attempts
-            job.attempts += 1
-
-            # Add to processing set with visibility timeout
-            expiry = time.time() + job.visibility_timeout
-            await self._client.zadd(processing_key, {job.id: expiry})
-
-            # Store job data for potential redelivery
-            job_key = self._job_key(queue_name, job.id)
-            await self._client.set(
-                job_key,
-                job.to_json(),
-                ex=job.visibility_timeout + 60,  # Extra buffer for cleanup
-            )
-
             logger.debug(
                 "Job dequeued",
                 extra={
@@ -1476,6 +1706,40 @@ class RedisQueueBackend:
                 details={"queue_name": queue_name, "error": str(e)},
             ) from e
 
+    async def wait_for_jobs(self, queue_names: list[str], timeout_seconds: float) -> bool:
+        """Block until any of the given queues receives a job, without claiming it.
+
+        A single BRPOP across the queues' ready lists consumes one wake-up
+        token, so each enqueue wakes at most one idle worker. Tokens can be
+        stale (the job was claimed by a busy worker first); the caller simply
+        finds nothing on its next dequeue and waits again.
+
+        Args:
+            queue_names: The queues to wait on.
+            timeout_seconds: Maximum seconds to wait. Must be positive.
+
+        Returns:
+            True if a wake-up token was received, False on timeout.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+
+        """
+        if not queue_names:
+            return False
+        try:
+            result = await self._client.brpop([self._ready_key(name) for name in queue_names], timeout=timeout_seconds)
+            return result is not None
+        except Exception as e:
+            logger.error(
+                f"Redis wait for jobs failed: {e}",
+                extra={"queue_names": queue_names, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                "Failed to wait for jobs",
+                details={"queue_names": queue_names, "error": str(e)},
+            ) from e
+
     async def acknowledge(self, job: Job) -> bool:
         """Acknowledge successful processing of a job.
 
@@ -1548,7 +1812,6 @@ class RedisQueueBackend:
         """
         processing_key = self._processing_key(job.queue_name)
         job_key = self._job_key(job.queue_name, job.id)
-        queue_key = self._queue_key(job.queue_name)
 
         try:
             # Remove from processing set
@@ -1559,7 +1822,7 @@ class RedisQueueBackend:
 
             if requeue and job.attempts < job.max_attempts:
                 # Requeue the job
-                await self._client.lpush(queue_key, job.to_json())
+                await self._push(job.queue_name, job.to_json())
                 logger.debug(
                     "Job rejected and requeued",
                     extra={
@@ -1620,9 +1883,7 @@ class RedisQueueBackend:
         queue_key = self._queue_key(queue_name)
 
         try:
-            # First restore any expired jobs and move scheduled jobs
-            await self._restore_expired_jobs(queue_name)
-            await self._move_scheduled_jobs(queue_name)
+            await self._maybe_sweep(queue_name)
 
             # LRANGE returns elements from start to end (inclusive)
             # For FIFO queue with LPUSH/RPOP, newest items are at index 0
@@ -1654,8 +1915,7 @@ class RedisQueueBackend:
         """Get the number of jobs waiting to be picked up."""
         queue_key = self._queue_key(queue_name)
         try:
-            await self._restore_expired_jobs(queue_name)
-            await self._move_scheduled_jobs(queue_name)
+            await self._maybe_sweep(queue_name)
             return await self._client.llen(queue_key)
         except Exception as e:
             raise QueueConnectionError(
@@ -1667,7 +1927,7 @@ class RedisQueueBackend:
         """Get the number of jobs currently being processed."""
         processing_key = self._processing_key(queue_name)
         try:
-            await self._restore_expired_jobs(queue_name)
+            await self._maybe_sweep(queue_name)
             return await self._client.zcard(processing_key)
         except Exception as e:
             raise QueueConnectionError(
@@ -1680,8 +1940,7 @@ class RedisQueueBackend:
         queue_key = self._queue_key(queue_name)
         processing_key = self._processing_key(queue_name)
         try:
-            await self._restore_expired_jobs(queue_name)
-            await self._move_scheduled_jobs(queue_name)
+            await self._maybe_sweep(queue_name)
             pending = await self._client.llen(queue_key)
             active = await self._client.zcard(processing_key)
             return pending + active
@@ -1699,8 +1958,8 @@ class RedisQueueBackend:
         """Schedule a job to be enqueued after a delay.
 
         The job is added to a scheduled sorted set with a score equal to
-        the execute_at timestamp. A background process or the dequeue
-        operation moves ready jobs to the main queue.
+        the execute_at timestamp. The periodic queue sweep moves ready jobs
+        to the main queue.
 
         Args:
             job: The job to schedule.
@@ -1810,94 +2069,911 @@ class RedisQueueBackend:
 
 
 # =============================================================================
-# Global State for Singleton Pattern
+# RedisStreamsQueueBackend Implementation
 # =============================================================================
 
-# Global queue backend instance (singleton)
-_queue_backend: Optional["QueueBackend"] = None
-
+# Shared Lua helper: drop up to ``n`` wake-up tokens on a ready list capped at
+# ``cap`` entries (see RedisStreamsQueueBackend.wait_for_jobs).
+_STREAM_WAKE_LUA = """
+local function wake(key, n, cap)
+  if n <= 0 then
+    return
+  end
+  for _ = 1, math.min(n, cap) do
+    redis.call('LPUSH', key, 1)
+  end
+  redis.call('LTRIM', key, 0, cap - 1)
+end
+"""
 
-# =============================================================================
-# Redis Client Management
-# =============================================================================
+# Appends jobs to a stream and wakes one idle worker per job, up to the cap.
+#
+# KEYS[1] = stream, KEYS[2] = ready list
+# ARGV[1] = token cap, ARGV[2..] = job JSON
+_STREAM_ENQUEUE_SCRIPT = (
+    _STREAM_WAKE_LUA
+    + """
+for i = 2, #ARGV do
+  redis.call('XADD', KEYS[1], '*', 'job', ARGV[i])
+end
+wake(KEYS[2], #ARGV - 1, tonumber(ARGV[1]))
+return #ARGV - 1
+"""
+)
+
+# Settles deliveries: acknowledges and deletes each entry, re-adding its job
+# JSON at the tail when one is given. A job is only re-added if this call is
+# the one that acknowledged it, so an entry its worker acknowledged while it
+# was being reclaimed is never resurrected.
+#
+# KEYS[1] = stream, KEYS[2] = ready list
+# ARGV[1] = group, ARGV[2] = token cap, ARGV[3..] = (entry id, job JSON or '') pairs
+# Returns {acknowledged, requeued}.
+_STREAM_SETTLE_SCRIPT = (
+    _STREAM_WAKE_LUA
+    + """
+local acked, requeued = 0, 0
+for i = 3, #ARGV, 2 do
+  if redis.call('XACK', KEYS[1], ARGV[1], ARGV[i]) == 1 then
+    acked = acked + 1
+    if ARGV[i + 1] ~= '' then
+      redis.call('XADD', KEYS[1], '*', 'job', ARGV[i + 1])
+      requeued = requeued + 1
+    end
+  end
+  redis.call('XDEL', KEYS[1], ARGV[i])
+end
+wake(KEYS[2], requeued, tonumber(ARGV[2]))
+return {acked, requeued}
+"""
+)
+
+# Moves scheduled jobs that are due onto the stream, at most ARGV[2] per call.
+#
+# KEYS[1] = scheduled zset, KEYS[2] = stream, KEYS[3] = ready list
+# ARGV[1] = now (epoch seconds), ARGV[2] = limit, ARGV[3] = token cap
+_STREAM_PROMOTE_SCRIPT = (
+    _STREAM_WAKE_LUA
+    + """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, job_json in ipairs(due) do
+  redis.call('XADD', KEYS[2], '*', 'job', job_json)
+  redis.call('ZREM', KEYS[1], job_json)
+end
+wake(KEYS[3], #due, tonumber(ARGV[3]))
+return #due
+"""
+)
+
+# Claims abandoned deliveries for this consumer. An entry is abandoned once
+# it has been idle for the longer of the claim threshold and its own job's
+# visibility_timeout; entries idle past the threshold but still inside their
+# job's timeout are left with their worker. Scans at most ARGV[5] pending
+# entries from the cursor and returns the cursor to resume from ('-' once the
+# end is reached) with the claimed (entry id, job JSON) pairs flattened. A
+# deleted entry is claimed with '' as its JSON.
+#
+# KEYS[1] = stream
+# ARGV[1] = group, ARGV[2] = consumer, ARGV[3] = claim threshold (ms),
+# ARGV[4] = cursor, ARGV[5] = count
+_STREAM_RECLAIM_SCRIPT = """
+local floor = tonumber(ARGV[3])
+local pending = redis.call('XPENDING', KEYS[1], ARGV[1], 'IDLE', floor, ARGV[4], '+', ARGV[5])
+local claimed = {}
+for _, p in ipairs(pending) do
+  local job_json = ''
+  local threshold = floor
+  local entry = redis.call('XRANGE', KEYS[1], p[1], p[1])
+  if #entry > 0 then
+    local fields = entry[1][2]
+    for i = 1, #fields, 2 do
+      if fields[i] == 'job' then
+        job_json = fields[i + 1]
+      end
+    end
+    local ok, job = pcall(cjson.decode, job_json)
+    if ok and type(job) == 'table' and tonumber(job['visibility_timeout']) then
+      threshold = math.max(floor, tonumber(job['visibility_timeout']) * 1000)
+    end
+  end
+  if tonumber(p[3]) >= threshold then
+    redis.call('XCLAIM', KEYS[1], ARGV[1], ARGV[2], 0, p[1], 'JUSTID')
+    table.insert(claimed, p[1])
+    table.insert(claimed, job_json)
+  end
+end
+local cursor = '-'
+if #pending >= tonumber(ARGV[5]) then
+  cursor = '(' .. pending[#pending][1]
+end
+return {cursor, claimed}
+"""
 
+# Pushes back the point at which an in-flight entry becomes reclaimable, if
+# this consumer still owns it. Reclaim happens once an entry has been idle
+# for its reclaim threshold (see _STREAM_RECLAIM_SCRIPT), so "remaining
+# visibility" is threshold - idle and the new idle time is
+# threshold - (remaining + extra), floored at zero.
+#
+# KEYS[1] = stream
+# ARGV[1] = group, ARGV[2] = consumer, ARGV[3] = entry id,
+# ARGV[4] = reclaim threshold (ms), ARGV[5] = extra visibility (ms)
+# Returns 1 if extended, 0 if the entry is no longer ours.
+_STREAM_EXTEND_SCRIPT = """
+local pending = redis.call('XPENDING', KEYS[1], ARGV[1], ARGV[3], ARGV[3], 1)
+if #pending == 0 or pending[1][2] ~= ARGV[2] then
+  return 0
+end
+local threshold = tonumber(ARGV[4])
+local remaining = math.max(threshold - tonumber(pending[1][3]), 0) + tonumber(ARGV[5])
+local idle = math.max(threshold - remaining, 0)
+redis.call('XCLAIM', KEYS[1], ARGV[1], ARGV[2], 0, ARGV[3], 'IDLE', idle, 'JUSTID')
+return 1
+"""
 
-async def _get_shared_redis_client() -> Any:
-    """Get the shared Redis client from cache_backend.
 
-    This reuses the same Redis client singleton that cache_backend uses,
-    avoiding duplicate connections to Redis.
+class RedisStreamsQueueBackend:
+    """Redis Streams queue implementation with a consumer group per queue.
 
-    Returns:
-        An async Redis client instance.
+    Each queue (one per ``WorkloadType``) is a stream read by a single
+    consumer group, so every entry is delivered to exactly one consumer and
+    Redis itself tracks what is in flight, by whom and for how long.
 
-    Raises:
-        QueueConnectionError: If Redis connection fails.
+    Queue Structure:
+        - queue:{name}:stream - Stream of jobs; every worker process is a
+          consumer in its ``shu-workers`` group
+        - queue:{name}:stream:scheduled - Sorted set for delayed jobs
+          (score = execute_at timestamp)
+        - queue:{name}:stream:ready - List of wake-up tokens for idle workers
+
+    Compared with RedisQueueBackend:
+        - Dequeue is one XREADGROUP, which can also block natively
+        - In-flight jobs live in the group's pending entries list instead of
+          a processing set plus per-job keys; XPENDING and XINFO show pending
+          and stuck work directly
+        - Jobs whose worker died are reclaimed from the pending entries list
+          during the rate-limited sweep and re-added at the tail of the
+          stream with the abandoned attempt counted
+        - Acknowledged entries are deleted, so XLEN is pending + in flight
+
+    Visibility:
+        Redis measures how long a delivery has been idle rather than keeping
+        a deadline, so a delivery becomes reclaimable once it has been idle
+        for the longer of ``claim_idle_seconds`` and its job's
+        ``visibility_timeout``. Jobs are never redelivered inside their own
+        visibility timeout; jobs with timeouts shorter than the claim
+        threshold are recovered later than with RedisQueueBackend.
+        ``extend_visibility`` winds the idle clock back, up to that same
+        threshold.
+
+    Acknowledgement:
+        Stream entry IDs are tracked per process, so a job must be
+        acknowledged, rejected or extended through the backend instance that
+        dequeued it (the worker always does this).
 
     """
-    try:
-        from .cache_backend import CacheConnectionError, _get_redis_client
 
-        return await _get_redis_client()
-    except CacheConnectionError as e:
-        # Convert CacheConnectionError to QueueConnectionError
-        raise QueueConnectionError(f"Redis connection failed: {e.message}", details=e.details) from e
+    GROUP_NAME = "shu-workers"
+    _SWEEP_BATCH_SIZE = 100  # Max scheduled jobs promoted and entries reclaimed per sweep
+    _READY_TOKEN_CAP = 64  # Max wake-up tokens kept per queue
 
+    def __init__(
+        self,
+        redis_client: Any,
+        *,
+        namespace: str | None = None,
+        sweep_interval_seconds: float = 0.0,
+        claim_idle_seconds: int = 600,
+        consumer_name: str | None = None,
+    ) -> None:
+        """Initialize with an existing Redis client.
 
-# =============================================================================
-# Queue Backend Factory
-# =============================================================================
+        Args:
+            redis_client: An async Redis client instance with
+                ``decode_responses=True``, typically created by
+                ``get_queue_backend()``.
+            namespace: Static deployment prefix for every key, as for
+                RedisQueueBackend.
+            sweep_interval_seconds: Minimum seconds between sweeps of a queue
+                (promoting due scheduled jobs and reclaiming abandoned
+                deliveries). ``0`` sweeps before every read.
+            claim_idle_seconds: Minimum idle time after which an
+                unacknowledged delivery is treated as abandoned and
+                reclaimed; jobs with a longer ``visibility_timeout`` wait
+                for that instead.
+            consumer_name: Name of this process in the consumer groups.
+                Defaults to a unique ``host:pid:suffix`` name.
 
+        """
+        self._client = redis_client
+        self._prefix = f"{namespace}:" if namespace else ""
+        self._sweep_interval = sweep_interval_seconds
+        self._claim_idle_ms = claim_idle_seconds * 1000
+        self._consumer = consumer_name or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Monotonic timestamp of the last sweep per queue name
+        self._last_sweep: dict[str, float] = {}
+        # Reclaim scan cursor per queue name
+        self._claim_cursor: dict[str, str] = {}
+        # Queues whose consumer group is known to exist
+        self._groups: set[str] = set()
+        # Stream entry ID of each job this process has in flight
+        self._entry_ids: dict[str, str] = {}
+        # Registered server-side scripts, keyed by source (loaded lazily)
+        self._scripts: dict[str, Any] = {}
+
+    def _stream_key(self, queue_name: str) -> str:
+        """Get the Redis key for the queue's stream."""
+        return f"{self._prefix}queue:{queue_name}:stream"
 
-async def get_queue_backend() -> QueueBackend:
-    """Get the configured queue backend (singleton).
+    def _scheduled_key(self, queue_name: str) -> str:
+        """Get the Redis key for the scheduled sorted set."""
+        return f"{self._prefix}queue:{queue_name}:stream:scheduled"
+
+    def _ready_key(self, queue_name: str) -> str:
+        """Get the Redis key for the wake-up token list."""
+        return f"{self._prefix}queue:{queue_name}:stream:ready"
+
+    def _script(self, source: str) -> Any:
+        """Return the registered script for ``source``, registering it on first use."""
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = self._client.register_script(source)
+        return script
+
+    async def _ensure_group(self, queue_name: str) -> None:
+        """Create the queue's stream and consumer group if they do not exist yet."""
+        if queue_name in self._groups:
+            return
+        try:
+            # Start at 0 so jobs added before the group existed are delivered.
+            await self._client.xgroup_create(self._stream_key(queue_name), self.GROUP_NAME, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add(queue_name)
 
-    Selection logic:
-    1. If SHU_REDIS_URL is set -> RedisQueueBackend (connection failure is fatal)
-    2. If SHU_REDIS_URL is not set -> InMemoryQueueBackend
+    async def _settle(self, queue_name: str, settlements: list[tuple[str, str]]) -> tuple[int, int]:
+        """Acknowledge and delete entries, re-adding the given job JSON ('' drops the job).
 
-    This function is suitable for use in background tasks, schedulers, and
-    other non-FastAPI code. For FastAPI endpoints, prefer using
-    get_queue_backend_dependency() with Depends().
+        Returns:
+            Tuple of (entries acknowledged, jobs requeued).
 
-    Returns:
-        The configured QueueBackend instance.
+        """
+        args: list[Any] = [self.GROUP_NAME, self._READY_TOKEN_CAP]
+        for entry_id, job_json in settlements:
+            args += [entry_id, job_json]
+        acked, requeued = await self._script(_STREAM_SETTLE_SCRIPT)(
+            keys=[self._stream_key(queue_name), self._ready_key(queue_name)],
+            args=args,
+        )
+        return int(acked), int(requeued)
 
-    Raises:
-        QueueConnectionError: If SHU_REDIS_URL is set but Redis is unreachable.
+    @staticmethod
+    def _redelivery_json(job_json: str) -> str:
+        """Return the JSON to re-add for an abandoned entry, counting the lost attempt."""
+        try:
+            job = Job.from_json(job_json)
+        except JobSerializationError:
+            return ""
+        job.attempts += 1
+        return job.to_json()
 
-    Example:
-        backend = await get_queue_backend()
-        job = Job(queue_name="tasks", payload={"action": "process"})
-        await backend.enqueue(job)
+    async def _sweep(self, queue_name: str) -> tuple[int, int]:
+        """Promote due scheduled jobs and reclaim abandoned deliveries.
 
-    """
-    global _queue_backend  # noqa: PLW0603 # works for now
+        Deliveries idle for at least ``claim_idle_seconds`` and their job's
+        ``visibility_timeout`` are claimed, walking the pending entries with a
+        persistent cursor, and re-added at the tail of the stream.
 
-    if _queue_backend is not None:
-        return _queue_backend
+        Args:
+            queue_name: The queue to sweep.
 
-    from .config import DeploymentMode, get_settings_instance
+        Returns:
+            Tuple of (jobs reclaimed, jobs promoted).
 
-    settings = get_settings_instance()
+        """
+        stream_key = self._stream_key(queue_name)
+        try:
+            promoted = await self._script(_STREAM_PROMOTE_SCRIPT)(
+                keys=[self._scheduled_key(queue_name), stream_key, self._ready_key(queue_name)],
+                args=[time.time(), self._SWEEP_BATCH_SIZE, self._READY_TOKEN_CAP],
+            )
+            cursor, entries = await self._script(_STREAM_RECLAIM_SCRIPT)(
+                keys=[stream_key],
+                args=[
+                    self.GROUP_NAME,
+                    self._consumer,
+                    self._claim_idle_ms,
+                    self._claim_cursor.get(queue_name, "-"),
+                    self._SWEEP_BATCH_SIZE,
+                ],
+            )
+            self._claim_cursor[queue_name] = cursor
+            claimed = [
+                (entry_id, self._redelivery_json(job_json))
+                for entry_id, job_json in zip(entries[::2], entries[1::2], strict=True)
+            ]
+            reclaimed = (await self._settle(queue_name, claimed))[1] if claimed else 0
+        except Exception as e:
+            logger.error(
+                f"Failed to sweep queue stream: {e}",
+                extra={"queue_name": queue_name, "error": str(e)},
+            )
+            return 0, 0
 
-    if not settings.redis_enabled:
-        # Multi-tenant without Redis is structurally broken: every pod has its
-        # own InMemoryQueueBackend, so a job enqueued on one pod is invisible
-        # to a worker on another, and tenant isolation is moot because every
-        # tenant shares one process's memory anyway. Refuse to start rather
-        # than silently degrade.
-        if settings.deployment_mode == DeploymentMode.MULTI_TENANT:
-            raise RuntimeError(
-                "SHU_REDIS_URL is required when SHU_DEPLOYMENT_MODE=multi_tenant. "
-                "Without Redis, queues fragment across pods and the worker pipeline "
-                "loses cross-pod job delivery — the deployment cannot function correctly."
+        if reclaimed:
+            logger.warning(
+                "Reclaimed abandoned jobs",
+                extra={"queue_name": queue_name, "reclaimed": reclaimed},
             )
-        # Silo: a tenant is configured but Redis is missing — in-memory queues
-        # mean each pod's queue is invisible to the others, almost certainly a
-        # misconfigured hosted deploy. Warn loudly but continue so local dev
-        # still works; self_hosted has no shared-state expectation.
-        if settings.deployment_mode == DeploymentMode.SILO:
+        if promoted:
+            logger.debug("Promoted scheduled jobs", extra={"queue_name": queue_name, "promoted": promoted})
+        return reclaimed, int(promoted)
+
+    async def _maybe_sweep(self, queue_name: str) -> None:
+        """Sweep ``queue_name`` if ``sweep_interval_seconds`` has elapsed since its last sweep."""
+        now = time.monotonic()
+        last = self._last_sweep.get(queue_name)
+        if last is not None and now - last < self._sweep_interval:
+            return
+        self._last_sweep[queue_name] = now
+        await self._sweep(queue_name)
+
+    async def enqueue(self, job: Job) -> bool:
+        """Append a job to its queue's stream and wake one idle worker.
+
+        Args:
+            job: The job to enqueue.
+
+        Returns:
+            True if the job was successfully enqueued.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+            QueueOperationError: If the job cannot be serialized.
+
+        """
+        await self.enqueue_many([job])
+        logger.debug("Job enqueued", extra={"job_id": job.id, "queue_name": job.queue_name})
+        return True
+
+    async def enqueue_many(self, jobs: list[Job]) -> int:
+        """Append several jobs with one server-side script call per target queue.
+
+        Args:
+            jobs: The jobs to enqueue; they may target different queues.
+
+        Returns:
+            The number of jobs enqueued.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+            QueueOperationError: If a job cannot be serialized (nothing is enqueued).
+
+        """
+        grouped = _serialize_by_queue(jobs)
+        for queue_name, payloads in grouped.items():
+            try:
+                await self._ensure_group(queue_name)
+                await self._script(_STREAM_ENQUEUE_SCRIPT)(
+                    keys=[self._stream_key(queue_name), self._ready_key(queue_name)],
+                    args=[self._READY_TOKEN_CAP, *payloads],
+                )
+            except Exception as e:
+                logger.error(
+                    f"Redis stream enqueue failed for queue '{queue_name}': {e}",
+                    extra={"queue_name": queue_name, "count": len(payloads), "error": str(e)},
+                )
+                raise QueueConnectionError(
+                    f"Failed to enqueue {len(payloads)} jobs to queue '{queue_name}'",
+                    details={"queue_name": queue_name, "count": len(payloads), "error": str(e)},
+                ) from e
+        return len(jobs)
+
+    async def _read(self, queue_name: str, block_ms: int | None) -> tuple[str, dict[str, str] | None] | None:
+        """Read the next undelivered entry for this consumer with XREADGROUP."""
+        stream_key = self._stream_key(queue_name)
+        try:
+            response = await self._client.xreadgroup(
+                self.GROUP_NAME, self._consumer, {stream_key: ">"}, count=1, block=block_ms
+            )
+        except Exception as e:
+            if "NOGROUP" not in str(e):
+                raise
+            # The stream was deleted behind our back (e.g. FLUSHDB): recreate it.
+            self._groups.discard(queue_name)
+            await self._ensure_group(queue_name)
+            response = await self._client.xreadgroup(
+                self.GROUP_NAME, self._consumer, {stream_key: ">"}, count=1, block=block_ms
+            )
+        if not response or not response[0][1]:
+            return None
+        return response[0][1][0]
+
+    async def dequeue(
+        self,
+        queue_name: str,
+        timeout_seconds: int | None = None,
+    ) -> Job | None:
+        """Claim the next job from the queue's stream.
+
+        A single XREADGROUP delivers the entry to this consumer and records
+        it in the group's pending entries list; with a timeout it blocks on
+        the server until an entry arrives.
+
+        Args:
+            queue_name: The queue to dequeue from.
+            timeout_seconds: How long to wait for a job.
+                - If None, returns immediately (non-blocking).
+                - If 0, blocks indefinitely until a job is available.
+                - If positive, blocks for up to that many seconds.
+
+        Returns:
+            The next job with attempts incremented, or None if no job
+            is available within the timeout.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+
+        """
+        block_ms = None if timeout_seconds is None else int(timeout_seconds * 1000)
+        try:
+            await self._ensure_group(queue_name)
+            await self._maybe_sweep(queue_name)
+
+            entry = await self._read(queue_name, block_ms)
+            if entry is None:
+                return None
+
+            entry_id, fields = entry
+            try:
+                job = Job.from_json((fields or {}).get("job", ""))
+            except JobSerializationError as e:
+                logger.error(
+                    f"Failed to deserialize job from queue stream: {e}",
+                    extra={"queue_name": queue_name, "entry_id": entry_id, "error": str(e)},
+                )
+                # Drop the malformed entry so it is not reclaimed forever
+                await self._settle(queue_name, [(entry_id, "")])
+                return None
+
+            job.attempts += 1
+            self._entry_ids[job.id] = entry_id
+            logger.debug(
+                "Job dequeued",
+                extra={"job_id": job.id, "queue_name": queue_name, "attempts": job.attempts},
+            )
+            return job
+
+        except Exception as e:
+            logger.error(
+                f"Redis stream dequeue failed for queue '{queue_name}': {e}",
+                extra={"queue_name": queue_name, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                f"Failed to dequeue from queue '{queue_name}'",
+                details={"queue_name": queue_name, "error": str(e)},
+            ) from e
+
+    async def wait_for_jobs(self, queue_names: list[str], timeout_seconds: float) -> bool:
+        """Block until any of the given queues receives a job, without claiming it.
+
+        Enqueues drop wake-up tokens on a per-queue ready list, as in
+        RedisQueueBackend, so each new job wakes at most one idle worker
+        instead of every worker blocked on the stream.
+
+        Args:
+            queue_names: The queues to wait on.
+            timeout_seconds: Maximum seconds to wait. Must be positive.
+
+        Returns:
+            True if a wake-up token was received, False on timeout.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+
+        """
+        if not queue_names:
+            return False
+        try:
+            result = await self._client.brpop([self._ready_key(name) for name in queue_names], timeout=timeout_seconds)
+            return result is not None
+        except Exception as e:
+            logger.error(
+                f"Redis wait for jobs failed: {e}",
+                extra={"queue_names": queue_names, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                "Failed to wait for jobs",
+                details={"queue_names": queue_names, "error": str(e)},
+            ) from e
+
+    async def acknowledge(self, job: Job) -> bool:
+        """Acknowledge successful processing of a job.
+
+        XACKs and deletes the job's stream entry.
+
+        Args:
+            job: The job to acknowledge.
+
+        Returns:
+            True if the job was acknowledged, False if not found (already
+            settled, reclaimed after going idle, or dequeued elsewhere).
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+
+        """
+        entry_id = self._entry_ids.pop(job.id, None)
+        if entry_id is None:
+            logger.debug("Job not found for acknowledgment", extra={"job_id": job.id, "queue_name": job.queue_name})
+            return False
+
+        try:
+            acked, _ = await self._settle(job.queue_name, [(entry_id, "")])
+        except Exception as e:
+            logger.error(
+                f"Redis stream acknowledge failed for job '{job.id}': {e}",
+                extra={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                f"Failed to acknowledge job '{job.id}'",
+                details={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            ) from e
+
+        if acked:
+            logger.debug("Job acknowledged", extra={"job_id": job.id, "queue_name": job.queue_name})
+        else:
+            logger.debug("Job not found for acknowledgment", extra={"job_id": job.id, "queue_name": job.queue_name})
+        return bool(acked)
+
+    async def reject(
+        self,
+        job: Job,
+        requeue: bool = True,
+    ) -> bool:
+        """Reject a job, optionally requeueing it for retry.
+
+        The entry is acknowledged and deleted; if requeue is True and the job
+        hasn't exceeded max_attempts, it is re-added at the tail of the
+        stream in the same script call.
+
+        Args:
+            job: The job to reject.
+            requeue: If True, the job is returned to the queue
+                (if under max_attempts). If False, the job is discarded.
+
+        Returns:
+            True if the operation succeeded, False if this process has no
+            record of the delivery.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+
+        """
+        entry_id = self._entry_ids.pop(job.id, None)
+        if entry_id is None:
+            logger.debug("Job not found for rejection", extra={"job_id": job.id, "queue_name": job.queue_name})
+            return False
+
+        retry = requeue and job.attempts < job.max_attempts
+        try:
+            _, requeued = await self._settle(job.queue_name, [(entry_id, job.to_json() if retry else "")])
+        except Exception as e:
+            logger.error(
+                f"Redis stream reject failed for job '{job.id}': {e}",
+                extra={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                f"Failed to reject job '{job.id}'",
+                details={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            ) from e
+
+        if requeued:
+            logger.debug(
+                "Job rejected and requeued",
+                extra={"job_id": job.id, "queue_name": job.queue_name, "attempts": job.attempts},
+            )
+        elif requeue and not retry:
+            logger.warning(
+                "Job rejected and discarded (max attempts exceeded)",
+                extra={
+                    "job_id": job.id,
+                    "queue_name": job.queue_name,
+                    "attempts": job.attempts,
+                    "max_attempts": job.max_attempts,
+                },
+            )
+        else:
+            logger.debug("Job rejected and discarded", extra={"job_id": job.id, "queue_name": job.queue_name})
+        return True
+
+    async def peek(
+        self,
+        queue_name: str,
+        limit: int = 10,
+    ) -> list[Job]:
+        """View undelivered jobs without claiming them.
+
+        Reads the entries after the group's last-delivered ID with XRANGE.
+
+        Args:
+            queue_name: The queue to peek.
+            limit: Maximum number of jobs to return. Default is 10.
+
+        Returns:
+            List of jobs, oldest first (may be empty).
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+
+        """
+        stream_key = self._stream_key(queue_name)
+        try:
+            await self._ensure_group(queue_name)
+            await self._maybe_sweep(queue_name)
+            groups = await self._client.xinfo_groups(stream_key)
+            last_delivered = next((g["last-delivered-id"] for g in groups if g["name"] == self.GROUP_NAME), "0-0")
+            entries = await self._client.xrange(stream_key, f"({last_delivered}", "+", count=limit)
+
+            jobs = []
+            for _, fields in entries:
+                try:
+                    jobs.append(Job.from_json((fields or {}).get("job", "")))
+                except JobSerializationError:
+                    # Skip malformed jobs
+                    continue
+            return jobs
+
+        except Exception as e:
+            logger.error(
+                f"Redis stream peek failed for queue '{queue_name}': {e}",
+                extra={"queue_name": queue_name, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                f"Failed to peek queue '{queue_name}'",
+                details={"queue_name": queue_name, "error": str(e)},
+            ) from e
+
+    async def _counts(self, queue_name: str) -> tuple[int, int]:
+        """Return (entries in the stream, entries in flight)."""
+        stream_key = self._stream_key(queue_name)
+        await self._ensure_group(queue_name)
+        await self._maybe_sweep(queue_name)
+        length = await self._client.xlen(stream_key)
+        summary = await self._client.xpending(stream_key, self.GROUP_NAME)
+        return int(length), int(summary["pending"])
+
+    async def pending_count(self, queue_name: str) -> int:
+        """Get the number of jobs waiting to be picked up."""
+        try:
+            length, in_flight = await self._counts(queue_name)
+            return length - in_flight
+        except Exception as e:
+            raise QueueConnectionError(
+                f"Failed to get pending count for queue '{queue_name}'",
+                details={"queue_name": queue_name, "error": str(e)},
+            ) from e
+
+    async def active_count(self, queue_name: str) -> int:
+        """Get the number of jobs currently being processed."""
+        try:
+            return (await self._counts(queue_name))[1]
+        except Exception as e:
+            raise QueueConnectionError(
+                f"Failed to get active count for queue '{queue_name}'",
+                details={"queue_name": queue_name, "error": str(e)},
+            ) from e
+
+    async def total_count(self, queue_name: str) -> int:
+        """Get the total number of jobs in the system (pending + active)."""
+        try:
+            return (await self._counts(queue_name))[0]
+        except Exception as e:
+            raise QueueConnectionError(
+                f"Failed to get total count for queue '{queue_name}'",
+                details={"queue_name": queue_name, "error": str(e)},
+            ) from e
+
+    async def schedule(
+        self,
+        job: Job,
+        delay_seconds: int,
+    ) -> bool:
+        """Schedule a job to be enqueued after a delay.
+
+        The job is added to a scheduled sorted set with a score equal to
+        the execute_at timestamp. The periodic queue sweep moves due jobs
+        onto the stream.
+
+        Args:
+            job: The job to schedule.
+            delay_seconds: Seconds to wait before enqueueing. Must be
+                positive.
+
+        Returns:
+            True if the job was scheduled.
+
+        Raises:
+            QueueConnectionError: If the Redis server is unreachable.
+            ValueError: If delay_seconds is not positive.
+
+        """
+        if delay_seconds <= 0:
+            raise ValueError("delay_seconds must be positive")
+
+        try:
+            job_json = job.to_json()
+        except JobSerializationError as e:
+            raise QueueOperationError(
+                f"Failed to schedule job: {e.message}", details={"job_id": job.id, "error": str(e)}
+            ) from e
+
+        try:
+            await self._client.zadd(self._scheduled_key(job.queue_name), {job_json: time.time() + delay_seconds})
+            logger.debug(
+                "Job scheduled",
+                extra={"job_id": job.id, "queue_name": job.queue_name, "delay_seconds": delay_seconds},
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Redis schedule failed for job '{job.id}': {e}",
+                extra={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                f"Failed to schedule job '{job.id}'",
+                details={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            ) from e
+
+    async def extend_visibility(self, job: Job, additional_seconds: int) -> bool:
+        """Extend the visibility timeout of an in-flight job.
+
+        Resets the delivery's idle clock with XCLAIM (atomically checking
+        this consumer still owns it) so it is reclaimed no sooner than
+        ``additional_seconds`` beyond its current expiry, capped at the
+        longer of ``claim_idle_seconds`` and the job's ``visibility_timeout``
+        from now.
+
+        Args:
+            job: The in-flight job to extend.
+            additional_seconds: Seconds to add beyond the current expiry.
+
+        Returns:
+            True if the expiry was updated, False if the job is no longer
+            in flight for this consumer (already settled or reclaimed).
+
+        Raises:
+            QueueConnectionError: If the backend is unreachable.
+
+        """
+        entry_id = self._entry_ids.get(job.id)
+        if entry_id is None:
+            return False
+
+        try:
+            extended = await self._script(_STREAM_EXTEND_SCRIPT)(
+                keys=[self._stream_key(job.queue_name)],
+                args=[
+                    self.GROUP_NAME,
+                    self._consumer,
+                    entry_id,
+                    max(self._claim_idle_ms, job.visibility_timeout * 1000),
+                    additional_seconds * 1000,
+                ],
+            )
+        except Exception as e:
+            logger.error(
+                f"Redis stream extend_visibility failed for job '{job.id}': {e}",
+                extra={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            )
+            raise QueueConnectionError(
+                f"Failed to extend visibility for job '{job.id}'",
+                details={"job_id": job.id, "queue_name": job.queue_name, "error": str(e)},
+            ) from e
+
+        if not extended:
+            # Reclaimed by another worker: a later ack from us must not count.
+            self._entry_ids.pop(job.id, None)
+            return False
+        logger.debug(
+            "Visibility timeout extended",
+            extra={"job_id": job.id, "queue_name": job.queue_name, "additional_seconds": additional_seconds},
+        )
+        return True
+
+
+# =============================================================================
+# Global State for Singleton Pattern
+# =============================================================================
+
+# Global queue backend instance (singleton)
+_queue_backend: Optional["QueueBackend"] = None
+
+
+# =============================================================================
+# Redis Client Management
+# =============================================================================
+
+
+async def _get_shared_redis_client() -> Any:
+    """Get the shared Redis client from cache_backend.
+
+    This reuses the same Redis client singleton that cache_backend uses,
+    avoiding duplicate connections to Redis.
+
+    Returns:
+        An async Redis client instance.
+
+    Raises:
+        QueueConnectionError: If Redis connection fails.
+
+    """
+    try:
+        from .cache_backend import CacheConnectionError, _get_redis_client
+
+        return await _get_redis_client()
+    except CacheConnectionError as e:
+        # Convert CacheConnectionError to QueueConnectionError
+        raise QueueConnectionError(f"Redis connection failed: {e.message}", details=e.details) from e
+
+
+# =============================================================================
+# Queue Backend Factory
+# =============================================================================
+
+
+async def get_queue_backend() -> QueueBackend:
+    """Get the configured queue backend (singleton).
+
+    Selection logic:
+    1. If SHU_REDIS_URL is set -> RedisQueueBackend, or RedisStreamsQueueBackend
+       with SHU_QUEUE_REDIS_STRUCTURE=streams (connection failure is fatal)
+    2. If SHU_REDIS_URL is not set -> InMemoryQueueBackend
+
+    This function is suitable for use in background tasks, schedulers, and
+    other non-FastAPI code. For FastAPI endpoints, prefer using
+    get_queue_backend_dependency() with Depends().
+
+    Returns:
+        The configured QueueBackend instance.
+
+    Raises:
+        QueueConnectionError: If SHU_REDIS_URL is set but Redis is unreachable.
+
+    Example:
+        backend = await get_queue_backend()
+        job = Job(queue_name="tasks", payload={"action": "process"})
+        await backend.enqueue(job)
+
+    """
+    global _queue_backend  # noqa: PLW0603 # works for now
+
+    if _queue_backend is not None:
+        return _queue_backend
+
+    from .config import DeploymentMode, get_settings_instance
+
+    settings = get_settings_instance()
+
+    if not settings.redis_enabled:
+        # Multi-tenant without Redis is structurally broken: every pod has its
+        # own InMemoryQueueBackend, so a job enqueued on one pod is invisible
+        # to a worker on another, and tenant isolation is moot because every
+        # tenant shares one process's memory anyway. Refuse to start rather
+        # than silently degrade.
+        if settings.deployment_mode == DeploymentMode.MULTI_TENANT:
+            raise RuntimeError(
+                "SHU_REDIS_URL is required when SHU_DEPLOYMENT_MODE=multi_tenant. "
+                "Without Redis, queues fragment across pods and the worker pipeline "
+                "loses cross-pod job delivery — the deployment cannot function correctly."
+            )
+        # Silo: a tenant is configured but Redis is missing — in-memory queues
+        # mean each pod's queue is invisible to the others, almost certainly a
+        # misconfigured hosted deploy. Warn loudly but continue so local dev
+        # still works; self_hosted has no shared-state expectation.
+        if settings.deployment_mode == DeploymentMode.SILO:
             warn_tenant_without_redis(logger, "queue", settings.tenant_id)  # noqa: STRAY-TENANT-ID — silo-only warn helper
         logger.info("SHU_REDIS_URL not configured, using InMemoryQueueBackend")
         _queue_backend = InMemoryQueueBackend()
@@ -1909,7 +2985,21 @@ async def get_queue_backend() -> QueueBackend:
     # layer and tenant_context.set(job.tenant_id) at dispatch — the namespace
     # only prevents collisions between **deployments** sharing one Redis.
     redis_client = await _get_shared_redis_client()
-    _queue_backend = RedisQueueBackend(redis_client, namespace=resolve_redis_namespace())
+    if settings.queue_redis_structure == "streams":
+        _queue_backend = RedisStreamsQueueBackend(
+            redis_client,
+            namespace=resolve_redis_namespace(),
+            sweep_interval_seconds=settings.queue_sweep_interval_seconds,
+            claim_idle_seconds=settings.queue_stream_claim_idle_seconds,
+        )
+        logger.info("Using RedisStreamsQueueBackend")
+        return _queue_backend
+
+    _queue_backend = RedisQueueBackend(
+        redis_client,
+        namespace=resolve_redis_namespace(),
+        sweep_interval_seconds=settings.queue_sweep_interval_seconds,
+    )
     logger.info("Using RedisQueueBackend")
     return _queue_backend
 
@@ -0,0 +1,452 @@
+"""Replay log for resumable server-sent-event streams.
+
+An SSE response used to be bound to the HTTP connection that started it:
+if the client dropped (flaky network, load balancer moving it to another
+node) the frames generated afterwards were lost, and the only recovery was
+regenerating the whole LLM response.
+
+With the replay log, the producer appends every frame to a bounded,
+per-stream log under a monotonically increasing sequence number, and the
+HTTP response merely tails that log. A client that loses its connection
+reattaches on any node with ``Last-Event-ID`` and receives every frame after
+the last one it saw. The log also carries a stop flag so a terminate request
+landing on a different node reaches the producer.
+
+Two interchangeable implementations, selected like the queue backend:
+- RedisStreamReplayLog: Redis Streams (XADD with approximate MAXLEN, XREAD
+  BLOCK), shared by every node
+- InMemoryStreamReplayLog: single-node/development fallback
+
+Example usage:
+    from shu.core.stream_replay import get_stream_replay_log, start_replay_pump, tail_replay
+
+    replay_log = await get_stream_replay_log()
+    await replay_log.open(stream_id, {"user_id": user_id})
+    start_replay_pump(replay_log, stream_id, frames, on_stop=lifecycle_stop)
+    return StreamingResponse(tail_replay(replay_log, stream_id), media_type="text/event-stream")
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol, runtime_checkable
+
+from .logging import get_logger
+from .streaming import SSE_DONE_FRAME
+from .tenant import resolve_redis_namespace
+
+logger = get_logger(__name__)
+
+# Max seconds a tail blocks waiting for new frames before re-checking that
+# the stream still exists. Kept below the Redis socket timeout.
+_TAIL_BLOCK_SECONDS = 1.0
+
+# Seconds between checks of the cross-node stop flag while a pump runs.
+_STOP_POLL_INTERVAL_SECONDS = 1.0
+
+# Max frames returned by one read.
+_READ_BATCH_SIZE = 256
+
+# Redis TTLs are refreshed every N appends rather than on every frame so a
+# token delta costs one round-trip.
+_TTL_REFRESH_EVERY = 100
+
+# Pump tasks are detached from the request; keep strong references so they
+# are not garbage-collected mid-stream.
+_pump_tasks: set[asyncio.Task] = set()
+
+
+@runtime_checkable
+class StreamReplayLog(Protocol):
+    """Protocol for per-stream SSE replay logs.
+
+    Sequence numbers start at 1 and are assigned by the single producer of a
+    stream; readers pass the last sequence they have seen (``0`` for "from
+    the start"). Frames older than the configured bound may have been
+    trimmed, in which case a reader resumes from the oldest frame retained.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Whether streams should be routed through the log at all."""
+        ...
+
+    async def open(self, stream_id: str, meta: dict[str, Any]) -> None:
+        """Create the log for ``stream_id`` with owner metadata."""
+        ...
+
+    async def append(self, stream_id: str, seq: int, frame: str) -> None:
+        """Append one SSE frame under sequence number ``seq``."""
+        ...
+
+    async def close(self, stream_id: str) -> None:
+        """Mark the stream complete; the log stays readable until it expires."""
+        ...
+
+    async def read(self, stream_id: str, after_seq: int, timeout_seconds: float) -> list[tuple[int, str]]:
+        """Return frames with sequence > ``after_seq``, waiting up to ``timeout_seconds`` for the first one."""
+        ...
+
+    async def get_meta(self, stream_id: str) -> dict[str, Any] | None:
+        """Return the stream's metadata, or None if unknown or expired."""
+        ...
+
+    async def request_stop(self, stream_id: str) -> None:
+        """Ask the producer of ``stream_id`` (on whatever node) to stop."""
+        ...
+
+    async def stop_requested(self, stream_id: str) -> bool:
+        """Return True if a stop has been requested for ``stream_id``."""
+        ...
+
+
+@dataclass
+class _InMemoryStream:
+    meta: dict[str, Any]
+    entries: deque
+    expires_at: float
+    stop: bool = False
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class InMemoryStreamReplayLog:
+    """Process-local replay log for single-node/development deployments.
+
+    Streams can only be resumed on the node that produced them, which is the
+    whole deployment in this mode.
+    """
+
+    def __init__(self, *, ttl_seconds: int, max_events: int) -> None:
+        """Initialize the log.
+
+        Args:
+            ttl_seconds: Seconds a stream stays readable after its last
+                write. ``0`` disables replay (``enabled`` is False).
+            max_events: Max frames retained per stream; older frames are
+                dropped first.
+
+        """
+        self._ttl = ttl_seconds
+        self._max_events = max_events
+        self._streams: dict[str, _InMemoryStream] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _live(self, stream_id: str) -> _InMemoryStream | None:
+        stream = self._streams.get(stream_id)
+        if stream is not None and stream.expires_at <= time.monotonic():
+            del self._streams[stream_id]
+            return None
+        return stream
+
+    def _cleanup(self) -> None:
+        now = time.monotonic()
+        for stream_id in [sid for sid, s in self._streams.items() if s.expires_at <= now]:
+            del self._streams[stream_id]
+
+    async def open(self, stream_id: str, meta: dict[str, Any]) -> None:
+        self._cleanup()
+        self._streams[stream_id] = _InMemoryStream(
+            meta=dict(meta, complete=False),
+            entries=deque(maxlen=self._max_events),
+            expires_at=time.monotonic() + self._ttl,
+        )
+
+    async def append(self, stream_id: str, seq: int, frame: str) -> None:
+        stream = self._live(stream_id)
+        if stream is None:
+            return
+        stream.entries.append((seq, frame))
+        stream.expires_at = time.monotonic() + self._ttl
+        # Wake current readers; later readers wait on a fresh event.
+        changed, stream.changed = stream.changed, asyncio.Event()
+        changed.set()
+
+    async def close(self, stream_id: str) -> None:
+        stream = self._live(stream_id)
+        if stream is None:
+            return
+        stream.meta["complete"] = True
+        stream.expires_at = time.monotonic() + self._ttl
+        changed, stream.changed = stream.changed, asyncio.Event()
+        changed.set()
+
+    async def read(self, stream_id: str, after_seq: int, timeout_seconds: float) -> list[tuple[int, str]]:
+        stream = self._live(stream_id)
+        if stream is None:
+            return []
+        changed = stream.changed
+        entries = [entry for entry in stream.entries if entry[0] > after_seq]
+        if entries or stream.meta.get("complete"):
+            return entries[:_READ_BATCH_SIZE]
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=timeout_seconds)
+        except TimeoutError:
+            return []
+        return [entry for entry in stream.entries if entry[0] > after_seq][:_READ_BATCH_SIZE]
+
+    async def get_meta(self, stream_id: str) -> dict[str, Any] | None:
+        stream = self._live(stream_id)
+        return dict(stream.meta) if stream is not None else None
+
+    async def request_stop(self, stream_id: str) -> None:
+        stream = self._live(stream_id)
+        if stream is not None:
+            stream.stop = True
+
+    async def stop_requested(self, stream_id: str) -> bool:
+        stream = self._live(stream_id)
+        return stream is not None and stream.stop
+
+
+class RedisStreamReplayLog:
+    """Redis Streams replay log shared by every node.
+
+    Key Structure:
+        - chat_stream:{id}:events - Redis stream of frames (entry id ``{seq}-0``)
+        - chat_stream:{id}:meta - JSON metadata (owner, completion flag)
+        - chat_stream:{id}:stop - Present once a stop has been requested
+
+    Every key carries the replay TTL, so abandoned streams clean themselves up.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        *,
+        ttl_seconds: int,
+        max_events: int,
+        namespace: str | None = None,
+    ) -> None:
+        """Initialize with an existing Redis client.
+
+        Args:
+            redis_client: An async Redis client with decode_responses=True,
+                normally the cache backend's shared client.
+            ttl_seconds: Seconds a stream stays readable after its last
+                write. ``0`` disables replay (``enabled`` is False).
+            max_events: Approximate max frames retained per stream
+                (``XADD MAXLEN ~``).
+            namespace: Deployment-level key prefix; see
+                ``resolve_redis_namespace``.
+
+        """
+        self._client = redis_client
+        self._ttl = ttl_seconds
+        self._max_events = max_events
+        self._prefix = f"{namespace}:" if namespace else ""
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _events_key(self, stream_id: str) -> str:
+        return f"{self._prefix}chat_stream:{stream_id}:events"
+
+    def _meta_key(self, stream_id: str) -> str:
+        return f"{self._prefix}chat_stream:{stream_id}:meta"
+
+    def _stop_key(self, stream_id: str) -> str:
+        return f"{self._prefix}chat_stream:{stream_id}:stop"
+
+    async def _refresh_ttl(self, stream_id: str) -> None:
+        await self._client.expire(self._events_key(stream_id), self._ttl)
+        await self._client.expire(self._meta_key(stream_id), self._ttl)
+
+    async def open(self, stream_id: str, meta: dict[str, Any]) -> None:
+        await self._client.set(self._meta_key(stream_id), json.dumps(dict(meta, complete=False)), ex=self._ttl)
+
+    async def append(self, stream_id: str, seq: int, frame: str) -> None:
+        await self._client.xadd(
+            self._events_key(stream_id),
+            {"frame": frame},
+            id=f"{seq}-0",
+            maxlen=self._max_events,
+            approximate=True,
+        )
+        if seq == 1 or seq % _TTL_REFRESH_EVERY == 0:
+            await self._refresh_ttl(stream_id)
+
+    async def close(self, stream_id: str) -> None:
+        meta = await self.get_meta(stream_id)
+        if meta is not None:
+            meta["complete"] = True
+            await self._client.set(self._meta_key(stream_id), json.dumps(meta), ex=self._ttl)
+        await self._client.expire(self._events_key(stream_id), self._ttl)
+
+    async def read(self, stream_id: str, after_seq: int, timeout_seconds: float) -> list[tuple[int, str]]:
+        response = await self._client.xread(
+            {self._events_key(stream_id): f"{after_seq}-0"},
+            count=_READ_BATCH_SIZE,
+            block=max(1, int(timeout_seconds * 1000)),
+        )
+        entries: list[tuple[int, str]] = []
+        for _key, messages in response or []:
+            for entry_id, fields in messages:
+                entries.append((int(entry_id.split("-", 1)[0]), fields["frame"]))
+        return entries
+
+    async def get_meta(self, stream_id: str) -> dict[str, Any] | None:
+        raw = await self._client.get(self._meta_key(stream_id))
+        return json.loads(raw) if raw else None
+
+    async def request_stop(self, stream_id: str) -> None:
+        await self._client.set(self._stop_key(stream_id), "1", ex=self._ttl)
+
+    async def stop_requested(self, stream_id: str) -> bool:
+        return bool(await self._client.exists(self._stop_key(stream_id)))
+
+
+# =============================================================================
+# Producer / consumer helpers
+# =============================================================================
+
+
+def start_replay_pump(
+    replay_log: StreamReplayLog,
+    stream_id: str,
+    frames: AsyncIterator[str],
+    *,
+    on_stop: Callable[[], None],
+) -> asyncio.Task:
+    """Drive ``frames`` into the replay log on a task detached from any connection.
+
+    The pump keeps consuming the producer after every reader has gone, so
+    late frames are still there when a client resumes. While it runs it
+    polls the stream's stop flag and calls ``on_stop`` once if another node
+    requested a stop. The log is always terminated with the SSE ``[DONE]``
+    frame and marked complete, even if the producer fails.
+
+    Returns:
+        The pump task (also referenced module-side until it finishes).
+
+    """
+
+    async def watch_stop() -> None:
+        while True:
+            await asyncio.sleep(_STOP_POLL_INTERVAL_SECONDS)
+            try:
+                if await replay_log.stop_requested(stream_id):
+                    on_stop()
+                    return
+            except Exception as e:
+                logger.warning("Stream stop-flag check failed for %s: %s", stream_id, e)
+
+    async def pump() -> None:
+        seq = 0
+        last_frame: str | None = None
+        watcher = asyncio.create_task(watch_stop(), name=f"stream-replay-stop:{stream_id}")
+        try:
+            async for frame in frames:
+                seq += 1
+                last_frame = frame
+                try:
+                    await replay_log.append(stream_id, seq, frame)
+                except Exception as e:
+                    logger.warning("Stream replay append failed for %s (seq %s): %s", stream_id, seq, e)
+        except Exception:
+            logger.exception("Stream replay producer failed for %s", stream_id)
+        finally:
+            watcher.cancel()
+            try:
+                if last_frame != SSE_DONE_FRAME:
+                    await replay_log.append(stream_id, seq + 1, SSE_DONE_FRAME)
+                await replay_log.close(stream_id)
+            except Exception as e:
+                logger.warning("Stream replay close failed for %s: %s", stream_id, e)
+
+    task = asyncio.create_task(pump(), name=f"stream-replay-pump:{stream_id}")
+    _pump_tasks.add(task)
+    task.add_done_callback(_pump_tasks.discard)
+    return task
+
+
+async def tail_replay(
+    replay_log: StreamReplayLog,
+    stream_id: str,
+    after_seq: int = 0,
+    *,
+    on_disconnect: Callable[[], None] | None = None,
+) -> AsyncIterator[str]:
+    """Yield frames after ``after_seq`` as SSE events carrying ``id:`` lines.
+
+    Ends after the ``[DONE]`` frame, or with a synthetic one if the stream
+    expires without completing (e.g. its producer node died). If the
+    consumer goes away first, ``on_disconnect`` is called.
+    """
+    finished = False
+    try:
+        while True:
+            entries = await replay_log.read(stream_id, after_seq, _TAIL_BLOCK_SECONDS)
+            if not entries:
+                meta = await replay_log.get_meta(stream_id)
+                if meta is None or meta.get("complete"):
+                    # A completed log always ends in [DONE], so an empty read
+                    # here means it was trimmed or expired underneath us.
+                    finished = True
+                    yield SSE_DONE_FRAME
+                    return
+                continue
+            for seq, frame in entries:
+                after_seq = seq
+                yield f"id: {seq}\n{frame}"
+                if frame == SSE_DONE_FRAME:
+                    finished = True
+                    return
+    finally:
+        if not finished and on_disconnect is not None:
+            try:
+                on_disconnect()
+            except Exception:
+                logger.exception("on_disconnect hook failed for stream %s", stream_id)
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+
+_stream_replay_log: StreamReplayLog | None = None
+
+
+async def get_stream_replay_log() -> StreamReplayLog:
+    """Get the configured stream replay log (singleton).
+
+    Uses Redis Streams when SHU_REDIS_URL is set (reusing the cache
+    backend's client), otherwise an in-memory log.
+    """
+    global _stream_replay_log  # noqa: PLW0603
+
+    if _stream_replay_log is not None:
+        return _stream_replay_log
+
+    from .config import get_settings_instance
+
+    settings = get_settings_instance()
+    ttl_seconds = settings.chat_stream_replay_ttl_seconds
+    max_events = settings.chat_stream_replay_max_events
+
+    if not settings.redis_enabled:
+        _stream_replay_log = InMemoryStreamReplayLog(ttl_seconds=ttl_seconds, max_events=max_events)
+        return _stream_replay_log
+
+    from .cache_backend import _get_redis_client
+
+    _stream_replay_log = RedisStreamReplayLog(
+        await _get_redis_client(),
+        ttl_seconds=ttl_seconds,
+        max_events=max_events,
+        namespace=resolve_redis_namespace(),
+    )
+    logger.info("Using RedisStreamReplayLog")
+    return _stream_replay_log
+
+
+def reset_stream_replay_log() -> None:
+    """Reset the stream replay log singleton (for testing only)."""
+    global _stream_replay_log  # noqa: PLW0603
+    _stream_replay_log = None
@@ -16,6 +16,9 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Terminal frame of every SSE stream; clients treat it as end-of-stream.
+SSE_DONE_FRAME = "data: [DONE]\n\n"
+
 
 def sanitize_stream_error_message(error_content: str | None) -> str:
     """Sanitize error messages for SSE streams while preserving actionable errors.
@@ -192,6 +195,6 @@ async def create_sse_stream_generator(
                 logger.exception(f"on_close hook failed during {error_context}")
         # Always send DONE marker to properly close the stream
         try:
-            yield "data: [DONE]\n\n"
+            yield SSE_DONE_FRAME
         except Exception:
             logger.debug(f"Could not send DONE marker during {error_context} - connection likely closed")
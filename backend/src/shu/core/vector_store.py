@@ -109,6 +109,37 @@ class VectorStore(Protocol):
         """
         ...
 
+    async def search_best_per_group(
+        self,
+        collection: str,
+        query_vector: list[float],
+        *,
+        db: AsyncSession,
+        group_column: str,
+        group_ids: list[str],
+        threshold: float = 0.0,
+        extra_where: str | None = None,
+    ) -> dict[str, VectorSearchResult]:
+        """Return the single best match within each of several groups.
+
+        Equivalent to one ``search(limit=1, filters={group_column: gid})`` per
+        group id, answered in a single query.
+
+        Args:
+            collection: Logical collection name.
+            query_vector: The query embedding vector.
+            db: Async database session from the caller.
+            group_column: Filterable column to group by (e.g., "document_id").
+            group_ids: Group values to search within.
+            threshold: Minimum similarity score (0.0-1.0).
+            extra_where: Raw SQL WHERE clause fragment for collection-specific filtering.
+
+        Returns:
+            Mapping of group id to its best result; groups without a match are absent.
+
+        """
+        ...
+
     async def store_embeddings(
         self,
         collection: str,
@@ -328,6 +359,74 @@ class PgVectorStore:
 
         return [VectorSearchResult(id=str(row[0]), score=float(row[1])) for row in rows]
 
+    # -- search_best_per_group ---------------------------------------------
+
+    async def search_best_per_group(
+        self,
+        collection: str,
+        query_vector: list[float],
+        *,
+        db: AsyncSession,
+        group_column: str,
+        group_ids: list[str],
+        threshold: float = 0.0,
+        extra_where: str | None = None,
+    ) -> dict[str, VectorSearchResult]:
+        """Best match per group, ranked with a window over ``group_column = ANY(:group_ids)``."""
+        from pgvector.sqlalchemy import Vector as PgVector
+
+        config = self._get_collection(collection)
+        if group_column not in config.filterable_columns:
+            valid = ", ".join(config.filterable_columns)
+            raise ValueError(
+                f"Group column '{group_column}' not allowed for collection '{collection}'. " f"Allowed: {valid}"
+            )
+        if not group_ids:
+            return {}
+
+        op = _DISTANCE_OPERATORS[config.distance_metric]
+        tbl = config.table_name
+        emb = config.embedding_column
+        id_col = config.id_column
+
+        where_clauses: list[str] = [
+            f"{emb} IS NOT NULL",
+            f"vector_dims({emb}) = :dimension",
+            f"{group_column} = ANY(:group_ids)",
+            f"1 - ({emb} {op} :query_vector) >= :threshold",
+        ]
+        if extra_where:
+            where_clauses.append(f"({extra_where})")
+        where_sql = " AND ".join(where_clauses)
+
+        # Table/column names come from hardcoded CollectionConfig, not user input
+        sql = f"""
+            SELECT id, grp, score FROM (
+                SELECT {id_col} AS id,
+                       {group_column} AS grp,
+                       GREATEST(0, 1 - ({emb} {op} :query_vector)) AS score,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY {group_column} ORDER BY {emb} {op} :query_vector
+                       ) AS rn
+                FROM {tbl}
+                WHERE {where_sql}
+            ) ranked
+            WHERE rn = 1
+        """  # noqa: S608  # nosec B608
+
+        from sqlalchemy import bindparam
+
+        query = text(sql).bindparams(bindparam("query_vector", type_=PgVector()))
+        params: dict[str, Any] = {
+            "query_vector": query_vector,
+            "group_ids": [str(gid) for gid in group_ids],
+            "threshold": threshold,
+            "dimension": len(query_vector),
+        }
+
+        result = await db.execute(query, params)
+        return {str(row[1]): VectorSearchResult(id=str(row[0]), score=float(row[2])) for row in result.fetchall()}
+
     # -- store_embeddings ---------------------------------------------------
 
     async def store_embeddings(
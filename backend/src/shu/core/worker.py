@@ -200,17 +200,29 @@ class WorkerConfig:
             these workload types. For example, {WorkloadType.INGESTION}
             means the worker only processes ingestion jobs.
 
-        poll_interval: Seconds between dequeue attempts when idle.
-            When no jobs are available, the worker waits this long
-            before trying again. Default is 1.0 second.
+        poll_interval: Maximum seconds an idle worker blocks waiting for
+            new jobs before re-checking its queues. Idle workers wake as
+            soon as a job is enqueued; this bounds how long shutdown,
+            scheduled jobs and capacity-limited queues can go unnoticed.
+            Default is 1.0 second.
 
         shutdown_timeout: Seconds to wait for current job on shutdown.
             When a shutdown signal (SIGTERM/SIGINT) is received, the
             worker finishes the current job but will forcefully exit
             if it takes longer than this timeout. Default is 30 seconds.
 
+        max_concurrent_jobs: Jobs a single worker runs at once. At 1 (the
+            default) the worker processes one job at a time. Above 1 each
+            job runs as its own asyncio task, so one worker can keep many
+            I/O-bound jobs (LLM profiling, plugin feeds) in flight.
+
+        workload_slots: Per-workload-type cap on this worker's concurrent
+            jobs, e.g. {WorkloadType.PROFILING: 8}. Types without an entry
+            (or with 0) may use every slot up to max_concurrent_jobs.
+            Applies on top of any process-shared WorkloadCapacityLimiter.
+
     Raises:
-        ValueError: If workload_types is empty.
+        ValueError: If workload_types is empty or a numeric field is out of range.
 
     Example:
         # Worker that handles all workload types
@@ -230,11 +242,20 @@ class WorkerConfig:
             shutdown_timeout=60.0  # Allow more time for LLM calls
         )
 
+        # One worker keeping up to 16 jobs in flight, at most 8 of them profiling
+        config = WorkerConfig(
+            workload_types={WorkloadType.PROFILING, WorkloadType.INGESTION},
+            max_concurrent_jobs=16,
+            workload_slots={WorkloadType.PROFILING: 8},
+        )
+
     """
 
     workload_types: set[WorkloadType]
     poll_interval: float = 1.0
     shutdown_timeout: float = 30.0
+    max_concurrent_jobs: int = 1
+    workload_slots: dict[WorkloadType, int] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -253,6 +274,11 @@ class WorkerConfig:
                 f"shutdown_timeout must be positive, got {self.shutdown_timeout}. "
                 "A zero or negative timeout is invalid."
             )
+        if self.max_concurrent_jobs < 1:
+            raise ValueError(f"max_concurrent_jobs must be at least 1, got {self.max_concurrent_jobs}.")
+        for work_type, slots in self.workload_slots.items():
+            if slots < 0:
+                raise ValueError(f"workload_slots for {work_type.name} must be non-negative, got {slots}.")
 
 
 class Worker:
@@ -274,10 +300,19 @@ class Worker:
         The worker is designed to run in a single asyncio event loop.
         Multiple workers can run in separate processes or coroutines.
 
+    Concurrent Jobs:
+        With max_concurrent_jobs > 1 the worker keeps dequeuing while
+        earlier jobs run, spawning each job as an asyncio task until every
+        slot is busy. Per-workload slots (workload_slots) and the shared
+        capacity limiter are both acquired before a queue is dequeued from,
+        so a full workload type is skipped rather than blocking the others.
+        Job handlers run unchanged inside their task, including any
+        visibility-extension heartbeats they start.
+
     Graceful Shutdown:
         When SIGTERM or SIGINT is received, the worker:
         1. Stops accepting new jobs
-        2. Finishes processing the current job (if any)
+        2. Finishes processing the current job(s) (if any)
         3. Exits cleanly
 
         Note: The shutdown is cooperative - if the current job handler does not
@@ -310,7 +345,9 @@ class Worker:
         _config: Worker configuration.
         _handler: Async function to process jobs.
         _running: Flag indicating if worker is running.
-        _current_job: The job currently being processed (if any).
+        _current_job: The job currently being processed (if any) in
+            single-job mode.
+        _active_jobs: Tasks for in-flight jobs in concurrent mode, by job ID.
 
     """
 
@@ -355,8 +392,11 @@ class Worker:
         self._current_job: Job | None = None
         self._queue_index: int = 0  # Round-robin index for fair queue polling
         self._capacity_limiter = capacity_limiter
-        # Track which workload types have acquired capacity for the current job
-        self._acquired_capacity: WorkloadType | None = None
+        # Per-worker workload slots; the limiter is a no-op for types without a slot limit
+        self._slots = WorkloadCapacityLimiter(limits=dict(config.workload_slots))
+        # Workload type whose capacity each in-flight job holds, by job ID
+        self._acquired_capacity: dict[str, WorkloadType] = {}
+        self._active_jobs: dict[str, asyncio.Task[None]] = {}
         # Monotonic timestamp of last capacity report (for periodic summaries)
         self._last_capacity_report: float = 0.0
 
@@ -382,8 +422,10 @@ class Worker:
     async def _try_acquire_capacity(self, work_type: WorkloadType | None) -> bool:
         """Try to acquire capacity for a workload type (non-blocking).
 
-        Uses the shared capacity limiter if available. If no limiter is
-        configured, always returns True (no limiting).
+        Takes a per-worker workload slot first, then a permit from the shared
+        capacity limiter if one is configured. Either being full means the
+        workload type is at capacity; a slot taken before a limiter refusal
+        is given back.
 
         Args:
             work_type: The workload type to acquire capacity for, or None.
@@ -392,9 +434,14 @@ class Worker:
             True if capacity was acquired (or no limiting), False if at capacity.
 
         """
-        if work_type is None or self._capacity_limiter is None:
+        if work_type is None:
             return True
-        return await self._capacity_limiter.acquire(work_type)
+        if not await self._slots.acquire(work_type):
+            return False
+        if self._capacity_limiter is None or await self._capacity_limiter.acquire(work_type):
+            return True
+        self._slots.release(work_type)
+        return False
 
     def _release_capacity(self, work_type: WorkloadType | None) -> None:
         """Release previously acquired capacity for a workload type.
@@ -403,9 +450,23 @@ class Worker:
             work_type: The workload type to release capacity for, or None.
 
         """
-        if work_type is None or self._capacity_limiter is None:
+        if work_type is None:
             return
-        self._capacity_limiter.release(work_type)
+        self._slots.release(work_type)
+        if self._capacity_limiter is not None:
+            self._capacity_limiter.release(work_type)
+
+    def _has_capacity(self, work_type: WorkloadType) -> bool:
+        """Whether a job of this workload type could be started right now.
+
+        Args:
+            work_type: The workload type to check.
+
+        """
+        if self._slots.get_available(work_type) == 0:
+            return False
+        limiter = self._capacity_limiter
+        return limiter is None or limiter.get_available(work_type) != 0
 
     @property
     def _is_capacity_reporter(self) -> bool:
@@ -468,9 +529,11 @@ class Worker:
 
         The worker will:
         1. Try to dequeue from each configured queue in round-robin fashion
-        2. Process any dequeued job
-        3. Sleep for poll_interval if no jobs are available
-        4. Exit gracefully on shutdown signal
+        2. Process any dequeued job (as a background task when
+           max_concurrent_jobs > 1, while slots remain)
+        3. Block on all queues with capacity (up to poll_interval) if no
+           jobs are available
+        4. Exit gracefully on shutdown signal, after in-flight jobs finish
 
         Example:
             worker = Worker(backend, config, process_job)
@@ -494,23 +557,42 @@ class Worker:
                 "queue_names": queue_names,
                 "poll_interval": self._config.poll_interval,
                 "shutdown_timeout": self._config.shutdown_timeout,
+                "max_concurrent_jobs": self._config.max_concurrent_jobs,
             },
         )
 
+        concurrent = self._config.max_concurrent_jobs > 1
         while self._running:
+            if concurrent and len(self._active_jobs) >= self._config.max_concurrent_jobs:
+                # Every slot is busy; wait for a job to finish
+                await asyncio.wait(self._active_jobs.values(), return_when=asyncio.FIRST_COMPLETED)
+                continue
+
             # Try to dequeue from any of the configured queues
             job = await self._dequeue_from_any(queue_names)
 
-            if job:
+            if job and concurrent:
+                self._start_job(job)
+            elif job:
                 await self._process_job(job)
+            elif self._active_jobs:
+                # Nothing to claim, but a finishing job may free a workload slot
+                await self._wait_for_work_or_completion(queue_names)
             else:
-                # No jobs available, sleep before trying again
-                await asyncio.sleep(self._config.poll_interval)
+                # No jobs available, block until one arrives (or poll_interval passes)
+                await self._wait_for_work(queue_names)
 
             # Periodic capacity report — only from the designated reporter worker
             if self._is_capacity_reporter:
                 await self._report_deferred_work()
 
+        if self._active_jobs:
+            logger.info(
+                f"{worker_label} waiting for {len(self._active_jobs)} in-flight job(s) to finish",
+                extra={"worker_id": self._worker_id},
+            )
+            await asyncio.gather(*self._active_jobs.values(), return_exceptions=True)
+
         logger.info(f"{worker_label} stopped", extra={"worker_id": self._worker_id})
 
     async def _dequeue_from_any(
@@ -529,7 +611,8 @@ class Worker:
         types (OCR, profiling) while other work sits in queues undone.
 
         When a job is successfully dequeued, the acquired capacity is held
-        and will be released by _process_job() in its finally block.
+        (keyed by job ID) and will be released by _process_job() in its
+        finally block.
 
         Args:
             queue_names: List of queue names to try dequeuing from.
@@ -555,7 +638,7 @@ class Worker:
                 job = await self._backend.dequeue(queue_name)
                 if job:
                     # Keep the acquired capacity for this job
-                    self._acquired_capacity = work_type
+                    self._acquired_capacity[job.id] = work_type
                     # Advance to next queue for next poll cycle
                     self._queue_index = (idx + 1) % num_queues
                     return job
@@ -573,6 +656,69 @@ class Worker:
         self._queue_index = (self._queue_index + 1) % num_queues
         return None
 
+    async def _wait_for_work(self, queue_names: list[str]) -> None:
+        """Block until one of the worker's queues receives a job.
+
+        Waits on every queue that currently has capacity in a single backend
+        call, so a new job is picked up within milliseconds instead of after
+        a full poll interval, and idle workers stop issuing empty dequeues.
+        The wait never claims a job: the next _dequeue_from_any() call does,
+        with its usual capacity checks and round-robin order.
+
+        The wait is bounded by poll_interval so shutdown, the periodic
+        capacity report and jobs behind a capacity limit are still noticed.
+        Falls back to sleeping for poll_interval when every queue is at
+        capacity or the backend wait fails.
+
+        Args:
+            queue_names: The worker's queue names.
+
+        """
+        eligible = [name for name in queue_names if self._has_capacity(WorkloadType.from_queue_name(name))]
+        if not eligible:
+            await asyncio.sleep(self._config.poll_interval)
+            return
+
+        try:
+            await self._backend.wait_for_jobs(eligible, self._config.poll_interval)
+        except Exception as e:
+            logger.error(
+                f"Failed to wait for jobs: {e}",
+                extra={"worker_id": self._worker_id, "queue_names": eligible, "error": str(e)},
+            )
+            await asyncio.sleep(self._config.poll_interval)
+
+    async def _wait_for_work_or_completion(self, queue_names: list[str]) -> None:
+        """Block until new work arrives or one of the in-flight jobs finishes.
+
+        A finished job frees its workload slot, which can make a queue that
+        was skipped for capacity eligible again before poll_interval passes.
+
+        Args:
+            queue_names: The worker's queue names.
+
+        """
+        waiter = asyncio.ensure_future(self._wait_for_work(queue_names))
+        try:
+            await asyncio.wait([waiter, *self._active_jobs.values()], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+
+    def _start_job(self, job: Job) -> None:
+        """Run a dequeued job as a background task (concurrent mode).
+
+        The task removes itself from _active_jobs when it finishes;
+        _process_job() never raises, so no exception is lost.
+
+        Args:
+            job: The job to process.
+
+        """
+        task = asyncio.create_task(self._process_job(job), name=f"worker-job:{job.id}")
+        self._active_jobs[job.id] = task
+        task.add_done_callback(lambda _t, job_id=job.id: self._active_jobs.pop(job_id, None))
+
     async def _process_job(self, job: Job) -> None:
         """Process a job with error handling and acknowledgment.
 
@@ -588,7 +734,8 @@ class Worker:
             job: The job to process.
 
         """
-        self._current_job = job
+        if self._config.max_concurrent_jobs == 1:
+            self._current_job = job
         start_time = time.time()
 
         try:
@@ -664,11 +811,10 @@ class Worker:
                 )
 
         finally:
-            self._current_job = None
+            if self._current_job is job:
+                self._current_job = None
             # Release acquired capacity back to the shared limiter
-            if self._acquired_capacity is not None:
-                self._release_capacity(self._acquired_capacity)
-                self._acquired_capacity = None
+            self._release_capacity(self._acquired_capacity.pop(job.id, None))
 
 
 # =============================================================================
@@ -219,3 +219,41 @@ async def enqueue_job(
     job = Job(queue_name=workload_type.queue_name, payload=payload, tenant_id=tid, **job_kwargs)
     await backend.enqueue(job)
     return job
+
+
+async def enqueue_jobs(
+    backend: QueueBackend,
+    workload_type: WorkloadType,
+    payloads: list[dict[str, Any]],
+    *,
+    tenant_id: str | None = None,
+    **job_kwargs: Any,
+) -> list[Job]:
+    """Enqueue one job per payload for the specified workload type in a single batch.
+
+    Batch counterpart of :func:`enqueue_job` for bulk producers (e.g. KB batch
+    ingestion): the jobs are handed to ``backend.enqueue_many`` so they cost
+    one backend round trip instead of one per job. Tenant resolution and
+    ``job_kwargs`` behave exactly as in :func:`enqueue_job`.
+
+    Returns:
+        The enqueued Job instances, in ``payloads`` order.
+
+    Raises:
+        EnqueueError: If no tenant_id is supplied and tenant_context is unset.
+        QueueConnectionError: If the backend is unreachable.
+        QueueOperationError: If a job cannot be serialized (nothing is enqueued).
+
+    """
+    tid = tenant_id if tenant_id is not None else tenant_context.get(None)
+    if tid is None:
+        raise EnqueueError(
+            f"Cannot enqueue {workload_type.value} jobs without tenant_id: "
+            "neither the explicit argument nor tenant_context is set."
+        )
+    jobs = [
+        Job(queue_name=workload_type.queue_name, payload=payload, tenant_id=tid, **job_kwargs) for payload in payloads
+    ]
+    if jobs:
+        await backend.enqueue_many(jobs)
+    return jobs
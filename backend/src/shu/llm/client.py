@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from shu.billing.enforcement import assert_subscription_active
 from shu.core.database import get_async_session_local
+from shu.core.http_client import get_provider_client_pool
 from shu.core.logging import get_logger
 from shu.models.plugin_execution import CallableTool
 from shu.services.error_sanitization import ErrorSanitizer, SanitizedError
@@ -209,7 +210,9 @@ class UnifiedLLMClient:
             self._llm_timeout = 30.0
             self._llm_stream_read_timeout = 120.0
 
-        self.client = httpx.AsyncClient(
+        # Borrow the process-wide pooled client for this provider so repeated
+        # chat turns, side calls and profiling batches reuse warm connections
+        self.client = get_provider_client_pool().get_client(
             base_url=self._apply_override("get_api_base_url", self.provider_adapter.get_api_base_url()),
             headers=headers,
             timeout=httpx.Timeout(
@@ -218,7 +221,6 @@ class UnifiedLLMClient:
                 write=self._llm_timeout,
                 pool=self._llm_timeout,
             ),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
         )
 
         # Retry configuration
@@ -1049,8 +1051,13 @@ class UnifiedLLMClient:
         return gen()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the HTTP client.
+
+        The client is shared through the provider client pool, so its
+        connections stay open for the next LLM client; the pool itself is
+        closed at shutdown.
+        """
+        return
 
     async def _format_content(self, content: Any) -> str:
         """Format content from response data."""
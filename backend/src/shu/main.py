@@ -17,7 +17,8 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+from starlette.types import ASGIApp
 
 from .api.admin.tenant_admin import cp_router as cp_tenant_admin_router
 from .api.admin.tenant_admin import router as tenant_admin_router
@@ -52,6 +53,7 @@ from .core.exceptions import ShuException
 from .core.http_client import close_http_client
 from .core.logging import get_logger, setup_logging
 from .core.middleware import (
+    ASGIMiddleware,
     AuthenticationMiddleware,
     MustChangePasswordMiddleware,
     RateLimitMiddleware,
@@ -66,22 +68,22 @@ logger = get_logger(__name__)
 settings = get_settings_instance()
 
 
-class StripAPITrailingSlashMiddleware(BaseHTTPMiddleware):
+class StripAPITrailingSlashMiddleware(ASGIMiddleware):
     """Normalize API paths to avoid 307 redirects while preserving headers.
 
     Rule: For all API paths, remove a trailing slash (except the exact API prefix),
     so both '/foo' and '/foo/' resolve to the same handler without redirects.
     """
 
-    def __init__(self, app, api_prefix: str) -> None:
+    def __init__(self, app: ASGIApp, api_prefix: str) -> None:
         super().__init__(app)
         self.api_prefix = api_prefix.rstrip("/")
 
-    async def dispatch(self, request, call_next):
+    async def before_request(self, request: Request) -> Response | None:
         path = request.scope.get("path", "")
         # Only touch API paths
         if not path.startswith(self.api_prefix + "/"):
-            return await call_next(request)
+            return None
 
         # Remove a trailing slash to avoid Starlette redirects
         if path.endswith("/"):
@@ -89,7 +91,7 @@ class StripAPITrailingSlashMiddleware(BaseHTTPMiddleware):
             # Do not collapse the API prefix itself
             if normalized != self.api_prefix:
                 request.scope["path"] = normalized
-        return await call_next(request)
+        return None
 
 
 def generate_error_id() -> str:
@@ -439,7 +441,7 @@ async def lifespan(app: FastAPI):  # noqa: PLR0912, PLR0915
             from .core.queue_backend import get_queue_backend
             from .core.worker import Worker, WorkerConfig, WorkloadCapacityLimiter
             from .core.workload_routing import WorkloadType
-            from .worker import process_job
+            from .worker import parse_workload_slots, process_job
 
             # Get queue backend (shared by all workers)
             backend = await get_queue_backend()
@@ -463,6 +465,8 @@ async def lifespan(app: FastAPI):  # noqa: PLR0912, PLR0915
                 workload_types=set(WorkloadType),
                 poll_interval=settings.worker_poll_interval,
                 shutdown_timeout=settings.worker_shutdown_timeout,
+                max_concurrent_jobs=settings.worker_jobs_per_worker,
+                workload_slots=parse_workload_slots(settings.worker_workload_slots),
             )
 
             # Create N concurrent workers sharing the same capacity limiter
@@ -730,6 +734,18 @@ async def lifespan(app: FastAPI):  # noqa: PLR0912, PLR0915
                 },
             )
 
+    # Write buffered fire-and-forget usage rows while the DB pool is still
+    # up — rows still queued at exit would be lost billing records.
+    try:
+        from .services.usage_recording import get_usage_recorder
+
+        usage_write_buffer = get_usage_recorder().write_buffer
+        if usage_write_buffer is not None:
+            await usage_write_buffer.close()
+            logger.info("Usage write buffer flushed")
+    except Exception as e:
+        logger.warning(f"Error flushing usage write buffer during shutdown: {e}")
+
     # Shutdown
     logger.info("Shutting down Shu...")
 
@@ -159,6 +159,7 @@ class Document(TenantScopedMixin, BaseModel):
     word_count = Column(Integer, nullable=True)
     character_count = Column(Integer, nullable=True)
     chunk_count = Column(Integer, default=0, nullable=False)
+    token_count = Column(Integer, nullable=True)  # STORED_TOKEN_ENCODING tokens in content
 
     # Shu RAG Document Profile (SHU-342)
     # Synopsis: One-paragraph summary for document-level retrieval
@@ -237,6 +238,7 @@ class Document(TenantScopedMixin, BaseModel):
             "word_count": self.word_count,
             "character_count": self.character_count,
             "chunk_count": self.chunk_count,
+            "token_count": self.token_count,
             "extraction_method": self.extraction_method,
             "extraction_engine": self.extraction_engine,
             "extraction_confidence": self.extraction_confidence,
@@ -291,6 +293,7 @@ class Document(TenantScopedMixin, BaseModel):
             "word_count": row.get("word_count"),
             "character_count": row.get("character_count"),
             "chunk_count": row.get("chunk_count", 0),
+            "token_count": row.get("token_count"),
             "extraction_method": row.get("extraction_method"),
             "extraction_engine": row.get("extraction_engine"),
             "extraction_confidence": row.get("extraction_confidence"),
@@ -348,6 +351,7 @@ class Document(TenantScopedMixin, BaseModel):
             "word_count": self.word_count,
             "character_count": self.character_count,
             "chunk_count": self.chunk_count,
+            "token_count": self.token_count,
             "document_type": self.document_type,
             "profiling_status": self.profiling_status,
             "profiling_coverage_percent": self.profiling_coverage_percent,
@@ -397,11 +401,14 @@ class Document(TenantScopedMixin, BaseModel):
             self.processed_at = None
             self.processing_error = None
 
-    def update_content_stats(self, word_count: int, character_count: int, chunk_count: int) -> None:
+    def update_content_stats(
+        self, word_count: int, character_count: int, chunk_count: int, token_count: int | None = None
+    ) -> None:
         """Update content statistics."""
         self.word_count = word_count
         self.character_count = character_count
         self.chunk_count = chunk_count
+        self.token_count = token_count
 
     # Profiling status helpers
     @property
@@ -44,6 +44,8 @@ class KnowledgeBase(TenantScopedMixin, BaseModel):
     )
     chunk_size = Column(Integer, default=1000, nullable=False)
     chunk_overlap = Column(Integer, default=200, nullable=False)
+    # Chunker strategy name (see services/chunking.py); NULL uses SHU_DEFAULT_CHUNKING_STRATEGY
+    chunking_strategy = Column(String(20), nullable=True)
 
     # RAG Configuration - New persistent storage for RAG settings
     rag_include_references = Column(Boolean, default=True, nullable=False)
@@ -279,6 +279,9 @@ class Message(TenantScopedMixin, BaseModel):
     # Message content
     role = Column(String(20), nullable=False, index=True)  # "user", "assistant", "system"
     content = Column(Text, nullable=False)
+    # Tokens in content (STORED_TOKEN_ENCODING), counted off the event loop by
+    # the service that saves the message; NULL means "count on read"
+    token_count = Column(Integer, nullable=True)
 
     # LLM tracking
     model_id = Column(String, ForeignKey("llm_models.id", ondelete="SET NULL"), nullable=True, index=True)
@@ -19,19 +19,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from shu.core.logging import get_logger
 
-from .host.exceptions import HttpRequestFailed
-from .host.host_builder import make_host
-
-# Optional JSON Schema validation support
-try:
-    import jsonschema  # type: ignore
-except Exception:
-    jsonschema = None  # type: ignore
 from ..core.cache_backend import CacheBackend, get_cache_backend
 from ..core.config import get_settings_instance  # type: ignore
 from ..services.policy_engine import POLICY_CACHE
 from .base import ExecuteContext, Plugin, PluginResult
-from .schema import resolve_op_schema
+from .host.exceptions import HttpRequestFailed
+from .host.host_builder import make_host
+from .schema import compiled_schema, resolve_op_schema
 
 logger = get_logger(__name__)
 
@@ -235,21 +229,12 @@ class Executor:
             self._limiter = None
             self._provider_limiter = None
 
-    def _validate(self, plugin: Plugin, params: dict[str, Any], op: str) -> dict[str, Any]:
-        """Validate params against the plugin's per-op input schema.
-
-        If the plugin exposes no schema for *op*, params are returned unchanged
-        (with stripped None values). Uses ``resolve_op_schema`` to try the per-op
-        interface first and fall back to the deprecated combined schema.
-
-        Raises
-        ------
-            HTTPException: 422 when validation fails or required keys are missing.
-
-        """
+    @staticmethod
+    def _input_schema_with_op(plugin: Plugin, op: str) -> dict[str, Any] | None:
+        """Resolve the per-op input schema with the host-injected ``op`` field declared."""
         schema = resolve_op_schema(plugin, op)
         if not schema:
-            return params
+            return None
 
         # Ensure the host-injected "op" field is declared in the schema so
         # validation catches callers that forget to inject it.
@@ -262,56 +247,84 @@ class Executor:
         if "op" not in req:
             req.append("op")
             schema["required"] = req
+        return schema
+
+    @staticmethod
+    def _output_schema(plugin: Plugin) -> dict[str, Any] | None:
+        try:
+            get_out = getattr(plugin, "get_output_schema", None)
+            if callable(get_out):
+                return get_out()
+        except Exception:
+            logger.exception("Plugin.get_output_schema failed for %s", getattr(plugin, "name", "?"))
+        return None
+
+    def _validate(self, plugin: Plugin, params: dict[str, Any], op: str) -> dict[str, Any]:
+        """Validate params against the plugin's per-op input schema.
+
+        If the plugin exposes no schema for *op*, params are returned unchanged
+        (with stripped None values). Uses ``resolve_op_schema`` to try the per-op
+        interface first and fall back to the deprecated combined schema. The
+        schema and its validator are compiled once per (plugin, version, op)
+        and reused until the plugin registry is refreshed.
+
+        Raises
+        ------
+            HTTPException: 422 when validation fails or required keys are missing.
+
+        """
+        try:
+            compiled = compiled_schema(plugin, op, "input", lambda: self._input_schema_with_op(plugin, op))
+        except Exception as e:
+            # The plugin's schema itself is invalid (meta-schema check).
+            raise HTTPException(status_code=422, detail={"error": "validation_error", "message": str(e)})
+        if compiled is None:
+            return params
 
         # Strip None values so optional params sent as null by OLLAMA don't fail schema validation.
         # Models sometimes call {..., "param": None, ...} which fails validation, so we strip them.
         clean_params = {k: v for k, v in params.items() if v is not None}
 
         # If jsonschema is available, perform full validation; otherwise minimal required check
-        if jsonschema is not None:
-            try:
-                jsonschema.validate(instance=clean_params, schema=schema)  # type: ignore[attr-defined]
-                return clean_params
-            except Exception as e:
+        if compiled.validator is not None:
+            error = compiled.first_error(clean_params)
+            if error is not None:
                 # Normalize error surface
                 raise HTTPException(
                     status_code=422,
                     detail={
                         "error": "validation_error",
-                        "message": str(e),
+                        "message": str(error),
                     },
                 )
+            return clean_params
         # Fallback: minimal check
-        required = (schema or {}).get("required", [])
+        required = compiled.schema.get("required", [])
         for k in required:
             if k not in clean_params:
                 raise HTTPException(status_code=422, detail={"error": "validation_error", "missing": k})
         return clean_params
 
     def _validate_output(self, plugin: Plugin, data: dict[str, Any] | None) -> None:
-        schema = None
         try:
-            get_out = getattr(plugin, "get_output_schema", None)
-            if callable(get_out):
-                schema = get_out()
-        except Exception:
-            logger.exception("Plugin.get_output_schema failed for %s", getattr(plugin, "name", "?"))
-        if not schema:
+            compiled = compiled_schema(plugin, "", "output", lambda: self._output_schema(plugin))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail={"error": "output_validation_error", "message": str(e)})
+        if compiled is None:
             return
-        if jsonschema is not None:
-            try:
-                jsonschema.validate(instance=data or {}, schema=schema)  # type: ignore[attr-defined]
-            except Exception as e:
+        if compiled.validator is not None:
+            error = compiled.first_error(data or {})
+            if error is not None:
                 raise HTTPException(
                     status_code=500,
                     detail={
                         "error": "output_validation_error",
-                        "message": str(e),
+                        "message": str(error),
                     },
                 )
         else:
             # Minimal fallback: ensure required keys are present
-            required = (schema or {}).get("required", [])
+            required = compiled.schema.get("required", [])
             for k in required:
                 if not data or k not in data:
                     raise HTTPException(status_code=500, detail={"error": "output_validation_error", "missing": k})
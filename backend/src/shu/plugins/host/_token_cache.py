@@ -0,0 +1,95 @@
+"""Process-wide access-token cache shared by every AuthCapability.
+
+Tokens are keyed by (provider, subject, scope-set) plus whatever else
+identifies the grant (issuer, credential row, key fingerprint). A token is
+re-minted shortly before it expires rather than after, and at most one mint
+per key runs at a time: concurrent callers await the in-flight mint (or keep
+using the still-valid cached token) instead of each starting their own. A
+failed early refresh falls back to the cached token until it expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+
+from shu.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Refresh this long before expiry, capped at a tenth of the token lifetime.
+_REFRESH_MARGIN_SECONDS = 300.0
+# Past this many entries, expired tokens are dropped on insert.
+_PRUNE_THRESHOLD = 1024
+
+# key -> (refresh_at_epoch, expires_at_epoch, access_token)
+_tokens: dict[tuple[str, ...], tuple[float, float, str]] = {}
+_inflight: dict[tuple[str, ...], asyncio.Future[str | None]] = {}
+
+# A mint returns (access_token, lifetime_seconds), or None when no token is available.
+Mint = Callable[[], Awaitable[tuple[str, float] | None]]
+
+
+def token_key(provider: str, subject: str | None, scopes: Iterable[str], *extra: str) -> tuple[str, ...]:
+    """Build a cache key; scope order and duplicates do not matter."""
+    return (provider, subject or "", " ".join(sorted({str(s) for s in scopes if s})), *extra)
+
+
+async def get_or_mint(key: tuple[str, ...], mint: Mint) -> str | None:
+    """Return the cached token for ``key``, minting (single-flight) when it is due for refresh."""
+    now = time.time()
+    entry = _tokens.get(key)
+    if entry and entry[0] > now:
+        return entry[2]
+
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        if entry and entry[1] > now:
+            return entry[2]
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        minted = await mint()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        # An early refresh that fails keeps serving the cached token until it
+        # actually expires; the next call past refresh_at retries the mint.
+        if entry and entry[1] > time.time():
+            logger.warning("Token refresh for %s failed, using cached token until it expires: %s", key[0], exc)
+            future.set_result(entry[2])
+            return entry[2]
+        future.set_exception(exc)
+        future.exception()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    else:
+        token = None
+        if minted:
+            token, lifetime = minted
+            _store(key, token, lifetime)
+        future.set_result(token)
+        return token
+    finally:
+        _inflight.pop(key, None)
+
+
+def _store(key: tuple[str, ...], token: str, lifetime: float) -> None:
+    now = time.time()
+    lifetime = max(float(lifetime), 1.0)
+    if len(_tokens) >= _PRUNE_THRESHOLD:
+        for stale in [k for k, (_, expires_at, _) in _tokens.items() if expires_at <= now]:
+            del _tokens[stale]
+    _tokens[key] = (now + lifetime - min(_REFRESH_MARGIN_SECONDS, lifetime / 10), now + lifetime, token)
+
+
+def clear_token_cache() -> None:
+    """Drop every cached token (tests, credential rotation)."""
+    _tokens.clear()
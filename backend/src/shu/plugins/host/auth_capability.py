@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import os
 import time
-from datetime import UTC
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 from sqlalchemy import and_, select
@@ -12,14 +17,53 @@ from ...core.config import get_settings_instance
 from ...core.database import get_db_session
 from ...models.provider_credential import ProviderCredential
 from ...providers.registry import get_auth_adapter
+from ._token_cache import get_or_mint, token_key
 from .base import ImmutableCapabilityMixin
 from .exceptions import HttpRequestFailed
 from .http_capability import HttpCapability
 
 logger = get_logger(__name__)
 
-# Simple in-memory token cache: key -> (expires_at_epoch, access_token)
-_TOKEN_CACHE: dict[tuple[str, ...], tuple[float, str]] = {}
+# Parsed service-account JSON: (inline JSON or path, file mtime) -> info
+_SA_INFO_CACHE: dict[tuple[str, float | None], dict[str, Any]] = {}
+
+
+def _read_service_account_info(raw: str) -> dict[str, Any]:
+    """Parse inline service-account JSON or load it from a file path.
+
+    Parsed results are cached per value (and per file mtime for paths), so
+    repeated token requests don't re-read or re-parse the key material.
+    """
+    raw_str = raw.strip()
+    mtime = None
+    if not raw_str.startswith("{") and os.path.exists(raw_str):
+        mtime = Path(raw_str).stat().st_mtime
+    cache_key = (raw_str, mtime)
+    info = _SA_INFO_CACHE.get(cache_key)
+    if info is None:
+        if mtime is not None:
+            with open(raw_str, encoding="utf-8") as f:
+                info = json.load(f)
+        else:
+            info = json.loads(raw_str)
+        _SA_INFO_CACHE[cache_key] = info
+    return dict(info)
+
+
+def _refresh_google_auth_credentials(
+    sa_info: dict[str, Any], scopes: list[str], subject: str | None
+) -> tuple[str, float] | None:
+    """Mint a service-account token with google-auth (blocking; run in a thread)."""
+    from google.auth.transport.requests import Request as _GARequest  # type: ignore
+    from google.oauth2 import service_account as _sa  # type: ignore
+
+    creds = _sa.Credentials.from_service_account_info(sa_info, scopes=scopes, subject=subject)
+    creds.refresh(_GARequest())
+    if not getattr(creds, "token", None):
+        return None
+    expiry = getattr(creds, "expiry", None)  # naive UTC
+    lifetime = (expiry.replace(tzinfo=UTC) - datetime.now(UTC)).total_seconds() if expiry else 3600.0
+    return str(creds.token), lifetime
 
 
 class AuthCapability(ImmutableCapabilityMixin):
@@ -153,8 +197,7 @@ class AuthCapability(ImmutableCapabilityMixin):
             data.update({k: str(v) for k, v in extra_params.items() if v is not None})
         return await self._post_form(token_url, data)
 
-    # TODO: Refactor this function. It's too complex (number of branches and statements).
-    async def user_google_token(self, *, required_scopes: list[str] | None = None) -> str | None:  # noqa: PLR0912, PLR0915
+    async def user_google_token(self, *, required_scopes: list[str] | None = None) -> str | None:
         """Return an access token for the connected Google account of the current user (via ProviderCredential).
         - If required_scopes is provided, ensure the stored grant includes all of them; otherwise return None
         - Uses the stored refresh_token in provider_credentials and refreshes via Google's token endpoint.
@@ -217,64 +260,79 @@ class AuthCapability(ImmutableCapabilityMixin):
             req_scopes_list = [str(s) for s in (required_scopes or []) if s]
             if req_scopes_list:
                 refresh_data["scope"] = " ".join(req_scopes_list)
-                try:
-                    logger.info(
-                        "user_google_token: refresh with scope param",
-                        extra={"scopes": req_scopes_list},
-                    )
-                except Exception:
-                    pass
-            body = await self._post_form(token_url, refresh_data)
-            access_token = body.get("access_token") if isinstance(body, dict) else None
-            if not access_token:
-                return None
 
-            # Optional: verify token scopes
+            # Keyed by credential row so a reconnect never serves the old grant's token.
+            key = token_key("google", self._user_id, req_scopes_list, str(row.id))
+            return await get_or_mint(
+                key, lambda: self._refresh_google_user_token(db, row, token_url, refresh_data, req_scopes_list)
+            )
+        finally:
             try:
-                req_scopes = set(req_scopes_list)
-                if req_scopes:
-                    ti = await self._http.fetch(
-                        "GET",
-                        "https://www.googleapis.com/oauth2/v1/tokeninfo",
-                        params={"access_token": access_token},
-                        headers={"Accept": "application/json"},
-                        timeout=10,
-                    )
-                    body_ti = ti.get("body") if isinstance(ti, dict) else None
-                    scope_str = body_ti.get("scope") if isinstance(body_ti, dict) else None
-                    token_scopes = {s for s in str(scope_str or "").split() if s}
-                    if req_scopes and token_scopes and not req_scopes.issubset(token_scopes):
-                        logger.warning(
-                            "user_google_token: refreshed access token lacks required scopes; required=%s token_scopes=%s",
-                            list(req_scopes),
-                            list(token_scopes),
-                        )
-                        return None
-            except Exception as e:
-                try:
-                    logger.warning("user_google_token: tokeninfo check failed", extra={"error": str(e)[:200]})
-                except Exception:
-                    pass
+                await db.close()
+            except Exception:
+                pass
 
-            # Best-effort: update access token/expiry on the row
+    async def _refresh_google_user_token(
+        self,
+        db: Any,
+        row: ProviderCredential,
+        token_url: str,
+        refresh_data: dict[str, str],
+        req_scopes_list: list[str],
+    ) -> tuple[str, float] | None:
+        """Mint a user access token from the stored refresh token and persist it on the row."""
+        if req_scopes_list:
             try:
-                from datetime import datetime, timedelta
+                logger.info(
+                    "user_google_token: refresh with scope param",
+                    extra={"scopes": req_scopes_list},
+                )
+            except Exception:
+                pass
+        body = await self._post_form(token_url, refresh_data)
+        access_token = body.get("access_token") if isinstance(body, dict) else None
+        if not access_token:
+            return None
+        exp_in = int((body.get("expires_in") if isinstance(body, dict) else 3600) or 3600)
 
-                row.set_access_token(access_token)
-                exp_in = int((body.get("expires_in") if isinstance(body, dict) else 3600) or 3600)
-                row.expires_at = datetime.now(UTC) + timedelta(seconds=max(1, exp_in))
-                await db.commit()
+        # Optional: verify token scopes
+        try:
+            req_scopes = set(req_scopes_list)
+            if req_scopes:
+                ti = await self._http.fetch(
+                    "GET",
+                    "https://www.googleapis.com/oauth2/v1/tokeninfo",
+                    params={"access_token": access_token},
+                    headers={"Accept": "application/json"},
+                    timeout=10,
+                )
+                body_ti = ti.get("body") if isinstance(ti, dict) else None
+                scope_str = body_ti.get("scope") if isinstance(body_ti, dict) else None
+                token_scopes = {s for s in str(scope_str or "").split() if s}
+                if req_scopes and token_scopes and not req_scopes.issubset(token_scopes):
+                    logger.warning(
+                        "user_google_token: refreshed access token lacks required scopes; required=%s token_scopes=%s",
+                        list(req_scopes),
+                        list(token_scopes),
+                    )
+                    return None
+        except Exception as e:
+            try:
+                logger.warning("user_google_token: tokeninfo check failed", extra={"error": str(e)[:200]})
             except Exception:
-                try:
-                    await db.rollback()
-                except Exception:
-                    pass
-            return access_token
-        finally:
+                pass
+
+        # Best-effort: update access token/expiry on the row
+        try:
+            row.set_access_token(access_token)
+            row.expires_at = datetime.now(UTC) + timedelta(seconds=max(1, exp_in))
+            await db.commit()
+        except Exception:
             try:
-                await db.close()
+                await db.rollback()
             except Exception:
                 pass
+        return access_token, exp_in
 
     async def jwt_bearer_assertion(
         self,
@@ -290,6 +348,46 @@ class AuthCapability(ImmutableCapabilityMixin):
         extra_headers: dict[str, Any] | None = None,
         extra_claims: dict[str, Any] | None = None,
     ) -> str:
+        scope_list = scopes.split(" ") if isinstance(scopes, str) else list(scopes)
+        key = token_key(
+            "jwt_bearer",
+            subject,
+            scope_list,
+            token_url,
+            issuer,
+            hashlib.sha256(private_key_pem.encode("utf-8")).hexdigest(),
+        )
+        token = await get_or_mint(
+            key,
+            lambda: self._mint_jwt_bearer_token(
+                token_url=token_url,
+                issuer=issuer,
+                scopes=scopes,
+                subject=subject,
+                private_key_pem=private_key_pem,
+                audience=audience,
+                lifetime_seconds=lifetime_seconds,
+                extra_headers=extra_headers,
+                extra_claims=extra_claims,
+            ),
+        )
+        assert token is not None  # the mint raises rather than returning None
+        return token
+
+    async def _mint_jwt_bearer_token(
+        self,
+        *,
+        token_url: str,
+        issuer: str,
+        scopes: str | list[str],
+        subject: str | None,
+        private_key_pem: str,
+        audience: str | None = None,
+        lifetime_seconds: int = 3600,
+        extra_headers: dict[str, Any] | None = None,
+        extra_claims: dict[str, Any] | None = None,
+    ) -> tuple[str, float]:
+        """Sign a JWT-bearer assertion and exchange it for an access token."""
         # Prefer PyJWT if present; fallback to python-jose
         try:
             import jwt  # type: ignore
@@ -329,18 +427,6 @@ class AuthCapability(ImmutableCapabilityMixin):
         )
         assertion = jwt.encode(claims, private_key_pem, algorithm="RS256", headers=headers)
 
-        cache_key = (
-            "jwt_bearer",
-            token_url,
-            issuer,
-            subject or "",
-            scope_str,
-            str(hash(private_key_pem)),
-        )
-        cached = _TOKEN_CACHE.get(cache_key)
-        if cached and cached[0] - 60 > now:
-            return cached[1]
-
         body = await self._post_form(
             token_url,
             {
@@ -361,25 +447,12 @@ class AuthCapability(ImmutableCapabilityMixin):
             )
             raise RuntimeError(f"Token response missing access_token: {body}")
         expires_in = int(body.get("expires_in", 3600))
-        _TOKEN_CACHE[cache_key] = (now + min(expires_in, 3600), token)
-        return token
+        return token, min(expires_in, 3600)
 
     async def google_service_account_token(self, *, scopes: list[str], subject: str | None = None) -> str:
-        import json
-        import os
-
-        sa_info: dict[str, Any] | None = None
         if self._settings.google_service_account_json:
-            raw = self._settings.google_service_account_json
             try:
-                raw_str = raw.strip()
-                if raw_str.startswith("{"):
-                    sa_info = json.loads(raw_str)
-                elif os.path.exists(raw_str):
-                    with open(raw_str, encoding="utf-8") as f:
-                        sa_info = json.load(f)
-                else:
-                    sa_info = json.loads(raw_str)
+                sa_info = _read_service_account_info(self._settings.google_service_account_json)
             except Exception as e:
                 raise RuntimeError(
                     "Invalid GOOGLE_SERVICE_ACCOUNT_JSON content or path; set GOOGLE_SERVICE_ACCOUNT_JSON to a file path or inline JSON"
@@ -388,54 +461,45 @@ class AuthCapability(ImmutableCapabilityMixin):
             fp = self._settings.google_service_account_file
             if not os.path.exists(fp):
                 raise RuntimeError(f"Service account file not found: {fp}")
-            with open(fp, encoding="utf-8") as f:
-                sa_info = json.load(f)
+            sa_info = _read_service_account_info(fp)
         else:
             raise RuntimeError(
                 "Service account credentials not configured (set GOOGLE_SERVICE_ACCOUNT_JSON to a file path or inline JSON)"
             )
 
-        assert sa_info is not None, "Service account JSON not loaded"
         client_email = sa_info.get("client_email")
         private_key = sa_info.get("private_key")
         token_uri = sa_info.get("token_uri", "https://oauth2.googleapis.com/token")
-        key_id = sa_info.get("private_key_id")
         if not (client_email and private_key):
             raise RuntimeError("Service account JSON missing client_email or private_key")
         if "\\n" in private_key:
             private_key = private_key.replace("\\n", "\n")
 
-        # Try google-auth Credentials flow first
-        try:
-            from google.auth.transport.requests import Request as _GARequest  # type: ignore
-            from google.oauth2 import service_account as _sa  # type: ignore
+        async def mint() -> tuple[str, float]:
+            # Try google-auth Credentials flow first; its refresh is blocking I/O,
+            # so it runs on a worker thread.
+            try:
+                minted = await asyncio.to_thread(_refresh_google_auth_credentials, sa_info, scopes, subject)
+                if minted:
+                    return minted
+            except Exception:
+                pass
 
-            creds = _sa.Credentials.from_service_account_info(
-                sa_info,
+            # Fallback: manual JWT bearer assertion
+            return await self._mint_jwt_bearer_token(
+                token_url=token_uri,
+                issuer=client_email,
                 scopes=scopes,
                 subject=subject,
+                private_key_pem=private_key,
+                audience=token_uri,
             )
-            creds.refresh(_GARequest())
-            if getattr(creds, "token", None):
-                return str(creds.token)
-        except Exception:
-            pass
-
-        # Fallback: manual JWT bearer assertion
-        return await self.jwt_bearer_assertion(
-            token_url=token_uri,
-            issuer=client_email,
-            scopes=scopes,
-            subject=subject,
-            private_key_pem=private_key,
-            key_id=key_id,
-            audience=token_uri,
-        )
 
-    async def google_domain_delegation_check(self, *, scopes: list[str], subject: str) -> dict[str, Any]:
-        import json
-        import os
+        token = await get_or_mint(token_key("google_service_account", subject, scopes, client_email), mint)
+        assert token is not None  # the mint raises rather than returning None
+        return token
 
+    async def google_domain_delegation_check(self, *, scopes: list[str], subject: str) -> dict[str, Any]:
         sa_info: dict[str, Any] | None = None
         raw = self._settings.google_service_account_json or self._settings.google_service_account_file
         if not raw:
@@ -445,14 +509,7 @@ class AuthCapability(ImmutableCapabilityMixin):
                 "error": {"message": "Service account not configured (GOOGLE_SERVICE_ACCOUNT_JSON)"},
             }
         try:
-            raw_str = str(raw).strip()
-            if raw_str.startswith("{"):
-                sa_info = json.loads(raw_str)
-            elif os.path.exists(raw_str):
-                with open(raw_str, encoding="utf-8") as f:
-                    sa_info = json.load(f)
-            else:
-                sa_info = json.loads(raw_str)
+            sa_info = _read_service_account_info(str(raw))
         except Exception as e:
             return {
                 "ready": False,
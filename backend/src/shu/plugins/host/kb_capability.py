@@ -9,6 +9,7 @@ from shu.core.logging import get_logger
 from ...core.database import get_db_session
 from ...core.ocr_modes import OcrMode
 from ...knowledge.ko import KnowledgeObject
+from ...services.ingestion_service import ingest_batch as _host_ingest_batch
 from ...services.ingestion_service import ingest_document as _host_ingest_document
 from ...services.ingestion_service import ingest_email as _host_ingest_email
 from ...services.ingestion_service import ingest_text as _host_ingest_text
@@ -193,6 +194,43 @@ class KbCapability(ImmutableCapabilityMixin):
             except Exception:
                 pass
 
+    async def ingest_batch(self, knowledge_base_id: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Ingest many text/email knowledge objects in one session.
+
+        Each item carries the keyword arguments of ``ingest_text`` (``kind``
+        omitted or ``"text"``) or ``ingest_email`` (``kind="email"``). Unchanged
+        items are skipped against one prefetch of existing documents, the rest
+        are written and their embed jobs enqueued in bulk. Returns one result
+        per item, in order.
+        """
+        if not items:
+            return []
+        db = await get_db_session()
+        try:
+            results = await _host_ingest_batch(
+                db,
+                knowledge_base_id,
+                list(items),
+                plugin_name=self._plugin_name,
+                user_id=self._user_id,
+            )
+            logger.info(
+                "host.kb.ingest_batch",
+                extra={
+                    "plugin": self._plugin_name,
+                    "user_id": self._user_id,
+                    "kb": knowledge_base_id,
+                    "items": len(results),
+                    "skipped": sum(1 for r in results if r.get("skipped")),
+                },
+            )
+            return results
+        finally:
+            try:
+                await db.close()
+            except Exception:
+                pass
+
     async def ingest_thread(
         self,
         knowledge_base_id: str,
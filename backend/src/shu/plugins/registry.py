@@ -17,6 +17,7 @@ from ..core.logging import get_logger
 from ..models.plugin_registry import PluginDefinition  # v0 registry model reused for v1 enablement checks
 from .base import Plugin
 from .loader import PluginLoader, PluginRecord
+from .schema import clear_compiled_schemas
 
 logger = get_logger(__name__)
 
@@ -30,6 +31,12 @@ class PluginRegistry:
     def refresh(self) -> None:
         self._manifest = self._loader.discover()
         self._cache.clear()
+        clear_compiled_schemas()
+
+    def evict(self, name: str) -> None:
+        """Drop the cached instance of *name* and its compiled schemas."""
+        self._cache.pop(name, None)
+        clear_compiled_schemas(name)
 
     async def full_refresh(self, session: AsyncSession) -> bool:
         """Async refresh: discover filesystem plugins and MCP connections.
@@ -223,7 +230,7 @@ class PluginRegistry:
                 except Exception:
                     enabled = False
             if not enabled:
-                self._cache.pop(name, None)
+                self.evict(name)
                 logger.info("Plugin '%s' evicted from cache due to disable toggle", name)
                 return None
             return self._cache[name]
@@ -4,52 +4,76 @@ Intended for /api/v1/plugins/* endpoints initially.
 
 from __future__ import annotations
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, *, max_bytes: int, path_prefix: str | None = None) -> None:
-        super().__init__(app)
+class RequestSizeLimitMiddleware:
+    def __init__(self, app: ASGIApp, *, max_bytes: int, path_prefix: str | None = None) -> None:
+        self.app = app
         self.max_bytes = int(max_bytes)
         self.path_prefix = path_prefix.rstrip("/") if path_prefix else None
 
-    async def dispatch(self, request: Request, call_next):
+    def _too_large(self, detail: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=413,
+            content={
+                "error": "REQUEST_TOO_LARGE",
+                "detail": detail,
+                "max_bytes": self.max_bytes,
+            },
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
         if self.path_prefix and not request.url.path.startswith(self.path_prefix):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Prefer Content-Length when present; fall back to reading limited body size.
         cl = request.headers.get("content-length")
         if cl is not None:
             try:
                 if int(cl) > self.max_bytes:
-                    return JSONResponse(
-                        status_code=413,
-                        content={
-                            "error": "REQUEST_TOO_LARGE",
-                            "detail": f"Content-Length exceeds limit of {self.max_bytes} bytes",
-                            "max_bytes": self.max_bytes,
-                        },
-                    )
+                    response = self._too_large(f"Content-Length exceeds limit of {self.max_bytes} bytes")
+                    await response(scope, receive, send)
+                    return
             except ValueError:
                 pass
 
-        # Read body carefully with limit to avoid buffering huge payloads
-        body = await request.body()
-        if len(body) > self.max_bytes:
-            return JSONResponse(
-                status_code=413,
-                content={
-                    "error": "REQUEST_TOO_LARGE",
-                    "detail": f"Payload exceeds limit of {self.max_bytes} bytes",
-                    "max_bytes": self.max_bytes,
-                },
-            )
-
-        # Replace the stream so downstream can read the same body
-        async def receive():
-            return {"type": "http.request", "body": body, "more_body": False}
-
-        request._receive = receive  # type: ignore[attr-defined]
-        return await call_next(request)
+        # Read body carefully with limit to avoid buffering huge payloads:
+        # stop as soon as the running total crosses the limit.
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_bytes:
+                response = self._too_large(f"Payload exceeds limit of {self.max_bytes} bytes")
+                await response(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        # Replay the buffered body once so downstream can read it, then hand
+        # back to the server's receive (e.g. for disconnect detection).
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 from shu.core.logging import get_logger
 from shu.plugins.base import Plugin
 
+try:  # optional dependency
+    import jsonschema  # type: ignore
+except Exception:  # pragma: no cover
+    jsonschema = None  # type: ignore
+
 logger = get_logger(__name__)
 
 
@@ -137,3 +143,61 @@ def extract_op_title(schema: dict[str, Any] | None, op: str) -> str | None:
         return ((schema.get("properties") or {}).get("op") or {}).get("x-ui", {}).get("enum_labels", {}).get(str(op))
     except Exception:
         return None
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """A plugin schema with its prebuilt validator (``None`` without jsonschema)."""
+
+    schema: dict[str, Any]
+    validator: Any | None
+
+    def first_error(self, instance: Any) -> Exception | None:
+        """Return the error ``jsonschema.validate`` would raise for *instance*, or None."""
+        if self.validator is None:
+            return None
+        return jsonschema.exceptions.best_match(self.validator.iter_errors(instance))  # type: ignore[union-attr]
+
+
+# (plugin name, version, op, "input" | "output") -> compiled schema, or None
+# when the plugin has no schema for that slot. Cleared by PluginRegistry.refresh
+# and whenever the registry drops a cached plugin instance.
+_COMPILED_SCHEMAS: dict[tuple[str, str, str, str], CompiledSchema | None] = {}
+
+
+def compiled_schema(
+    plugin: Plugin, op: str, kind: str, build: Callable[[], dict[str, Any] | None]
+) -> CompiledSchema | None:
+    """Return the cached compiled schema for *plugin*/*op*/*kind*, building it on first use.
+
+    *build* produces the schema dict. The meta-schema check and validator
+    construction happen once per key instead of on every call; a schema that
+    fails the meta-schema check raises ``jsonschema.SchemaError`` and is not
+    cached.
+    """
+    key = (str(getattr(plugin, "name", "")), str(getattr(plugin, "version", "")), op, kind)
+    try:
+        return _COMPILED_SCHEMAS[key]
+    except KeyError:
+        pass
+
+    schema = build()
+    compiled = None
+    if schema:
+        validator = None
+        if jsonschema is not None:
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema)
+        compiled = CompiledSchema(schema=schema, validator=validator)
+    _COMPILED_SCHEMAS[key] = compiled
+    return compiled
+
+
+def clear_compiled_schemas(plugin_name: str | None = None) -> None:
+    """Drop compiled schemas for *plugin_name*, or for every plugin when omitted."""
+    if plugin_name is None:
+        _COMPILED_SCHEMAS.clear()
+        return
+    for key in [k for k in _COMPILED_SCHEMAS if k[0] == plugin_name]:
+        _COMPILED_SCHEMAS.pop(key, None)
@@ -139,6 +139,21 @@ def _open_pdf(
                 pass
 
 
+def _pixmap_to_array(pix: Any) -> Any:
+    """View a rendered pixmap's samples as a uint8 NumPy array for EasyOCR.
+
+    Wraps the pixmap's sample buffer directly instead of encoding a PNG and
+    decoding it again. The array borrows the pixmap's memory, so the pixmap
+    must outlive it.
+    """
+    import numpy as np
+
+    rows = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.h, pix.stride)
+    if pix.n == 1:
+        return rows[:, : pix.w]
+    return rows[:, : pix.w * pix.n].reshape(pix.h, pix.w, pix.n)
+
+
 class UnsupportedFileFormatError(Exception):
     """Exception raised when a file format is not supported for text extraction."""
 
@@ -977,12 +992,15 @@ class TextExtractor:
                 )
             return "", 0.0
 
-    # TODO: Refactor this function. It's too complex (number of branches and statements).
     async def _process_pdf_with_ocr_direct(self, doc, file_path: str, progress_callback=None):  # noqa: PLR0912, PLR0915
-        """Process PDF with OCR directly (EasyOCR with Tesseract fallback)."""
-        import threading
-        import time
+        """Process PDF with OCR directly (EasyOCR with Tesseract fallback).
 
+        Pages are rasterised one at a time on the calling thread (fitz
+        documents are not thread-safe) and handed to EasyOCR threads, with up
+        to ``SHU_OCR_PAGE_CONCURRENCY`` pages in flight. Rendering of the next
+        page overlaps OCR of the previous ones; page texts are reassembled in
+        page order.
+        """
         # Get the OCR instance (EasyOCR with Tesseract fallback)
         try:
             logger.info("Getting OCR instance", extra={"file_path": file_path})
@@ -998,205 +1016,202 @@ class TextExtractor:
             logger.info("Falling back to Tesseract", extra={"file_path": file_path})
             return self._process_pdf_with_tesseract_direct(doc, file_path, progress_callback)
 
-        # Process pages with EasyOCR
-        import fitz  # Add missing import
+        import fitz
 
-        page_outputs: list[str] = []
-        confidence_scores = []
+        settings = self.config_manager.settings
+        render_scale = settings.ocr_render_scale
+        max_in_flight = max(1, int(settings.ocr_page_concurrency))
         total_pages = len(doc)
 
-        for page_num in range(total_pages):
-            # Check for job cancellation before processing each page
-            if self._current_sync_job_id and self.is_job_cancelled(self._current_sync_job_id):
-                logger.info(f"OCR cancelled for job {self._current_sync_job_id}, stopping at page {page_num + 1}")
-                break
+        page_outputs: dict[int, str] = {}
+        confidence_scores: list[float] = []
+        in_flight: dict[asyncio.Task, tuple[int, float]] = {}  # task -> (page_num, start time)
+        next_page = 0
+        completed = 0
+        progress_ticks = 0
+        cancelled = False
 
-            page = doc[page_num]
+        try:
+            while in_flight or (next_page < total_pages and not cancelled):
+                # Fill free slots with freshly rendered pages
+                while next_page < total_pages and len(in_flight) < max_in_flight and not cancelled:
+                    # Check for job cancellation before processing each page
+                    if self._current_sync_job_id and self.is_job_cancelled(self._current_sync_job_id):
+                        logger.info(
+                            f"OCR cancelled for job {self._current_sync_job_id}, stopping at page {next_page + 1}"
+                        )
+                        cancelled = True
+                        break
 
-            logger.info(
-                f"Starting OCR processing for page {page_num + 1}/{total_pages}",
-                extra={"file_path": file_path},
-            )
+                    page_num = next_page
+                    next_page += 1
+                    logger.info(
+                        f"Starting OCR processing for page {page_num + 1}/{total_pages}",
+                        extra={"file_path": file_path},
+                    )
+                    if progress_callback:
+                        progress_callback(completed, total_pages)
 
-            # Update progress - starting page
-            page_start_time = time.time()
-            if progress_callback:
-                progress_callback(page_num, total_pages)
+                    try:
+                        pix = doc[page_num].get_pixmap(matrix=fitz.Matrix(render_scale, render_scale))
+                        img_array = _pixmap_to_array(pix)
+                    except Exception as e:
+                        logger.warning(f"Failed to render page {page_num + 1}: {e}", extra={"file_path": file_path})
+                        page_outputs[page_num] = f"[OCR failed on page {page_num + 1}]"
+                        completed += 1
+                        if progress_callback:
+                            progress_callback(completed, total_pages, 0.0, 0)
+                        continue
 
-            # Convert page to image
-            render_scale = self.config_manager.settings.ocr_render_scale
-            pix = page.get_pixmap(matrix=fitz.Matrix(render_scale, render_scale))
+                    task = asyncio.create_task(self._ocr_page(ocr, page_num, img_array, pix, file_path))
+                    # The OCR thread holds the only remaining references to the page image.
+                    del img_array
+                    pix = None
+                    in_flight[task] = (page_num, time.time())
 
-            # Convert to numpy array for EasyOCR
-            import io
+                if not in_flight:
+                    continue
 
-            import numpy as np
-            from PIL import Image
+                done, _ = await asyncio.wait(in_flight, timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
 
-            # Convert pixmap to PIL Image, then to numpy array
-            img_data = pix.tobytes("png")
-            pil_image = Image.open(io.BytesIO(img_data))
-            img_array = np.array(pil_image)
-
-            # Set up progress monitoring during OCR processing
-            ocr_result = None
-            ocr_error = None
-            ocr_complete = threading.Event()
-
-            def run_ocr(
-                current_page_num: int = page_num,
-                _img: "np.ndarray" = img_array,
-                _done: threading.Event = ocr_complete,
-            ) -> None:
-                """Run OCR in a separate thread so we can monitor progress."""
-                nonlocal ocr_result, ocr_error
-                try:
-                    # Check for job cancellation before starting OCR
-                    if self._current_sync_job_id and self.is_job_cancelled(self._current_sync_job_id):
-                        logger.info(f"OCR cancelled for job {self._current_sync_job_id} on page {current_page_num + 1}")
-                        ocr_error = Exception("OCR cancelled")
-                        return
-
-                    logger.info(f"Running OCR on page {current_page_num + 1}", extra={"file_path": file_path})
-
-                    # Use EasyOCR (Tesseract fallback handled in get_ocr_instance)
-                    if hasattr(ocr, "readtext"):  # EasyOCR
-                        ocr_result = ocr.readtext(_img)
-                        logger.info(f"EasyOCR completed for page {current_page_num + 1}")
-                    else:
-                        logger.error(f"Unknown OCR instance type on page {current_page_num + 1}")
-                        ocr_result = []
-                except Exception as e:
-                    ocr_error = e
-                    logger.error(f"OCR failed on page {current_page_num + 1}: {e}", extra={"file_path": file_path})
-                finally:
-                    _done.set()
-
-            # Start OCR in background thread
-            ocr_thread = threading.Thread(target=run_ocr)
-            ocr_thread.daemon = False  # Changed to False so we can properly track and wait for completion
-            ocr_thread.start()
-            # Release our references to the page image data immediately.  The thread
-            # captured img_array by value via the default-arg binding above, so GC can
-            # reclaim this memory as soon as the thread finishes — even if the thread
-            # is orphaned by a timeout.
-            del img_array
-            pix = None
-
-            # Register thread for tracking if we have a job ID
-            if self._current_sync_job_id:
-                self.register_ocr_thread(self._current_sync_job_id, ocr_thread)
-
-            # Monitor progress while OCR is running (ASYNC VERSION with timeout)
-            progress_counter = 0
-            max_wait_time = self.config_manager.settings.ocr_page_timeout
-            start_time = time.time()
-
-            while not ocr_complete.is_set():
-                # Check for job cancellation
-                if self._current_sync_job_id and self.is_job_cancelled(self._current_sync_job_id):
-                    logger.info(f"OCR monitoring cancelled for job {self._current_sync_job_id} on page {page_num + 1}")
-                    # Force completion and use empty result
-                    ocr_complete.set()
-                    ocr_result = []
-                    break
+                if not done:
+                    # Send progress updates every 0.5 seconds while pages are in OCR
+                    progress_ticks += 1
+                    if progress_callback:
+                        # Show sub-page progress (page X.Y/total), max 90% of a page
+                        progress_callback(completed + min(progress_ticks * 0.1, 0.9), total_pages)
+                    continue
+
+                progress_ticks = 0
+                for task in done:
+                    page_num, page_start_time = in_flight.pop(task)
+                    page_text = ""
+                    try:
+                        result = task.result()
+                        if result:
+                            page_confidences: list[float] = []
+                            detections: list[str] = []
+                            for detection in result:
+                                if len(detection) >= 3:
+                                    _bbox, text_content, confidence = detection
+                                    detections.append(text_content)
+                                    page_confidences.append(confidence)
+                            page_text = " ".join(detections)
+                            page_outputs[page_num] = page_text
+                            confidence_scores.extend(page_confidences)
 
-                # Check for timeout
-                if time.time() - start_time > max_wait_time:
-                    logger.error(
-                        f"OCR timeout on page {page_num + 1} after {max_wait_time} seconds",
-                        extra={"file_path": file_path},
-                    )
-                    # Force completion and use empty result
-                    ocr_complete.set()
-                    ocr_result = []
-                    break
+                        logger.info(
+                            f"Completed OCR processing for page {page_num + 1}/{total_pages}",
+                            extra={"file_path": file_path},
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            f"EasyOCR processing failed on page {page_num + 1}: {e}",
+                            extra={"file_path": file_path},
+                        )
+                        # Add a marker for the failed page to maintain page count
+                        page_outputs[page_num] = f"[OCR failed on page {page_num + 1}]"
 
-                # Send progress updates every 0.5 seconds during OCR processing (NON-BLOCKING)
-                # This also makes cancellation more responsive
-                await asyncio.sleep(0.5)
-                progress_counter += 1
+                    # Update progress - page completed (or failed)
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total_pages, time.time() - page_start_time, len(page_text))
+        finally:
+            # Stop monitoring pages still in flight if we are cancelled or fail;
+            # their OCR threads finish on their own and are tracked per job.
+            for task in in_flight:
+                task.cancel()
 
-                if progress_callback:
-                    # Show sub-page progress (page X.Y/total)
-                    sub_progress = min(progress_counter * 0.1, 0.9)  # Max 90% progress per page
-                    effective_page = page_num + sub_progress
-                    progress_callback(effective_page, total_pages)
+        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
 
-                logger.debug(
-                    f"OCR processing page {page_num + 1}, progress update {progress_counter}",
-                    extra={"file_path": file_path},
-                )
+        text = "\n".join(page_outputs[page_num] for page_num in sorted(page_outputs))
+        return text.strip(), "ocr", avg_confidence
 
-            # Wait for OCR to complete (NON-BLOCKING with timeout)
-            try:
-                await asyncio.wait_for(
-                    asyncio.get_running_loop().run_in_executor(None, ocr_thread.join),
-                    timeout=10.0,  # 10 second timeout for thread join
-                )
-            except TimeoutError:
-                logger.error(
-                    f"OCR thread join timeout on page {page_num + 1}",
-                    extra={"file_path": file_path},
-                )
+    async def _ocr_page(self, ocr, page_num: int, img_array, pix, file_path: str) -> list | None:
+        """Run EasyOCR on one rendered page in a tracked thread.
+
+        ``pix`` is kept alive alongside ``img_array`` because the array is a
+        view over the pixmap's sample buffer. Returns the raw EasyOCR
+        detections, or ``[]`` if the page timed out or the job was cancelled;
+        raises if OCR itself failed.
+        """
+        ocr_result = None
+        ocr_error = None
+        ocr_complete = threading.Event()
 
-            # Process results
-            page_text = ""
+        def run_ocr(_img=img_array, _pix=pix, _done: threading.Event = ocr_complete) -> None:
+            """Run OCR in a separate thread so we can monitor progress."""
+            nonlocal ocr_result, ocr_error
             try:
-                if ocr_error:
-                    raise ocr_error
-
-                result = ocr_result
-
-                if result:
-                    page_confidences = []
-
-                    # Handle EasyOCR result format
-                    if hasattr(ocr, "readtext"):  # EasyOCR format
-                        detections: list[str] = []
-                        for detection in result:
-                            if len(detection) >= 3:
-                                _bbox, text_content, confidence = detection
-                                detections.append(text_content)
-                                page_confidences.append(confidence)
-                        page_text = " ".join(detections)
-                    else:
-                        # Unknown format - log warning and skip
-                        logger.warning(f"Unknown OCR result format on page {page_num + 1}")
-                        page_text = ""
-
-                    page_outputs.append(page_text)
-                    confidence_scores.extend(page_confidences)
-
-                # Update progress - page completed
-                page_time = time.time() - page_start_time
-                page_text_length = len(page_text) if page_text else 0
-                if progress_callback:
-                    progress_callback(page_num + 1, total_pages, page_time, page_text_length)
+                # Check for job cancellation before starting OCR
+                if self._current_sync_job_id and self.is_job_cancelled(self._current_sync_job_id):
+                    logger.info(f"OCR cancelled for job {self._current_sync_job_id} on page {page_num + 1}")
+                    ocr_error = Exception("OCR cancelled")
+                    return
 
-                logger.info(
-                    f"Completed OCR processing for page {page_num + 1}/{total_pages}",
-                    extra={"file_path": file_path},
-                )
+                logger.info(f"Running OCR on page {page_num + 1}", extra={"file_path": file_path})
 
+                # Use EasyOCR (Tesseract fallback handled in get_ocr_instance)
+                if hasattr(ocr, "readtext"):  # EasyOCR
+                    ocr_result = ocr.readtext(_img)
+                    logger.info(f"EasyOCR completed for page {page_num + 1}")
+                else:
+                    logger.error(f"Unknown OCR instance type on page {page_num + 1}")
+                    ocr_result = []
             except Exception as e:
-                logger.warning(
-                    f"EasyOCR processing failed on page {page_num + 1}: {e}",
+                ocr_error = e
+                logger.error(f"OCR failed on page {page_num + 1}: {e}", extra={"file_path": file_path})
+            finally:
+                _done.set()
+
+        # Start OCR in background thread
+        ocr_thread = threading.Thread(target=run_ocr)
+        ocr_thread.daemon = False  # Non-daemon so we can properly track and wait for completion
+        ocr_thread.start()
+        # Release our references to the page image data immediately.  The thread
+        # captured img_array and pix by value via the default-arg binding above,
+        # so GC can reclaim this memory as soon as the thread finishes — even if
+        # the thread is orphaned by a timeout.
+        del img_array
+        pix = None
+
+        # Register thread for tracking if we have a job ID
+        if self._current_sync_job_id:
+            self.register_ocr_thread(self._current_sync_job_id, ocr_thread)
+
+        # Monitor the thread for cancellation and timeout (non-blocking)
+        max_wait_time = self.config_manager.settings.ocr_page_timeout
+        start_time = time.time()
+
+        while not ocr_complete.is_set():
+            if self._current_sync_job_id and self.is_job_cancelled(self._current_sync_job_id):
+                logger.info(f"OCR monitoring cancelled for job {self._current_sync_job_id} on page {page_num + 1}")
+                return []
+
+            if time.time() - start_time > max_wait_time:
+                logger.error(
+                    f"OCR timeout on page {page_num + 1} after {max_wait_time} seconds",
                     extra={"file_path": file_path},
                 )
+                return []
 
-                # Still update progress even if page failed
-                page_time = time.time() - page_start_time
-                if progress_callback:
-                    progress_callback(page_num + 1, total_pages, page_time, 0)
-
-                # Add empty text for failed page to maintain page count
-                page_outputs.append(f"[OCR failed on page {page_num + 1}]")
-                continue
+            await asyncio.sleep(0.1)
 
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
+        # Wait for OCR to complete (NON-BLOCKING with timeout)
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(None, ocr_thread.join),
+                timeout=10.0,  # 10 second timeout for thread join
+            )
+        except TimeoutError:
+            logger.error(
+                f"OCR thread join timeout on page {page_num + 1}",
+                extra={"file_path": file_path},
+            )
 
-        return "\n".join(page_outputs).strip(), "ocr", avg_confidence
+        if ocr_error:
+            raise ocr_error
+        return ocr_result
 
     def _process_pdf_with_tesseract_direct(self, doc, file_path: str, progress_callback=None):
         """Process PDF with Tesseract directly (no process isolation)."""
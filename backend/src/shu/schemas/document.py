@@ -86,6 +86,7 @@ class DocumentResponse(BaseModel):
     word_count: int | None = Field(None, description="Number of words")
     character_count: int | None = Field(None, description="Number of characters")
     chunk_count: int = Field(0, description="Number of chunks")
+    token_count: int | None = Field(None, description="Number of tokens")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
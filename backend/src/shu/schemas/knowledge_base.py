@@ -10,6 +10,13 @@ from enum import Enum
 from pydantic import BaseModel, Field, field_validator
 
 from shu.core.config import get_settings_instance
+from shu.services.chunking import CHUNKING_STRATEGIES
+
+
+def _validate_chunking_strategy(v: str | None) -> str | None:
+    if v is not None and v not in CHUNKING_STRATEGIES:
+        raise ValueError(f"chunking_strategy must be one of: {', '.join(sorted(CHUNKING_STRATEGIES))}")
+    return v
 
 
 class KnowledgeBaseStatus(str, Enum):
@@ -168,6 +175,11 @@ class KnowledgeBaseBase(BaseModel):
     )
     chunk_size: int = Field(1000, ge=100, le=5000, description="Text chunk size")
     chunk_overlap: int = Field(200, ge=0, le=1000, description="Chunk overlap size")
+    chunking_strategy: str | None = Field(
+        None,
+        description="Chunking strategy: 'fixed', 'sentence', 'paragraph', 'markdown' or 'token_budget' "
+        "(null uses the instance default)",
+    )
 
     @field_validator("chunk_overlap")
     @classmethod
@@ -178,6 +190,12 @@ class KnowledgeBaseBase(BaseModel):
             raise ValueError("chunk_overlap must be less than chunk_size")
         return v
 
+    @field_validator("chunking_strategy")
+    @classmethod
+    def validate_chunking_strategy(cls, v: str | None) -> str | None:
+        """Validate chunking strategy."""
+        return _validate_chunking_strategy(v)
+
 
 class KnowledgeBaseCreate(KnowledgeBaseBase):
     """Schema for creating a new (non-personal) knowledge base.
@@ -197,6 +215,7 @@ class KnowledgeBaseUpdate(BaseModel):
     embedding_model: str | None = None
     chunk_size: int | None = Field(None, ge=100, le=5000)
     chunk_overlap: int | None = Field(None, ge=0, le=1000)
+    chunking_strategy: str | None = None
 
     @field_validator("chunk_overlap")
     @classmethod
@@ -207,6 +226,12 @@ class KnowledgeBaseUpdate(BaseModel):
             raise ValueError("chunk_overlap must be less than chunk_size")
         return v
 
+    @field_validator("chunking_strategy")
+    @classmethod
+    def validate_chunking_strategy(cls, v: str | None) -> str | None:
+        """Validate chunking strategy."""
+        return _validate_chunking_strategy(v)
+
 
 class KnowledgeBaseResponse(KnowledgeBaseBase):
     """Schema for knowledge base responses."""
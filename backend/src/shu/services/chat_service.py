@@ -3,6 +3,7 @@
 Handles conversation management, message processing, and LLM integration.
 """
 
+import asyncio
 import uuid
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
@@ -39,6 +40,7 @@ from ..services.message_utils import serialize_message_for_sse
 from ..services.prompt_service import PromptService
 from ..services.query_service import QueryService
 from ..services.side_call_service import SideCallService
+from ..utils.tokenization import count_tokens
 from .chat_streaming import EnsembleStreamingHelper, ProviderResponseEvent, StreamLifecycle
 from .knowledge_base_service import KnowledgeBaseService
 from .providers.adapter_base import get_adapter_from_provider
@@ -744,6 +746,7 @@ class ChatService:
             conversation_id=conversation.id,
             role="assistant",
             content=run.result_content,
+            token_count=await asyncio.to_thread(count_tokens, run.result_content),
             message_metadata={
                 "source": "experience_result",
                 "experience_run_id": run_id,
@@ -1031,11 +1034,13 @@ class ChatService:
                 },
             )
 
+        content = content.strip()
         message = Message(
             id=message_id,
             conversation_id=conversation_id,
             role=role,
-            content=content.strip(),
+            content=content,
+            token_count=await asyncio.to_thread(count_tokens, content),
             model_id=model_id,
             message_metadata=metadata_dict,
             parent_message_id=parent_message_id,
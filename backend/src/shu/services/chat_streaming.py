@@ -32,6 +32,7 @@ from ..models.llm_provider import Conversation, Message
 from ..services.chat_types import ChatContext, ChatMessage
 from ..services.message_utils import serialize_message_for_sse
 from ..services.usage_recording import get_usage_recorder
+from ..utils.tokenization import count_tokens
 
 if TYPE_CHECKING:  # pragma: no cover
     from .chat_service import ChatService, ModelExecutionInputs, RegenLineageInfo, VariantStreamResult
@@ -111,8 +112,10 @@ class StreamLifecycle:
     Lifetime: registered in ``app.state.in_flight_streams`` when the
     stream starts; removed by the ``stream_variant`` task's ``finally``
     when its variant completes. Process-local — never serialized, never
-    shared across pods. The terminate endpoint is single-pod-scoped by
-    construction (an SSE stream is anchored to the pod that opened it).
+    shared across pods. Generation stays anchored to the pod that opened
+    the stream; other pods reach it only through the stream's replay log
+    (``shu.core.stream_replay``), which carries the events for resuming
+    clients and a stop flag the producing pod turns into ``user_terminated``.
     """
 
     stream_id: str
@@ -1248,7 +1251,7 @@ class EnsembleStreamingHelper:
             # (b) callback failure (callback returns cleanly without stamping).
             early_state: dict[str, Any] = {}
 
-            async def on_terminate_signal() -> None:
+            async def on_terminate_signal() -> None:  # noqa: PLR0915
                 """SHU-803 follow-up: write the partial assistant Message at terminate-signal time.
 
                 Lifted from the regen-aware INSERT block in
@@ -1269,6 +1272,7 @@ class EnsembleStreamingHelper:
                 exits, so usage tokens reflect drain's final snapshot.
                 """
                 partial_content = "".join(content_accumulator).strip()
+                partial_token_count = await asyncio.to_thread(count_tokens, partial_content)
                 try:
                     partial_usage_at_signal = client.provider_adapter.get_partial_usage_snapshot()
                 except Exception:
@@ -1334,6 +1338,7 @@ class EnsembleStreamingHelper:
                                 conversation_id=conversation_id,
                                 role="assistant",
                                 content=partial_content,
+                                token_count=partial_token_count,
                                 model_id=inputs.model.id,
                                 message_metadata=metadata_dict,
                                 parent_message_id=assigned_parent_message_id,
@@ -1823,6 +1828,9 @@ class EnsembleStreamingHelper:
             # path the variant_index is fixed by the ensemble loop counter
             # and there is no risk of a UNIQUE collision. We use a single
             # retry budget either way to keep the control flow simple.
+            full_content = result.full_content.strip()
+            # Tokenize once, off the event loop, rather than on every retry.
+            full_token_count = await asyncio.to_thread(count_tokens, full_content)
             attempt = 0
             assistant_msg_loaded: Message | None = None
             while True:
@@ -1890,7 +1898,8 @@ class EnsembleStreamingHelper:
                             id=assigned_message_id,
                             conversation_id=conversation_id,
                             role="assistant",
-                            content=result.full_content.strip(),
+                            content=full_content,
+                            token_count=full_token_count,
                             model_id=inputs.model.id,
                             message_metadata=metadata_dict,
                             parent_message_id=assigned_parent_message_id,
@@ -2089,6 +2098,8 @@ class EnsembleStreamingHelper:
             # still surface the original LLM error to the SSE consumer even
             # if the persistence transaction itself rolls back.
             error_text = result.error_message or "An unexpected error occurred"
+            apology = f"I apologize, but I encountered an error: {error_text}"
+            apology_token_count = await asyncio.to_thread(count_tokens, apology)
             try:
                 async with session_factory() as session:
                     # SHU-802: stamp stream_state on the apology Message too —
@@ -2105,7 +2116,8 @@ class EnsembleStreamingHelper:
                         id=str(uuid.uuid4()),
                         conversation_id=conversation_id,
                         role="assistant",
-                        content=f"I apologize, but I encountered an error: {error_text}",
+                        content=apology,
+                        token_count=apology_token_count,
                         model_id=inputs.model.id,
                         message_metadata=error_metadata,
                     )
@@ -15,6 +15,8 @@ class ChatMessage:
     created_at: Any | None
     attachments: list[Attachment]
     metadata: dict[str, Any] | None = None
+    # Stored token count of ``content`` (STORED_TOKEN_ENCODING), when known.
+    token_count: int | None = None
 
     @classmethod
     def from_message(cls, message: Message, attachments: list[Attachment] | None = None) -> "ChatMessage":
@@ -25,6 +27,7 @@ class ChatMessage:
             created_at=getattr(message, "created_at", None),
             attachments=list(attachments or []),
             metadata=getattr(message, "message_metadata", None),
+            token_count=getattr(message, "token_count", None),
         )
 
     @classmethod
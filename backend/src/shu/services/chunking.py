@@ -0,0 +1,274 @@
+"""Structure-aware text chunkers for document ingestion.
+
+Each chunker walks the extracted document text lazily and yields ``ChunkSpan``
+objects carrying exact ``start``/``end`` offsets into the source text, so peak
+memory stays bounded to the text itself plus the chunk currently being built.
+
+Strategies (selected per knowledge base via ``chunking_strategy``):
+
+- ``fixed``: fixed-width character windows (the original behavior).
+- ``sentence``: packs whole sentences up to ``chunk_size`` characters.
+- ``paragraph``: packs blank-line separated paragraphs, falling back to
+  sentences for paragraphs larger than the budget.
+- ``markdown``: packs sections starting at markdown headings, falling back to
+  paragraphs for oversized sections.
+- ``token_budget``: packs sentences up to a tokenizer-measured budget derived
+  from ``chunk_size`` (~4 characters per token), so chunks never exceed the
+  embedding model's input window regardless of language or content density.
+
+Overlap is applied at unit granularity: structure-aware strategies carry over
+trailing whole units totalling at most ``chunk_overlap`` (characters, or
+tokens for ``token_budget``) instead of cutting mid-sentence.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import ClassVar
+
+from ..utils.tokenization import chars_to_tokens_estimate, estimate_tokens, tokens_to_chars_estimate
+
+DEFAULT_CHUNKING_STRATEGY = "fixed"
+
+# Sentence terminator (plus any closing quotes/brackets) followed by whitespace,
+# or a line break. Group 1 is the part that stays with the preceding sentence.
+_SENTENCE_BOUNDARY = re.compile(r"([.!?]+[\"')\]]*)\s+|\n\s*")
+# One or more blank lines.
+_PARAGRAPH_BOUNDARY = re.compile(r"\n[ \t]*\n\s*")
+# ATX markdown heading at the start of a line.
+_MARKDOWN_HEADING = re.compile(r"^#{1,6}[ \t]+\S", re.MULTILINE)
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkSpan:
+    """A chunk of source text identified by its exact offsets."""
+
+    start: int
+    end: int
+    text: str
+
+
+def _trimmed(text: str, start: int, end: int) -> tuple[int, int] | None:
+    """Shrink ``[start, end)`` to exclude surrounding whitespace; None if empty."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end) if start < end else None
+
+
+class Chunker(ABC):
+    """Base class for chunking strategies."""
+
+    name: ClassVar[str]
+
+    def __init__(self, chunk_size: int, chunk_overlap: int) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be non-negative and less than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    @abstractmethod
+    def iter_spans(self, text: str, start: int = 0, end: int | None = None) -> Iterator[ChunkSpan]:
+        """Yield chunks of ``text[start:end]`` in document order."""
+
+
+class FixedWidthChunker(Chunker):
+    """Fixed-width character windows with a fixed character overlap."""
+
+    name = "fixed"
+
+    def iter_spans(self, text: str, start: int = 0, end: int | None = None) -> Iterator[ChunkSpan]:
+        end = len(text) if end is None else end
+        step = self.chunk_size - self.chunk_overlap
+        while start < end:
+            chunk_end = min(start + self.chunk_size, end)
+            yield ChunkSpan(start, chunk_end, text[start:chunk_end])
+            if chunk_end == end:
+                break
+            start += step
+
+
+class _PackingChunker(Chunker):
+    """Greedily packs structural units (sentences, paragraphs, ...) into chunks.
+
+    Subclasses define how a region of text splits into units and which finer
+    chunker handles a single unit that is larger than the budget on its own.
+    """
+
+    def _measure(self, text: str, start: int, end: int) -> int:
+        """Size of a unit in budget units (characters by default)."""
+        return end - start
+
+    def _gap(self, prev_end: int, start: int) -> int:
+        """Budget cost of the separator between two adjacent units."""
+        return start - prev_end
+
+    @abstractmethod
+    def _iter_units(self, text: str, start: int, end: int) -> Iterator[tuple[int, int]]:
+        """Yield whitespace-trimmed ``(start, end)`` unit offsets in order."""
+
+    @abstractmethod
+    def _fallback(self) -> Chunker:
+        """Chunker used to split a unit that exceeds the budget by itself."""
+
+    def iter_spans(self, text: str, start: int = 0, end: int | None = None) -> Iterator[ChunkSpan]:
+        end = len(text) if end is None else end
+        # (start, end, size) for each unit in the chunk being built
+        window: deque[tuple[int, int, int]] = deque()
+        size = 0
+
+        for unit_start, unit_end in self._iter_units(text, start, end):
+            unit_size = self._measure(text, unit_start, unit_end)
+
+            if unit_size > self.chunk_size:
+                if window:
+                    yield self._emit(text, window)
+                    window.clear()
+                    size = 0
+                yield from self._fallback().iter_spans(text, unit_start, unit_end)
+                continue
+
+            added = unit_size + (self._gap(window[-1][1], unit_start) if window else 0)
+            if window and size + added > self.chunk_size:
+                yield self._emit(text, window)
+                window, size = self._carry_overlap(window, unit_start, unit_size)
+                added = unit_size + (self._gap(window[-1][1], unit_start) if window else 0)
+
+            window.append((unit_start, unit_end, unit_size))
+            size += added
+
+        if window:
+            yield self._emit(text, window)
+
+    def _carry_overlap(
+        self, window: deque[tuple[int, int, int]], next_start: int, next_size: int
+    ) -> tuple[deque[tuple[int, int, int]], int]:
+        """Keep the trailing units that fit in the overlap and leave room for the next unit."""
+        carried: deque[tuple[int, int, int]] = deque()
+        carried_size = 0
+        for unit in reversed(window):
+            candidate = unit[2] + (carried_size + self._gap(unit[1], carried[0][0]) if carried else 0)
+            gap_to_next = self._gap(carried[-1][1] if carried else unit[1], next_start)
+            if candidate > self.chunk_overlap or candidate + gap_to_next + next_size > self.chunk_size:
+                break
+            carried.appendleft(unit)
+            carried_size = candidate
+        return carried, carried_size
+
+    @staticmethod
+    def _emit(text: str, window: deque[tuple[int, int, int]]) -> ChunkSpan:
+        start, end = window[0][0], window[-1][1]
+        return ChunkSpan(start, end, text[start:end])
+
+
+class SentenceChunker(_PackingChunker):
+    """Packs whole sentences up to ``chunk_size`` characters."""
+
+    name = "sentence"
+
+    def _iter_units(self, text: str, start: int, end: int) -> Iterator[tuple[int, int]]:
+        pos = start
+        for match in _SENTENCE_BOUNDARY.finditer(text, start, end):
+            unit_end = match.end(1) if match.group(1) else match.start()
+            unit = _trimmed(text, pos, unit_end)
+            if unit:
+                yield unit
+            pos = match.end()
+        unit = _trimmed(text, pos, end)
+        if unit:
+            yield unit
+
+    def _fallback(self) -> Chunker:
+        return FixedWidthChunker(self.chunk_size, self.chunk_overlap)
+
+
+class ParagraphChunker(_PackingChunker):
+    """Packs blank-line separated paragraphs up to ``chunk_size`` characters."""
+
+    name = "paragraph"
+
+    def _iter_units(self, text: str, start: int, end: int) -> Iterator[tuple[int, int]]:
+        pos = start
+        for match in _PARAGRAPH_BOUNDARY.finditer(text, start, end):
+            unit = _trimmed(text, pos, match.start())
+            if unit:
+                yield unit
+            pos = match.end()
+        unit = _trimmed(text, pos, end)
+        if unit:
+            yield unit
+
+    def _fallback(self) -> Chunker:
+        return SentenceChunker(self.chunk_size, self.chunk_overlap)
+
+
+class MarkdownHeadingChunker(_PackingChunker):
+    """Packs markdown sections (a heading and its body) up to ``chunk_size`` characters."""
+
+    name = "markdown"
+
+    def _iter_units(self, text: str, start: int, end: int) -> Iterator[tuple[int, int]]:
+        pos = start
+        for match in _MARKDOWN_HEADING.finditer(text, start, end):
+            unit = _trimmed(text, pos, match.start())
+            if unit:
+                yield unit
+            pos = match.start()
+        unit = _trimmed(text, pos, end)
+        if unit:
+            yield unit
+
+    def _fallback(self) -> Chunker:
+        return ParagraphChunker(self.chunk_size, self.chunk_overlap)
+
+
+class TokenBudgetChunker(SentenceChunker):
+    """Packs whole sentences up to a tokenizer-measured token budget.
+
+    ``chunk_size`` and ``chunk_overlap`` are given in characters like every
+    other strategy and converted to a token budget, so a KB can switch
+    strategies without re-tuning its sizes.
+    """
+
+    name = "token_budget"
+
+    def __init__(self, chunk_size: int, chunk_overlap: int) -> None:
+        budget = max(1, chars_to_tokens_estimate(chunk_size))
+        super().__init__(budget, min(chars_to_tokens_estimate(chunk_overlap), budget - 1))
+
+    def _measure(self, text: str, start: int, end: int) -> int:
+        return estimate_tokens(text[start:end])
+
+    def _gap(self, prev_end: int, start: int) -> int:
+        return 0
+
+    def _fallback(self) -> Chunker:
+        return FixedWidthChunker(
+            tokens_to_chars_estimate(self.chunk_size), tokens_to_chars_estimate(self.chunk_overlap)
+        )
+
+
+CHUNKING_STRATEGIES: dict[str, type[Chunker]] = {
+    cls.name: cls
+    for cls in (FixedWidthChunker, SentenceChunker, ParagraphChunker, MarkdownHeadingChunker, TokenBudgetChunker)
+}
+
+
+def get_chunker(strategy: str | None, chunk_size: int, chunk_overlap: int) -> Chunker:
+    """Build the chunker for ``strategy`` (``None`` selects the default strategy).
+
+    Raises:
+        ValueError: If the strategy name is unknown.
+
+    """
+    name = strategy or DEFAULT_CHUNKING_STRATEGY
+    try:
+        chunker_cls = CHUNKING_STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown chunking strategy {name!r}; expected one of {sorted(CHUNKING_STRATEGIES)}") from None
+    return chunker_cls(chunk_size, chunk_overlap)
@@ -1,8 +1,13 @@
+import hashlib
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from sqlalchemy import update
+
+from shu.core.database import get_async_session_local
 from shu.core.logging import get_logger
 from shu.models.llm_provider import Conversation
+from shu.utils.tokenization import STORED_TOKEN_ENCODING, count_tokens, encoding_for_model
 
 from .chat_types import ChatMessage
 
@@ -11,6 +16,15 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Conversation.meta key holding the rolling summary of aged-out messages:
+# {"text", "last_message_id", "fingerprint", "message_count"}.
+CONTEXT_SUMMARY_META_KEY = "context_summary"
+
+
+def _fingerprint(message_ids: list[str]) -> str:
+    """Identify an exact message sequence (order and variant choice included)."""
+    return hashlib.sha256("\n".join(message_ids).encode()).hexdigest()
+
 
 class ContextWindowManager:
     """Helper that encapsulates the context-window logic previously inside ChatService."""
@@ -46,8 +60,15 @@ class ContextWindowManager:
         max_tokens: int,
         recent_message_limit_override: int | None = None,
         user_id: str | None = None,
+        model_name: str | None = None,
     ) -> list[ChatMessage]:
-        """Apply pruning/summarization to the message list."""
+        """Apply pruning/summarization to the message list.
+
+        Tokens are counted with ``model_name``'s tokenizer. Messages carrying a
+        stored ``token_count`` reuse it when that tokenizer matches the stored
+        encoding, so persisted history is never re-tokenized.
+        """
+        use_stored_counts = encoding_for_model(model_name) == STORED_TOKEN_ENCODING
 
         def get_content_text(msg) -> str:
             """Extract text from message content, handling multimodal formats."""
@@ -63,12 +84,15 @@ class ContextWindowManager:
                 return " ".join(text_parts)
             return ""
 
-        def estimate_tokens(text: str) -> int:
+        def estimate_tokens(msg) -> int:
             if self._token_estimator_override:
-                return self._token_estimator_override(text)
-            return int(len(text.split()) * 1.3)
+                return self._token_estimator_override(get_content_text(msg))
+            stored = getattr(msg, "token_count", None)
+            if use_stored_counts and isinstance(stored, int) and isinstance(getattr(msg, "content", None), str):
+                return stored
+            return count_tokens(get_content_text(msg), model=model_name)
 
-        total_tokens = sum(estimate_tokens(get_content_text(msg)) for msg in messages)
+        total_tokens = sum(estimate_tokens(msg) for msg in messages)
         if total_tokens <= max_tokens:
             return messages
 
@@ -86,7 +110,7 @@ class ContextWindowManager:
         managed_messages: list[ChatMessage] = []
 
         if older_messages:
-            summary = await self._summarize_conversation_history(older_messages, user_id=user_id)
+            summary = await self._rolling_summary(conversation, older_messages, user_id=user_id)
             if summary:
                 # Use 'user' role instead of 'system' to avoid adapter compatibility issues.
                 # Adapters like Anthropic/Gemini expect system content via ChatContext.system_prompt,
@@ -104,7 +128,7 @@ class ContextWindowManager:
 
         managed_messages.extend(recent_messages)
 
-        final_tokens = sum(estimate_tokens(get_content_text(msg)) for msg in managed_messages)
+        final_tokens = sum(estimate_tokens(msg) for msg in managed_messages)
         logger.info(
             "Context window managed: %s -> %s tokens",
             total_tokens,
@@ -113,10 +137,79 @@ class ContextWindowManager:
 
         return managed_messages
 
+    async def _rolling_summary(
+        self,
+        conversation: Conversation,
+        older_messages: list[ChatMessage],
+        *,
+        user_id: str | None = None,
+    ) -> str | None:
+        """Return a summary of ``older_messages``, reusing the persisted one where possible.
+
+        The summary stored on ``conversation.meta`` records the last message it
+        covers and a fingerprint of every covered message id. If that sequence
+        is still a prefix of ``older_messages`` only the messages aged out since
+        are folded in (nothing at all when none have); otherwise, e.g. after a
+        regeneration or a switch to another variant replaced a covered
+        message, the whole history is summarized afresh.
+        """
+        message_ids = [getattr(msg, "id", None) for msg in older_messages]
+        if not all(message_ids):
+            # Unpersisted messages can't be checkpointed.
+            return await self._summarize_conversation_history(older_messages, user_id=user_id)
+
+        stored: dict[str, Any] | None = (getattr(conversation, "meta", None) or {}).get(CONTEXT_SUMMARY_META_KEY)
+        covered = self._covered_prefix(stored, message_ids)
+        if stored and covered == len(message_ids):
+            return stored["text"]
+
+        if covered:
+            summary = await self._summarize_conversation_history(
+                older_messages[covered:], user_id=user_id, previous_summary=stored["text"]
+            )
+        else:
+            summary = await self._summarize_conversation_history(older_messages, user_id=user_id)
+
+        if summary:
+            await self._store_summary(conversation, summary, message_ids)
+        return summary
+
+    @staticmethod
+    def _covered_prefix(stored: dict[str, Any] | None, message_ids: list[str]) -> int:
+        """Return how many leading ``message_ids`` the stored summary covers (0 if stale)."""
+        if not stored or not stored.get("text"):
+            return 0
+        try:
+            end = message_ids.index(stored.get("last_message_id")) + 1
+        except ValueError:
+            return 0
+        return end if stored.get("fingerprint") == _fingerprint(message_ids[:end]) else 0
+
+    async def _store_summary(self, conversation: Conversation, summary: str, message_ids: list[str]) -> None:
+        meta = dict(getattr(conversation, "meta", None) or {})
+        meta[CONTEXT_SUMMARY_META_KEY] = {
+            "text": summary,
+            "last_message_id": message_ids[-1],
+            "fingerprint": _fingerprint(message_ids),
+            "message_count": len(message_ids),
+        }
+        conversation.meta = meta
+        # The chat path detaches its request session before anything commits,
+        # so write the checkpoint on a short-lived session of its own rather
+        # than committing (or rolling back) the caller's.
+        try:
+            async with get_async_session_local()() as session:
+                await session.execute(update(Conversation).where(Conversation.id == conversation.id).values(meta=meta))
+                await session.commit()
+        except Exception as exc:
+            # The summary is still used for this turn; the next one recomputes it.
+            logger.warning("Failed to persist context summary for conversation %s: %s", conversation.id, exc)
+
     async def _summarize_conversation_history(
         self,
         messages: list[ChatMessage],
         user_id: str | None = None,
+        previous_summary: str | None = None,
     ) -> str | None:
         if not messages:
             return None
@@ -125,6 +218,10 @@ class ContextWindowManager:
             conversation_text = "\n".join(
                 [f"{getattr(msg, 'role', '').title()}: {getattr(msg, 'content', '')}" for msg in messages]
             )
+            if previous_summary:
+                # Incremental update: fold the newly aged-out messages into the
+                # existing summary instead of re-reading the whole transcript.
+                conversation_text = f"[Summary of the conversation so far]: {previous_summary}\n{conversation_text}"
 
             if "{conversation_text}" in self.summary_prompt:
                 summary_prompt = self.summary_prompt.replace("{conversation_text}", conversation_text)
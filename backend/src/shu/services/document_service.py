@@ -4,12 +4,16 @@ This module contains business logic for managing documents,
 including CRUD operations, processing, and multi-source support.
 """
 
-from sqlalchemy import and_, delete, func, select
+import asyncio
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Row, and_, delete, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..billing.enforcement import assert_document_count_under_limit
 from ..billing.entitlements import LimitExceededError
+from ..core.config import get_settings_instance
 from ..core.exceptions import DocumentNotFoundError, KnowledgeBaseNotFoundError
 from ..core.logging import get_logger
 from ..models.document import Document, DocumentChunk, DocumentStatus
@@ -25,6 +29,11 @@ from ..schemas.document import (
     DocumentUpdate,
     ProcessingStatus,
 )
+from ..utils.tokenization import count_tokens
+
+if TYPE_CHECKING:
+    from ..models.knowledge_base import KnowledgeBase
+    from .rag_processing_service import RAGProcessingService
 
 logger = get_logger(__name__)
 
@@ -423,8 +432,21 @@ class DocumentService:
         content: str,
         *,
         user_id: str | None = None,
+        batch_embeddings: bool = False,
     ) -> tuple[int, int, int]:
-        """Generate chunks for a document and update processing stats."""
+        """Generate chunks for a document and update processing stats.
+
+        With ``SHU_INCREMENTAL_CHUNK_EMBEDDING`` enabled (the default), the new
+        chunk layout is diffed against the stored chunks and only chunks whose
+        text or position changed are embedded and written; unchanged chunks keep
+        their stored embedding, summary and topics untouched. Otherwise every
+        chunk is deleted and re-embedded.
+
+        With ``batch_embeddings`` set (ingestion workers), chunk texts go through
+        the process-wide ``EmbeddingBatcher`` and are coalesced with those of
+        other documents being embedded concurrently.
+        """
+        from ..core.embedding_batcher import get_batching_embedding_service
         from ..core.embedding_service import get_embedding_service
         from .knowledge_base_service import KnowledgeBaseService
         from .rag_processing_service import RAGProcessingService
@@ -434,28 +456,152 @@ class DocumentService:
         if not kb:
             raise KnowledgeBaseNotFoundError(knowledge_base_id)
 
-        embedding_service = await get_embedding_service()
+        if batch_embeddings:
+            embedding_service = await get_batching_embedding_service()
+        else:
+            embedding_service = await get_embedding_service()
         rag = RAGProcessingService(embedding_service)
-        chunks = await rag.process_document(
-            document_id=document.id,
-            knowledge_base=kb,
-            text=content,
-            document_title=title,
-            user_id=user_id,
-        )
 
-        await self.db.execute(delete(DocumentChunk).where(DocumentChunk.document_id == document.id))
-        for chunk in chunks:
-            self.db.add(chunk)
+        if get_settings_instance().incremental_chunk_embedding:
+            chunk_count = await self._sync_chunks_incrementally(rag, kb, document, title, content, user_id=user_id)
+        else:
+            chunks = await rag.process_document(
+                document_id=document.id,
+                knowledge_base=kb,
+                text=content,
+                document_title=title,
+                user_id=user_id,
+            )
+
+            await self.db.execute(delete(DocumentChunk).where(DocumentChunk.document_id == document.id))
+            for chunk in chunks:
+                self.db.add(chunk)
+            chunk_count = len(chunks)
 
         word_count = len(content.split()) if content else 0
         character_count = len(content)
-        chunk_count = len(chunks)
+        # Full-document bodies can be large; keep the BPE pass off the event loop.
+        token_count = await asyncio.to_thread(count_tokens, content)
 
-        document.update_content_stats(word_count, character_count, chunk_count)
+        document.update_content_stats(word_count, character_count, chunk_count, token_count)
 
         return word_count, character_count, chunk_count
 
+    async def _sync_chunks_incrementally(
+        self,
+        rag: "RAGProcessingService",
+        kb: "KnowledgeBase",
+        document: Document,
+        title: str,
+        content: str,
+        *,
+        user_id: str | None = None,
+    ) -> int:
+        """Diff the new chunk layout against stored chunks and write only the changes.
+
+        A stored chunk is reused when the chunk at the same index has identical
+        text (by SHA-256), offsets and metadata, and carries an embedding from the
+        active model. Changed indexes are embedded in one batch and updated in
+        place (clearing their now-stale profile fields), new indexes are inserted,
+        and indexes past the new chunk count are deleted.
+
+        Returns the new chunk count.
+        """
+        from .rag_processing_service import chunk_content_hash
+
+        planned = rag.build_chunks(document.id, kb, content, document_title=title)
+        stored = await self._load_chunk_fingerprints(document.id)
+        model_name = rag.embedding_service.model_name
+
+        to_embed: list[DocumentChunk] = []
+        stored_ids: dict[int, str] = {}
+        for chunk in planned:
+            fingerprint = stored.get(chunk.chunk_index)
+            if fingerprint is not None:
+                stored_ids[chunk.chunk_index] = fingerprint.id
+                if (
+                    fingerprint.has_embedding
+                    and fingerprint.embedding_model == model_name
+                    and fingerprint.content_hash == chunk_content_hash(chunk.content)
+                    and fingerprint.start_char == chunk.start_char
+                    and fingerprint.end_char == chunk.end_char
+                    and fingerprint.chunk_metadata == chunk.chunk_metadata
+                ):
+                    continue
+            to_embed.append(chunk)
+
+        await rag.embed_chunks(to_embed, user_id=user_id)
+
+        updates = [
+            {
+                "id": stored_ids[chunk.chunk_index],
+                "content": chunk.content,
+                "char_count": chunk.char_count,
+                "word_count": chunk.word_count,
+                "token_count": chunk.token_count,
+                "start_char": chunk.start_char,
+                "end_char": chunk.end_char,
+                "embedding": chunk.embedding,
+                "embedding_model": chunk.embedding_model,
+                "embedding_created_at": chunk.embedding_created_at,
+                "chunk_metadata": chunk.chunk_metadata,
+                "summary": None,
+                "summary_embedding": None,
+                "topics": None,
+            }
+            for chunk in to_embed
+            if chunk.chunk_index in stored_ids
+        ]
+        if updates:
+            await self.db.execute(update(DocumentChunk), updates)
+
+        for chunk in to_embed:
+            if chunk.chunk_index not in stored_ids:
+                self.db.add(chunk)
+
+        if any(idx >= len(planned) for idx in stored):
+            await self.db.execute(
+                delete(DocumentChunk).where(
+                    DocumentChunk.document_id == document.id,
+                    DocumentChunk.chunk_index >= len(planned),
+                )
+            )
+
+        logger.debug(
+            "Synced document chunks incrementally",
+            extra={
+                "doc_id": document.id,
+                "chunk_count": len(planned),
+                "reused": len(planned) - len(to_embed),
+                "updated": len(updates),
+                "inserted": len(to_embed) - len(updates),
+                "deleted": sum(1 for idx in stored if idx >= len(planned)),
+            },
+        )
+
+        return len(planned)
+
+    async def _load_chunk_fingerprints(self, doc_id: str) -> dict[int, Row]:
+        """Load the diff fingerprint of every stored chunk, keyed by chunk_index.
+
+        Chunk text is hashed server-side so the comparison never transfers the
+        stored content or embedding vectors.
+        """
+        content_hash = func.encode(func.sha256(func.convert_to(DocumentChunk.content, "UTF8")), "hex")
+        result = await self.db.execute(
+            select(
+                DocumentChunk.id,
+                DocumentChunk.chunk_index,
+                DocumentChunk.start_char,
+                DocumentChunk.end_char,
+                DocumentChunk.embedding_model,
+                DocumentChunk.chunk_metadata,
+                DocumentChunk.embedding.is_not(None).label("has_embedding"),
+                content_hash.label("content_hash"),
+            ).where(DocumentChunk.document_id == doc_id)
+        )
+        return {row.chunk_index: row for row in result.all()}
+
     async def mark_document_error(self, doc_id: str, error_message: str) -> None:
         """Mark a document as having an error."""
         logger.debug("Marking document as error", extra={"doc_id": doc_id, "error_message": error_message})
@@ -17,6 +17,7 @@ from ..billing.enforcement import assert_subscription_active
 from ..core.exceptions import EmbeddingProviderError
 from ..core.external_model_resolver import ensure_provider_and_model_active
 from ..core.logging import get_logger
+from ..core.query_embedding_cache import cached_query_embedding
 from ..core.safe_decimal import safe_decimal
 from ..services.usage_recording import get_usage_recorder
 
@@ -67,6 +68,11 @@ class ExternalEmbeddingService:
         return await self._embed_batch(texts, prefix=self._document_prefix, user_id=user_id)
 
     async def embed_query(self, text: str, *, user_id: str | None = None) -> list[float]:
+        # Cache hits skip the paid API call, its usage row and the subscription check.
+        model_key = f"external:{self._model_id}:{self._model_name}:{self._dimension}:{self._query_prefix}"
+        return await cached_query_embedding(model_key, text, lambda: self._embed_query(text, user_id=user_id))
+
+    async def _embed_query(self, text: str, *, user_id: str | None = None) -> list[float]:
         results = await self._embed_batch([text], prefix=self._query_prefix, user_id=user_id)
         if not results:
             raise EmbeddingProviderError(
@@ -1,7 +1,7 @@
 """High-level ingestion helpers used by host.kb capability.
 
 Implementation Status: Partial
-- Currently implements ingest_document, ingest_email, ingest_text, ingest_thread
+- Currently implements ingest_document, ingest_email, ingest_text, ingest_thread, ingest_batch
 - Reuses TextExtractor + DocumentService + RAGProcessingService
 
 Limitations/Known Issues:
@@ -667,25 +667,15 @@ async def ingest_document(  # noqa: PLR0915
     }
 
 
-async def ingest_email(
-    db: AsyncSession,
-    knowledge_base_id: str,
-    *,
-    plugin_name: str,
-    user_id: str,
+def _email_content(
     subject: str,
     sender: str | None,
     recipients: dict[str, list[str]],
     date: str | None,
-    message_id: str,
-    thread_id: str | None,
     body_text: str | None,
-    body_html: str | None = None,
-    labels: list[str] | None = None,
-    source_url: str | None = None,
-    attributes: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    # Build an indexable text body
+    body_html: str | None,
+) -> str:
+    """Build the indexable text body (headers + plain-text body) for an email."""
     header_lines: list[str] = []
     header_lines.append(f"Subject: {subject or '(no subject)'}")
     if sender:
@@ -712,15 +702,17 @@ async def ingest_email(
         s = _re.sub(r"<[^>]+>", " ", s)
         s = _re.sub(r"\s+", " ", s)
         body = s.strip()
-    content = f"{header}\n\n{body}".strip()
+    return f"{header}\n\n{body}".strip()
 
-    # Persist Document
-    svc = DocumentService(db)
-    external_id = str((attributes or {}).get("external_id") or message_id)
-    source_type = f"plugin:{plugin_name}"
-    file_type = "email"
-    title = subject or "(no subject)"
 
+def _email_extraction(
+    external_id: str,
+    message_id: str,
+    thread_id: str | None,
+    labels: list[str] | None,
+    attributes: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the extraction record stored for an ingested email."""
     extraction_details: dict[str, Any] = {
         "external_id": external_id,
         "message_id": message_id,
@@ -729,7 +721,7 @@ async def ingest_email(
     }
     if attributes and attributes.get("extraction_metadata"):
         extraction_details.update(attributes.get("extraction_metadata") or {})
-    extraction = {
+    return {
         "method": "text",
         "engine": "direct",
         "confidence": None,
@@ -737,6 +729,36 @@ async def ingest_email(
         "details": extraction_details,
     }
 
+
+async def ingest_email(
+    db: AsyncSession,
+    knowledge_base_id: str,
+    *,
+    plugin_name: str,
+    user_id: str,
+    subject: str,
+    sender: str | None,
+    recipients: dict[str, list[str]],
+    date: str | None,
+    message_id: str,
+    thread_id: str | None,
+    body_text: str | None,
+    body_html: str | None = None,
+    labels: list[str] | None = None,
+    source_url: str | None = None,
+    attributes: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    content = _email_content(subject, sender, recipients, date, body_text, body_html)
+
+    # Persist Document
+    svc = DocumentService(db)
+    external_id = str((attributes or {}).get("external_id") or message_id)
+    source_type = f"plugin:{plugin_name}"
+    file_type = "email"
+    title = subject or "(no subject)"
+
+    extraction = _email_extraction(external_id, message_id, thread_id, labels, attributes)
+
     upsert_result = await _upsert_document_record(
         svc,
         knowledge_base_id,
@@ -1097,3 +1119,342 @@ async def ingest_thread(  # noqa: PLR0915
         "status": DocumentStatus.EMBEDDING.value,
         "skipped": False,
     }
+
+
+# Existing-row columns needed to decide skip vs. update without loading content.
+_BATCH_PREFETCH_COLUMNS = (
+    Document.id,
+    Document.source_id,
+    Document.source_type,
+    Document.source_url,
+    Document.source_hash,
+    Document.source_modified_at,
+    Document.content_hash,
+    Document.processing_status,
+    Document.processing_error,
+    Document.word_count,
+    Document.character_count,
+    Document.chunk_count,
+)
+# Bound parameters per prefetch query stay well under the driver's limit.
+_BATCH_PREFETCH_CHUNK = 1000
+
+
+@dataclass
+class _BatchItem:
+    """One knowledge object of an ingest_batch call, normalized to text."""
+
+    source_id: str
+    title: str
+    file_type: str
+    content: str
+    content_hash: str
+    source_hash: str | None
+    source_url: str | None
+    source_modified_at: datetime | None
+    extraction: dict[str, Any]
+    force_reingest: bool
+
+
+def _prepare_batch_item(item: dict[str, Any]) -> _BatchItem:
+    """Normalize a text or email item into the fields stored on its Document."""
+    attrs = item.get("attributes") or {}
+    if item.get("kind", "text") == "email":
+        message_id = str(item["message_id"])
+        source_id = str(attrs.get("external_id") or message_id)
+        title = item.get("subject") or "(no subject)"
+        file_type = "email"
+        content = _email_content(
+            item.get("subject") or "",
+            item.get("sender"),
+            item.get("recipients") or {},
+            item.get("date"),
+            item.get("body_text"),
+            item.get("body_html"),
+        )
+        extraction = _email_extraction(source_id, message_id, item.get("thread_id"), item.get("labels"), attrs)
+    else:
+        source_id = str(item["source_id"])
+        title = item.get("title") or source_id
+        file_type = "txt"
+        content = item.get("content") or ""
+        extraction = {"method": "text", "engine": "direct", "confidence": None, "duration": None, "details": None}
+
+    return _BatchItem(
+        source_id=source_id,
+        title=title,
+        file_type=file_type,
+        content=content,
+        content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        source_hash=attrs.get("source_hash"),
+        source_url=item.get("source_url") or attrs.get("source_url"),
+        source_modified_at=_safe_dt(attrs.get("modified_at")),
+        extraction=extraction,
+        force_reingest=bool(attrs.get("force_reingest")),
+    )
+
+
+async def _prefetch_existing(db: AsyncSession, knowledge_base_id: str, source_ids: list[str]) -> dict[str, Document]:
+    """Load the skip-check columns of every existing document among ``source_ids``."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import load_only
+
+    existing: dict[str, Document] = {}
+    for start in range(0, len(source_ids), _BATCH_PREFETCH_CHUNK):
+        chunk = source_ids[start : start + _BATCH_PREFETCH_CHUNK]
+        res = await db.execute(
+            select(Document)
+            .options(load_only(*_BATCH_PREFETCH_COLUMNS))
+            .where(Document.knowledge_base_id == knowledge_base_id, Document.source_id.in_(chunk))
+        )
+        for doc in res.scalars():
+            existing.setdefault(doc.source_id, doc)
+    return existing
+
+
+def _batch_row(item: _BatchItem, source_type: str) -> dict[str, Any]:
+    """Column values written for a created or re-ingested batch document."""
+    return {
+        "title": item.title,
+        "file_type": item.file_type,
+        "source_type": source_type,
+        "content": item.content,
+        "content_hash": item.content_hash,
+        "file_size": len(item.content) if item.content else None,
+        "extraction_method": item.extraction.get("method"),
+        "extraction_engine": item.extraction.get("engine"),
+        "extraction_confidence": item.extraction.get("confidence"),
+        "extraction_duration": item.extraction.get("duration"),
+        "extraction_metadata": item.extraction.get("details"),
+    }
+
+
+async def _write_batch_documents(
+    db: AsyncSession,
+    knowledge_base_id: str,
+    prepared: list[_BatchItem],
+    to_create: list[int],
+    to_update: list[int],
+    existing: dict[str, Document],
+    source_type: str,
+) -> dict[str, str]:
+    """Insert/update the batch's documents in one transaction; returns source_id -> document id.
+
+    Indexes of rows a concurrent ingest created after the prefetch are moved
+    from ``to_create`` onto ``to_update`` and re-ingested as updates.
+    """
+    import uuid
+
+    from sqlalchemy import update
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    from ..billing.enforcement import assert_document_count_under_limit, document_count_batch
+    from ..models.document import DocumentStatus
+    from ..utils import KnowledgeBaseVerifier
+
+    doc_ids: dict[str, str] = {}
+    if to_create:
+        await KnowledgeBaseVerifier.verify_exists(db, knowledge_base_id)
+        async with document_count_batch():
+            for _ in to_create:
+                await assert_document_count_under_limit(db)
+
+        new_rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "knowledge_base_id": knowledge_base_id,
+                "source_id": prepared[idx].source_id,
+                "source_url": prepared[idx].source_url,
+                "source_hash": prepared[idx].source_hash,
+                "source_modified_at": prepared[idx].source_modified_at,
+                "processing_status": DocumentStatus.PENDING.value,
+                "chunk_count": 0,
+                **_batch_row(prepared[idx], source_type),
+            }
+            for idx in to_create
+        ]
+        res = await db.execute(
+            pg_insert(Document)
+            .values(new_rows)
+            .on_conflict_do_nothing(index_elements=["knowledge_base_id", "source_type", "source_id"])
+            .returning(Document.id, Document.source_id)
+        )
+        doc_ids.update({source_id: doc_id for doc_id, source_id in res.all()})
+
+        raced = [idx for idx in to_create if prepared[idx].source_id not in doc_ids]
+        if raced:
+            existing.update(await _prefetch_existing(db, knowledge_base_id, [prepared[i].source_id for i in raced]))
+            to_update.extend(idx for idx in raced if prepared[idx].source_id in existing)
+
+    update_rows = []
+    for idx in to_update:
+        item = prepared[idx]
+        current = existing[item.source_id]
+        doc_ids[item.source_id] = current.id
+        update_rows.append(
+            {
+                "id": current.id,
+                "source_url": item.source_url or current.source_url,
+                "source_hash": item.source_hash or current.source_hash,
+                "source_modified_at": item.source_modified_at or current.source_modified_at,
+                **_batch_row(item, source_type),
+            }
+        )
+    if update_rows:
+        await db.execute(update(Document), update_rows)
+    await db.commit()
+    return doc_ids
+
+
+async def _enqueue_batch_embeds(
+    db: AsyncSession,
+    knowledge_base_id: str,
+    document_ids: list[str],
+    user_id: str | None,
+) -> None:
+    """Enqueue one embed job per document in a single call, then mark them EMBEDDING.
+
+    As in ingest_text, EMBEDDING is committed only after the enqueue succeeds;
+    on failure the documents are marked ERROR with a transient (retryable)
+    error and the exception is re-raised.
+    """
+    from sqlalchemy import update
+
+    from ..core.queue_backend import get_queue_backend
+    from ..core.workload_routing import WorkloadType, enqueue_jobs
+    from ..models.document import DocumentStatus
+
+    try:
+        queue = await get_queue_backend()
+        await enqueue_jobs(
+            queue,
+            WorkloadType.INGESTION_EMBED,
+            [
+                {
+                    "document_id": document_id,
+                    "knowledge_base_id": knowledge_base_id,
+                    "user_id": user_id,
+                    "action": "embed_document",
+                }
+                for document_id in document_ids
+            ],
+            max_attempts=3,
+            visibility_timeout=300,
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to enqueue batch ingestion embedding jobs",
+            extra={"knowledge_base_id": knowledge_base_id, "count": len(document_ids), "error": str(e)},
+        )
+        await db.execute(
+            update(Document)
+            .where(Document.id.in_(document_ids))
+            .values(
+                processing_status=DocumentStatus.ERROR.value,
+                processing_error=f"{_ERR_ENQUEUE_EMBEDDING} {e}",
+                processed_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        raise
+
+    await db.execute(
+        update(Document)
+        .where(Document.id.in_(document_ids))
+        .values(processing_status=DocumentStatus.EMBEDDING.value, processing_error=None, processed_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+async def ingest_batch(
+    db: AsyncSession,
+    knowledge_base_id: str,
+    items: list[dict[str, Any]],
+    *,
+    plugin_name: str,
+    user_id: str,
+) -> list[dict[str, Any]]:
+    """Ingest many text/email knowledge objects with a fixed number of round trips.
+
+    Each item is a dict with ``kind`` ``"text"`` (default; the ``ingest_text``
+    keyword arguments) or ``"email"`` (the ``ingest_email`` keyword arguments).
+    Emails go through the same queued embed pipeline as text instead of being
+    chunked inline.
+
+    Existing documents are prefetched in one query, unchanged ones are skipped
+    in memory with the same rules as ``ingest_text``, new documents are
+    inserted with one multi-row INSERT, changed ones are updated with one
+    executemany UPDATE, and every embed job is enqueued with one
+    ``enqueue_many`` call. When a source_id appears more than once, the last
+    occurrence wins and earlier ones report ``skip_reason="superseded_in_batch"``.
+
+    The document cap is checked for every new document before anything is
+    written, so a batch that would exceed it raises ``LimitExceededError``
+    without inserting any of its documents.
+
+    Returns:
+        One result dict per item, in input order, shaped like ``ingest_text``'s.
+
+    """
+    from ..models.document import DocumentStatus
+
+    namespace = f"{plugin_name}:{user_id}"
+    prepared = [_prepare_batch_item(item) for item in items]
+    last_index = {item.source_id: idx for idx, item in enumerate(prepared)}
+    existing = await _prefetch_existing(db, knowledge_base_id, list(last_index))
+
+    results: list[dict[str, Any]] = [{} for _ in prepared]
+    to_create: list[int] = []
+    to_update: list[int] = []
+    for idx, item in enumerate(prepared):
+        if last_index[item.source_id] != idx:
+            continue
+        current = existing.get(item.source_id)
+        ko_id = deterministic_ko_id(namespace, item.source_id)
+        skip_result = _check_skip(current, item.source_hash, item.content_hash, item.force_reingest, ko_id)
+        if skip_result:
+            results[idx] = skip_result
+        elif current is None:
+            to_create.append(idx)
+        else:
+            to_update.append(idx)
+
+    queued: list[int] = []
+    if to_create or to_update:
+        doc_ids = await _write_batch_documents(
+            db, knowledge_base_id, prepared, to_create, to_update, existing, f"plugin:{plugin_name}"
+        )
+        queued = sorted(idx for idx in to_create + to_update if prepared[idx].source_id in doc_ids)
+        if queued:
+            await _enqueue_batch_embeds(
+                db, knowledge_base_id, [doc_ids[prepared[idx].source_id] for idx in queued], user_id
+            )
+        for idx in queued:
+            results[idx] = {
+                "ko_id": deterministic_ko_id(namespace, prepared[idx].source_id),
+                "document_id": doc_ids[prepared[idx].source_id],
+                "status": DocumentStatus.EMBEDDING.value,
+                "skipped": False,
+            }
+
+    for idx, item in enumerate(prepared):
+        if not results[idx]:
+            results[idx] = {
+                "ko_id": deterministic_ko_id(namespace, item.source_id),
+                "document_id": results[last_index[item.source_id]].get("document_id"),
+                "skipped": True,
+                "skip_reason": "superseded_in_batch",
+            }
+
+    logger.info(
+        "Batch ingestion enqueued",
+        extra={
+            "knowledge_base_id": knowledge_base_id,
+            "items": len(prepared),
+            "skipped": len(prepared) - len(queued),
+            "enqueued": len(queued),
+        },
+    )
+    return results
@@ -2,21 +2,29 @@
 
 Handles exporting a knowledge base to a portable zip archive and importing
 it on another Shu instance without re-profiling.
+
+On asyncpg, export streams each table with a binary ``COPY ... TO STDOUT``
+and the JSONL/zip encoding runs on a worker thread; import parses the
+archive off the event loop and loads each batch with ``COPY`` into a
+transaction-scoped staging table. The archive format is the same either way.
 """
 
 import asyncio
+import contextlib
 import io
 import json
 import os
+import queue
 import tempfile
+import threading
 import uuid
 import zipfile
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import UploadFile
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,6 +36,8 @@ from shu.models.document import Document, DocumentChunk, DocumentQuery, Document
 from shu.models.knowledge_base import KnowledgeBase
 from shu.schemas.knowledge_base import ImportManifestValidation, ImportStartResult
 from shu.services.knowledge_base_service import KnowledgeBaseService
+from shu.utils.embedding_codec import encode_pg_float4_array
+from shu.utils.pg_copy import BinaryCopyDecoder, decode_float, decode_int, decode_text, decode_timestamptz
 
 logger = get_logger(__name__)
 
@@ -36,6 +46,104 @@ SCHEMA_VERSION = "1"
 # Prevent background import tasks from being garbage collected before completion
 _active_import_tasks: set[asyncio.Task] = set()
 
+# Columns the COPY export reads, as (column, kind) in the order each model's
+# ``serialize_for_export`` emits them. The kind picks the SQL cast on the way
+# out and the conversion on the way in; columns not listed here import as-is.
+_EXPORT_COLUMNS: dict[type, tuple[tuple[str, str], ...]] = {
+    Document: (
+        ("source_id", "text"),
+        ("source_type", "text"),
+        ("title", "text"),
+        ("file_type", "text"),
+        ("content", "text"),
+        ("content_hash", "text"),
+        ("processing_status", "text"),
+        ("synopsis", "text"),
+        ("synopsis_embedding", "vector"),
+        ("document_type", "text"),
+        ("capability_manifest", "json"),
+        ("relational_context", "json"),
+        ("profiling_status", "text"),
+        ("profiling_coverage_percent", "float"),
+        ("word_count", "int"),
+        ("character_count", "int"),
+        ("chunk_count", "int"),
+        ("token_count", "int"),
+        ("extraction_method", "text"),
+        ("extraction_engine", "text"),
+        ("extraction_confidence", "float"),
+        ("extraction_duration", "float"),
+        ("extraction_metadata", "json"),
+        ("source_url", "text"),
+        ("source_metadata", "text"),
+        ("source_hash", "text"),
+        ("source_modified_at", "timestamp"),
+        ("file_size", "int"),
+        ("mime_type", "text"),
+    ),
+    DocumentChunk: (
+        ("chunk_index", "int"),
+        ("content", "text"),
+        ("embedding", "vector"),
+        ("summary", "text"),
+        ("summary_embedding", "vector"),
+        ("topics", "json"),
+        ("char_count", "int"),
+        ("word_count", "int"),
+        ("start_char", "int"),
+        ("end_char", "int"),
+        ("embedding_model", "text"),
+        ("token_count", "int"),
+        ("chunk_metadata", "json"),
+    ),
+    DocumentQuery: (
+        ("query_text", "text"),
+        ("query_embedding", "vector"),
+    ),
+}
+
+_COPY_DECODERS: dict[str, Callable[[bytes], Any]] = {
+    "text": decode_text,
+    "int": decode_int,
+    "float": decode_float,
+    "json": json.loads,
+    "timestamp": lambda value: decode_timestamptz(value).isoformat(),
+    "vector": encode_pg_float4_array,
+}
+
+# COPY output chunks buffered between the connection and the zip writer thread.
+_COPY_QUEUE_DEPTH = 64
+
+_IMPORT_STAGE_TABLE = "_kb_import_stage"
+
+
+def _copy_export_query(model: type, key_column: str, no_embeddings: bool) -> str:
+    """Build the binary COPY query for one export pass.
+
+    The first output column is ``key_column`` (the document ID), followed by
+    the ``_EXPORT_COLUMNS`` of ``model`` cast to types the decoders handle.
+    """
+    exprs = [key_column]
+    for column, kind in _EXPORT_COLUMNS[model]:
+        if kind == "vector":
+            exprs.append("NULL::real[]" if no_embeddings else f"{column}::real[]")
+        elif kind == "json":
+            exprs.append(f"{column}::text")
+        else:
+            exprs.append(column)
+    return (
+        f"SELECT {', '.join(exprs)} FROM {model.__tablename__} "  # noqa: S608 - identifiers are module constants
+        "WHERE knowledge_base_id = $1 ORDER BY id"
+    )
+
+
+def _export_line(model: type, export_index: int, values: tuple[bytes | None, ...]) -> bytes:
+    """Encode one COPY tuple as an archive JSONL line."""
+    row: dict[str, Any] = {"export_index": export_index}
+    for (column, kind), value in zip(_EXPORT_COLUMNS[model], values, strict=True):
+        row[column] = None if value is None else _COPY_DECODERS[kind](value)
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class KBImportExportService:
     """Service for importing and exporting knowledge bases."""
@@ -55,6 +163,14 @@ class KBImportExportService:
         self.db = db
         self.kb_service = kb_service
         self._settings = get_settings_instance()
+        dialect = getattr(getattr(db, "bind", None), "dialect", None)
+        self._use_copy = getattr(dialect, "driver", None) == "asyncpg"
+
+    async def _driver_connection(self) -> Any:
+        """Return the asyncpg connection behind the session's transaction."""
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        return raw.driver_connection
 
     @staticmethod
     def _read_manifest(source: Any) -> dict[str, Any]:
@@ -269,6 +385,7 @@ class KBImportExportService:
             embedding_model=effective_model,
             chunk_size=manifest.get("chunk_size", 1000),
             chunk_overlap=manifest.get("chunk_overlap", 200),
+            chunking_strategy=manifest.get("chunking_strategy"),
             status="importing",
             owner_id=owner_id,
             import_progress={"phase": "queued"},
@@ -402,19 +519,18 @@ class KBImportExportService:
 
             # Phase 1: Documents
             export_index_to_doc_id: dict[int, str] = {}
-            doc_batch: list[dict[str, Any]] = []
             docs_done = 0
 
-            for line in self._iter_jsonl(zf, "documents.jsonl"):
+            def build_document(line: str) -> dict[str, Any] | None:
                 try:
                     row = json.loads(line)
                 except json.JSONDecodeError:
                     logger.warning("Skipping malformed document JSONL line", extra={"kb_id": kb_id})
-                    continue
+                    return None
 
                 if "export_index" not in row:
                     logger.warning("Skipping document line missing export_index", extra={"kb_id": kb_id})
-                    continue
+                    return None
 
                 raw_status = row.get("processing_status", "")
                 try:
@@ -424,26 +540,16 @@ class KBImportExportService:
                         "Skipping document with invalid processing_status",
                         extra={"kb_id": kb_id, "processing_status": raw_status},
                     )
-                    continue
+                    return None
 
                 new_id = str(uuid.uuid4())
                 export_index_to_doc_id[row["export_index"]] = new_id
-                doc_batch.append(Document.build_import_record(row, new_id, kb_id, effectively_skip))
-
-                if len(doc_batch) >= self._settings.kb_export_batch_size:
-                    await self.db.execute(pg_insert(Document).values(doc_batch))
-                    await self.db.commit()
-                    docs_done += len(doc_batch)
-                    await self._update_import_progress(kb_id, documents_done=docs_done)
-                    doc_batch.clear()
-
-            # Flush remaining documents
-            if doc_batch:
-                await self.db.execute(pg_insert(Document).values(doc_batch))
-                await self.db.commit()
+                return Document.build_import_record(row, new_id, kb_id, effectively_skip)
+
+            async for doc_batch in self._iter_import_batches(zf, "documents.jsonl", build_document):
+                await self._insert_batch(Document, doc_batch)
                 docs_done += len(doc_batch)
                 await self._update_import_progress(kb_id, documents_done=docs_done)
-                doc_batch.clear()
 
             # Phase 2: Chunks
             chunks_done = await self._import_related_entities(
@@ -504,20 +610,19 @@ class KBImportExportService:
 
         """
         entity_label = filename.removesuffix(".jsonl")
-        batch: list[dict[str, Any]] = []
         total = 0
 
-        for line in self._iter_jsonl(zf, filename):
+        def build_record(line: str) -> dict[str, Any] | None:
             try:
                 row = json.loads(line)
             except json.JSONDecodeError:
                 logger.warning(f"Skipping malformed {entity_label} JSONL line", extra={"kb_id": kb_id})
-                continue
+                return None
 
             export_index = row.get("export_index")
             if export_index is None or required_field not in row:
                 logger.warning(f"Skipping {entity_label} line missing required fields", extra={"kb_id": kb_id})
-                continue
+                return None
 
             doc_id = export_index_to_doc_id.get(export_index)
             if doc_id is None:
@@ -525,25 +630,98 @@ class KBImportExportService:
                     f"Skipping {entity_label} with unknown export_index",
                     extra={"kb_id": kb_id, "export_index": export_index},
                 )
-                continue
-
-            batch.append(model.build_import_record(row, doc_id, kb_id, skip_embeddings))
+                return None
 
-            if len(batch) >= self._settings.kb_export_batch_size:
-                await self.db.execute(pg_insert(model).values(batch))
-                await self.db.commit()
-                total += len(batch)
-                await self._update_import_progress(kb_id, **{progress_key: total})
-                batch.clear()
+            return model.build_import_record(row, doc_id, kb_id, skip_embeddings)
 
-        if batch:
-            await self.db.execute(pg_insert(model).values(batch))
-            await self.db.commit()
+        async for batch in self._iter_import_batches(zf, filename, build_record):
+            await self._insert_batch(model, batch)
             total += len(batch)
-            batch.clear()
+            await self._update_import_progress(kb_id, **{progress_key: total})
 
         return total
 
+    async def _iter_import_batches(
+        self,
+        zf: zipfile.ZipFile,
+        name: str,
+        build_record: Callable[[str], dict[str, Any] | None],
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield insert batches built from a JSONL member of the archive.
+
+        Inflating, JSON parsing and embedding decoding run on a worker thread
+        one batch at a time, so the event loop only waits on the database.
+
+        Args:
+            zf: Open ZipFile.
+            name: Name of the JSONL member file.
+            build_record: Turns a line into an insert dict, or None to skip it.
+
+        Yields:
+            Lists of at most ``kb_export_batch_size`` insert dicts.
+
+        """
+        batch_size = self._settings.kb_export_batch_size
+
+        with contextlib.closing(self._iter_jsonl(zf, name)) as lines:
+
+            def next_batch() -> list[dict[str, Any]]:
+                batch: list[dict[str, Any]] = []
+                for line in lines:
+                    record = build_record(line)
+                    if record is not None:
+                        batch.append(record)
+                        if len(batch) >= batch_size:
+                            break
+                return batch
+
+            while batch := await asyncio.to_thread(next_batch):
+                yield batch
+
+    async def _insert_batch(self, model: type, batch: list[dict[str, Any]]) -> None:
+        """Insert one batch of import records and commit it."""
+        if self._use_copy:
+            await self._copy_insert(model, batch)
+        else:
+            await self.db.execute(pg_insert(model).values(batch))
+        await self.db.commit()
+
+    async def _copy_insert(self, model: type, batch: list[dict[str, Any]]) -> None:
+        """Load a batch through ``COPY`` into a staging table, then insert it.
+
+        The KB tables force row-level security, which rejects ``COPY FROM``
+        outright, so rows are copied into a temp table (dropped on commit)
+        and moved with a single ``INSERT ... SELECT`` that the tenant policy
+        checks like any other insert.
+        """
+        kinds = dict(_EXPORT_COLUMNS[model])
+        columns = list(batch[0])
+        table = model.__tablename__
+        stage_columns = ", ".join(f"{c}::real[] AS {c}" if kinds.get(c) == "vector" else c for c in columns)
+        insert_columns = ", ".join(f"{c}::vector" if kinds.get(c) == "vector" else c for c in columns)
+
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE {_IMPORT_STAGE_TABLE} ON COMMIT DROP AS "  # noqa: S608 - identifiers come from the model
+                f"SELECT {stage_columns} FROM {table} WITH NO DATA"
+            )
+        )
+        records = [
+            tuple(
+                json.dumps(row.get(c)) if kinds.get(c) == "json" and row.get(c) is not None else row.get(c)
+                for c in columns
+            )
+            for row in batch
+        ]
+        driver = await self._driver_connection()
+        await driver.copy_records_to_table(_IMPORT_STAGE_TABLE, records=records, columns=columns)
+        await self.db.execute(
+            text(
+                f"INSERT INTO {table} ({', '.join(columns)}) "  # noqa: S608 - identifiers come from the model
+                f"SELECT {insert_columns} FROM {_IMPORT_STAGE_TABLE}"
+            )
+        )
+
     async def _finalize_import(
         self,
         kb_id: str,
@@ -633,6 +811,7 @@ class KBImportExportService:
                 "embeddings_included": not no_embeddings,
                 "chunk_size": kb.chunk_size,
                 "chunk_overlap": kb.chunk_overlap,
+                "chunking_strategy": kb.chunking_strategy,
                 "rag_config": kb.get_rag_config(),
                 "counts": {
                     "documents": doc_count,
@@ -679,6 +858,9 @@ class KBImportExportService:
         """
         doc_id_to_index: dict[str, int] = {}
 
+        if self._use_copy:
+            return await self._copy_data_files(zf, kb_id, no_embeddings, doc_id_to_index)
+
         doc_count = await self._write_documents(zf, kb_id, no_embeddings, doc_id_to_index)
         chunk_count = await self._write_related_entities(
             zf,
@@ -699,6 +881,122 @@ class KBImportExportService:
 
         return doc_count, chunk_count, query_count
 
+    async def _copy_data_files(
+        self,
+        zf: zipfile.ZipFile,
+        kb_id: str,
+        no_embeddings: bool,
+        doc_id_to_index: dict[str, int],
+    ) -> tuple[int, int, int]:
+        """COPY-based ``_write_data_files``: one binary COPY per entity type."""
+
+        def document_line(fields: tuple[bytes | None, ...]) -> bytes:
+            doc_id, *values = fields
+            export_index = len(doc_id_to_index)
+            doc_id_to_index[decode_text(doc_id)] = export_index
+            return _export_line(Document, export_index, values)
+
+        def related_line(model: type) -> Callable[[tuple[bytes | None, ...]], bytes | None]:
+            def encode(fields: tuple[bytes | None, ...]) -> bytes | None:
+                doc_id, *values = fields
+                export_index = doc_id_to_index.get(decode_text(doc_id))
+                if export_index is None:
+                    return None
+                return _export_line(model, export_index, values)
+
+            return encode
+
+        doc_count = await self._copy_to_member(
+            zf, "documents.jsonl", _copy_export_query(Document, "id", no_embeddings), kb_id, document_line
+        )
+        chunk_count = await self._copy_to_member(
+            zf,
+            "chunks.jsonl",
+            _copy_export_query(DocumentChunk, "document_id", no_embeddings),
+            kb_id,
+            related_line(DocumentChunk),
+        )
+        query_count = await self._copy_to_member(
+            zf,
+            "queries.jsonl",
+            _copy_export_query(DocumentQuery, "document_id", no_embeddings),
+            kb_id,
+            related_line(DocumentQuery),
+        )
+        return doc_count, chunk_count, query_count
+
+    async def _copy_to_member(
+        self,
+        zf: zipfile.ZipFile,
+        name: str,
+        query: str,
+        kb_id: str,
+        encode: Callable[[tuple[bytes | None, ...]], bytes | None],
+    ) -> int:
+        """Stream a binary COPY into a zip member.
+
+        COPY output is handed to a worker thread through a bounded queue; the
+        thread decodes tuples, encodes JSONL lines and deflates them into the
+        archive, so a slow writer throttles the COPY rather than buffering it.
+
+        Args:
+            zf: Open ZipFile to write into.
+            name: Name of the JSONL member.
+            query: COPY query taking the KB ID as ``$1``.
+            kb_id: Knowledge base ID.
+            encode: Turns a COPY tuple into a JSONL line, or None to skip it.
+
+        Returns:
+            Number of lines written.
+
+        """
+        chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=_COPY_QUEUE_DEPTH)
+        writer_failed = threading.Event()
+
+        def write_member() -> int:
+            try:
+                decoder = BinaryCopyDecoder()
+                count = 0
+                with zf.open(name, "w") as member:
+                    while (chunk := chunks.get()) is not None:
+                        lines = [line for fields in decoder.feed(chunk) if (line := encode(fields)) is not None]
+                        count += len(lines)
+                        member.write(b"".join(lines))
+                decoder.finish()
+                return count
+            except BaseException:
+                writer_failed.set()
+                raise
+
+        def put_blocking(item: bytes | None) -> None:
+            while not writer_failed.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        writer = asyncio.get_running_loop().run_in_executor(None, write_member)
+
+        async def sink(data: bytes) -> None:
+            try:
+                chunks.put_nowait(bytes(data))
+            except queue.Full:
+                await asyncio.to_thread(put_blocking, bytes(data))
+            if writer_failed.is_set():
+                await writer  # re-raises the writer's error and aborts the COPY
+
+        driver = await self._driver_connection()
+        try:
+            await driver.copy_from_query(query, kb_id, output=sink, format="binary")
+        except BaseException:
+            await asyncio.to_thread(put_blocking, None)
+            with contextlib.suppress(Exception):
+                await writer
+            raise
+        await asyncio.to_thread(put_blocking, None)
+        return await writer
+
     async def _write_documents(
         self,
         zf: zipfile.ZipFile,
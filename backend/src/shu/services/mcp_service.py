@@ -427,7 +427,7 @@ class McpService:
         """Evict cached adapter and sync the plugin registry after a mutation."""
         from ..plugins.registry import REGISTRY
 
-        REGISTRY._cache.pop(f"mcp:{connection_name}", None)
+        REGISTRY.evict(f"mcp:{connection_name}")
         await REGISTRY.sync(self.db)
 
     async def _check_name_unique(self, name: str, exclude_id: str | None = None) -> None:
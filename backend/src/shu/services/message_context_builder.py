@@ -148,6 +148,7 @@ class MessageContextBuilder:
             max_tokens=effective_max_tokens,
             recent_message_limit_override=recent_messages_limit,
             user_id=str(current_user.id),
+            model_name=getattr(model, "model_name", None),
         )
 
         return ChatContext(system_prompt=combined_system, messages=chat_messages), all_source_metadata
@@ -403,7 +403,7 @@ class PasswordResetService:
         # don't set it explicitly here because the validator is the single
         # source of truth for that bump, applied uniformly across every
         # password-mutation path.
-        user.password_hash = self._hash_password(new_password)
+        user.password_hash = await self._hash_password(new_password)
         user.must_change_password = False
         token_row.used_at = now
 
@@ -616,7 +616,7 @@ def get_password_reset_service_dependency(
         email_service=email_service if email_service is not None else get_email_service_dependency(),
         cache=cache if cache is not None else get_cache_backend_dependency(),
         password_validator=password_auth_service.validate_password,
-        password_hasher=password_auth_service._hash_password,
+        password_hasher=password_auth_service.hash_password_async,
         token_ttl_seconds=settings.password_reset_token_ttl_seconds,
         app_base_url=settings.app_base_url,
     )
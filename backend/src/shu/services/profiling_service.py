@@ -21,7 +21,7 @@ from ..schemas.profiling import (
     DocumentProfile,
     SynthesizedQuery,
 )
-from ..utils.tokenization import estimate_tokens
+from ..utils.tokenization import count_tokens
 from .profile_parser import ProfileParser
 from .side_call_service import SideCallResult, SideCallService
 
@@ -204,7 +204,7 @@ class ProfilingService:
 
         """
         max_tokens = self.settings.profiling_max_input_tokens
-        token_count = estimate_tokens(content)
+        token_count = count_tokens(content)
         if token_count > max_tokens:
             error_msg = f"Input exceeds profiling_max_input_tokens: {token_count} > {max_tokens}"
             logger.warning(
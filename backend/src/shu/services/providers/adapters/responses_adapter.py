@@ -5,6 +5,7 @@ from typing import Any
 import httpx
 import jmespath
 
+from shu.core.http_client import get_provider_client_pool
 from shu.core.logging import get_logger
 from shu.core.safe_decimal import safe_decimal
 from shu.models.plugin_execution import CallableTool
@@ -176,16 +177,23 @@ class ResponsesAdapter(BaseProviderAdapter):
         auth_def = self.get_authorization_header() or {}
         headers = auth_def.get("headers") or {}
 
-        # SHU-803 AC9e: ``async with`` so the client (and its connection
-        # pool) is closed before this coroutine returns. The adapter is
-        # short-lived (one stream / variant) and cancel() runs at most
-        # once per stream, so there is no client reuse to optimize for.
+        # SHU-803 AC9e: the adapter is short-lived (one stream / variant) and
+        # cancel() runs at most once per stream, so the POST borrows the
+        # process-wide pooled client for this provider rather than paying a
+        # fresh handshake. An injected test transport gets its own client,
+        # closed (``async with``) before this coroutine returns.
         try:
-            async with httpx.AsyncClient(
-                transport=self._cancel_transport,
-                timeout=2.0,
-            ) as client:
-                response = await client.post(cancel_url, headers=headers)
+            if self._cancel_transport is None:
+                client = get_provider_client_pool().get_client(
+                    base_url=base_url, headers={k: str(v) for k, v in headers.items()}, timeout=httpx.Timeout(2.0)
+                )
+                response = await client.post(cancel_url)
+            else:
+                async with httpx.AsyncClient(
+                    transport=self._cancel_transport,
+                    timeout=2.0,
+                ) as client:
+                    response = await client.post(cancel_url, headers=headers)
         except Exception as exc:
             # Network failure, DNS, TLS, whatever — fall through to drain.
             # Log to telemetry; consumer loop doesn't care which side failed.
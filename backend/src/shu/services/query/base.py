@@ -4,6 +4,7 @@ This module contains the base class, decorators, and shared methods used across
 all query types (similarity, keyword, hybrid, multi-surface).
 """
 
+import asyncio
 import functools
 import re
 import time
@@ -17,6 +18,7 @@ from ...core.config import ConfigurationManager
 from ...models.document import Document
 from ...models.knowledge_base import KnowledgeBase
 from ...utils.text import fold_unicode_to_ascii
+from ...utils.tokenization import count_tokens, truncate_to_tokens
 from .constants import COMPREHENSIVE_STOP_WORDS
 
 if TYPE_CHECKING:
@@ -276,8 +278,11 @@ class QueryServiceBase:
                 if not d:
                     continue
                 content = d.content or ""
-                # Estimate tokens using words; we document this limitation
-                est_tokens = d.word_count if d.word_count is not None else len(content.split())
+                # Stored at ingestion; older documents are counted (and cached) on
+                # demand, off the event loop like the truncation below.
+                est_tokens = d.token_count
+                if est_tokens is None:
+                    est_tokens = await asyncio.to_thread(count_tokens, content)
 
                 if est_tokens <= token_cap:
                     escalated_docs.append(
@@ -293,11 +298,7 @@ class QueryServiceBase:
                     )
                     total_tokens += int(est_tokens)
                 else:
-                    # Segment by simple word-slices
-                    words = content.split()
-                    allowed = max(token_cap, 0)
-                    segment_words = words[:allowed]
-                    segment_text = " ".join(segment_words)
+                    segment_text = await asyncio.to_thread(truncate_to_tokens, content, token_cap)
                     escalated_docs.append(
                         {
                             "document_id": d.id,
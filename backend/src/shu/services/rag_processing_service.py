@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 
@@ -5,6 +7,8 @@ from ..core.config import get_settings_instance
 from ..core.logging import get_logger
 from ..models.document import DocumentChunk
 from ..models.knowledge_base import KnowledgeBase
+from ..utils.tokenization import count_tokens
+from .chunking import get_chunker
 
 if TYPE_CHECKING:
     from ..core.embedding_service import EmbeddingService
@@ -12,6 +16,16 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def chunk_content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of a chunk's text.
+
+    Matches the server-side ``encode(sha256(convert_to(content, 'UTF8')), 'hex')``
+    expression used by ``DocumentService`` to fingerprint stored chunks, so
+    the two can be compared without pulling stored chunk text back over the wire.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class RAGProcessingService:
     """Handles text chunking and embedding generation for documents.
 
@@ -23,26 +37,29 @@ class RAGProcessingService:
     def __init__(self, embedding_service: "EmbeddingService") -> None:
         self.embedding_service = embedding_service
 
-    def chunk_text(self, text: str, chunk_size: int | None = None, chunk_overlap: int | None = None) -> list[str]:
-        """Split text into overlapping chunks."""
+    def chunk_text(
+        self,
+        text: str,
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+        strategy: str | None = None,
+    ) -> list[str]:
+        """Split text into overlapping chunks using the given chunking strategy."""
         if not text:
             return []
 
         settings = get_settings_instance()
-        default_chunk_size = chunk_size or settings.default_chunk_size
-        default_chunk_overlap = chunk_overlap or settings.default_chunk_overlap
-
-        chunks = []
-        start = 0
-        text_length = len(text)
-        while start < text_length:
-            end = min(start + default_chunk_size, text_length)
-            chunk = text[start:end]
-            chunks.append(chunk)
-            if end == text_length:
-                break
-            start += default_chunk_size - default_chunk_overlap
-        return chunks
+        chunker = get_chunker(
+            strategy or settings.default_chunking_strategy,
+            chunk_size or settings.default_chunk_size,
+            chunk_overlap or settings.default_chunk_overlap,
+        )
+        return [span.text for span in chunker.iter_spans(text)]
+
+    @staticmethod
+    def _resolve_strategy(knowledge_base: KnowledgeBase) -> str:
+        """Return the KB's chunking strategy, falling back to the instance default."""
+        return knowledge_base.chunking_strategy or get_settings_instance().default_chunking_strategy
 
     async def process_document(
         self,
@@ -57,6 +74,49 @@ class RAGProcessingService:
         """Chunk the document text and generate embeddings for each chunk.
         Returns a list of DocumentChunk objects (not yet added to DB).
         """
+        document_chunks = self.build_chunks(
+            document_id, knowledge_base, text, document_title=document_title, config_manager=config_manager
+        )
+        await self.embed_chunks(document_chunks, user_id=user_id)
+        return document_chunks
+
+    async def embed_chunks(self, chunks: list[DocumentChunk], *, user_id: str | None = None) -> None:
+        """Generate embeddings (and token counts) for ``chunks`` and attach them in place."""
+        if not chunks:
+            return
+
+        contents = [c.content for c in chunks]
+        # Tokenize on a worker thread while the embedding request is in flight.
+        embeddings, token_counts = await asyncio.gather(
+            self.embedding_service.embed_texts(contents, user_id=user_id),
+            asyncio.to_thread(lambda: [count_tokens(content) for content in contents]),
+        )
+
+        if len(embeddings) != len(chunks):
+            raise ValueError(f"Embedding count mismatch: got {len(embeddings)} embeddings for {len(chunks)} chunks")
+
+        embedded_at = datetime.now(UTC)
+        for chunk, embedding, token_count in zip(chunks, embeddings, token_counts, strict=True):
+            chunk.embedding = embedding
+            chunk.token_count = token_count
+            chunk.embedding_model = self.embedding_service.model_name
+            chunk.embedding_created_at = embedded_at
+
+    def build_chunks(
+        self,
+        document_id: str,
+        knowledge_base: KnowledgeBase,
+        text: str,
+        document_title: str | None = None,
+        config_manager: Optional["ConfigurationManager"] = None,  # noqa: F821
+    ) -> list[DocumentChunk]:
+        """Chunk the document text into DocumentChunk objects without embeddings.
+
+        Split out of ``process_document`` so callers can diff the planned chunks
+        against what is already stored and only embed the ones that changed.
+        Token counts are left for ``embed_chunks``, which computes them off the
+        event loop.
+        """
         from ..core.config import get_config_manager
 
         settings = get_settings_instance()
@@ -70,85 +130,40 @@ class RAGProcessingService:
         title_chunk_enabled = configuration_manager.get_title_chunk_enabled(kb_config=kb_config)
         title_weighting_enabled = configuration_manager.get_title_weighting_enabled(kb_config=kb_config)
 
-        # 1. Chunk the text
-        chunks = self.chunk_text(text, chunk_size, chunk_overlap)
+        chunker = get_chunker(self._resolve_strategy(knowledge_base), chunk_size, chunk_overlap)
 
-        # 2. Handle document title based on configuration
-        if document_title and chunks:
-            if title_chunk_enabled:
-                title_chunk = f"Document Title: {document_title}"
-                chunks.insert(0, title_chunk)
-            else:
-                title_prefix = f"Document Title: {document_title}\n\n"
-                chunks[0] = title_prefix + chunks[0]
+        def _metadata(chunk_type: str) -> dict:
+            metadata = {"chunk_type": chunk_type, "title_weighting_enabled": title_weighting_enabled}
+            if chunk_type == "title":
+                metadata["original_title"] = document_title
+            return metadata
 
-        # 3. Generate embeddings via the EmbeddingService
-        embeddings = await self.embedding_service.embed_texts(chunks, user_id=user_id)
-
-        if len(embeddings) != len(chunks):
-            raise ValueError(f"Embedding count mismatch: got {len(embeddings)} embeddings for {len(chunks)} chunks")
-
-        # 4. Create DocumentChunk objects
-        document_chunks = []
-        start_char = 0
-        title_chunk_offset = 1 if (document_title and title_chunk_enabled) else 0
-
-        # When the title is inlined (title_chunk_enabled=False), the prefix
-        # inflates chunks[0] but start_char/end_char must map to the original
-        # source text. Track the prefix length so we can subtract it.
-        title_prefix_len = 0
-        if document_title and chunks and not title_chunk_enabled:
-            title_prefix_len = len(f"Document Title: {document_title}\n\n")
-
-        for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=False)):
-            is_title_chunk = idx == 0 and title_chunk_offset == 1
-
-            chunk_metadata = {}
-            if is_title_chunk:
-                chunk_metadata = {
-                    "chunk_type": "title",
-                    "title_weighting_enabled": title_weighting_enabled,
-                    "original_title": document_title,
-                }
-            else:
-                chunk_metadata = {
-                    "chunk_type": "content",
-                    "title_weighting_enabled": title_weighting_enabled,
-                }
-
-            # For the title chunk (separate), positions are synthetic (not in source text).
-            # For content chunks, positions map to the original source text.
-            if is_title_chunk:
-                chunk_start = 0
-                chunk_end = len(chunk)
-            else:
-                chunk_start = start_char
-                # For the first content chunk with inlined title, the source-text
-                # length is the chunk length minus the prepended title prefix.
-                source_len = len(chunk) - (title_prefix_len if idx == 0 else 0)
-                chunk_end = start_char + source_len
-
-            doc_chunk = DocumentChunk(
+        def _make_chunk(idx: int, content: str, start: int, end: int, chunk_type: str) -> DocumentChunk:
+            return DocumentChunk(
                 document_id=document_id,
                 knowledge_base_id=knowledge_base.id,
                 chunk_index=idx,
-                content=chunk,
-                char_count=len(chunk),
-                word_count=len(chunk.split()),
-                start_char=chunk_start,
-                end_char=chunk_end,
-                embedding=embedding,
-                embedding_model=self.embedding_service.model_name,
-                embedding_created_at=datetime.now(UTC),
-                chunk_metadata=chunk_metadata,
+                content=content,
+                char_count=len(content),
+                word_count=len(content.split()),
+                start_char=start,
+                end_char=end,
+                chunk_metadata=_metadata(chunk_type),
             )
-            document_chunks.append(doc_chunk)
-
-            if is_title_chunk:
-                start_char = 0
-            else:
-                # Advance by the source-text portion of this chunk
-                source_len = len(chunk) - (title_prefix_len if idx == 0 else 0)
-                start_char += source_len - chunk_overlap
+
+        # Spans are consumed straight off the chunker generator; offsets always
+        # map to the original source text, even when the title is inlined into
+        # the first chunk's content.
+        document_chunks: list[DocumentChunk] = []
+        for span in chunker.iter_spans(text):
+            content = span.text
+            if not document_chunks and document_title:
+                if title_chunk_enabled:
+                    # Positions of the separate title chunk are synthetic (not in source text).
+                    title_chunk = f"Document Title: {document_title}"
+                    document_chunks.append(_make_chunk(0, title_chunk, 0, len(title_chunk), "title"))
+                else:
+                    content = f"Document Title: {document_title}\n\n{content}"
+            document_chunks.append(_make_chunk(len(document_chunks), content, span.start, span.end, "content"))
 
         return document_chunks
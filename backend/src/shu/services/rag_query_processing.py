@@ -1,5 +1,6 @@
 """Shared helpers for preparing RAG retrieval queries."""
 
+import asyncio
 from collections.abc import Callable, Sequence
 from typing import Any
 
@@ -9,6 +10,8 @@ from shu.core.logging import get_logger
 
 from ..auth.models import User
 from ..core.config import ConfigurationManager
+from ..core.database import get_async_session_local
+from ..core.embedding_service import shared_query_embeddings
 from ..models.llm_provider import Message
 from ..schemas.query import QueryRequest, RagRewriteMode
 from .knowledge_base_service import KnowledgeBaseService
@@ -121,50 +124,98 @@ async def execute_rag_queries(
     if rag_rewrite_mode == RagRewriteMode.NO_RAG:
         return rewritten_query, rewrite_diagnostics, []
 
-    words = rewritten_query.split()
+    responses = await query_knowledge_bases(
+        config_manager=config_manager,
+        query_service=query_service,
+        kb_service=KnowledgeBaseService(db_session, config_manager),
+        knowledge_base_ids=knowledge_base_ids,
+        query_text=rewritten_query,
+        request_builder=request_builder,
+        diagnostics=rewrite_diagnostics,
+        user_id=user_id,
+        dump_mode="json",
+    )
+    return rewritten_query, rewrite_diagnostics, responses
+
+
+async def query_knowledge_bases(
+    config_manager: ConfigurationManager,
+    query_service: QueryService,
+    kb_service: KnowledgeBaseService,
+    knowledge_base_ids: Sequence[str],
+    query_text: str,
+    request_builder: QueryRequestBuilder,
+    diagnostics: dict[str, Any] | None,
+    *,
+    user_id: str | None = None,
+    dump_mode: str = "python",
+) -> list[dict[str, Any]]:
+    """Run the retrieval query against each KB and collect per-KB responses.
+
+    A single KB is queried on the caller's session and services. Several KBs
+    are fanned out concurrently, at most ``rag_kb_query_concurrency`` at a
+    time, each on its own DB session; the query text is embedded once and
+    shared across them. Responses keep the order of ``knowledge_base_ids``.
+    KBs that fail or are skipped for too few meaningful words are left out
+    (skips are recorded under ``diagnostics["skipped"]``).
+    """
+    words = query_text.split()
     cleaned_words = [
         w.lower().strip('.,!?;:"()[]{}')
         for w in words
         if w.lower().strip('.,!?;:"()[]{}') not in COMPREHENSIVE_STOP_WORDS
     ]
 
-    kb_service = KnowledgeBaseService(db_session, config_manager)
-    responses: list[dict[str, Any]] = []
-
-    for kb_id in knowledge_base_ids:
-        rag_config: dict[str, Any] | None = None
+    async def query_one(kb_id: str, kb_svc: KnowledgeBaseService, q_svc: QueryService) -> dict[str, Any] | None:
         try:
-            rag_config_response = await kb_service.get_rag_config(kb_id)
+            rag_config_response = await kb_svc.get_rag_config(kb_id)
             rag_config = rag_config_response.model_dump()
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning("Failed to load RAG config for KB %s: %s", kb_id, exc)
-            continue
+            return None
 
         min_words = rag_config.get("minimum_query_words", 3)
         if len(words) < min_words or len(cleaned_words) == 0:
-            if rewrite_diagnostics is not None:
-                skipped = rewrite_diagnostics.setdefault("skipped", {})
+            if diagnostics is not None:
+                skipped = diagnostics.setdefault("skipped", {})
                 skipped[kb_id] = "insufficient_meaningful_words"
-            continue
+            return None
 
         try:
-            query_request = request_builder(kb_id, rag_config, rewritten_query)
+            query_request = request_builder(kb_id, rag_config, query_text)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Failed to build query request for KB %s: %s", kb_id, exc)
-            continue
+            return None
 
         try:
-            response = await query_service.query_documents(kb_id, query_request, user_id=user_id)
+            response = await q_svc.query_documents(kb_id, query_request, user_id=user_id)
             if hasattr(response, "model_dump"):
-                response = response.model_dump(mode="json")
-            responses.append(
-                {
-                    "knowledge_base_id": kb_id,
-                    "response": response,
-                    "rag_config": rag_config,
-                }
-            )
+                response = response.model_dump(mode=dump_mode)
+            return {
+                "knowledge_base_id": kb_id,
+                "response": response,
+                "rag_config": rag_config,
+            }
         except Exception as exc:  # query execution error
             logger.warning("Failed to query documents for KB %s: %s", kb_id, exc)
+            return None
+
+    concurrency = max(1, int(getattr(config_manager.settings, "rag_kb_query_concurrency", 1) or 1))
+    if len(knowledge_base_ids) <= 1 or concurrency == 1:
+        outcomes = [await query_one(kb_id, kb_service, query_service) for kb_id in knowledge_base_ids]
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    session_factory = get_async_session_local()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def query_on_own_session(kb_id: str) -> dict[str, Any] | None:
+        async with semaphore, session_factory() as session:
+            return await query_one(
+                kb_id,
+                KnowledgeBaseService(session, config_manager),
+                QueryService(session, config_manager),
+            )
 
-    return rewritten_query, rewrite_diagnostics, responses
+    with shared_query_embeddings():
+        outcomes = await asyncio.gather(*(query_on_own_session(kb_id) for kb_id in knowledge_base_ids))
+    return [outcome for outcome in outcomes if outcome is not None]
@@ -12,7 +12,8 @@ from ..core.config import ConfigurationManager
 from ..models.llm_provider import Message
 from ..schemas.query import QueryRequest
 from .knowledge_base_service import KnowledgeBaseService
-from .query_service import COMPREHENSIVE_STOP_WORDS, QueryService
+from .query_service import QueryService
+from .rag_query_processing import query_knowledge_bases
 from .side_call_service import SideCallService
 
 logger = get_logger(__name__)
@@ -113,50 +114,14 @@ async def execute_rag_queries(
         rewritten_query = query_text
         rewrite_diagnostics = None
 
-    words = rewritten_query.split()
-    cleaned_words = [
-        w.lower().strip('.,!?;:"()[]{}')
-        for w in words
-        if w.lower().strip('.,!?;:"()[]{}') not in COMPREHENSIVE_STOP_WORDS
-    ]
-
-    kb_service = KnowledgeBaseService(db_session, config_manager)
-    responses: list[dict[str, Any]] = []
-
-    for kb_id in knowledge_base_ids:
-        rag_config: dict[str, Any] | None = None
-        try:
-            rag_config_response = await kb_service.get_rag_config(kb_id)
-            rag_config = rag_config_response.model_dump()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.warning("Failed to load RAG config for KB %s: %s", kb_id, exc)
-            continue
-
-        min_words = rag_config.get("minimum_query_words", 3)
-        if len(words) < min_words or len(cleaned_words) == 0:
-            if rewrite_diagnostics is not None:
-                skipped = rewrite_diagnostics.setdefault("skipped", {})
-                skipped[kb_id] = "insufficient_meaningful_words"
-            continue
-
-        try:
-            query_request = request_builder(kb_id, rag_config, rewritten_query)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error("Failed to build query request for KB %s: %s", kb_id, exc)
-            continue
-
-        try:
-            response = await query_service.query_documents(kb_id, query_request, user_id=user_id)
-            if hasattr(response, "model_dump"):
-                response = response.model_dump()
-            responses.append(
-                {
-                    "knowledge_base_id": kb_id,
-                    "response": response,
-                    "rag_config": rag_config,
-                }
-            )
-        except Exception as exc:  # query execution error
-            logger.warning("Failed to query documents for KB %s: %s", kb_id, exc)
-
+    responses = await query_knowledge_bases(
+        config_manager=config_manager,
+        query_service=query_service,
+        kb_service=KnowledgeBaseService(db_session, config_manager),
+        knowledge_base_ids=knowledge_base_ids,
+        query_text=rewritten_query,
+        request_builder=request_builder,
+        diagnostics=rewrite_diagnostics,
+        user_id=user_id,
+    )
     return rewritten_query, rewrite_diagnostics, responses
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
-from uuid import UUID
 
 from sqlalchemy import select
 
@@ -129,53 +128,70 @@ def dedupe_contributing_chunks(
     return result, title_summary
 
 
-async def _promote_best_chunk(
-    doc_id: UUID,
+_NON_TITLE_CHUNK_WHERE = "(chunk_metadata->>'chunk_type' != 'title' OR chunk_metadata->>'chunk_type' IS NULL)"
+
+
+async def _promote_best_chunks(
+    doc_ids: list[str],
     query_vector: list[float],
     vector_store: VectorStore,
     db: AsyncSession,
-) -> FormattedChunk | None:
-    """Fetch the best non-title content chunk for a document via scoped vector search.
+) -> dict[str, FormattedChunk]:
+    """Fetch the best non-title content chunk for each document via scoped vector search.
 
     Used when a document's only contributing chunks are title chunks —
     the document was found through ingestion-time intelligence (query_match,
     synopsis_match) but no content chunks matched directly. Promoting the
     best content chunk delivers on that identification.
+
+    All documents needing promotion are resolved together: one grouped
+    vector search picks the best chunk per document, and one query loads
+    their content, regardless of how many documents are promoted.
+
+    Returns:
+        Mapping of document id to its promoted chunk; documents without a
+        content chunk are absent.
+
     """
-    results = await vector_store.search(
+    if not doc_ids:
+        return {}
+
+    hits = await vector_store.search_best_per_group(
         collection="chunks",
         query_vector=query_vector,
         db=db,
-        limit=1,
+        group_column="document_id",
+        group_ids=doc_ids,
         threshold=0.0,
-        filters={"document_id": str(doc_id)},
-        extra_where="(chunk_metadata->>'chunk_type' != 'title' OR chunk_metadata->>'chunk_type' IS NULL)",
+        extra_where=_NON_TITLE_CHUNK_WHERE,
     )
+    if not hits:
+        return {}
 
-    if not results:
-        return None
-
-    # Load full content for the promoted chunk
-    hit = results[0]
+    # Load full content for the promoted chunks
     stmt = select(
+        DocumentChunk.id,
         DocumentChunk.chunk_index,
         DocumentChunk.content,
         DocumentChunk.summary,
-    ).where(DocumentChunk.id == hit.id)
-    row = (await db.execute(stmt)).first()
-
-    if not row:
-        return None
-
-    return FormattedChunk(
-        chunk_id=str(hit.id),
-        chunk_index=row[0],
-        score=hit.score,
-        content=row[1] or "",
-        surfaces=["promoted"],
-        summary=row[2] or None,
-        promoted=True,
-    )
+    ).where(DocumentChunk.id.in_([hit.id for hit in hits.values()]))
+    rows = {str(row[0]): row for row in (await db.execute(stmt)).all()}
+
+    promoted: dict[str, FormattedChunk] = {}
+    for doc_id, hit in hits.items():
+        row = rows.get(str(hit.id))
+        if not row:
+            continue
+        promoted[doc_id] = FormattedChunk(
+            chunk_id=str(hit.id),
+            chunk_index=row[1],
+            score=hit.score,
+            content=row[2] or "",
+            surfaces=["promoted"],
+            summary=row[3] or None,
+            promoted=True,
+        )
+    return promoted
 
 
 DEFAULT_MAX_CHUNKS_PER_DOCUMENT = 3
@@ -204,6 +220,7 @@ async def format_results(
 
     """
     formatted: list[FormattedDocument] = []
+    needs_promotion: list[str] = []
 
     for result in fused_results:
         # Deduplicate and annotate chunks, filtering out title chunks
@@ -228,20 +245,8 @@ async def format_results(
         # Check if we need to promote: document has contributing chunks
         # but ALL of them were title chunks (so chunks list is empty after filtering)
         has_contributing = len(result.contributing_chunks) > 0
-        all_title = has_contributing and len(chunks) == 0
-
-        if all_title:
-            promoted = await _promote_best_chunk(result.document_id, query_vector, vector_store, db)
-            if promoted:
-                chunks = [promoted]
-                logger.info(
-                    "Promoted best content chunk for title-only document",
-                    extra={
-                        "document_id": str(result.document_id),
-                        "document_title": result.document_title,
-                        "promoted_score": promoted.score,
-                    },
-                )
+        if has_contributing and len(chunks) == 0:
+            needs_promotion.append(str(result.document_id))
 
         doc = FormattedDocument(
             document_id=str(result.document_id),
@@ -254,4 +259,20 @@ async def format_results(
         )
         formatted.append(doc)
 
+    if needs_promotion:
+        promoted = await _promote_best_chunks(needs_promotion, query_vector, vector_store, db)
+        for doc in formatted:
+            chunk = promoted.get(doc.document_id)
+            if chunk is None or doc.chunks:
+                continue
+            doc.chunks = [chunk]
+            logger.info(
+                "Promoted best content chunk for title-only document",
+                extra={
+                    "document_id": doc.document_id,
+                    "document_title": doc.document_title,
+                    "promoted_score": chunk.score,
+                },
+            )
+
     return formatted
@@ -6,6 +6,9 @@ Exposes two classes and a singleton accessor:
 - ``UsageRecorder`` — coordinates cost resolution, snapshot capture, and the
   llm_usage INSERT. Composes a ``CostResolver``; swallows failures so callers
   are never broken by a missing billing row.
+- ``UsageWriteBuffer`` — optional in-process buffer behind the recorder's
+  fire-and-forget path; turns bursts of single-row transactions into
+  multi-row inserts and caches the provider/model lookups.
 - ``get_usage_recorder()`` — module-level singleton. Follows the same
   ``get_X()`` pattern used by ``get_billing_settings``, ``get_async_session_local``,
   and the other service accessors in this codebase.
@@ -37,12 +40,19 @@ callers pass ``input_tokens=page_count, output_tokens=0``.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import dataclass
 from decimal import Decimal
 from functools import lru_cache
+from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
+from ..billing.usage_ledger import record_billable_cost
+from ..core.config import get_settings_instance
 from ..core.database import get_async_session_local
 from ..core.logging import get_logger
+from ..core.tenant import tenant_context
 from ..models.llm_provider import LLMModel, LLMProvider, LLMUsage
 
 if TYPE_CHECKING:
@@ -51,6 +61,51 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class _ProviderSnapshot:
+    """The LLMProvider columns a usage row needs, cached across flushes."""
+
+    name: str
+    is_system_managed: bool
+
+
+@dataclass(frozen=True)
+class _ModelSnapshot:
+    """The LLMModel columns a usage row needs, cached across flushes."""
+
+    model_name: str
+    cost_per_input_unit: Decimal | None
+    cost_per_output_unit: Decimal | None
+
+
+def _log_lost_usage(usage: dict[str, Any], error: Exception) -> None:
+    # If we hit this we are in trouble — caller loses a billing row.
+    # Log the raw payload plus traceback so the failure can be
+    # reconstructed from logs even without the original DB write.
+    logger.error(
+        "Failed to record usage: %s - %s",
+        usage["request_type"],
+        error,
+        exc_info=error,
+        extra={
+            "provider_id": usage["provider_id"],
+            "model_id": usage["model_id"],
+            "user_id": usage["user_id"],
+            "input_tokens": usage["input_tokens"],
+            "output_tokens": usage["output_tokens"],
+            "total_tokens": usage["total_tokens"],
+            "input_cost": str(usage["input_cost"]),
+            "output_cost": str(usage["output_cost"]),
+            "total_cost": str(usage["total_cost"]),
+            # Upstream call outcome — lets ops correlate a dropped
+            # billing row with whether the LLM call itself succeeded
+            # or was already an error case.
+            "success": usage["success"],
+            "error_message": usage["error_message"],
+        },
+    )
+
+
 class CostResolver:
     """Applies the two-tier cost contract. Pure function dressed as a class
     so ``UsageRecorder`` can compose a replaceable strategy — tests inject
@@ -60,7 +115,7 @@ class CostResolver:
     def resolve(
         self,
         *,
-        model: LLMModel | None,
+        model: LLMModel | _ModelSnapshot | None,
         input_tokens: int,
         output_tokens: int,
         input_cost: Decimal,
@@ -108,8 +163,20 @@ class UsageRecorder:
     back atomically.
     """
 
-    def __init__(self, cost_resolver: CostResolver | None = None) -> None:
+    def __init__(
+        self,
+        cost_resolver: CostResolver | None = None,
+        write_buffer: UsageWriteBuffer | None = None,
+    ) -> None:
         self._cost_resolver = cost_resolver or CostResolver()
+        self._write_buffer = write_buffer
+        if write_buffer is not None:
+            write_buffer.bind(self)
+
+    @property
+    def write_buffer(self) -> UsageWriteBuffer | None:
+        """The buffer behind the fire-and-forget path, if buffering is on."""
+        return self._write_buffer
 
     async def record(
         self,
@@ -137,9 +204,10 @@ class UsageRecorder:
 
         Failure semantics:
         - ``session=None`` (fire-and-forget): a fresh session is opened
-          and committed; any failure is logged but **not raised**, so
-          legacy callers (external embedding, side-call service, etc.)
-          stay decoupled from billing-record reliability.
+          and committed — or, with a write buffer, the row is queued for
+          the next multi-row flush; any failure is logged but **not
+          raised**, so legacy callers (external embedding, side-call
+          service, etc.) stay decoupled from billing-record reliability.
         - ``session=<AsyncSession>`` (caller-owned transaction): the
           insert is flushed inside a nested savepoint on the caller's
           session and any failure is **propagated**, so the caller can
@@ -163,7 +231,7 @@ class UsageRecorder:
             # depend on (AC#3 in SHU-759). Callers that want fire-and-forget
             # semantics should omit `session=` and use the fresh-session
             # branch below.
-            await self._insert(
+            billable_cost = await self._insert(
                 session,
                 commit=False,
                 provider_id=provider_id,
@@ -181,59 +249,39 @@ class UsageRecorder:
                 error_message=error_message,
                 request_metadata=request_metadata,
             )
+            await record_billable_cost(billable_cost)
             return
 
         # Fresh-session path: legacy fire-and-forget contract used by
         # external embeddings, side-call service, etc. Billing failures
         # here must never crash the caller; log the full payload so the
         # row can be reconstructed from logs.
+        usage = {
+            "provider_id": provider_id,
+            "model_id": model_id,
+            "user_id": user_id,
+            "request_type": request_type,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": total_tokens,
+            "input_cost": input_cost,
+            "output_cost": output_cost,
+            "total_cost": total_cost,
+            "response_time_ms": response_time_ms,
+            "success": success,
+            "error_message": error_message,
+            "request_metadata": request_metadata,
+        }
+        if self._write_buffer is not None:
+            await self._write_buffer.add(usage)
+            return
         try:
             session_factory = get_async_session_local()
             async with session_factory() as new_session:
-                await self._insert(
-                    new_session,
-                    commit=True,
-                    provider_id=provider_id,
-                    model_id=model_id,
-                    user_id=user_id,
-                    request_type=request_type,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    total_tokens=total_tokens,
-                    input_cost=input_cost,
-                    output_cost=output_cost,
-                    total_cost=total_cost,
-                    response_time_ms=response_time_ms,
-                    success=success,
-                    error_message=error_message,
-                    request_metadata=request_metadata,
-                )
+                billable_cost = await self._insert(new_session, commit=True, **usage)
+            await record_billable_cost(billable_cost)
         except Exception as e:
-            # If we hit this we are in trouble — caller loses a billing row.
-            # Log the raw payload plus traceback so the failure can be
-            # reconstructed from logs even without the original DB write.
-            logger.error(
-                "Failed to record usage: %s - %s",
-                request_type,
-                e,
-                exc_info=True,
-                extra={
-                    "provider_id": provider_id,
-                    "model_id": model_id,
-                    "user_id": user_id,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens,
-                    "input_cost": str(input_cost),
-                    "output_cost": str(output_cost),
-                    "total_cost": str(total_cost),
-                    # Upstream call outcome — lets ops correlate a dropped
-                    # billing row with whether the LLM call itself succeeded
-                    # or was already an error case.
-                    "success": success,
-                    "error_message": error_message,
-                },
-            )
+            _log_lost_usage(usage, e)
 
     async def _insert(
         self,
@@ -254,13 +302,14 @@ class UsageRecorder:
         success: bool,
         error_message: str | None,
         request_metadata: dict[str, Any] | None,
-    ) -> None:
+    ) -> Decimal:
         """Resolve provider/model, apply the cost contract, insert the row.
 
         One ``session.get`` pair serves both snapshot-name capture (SHU-727)
         and rate lookup for the DB-rate fallback (SHU-715). ``commit=True``
         commits the session (fresh-session path); ``commit=False`` flushes
-        inside a nested savepoint (caller-owned session).
+        inside a nested savepoint (caller-owned session). Returns the
+        row's billable cost (see ``_build_record``).
         """
         provider = await session.get(LLMProvider, provider_id)
         # SHU-816: tool-call usage rows have no model — request_type
@@ -268,6 +317,59 @@ class UsageRecorder:
         # doesn't get a None primary key.
         model = await session.get(LLMModel, model_id) if model_id is not None else None
 
+        record, billable_cost = self._build_record(
+            provider,
+            model,
+            provider_id=provider_id,
+            model_id=model_id,
+            user_id=user_id,
+            request_type=request_type,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=total_tokens,
+            input_cost=input_cost,
+            output_cost=output_cost,
+            total_cost=total_cost,
+            response_time_ms=response_time_ms,
+            success=success,
+            error_message=error_message,
+            request_metadata=request_metadata,
+        )
+        if commit:
+            session.add(record)
+            await session.commit()
+        else:
+            async with session.begin_nested():
+                session.add(record)
+                await session.flush()
+        return billable_cost
+
+    def _build_record(
+        self,
+        provider: LLMProvider | _ProviderSnapshot | None,
+        model: LLMModel | _ModelSnapshot | None,
+        *,
+        provider_id: str,
+        model_id: str | None,
+        user_id: str | None,
+        request_type: str,
+        input_tokens: int,
+        output_tokens: int,
+        total_tokens: int,
+        input_cost: Decimal,
+        output_cost: Decimal,
+        total_cost: Decimal,
+        response_time_ms: int | None,
+        success: bool,
+        error_message: str | None,
+        request_metadata: dict[str, Any] | None,
+    ) -> tuple[LLMUsage, Decimal]:
+        """Apply the cost contract and build the row for an already-resolved provider/model.
+
+        Returns the row plus its cost as counted toward hard caps:
+        ``total_cost`` for system-managed providers, zero otherwise (the same
+        filter ``UsageProviderImpl`` applies when summarizing a period).
+        """
         input_cost, output_cost, total_cost = self._cost_resolver.resolve(
             model=model,
             input_tokens=input_tokens,
@@ -303,13 +405,151 @@ class UsageRecorder:
             error_message=error_message,
             request_metadata=request_metadata,
         )
-        if commit:
-            session.add(record)
-            await session.commit()
+        billable_cost = total_cost if provider is not None and provider.is_system_managed else Decimal("0")
+        return record, billable_cost
+
+
+@dataclass
+class _PendingUsage:
+    tenant_id: str | None
+    enqueued_at: float
+    usage: dict[str, Any]
+
+
+class UsageWriteBuffer:
+    """Batches fire-and-forget usage rows into multi-row inserts.
+
+    Rows queue in memory and are written when ``max_rows`` are pending (the
+    caller whose row fills the batch awaits the write, which is what bounds
+    the buffer under load) or when the oldest row has waited
+    ``flush_interval`` seconds. Each flush opens one session per tenant, so
+    tenant stamping and RLS see the same ``tenant_context`` the caller had.
+
+    Provider/model lookups are cached as snapshots for ``lookup_ttl``
+    seconds; a rate change reaches the DB-rate fallback within that window.
+    If a batch insert fails, its rows are retried one by one so a single bad
+    row (e.g. its provider was deleted) only loses itself; rows that still
+    fail are logged with their full payload and counted in ``dropped_rows``.
+    """
+
+    def __init__(self, *, max_rows: int, flush_interval: float, lookup_ttl: float) -> None:
+        self._max_rows = max_rows
+        self._flush_interval = flush_interval
+        self._lookup_ttl = lookup_ttl
+        self._recorder: UsageRecorder | None = None
+        self._pending: list[_PendingUsage] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self._lookups: dict[tuple[str | None, type, str], tuple[Any, float]] = {}
+        self._stats = dict.fromkeys(
+            ("enqueued_rows", "flushed_rows", "dropped_rows", "flushes", "lookup_hits", "lookup_misses"),
+            0,
+        )
+        self._last_flush_lag = 0.0
+        self._max_flush_lag = 0.0
+
+    def bind(self, recorder: UsageRecorder) -> None:
+        """Attach the recorder whose cost contract builds the rows."""
+        self._recorder = recorder
+
+    async def add(self, usage: dict[str, Any]) -> None:
+        """Queue one row; flushes inline when the batch is full."""
+        self._pending.append(_PendingUsage(tenant_context.get(None), time.monotonic(), usage))
+        self._stats["enqueued_rows"] += 1
+        if len(self._pending) >= self._max_rows:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        # Shielded so close() cancelling the timer can't abort a write halfway.
+        await asyncio.shield(self.flush())
+
+    async def flush(self) -> None:
+        """Write every pending row now."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            # This flush covers every row the timer was started for.
+            if self._timer is not None and not self._timer.done() and self._timer is not asyncio.current_task():
+                self._timer.cancel()
+                self._timer = None
+            self._stats["flushes"] += 1
+            batch.sort(key=lambda row: row.tenant_id or "")
+            for tenant_id, rows in groupby(batch, key=lambda row: row.tenant_id):
+                await self._write(tenant_id, list(rows))
+            lag = time.monotonic() - min(row.enqueued_at for row in batch)
+            self._last_flush_lag = lag
+            self._max_flush_lag = max(self._max_flush_lag, lag)
+            # Rows queued while this batch was being written still need a timer.
+            if self._pending and (self._timer is None or self._timer.done()):
+                self._timer = asyncio.create_task(self._flush_later())
+
+    async def close(self) -> None:
+        """Stop the flush timer and write whatever is still pending (shutdown)."""
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        await self.flush()
+
+    async def _write(self, tenant_id: str | None, rows: list[_PendingUsage]) -> None:
+        token = tenant_context.set(tenant_id)
+        try:
+            try:
+                async with get_async_session_local()() as session:
+                    built = [await self._build(session, row.usage) for row in rows]
+                    session.add_all([record for record, _ in built])
+                    await session.commit()
+            except Exception as e:
+                if len(rows) > 1:
+                    for row in rows:
+                        await self._write(tenant_id, [row])
+                    return
+                self._stats["dropped_rows"] += 1
+                _log_lost_usage(rows[0].usage, e)
+                return
+            self._stats["flushed_rows"] += len(rows)
+            for _, billable_cost in built:
+                await record_billable_cost(billable_cost)
+        finally:
+            tenant_context.reset(token)
+
+    async def _build(self, session: AsyncSession, usage: dict[str, Any]) -> tuple[LLMUsage, Decimal]:
+        provider = await self._lookup(session, LLMProvider, usage["provider_id"])
+        model = await self._lookup(session, LLMModel, usage["model_id"]) if usage["model_id"] is not None else None
+        if self._recorder is None:
+            raise RuntimeError("UsageWriteBuffer is not bound to a UsageRecorder")
+        return self._recorder._build_record(provider, model, **usage)
+
+    async def _lookup(self, session: AsyncSession, cls: type, obj_id: str) -> Any:
+        key = (tenant_context.get(None), cls, obj_id)
+        now = time.monotonic()
+        cached = self._lookups.get(key)
+        if cached is not None and cached[1] > now:
+            self._stats["lookup_hits"] += 1
+            return cached[0]
+        self._stats["lookup_misses"] += 1
+        row = await session.get(cls, obj_id)
+        if row is None:
+            snapshot = None
+        elif cls is LLMProvider:
+            snapshot = _ProviderSnapshot(row.name, row.is_system_managed)
         else:
-            async with session.begin_nested():
-                session.add(record)
-                await session.flush()
+            snapshot = _ModelSnapshot(row.model_name, row.cost_per_input_unit, row.cost_per_output_unit)
+        self._lookups[key] = (snapshot, now + self._lookup_ttl)
+        return snapshot
+
+    def stats(self) -> dict[str, Any]:
+        """Row counters plus queue depth and write lag in seconds."""
+        oldest = min((row.enqueued_at for row in self._pending), default=None)
+        return {
+            **self._stats,
+            "pending_rows": len(self._pending),
+            "oldest_pending_seconds": round(time.monotonic() - oldest, 3) if oldest is not None else 0.0,
+            "last_flush_lag_seconds": round(self._last_flush_lag, 3),
+            "max_flush_lag_seconds": round(self._max_flush_lag, 3),
+        }
 
 
 @lru_cache
@@ -320,6 +560,16 @@ def get_usage_recorder() -> UsageRecorder:
     elsewhere in the codebase. Tests can replace the instance per-call by
     patching this function at the caller's binding, or bypass the singleton
     entirely by constructing ``UsageRecorder(cost_resolver=FakeResolver())``
-    directly.
+    directly. Fire-and-forget rows go through a ``UsageWriteBuffer`` unless
+    ``SHU_USAGE_WRITE_BUFFER_ENABLED`` is off.
     """
-    return UsageRecorder()
+    settings = get_settings_instance()
+    if not settings.usage_write_buffer_enabled:
+        return UsageRecorder()
+    return UsageRecorder(
+        write_buffer=UsageWriteBuffer(
+            max_rows=settings.usage_write_buffer_max_rows,
+            flush_interval=settings.usage_write_buffer_flush_interval,
+            lookup_ttl=settings.usage_write_buffer_lookup_ttl,
+        )
+    )
@@ -11,19 +11,25 @@ from typing import Any, Optional
 from .knowledge_base_verifier import KnowledgeBaseVerifier
 from .tokenization import (
     chars_to_tokens_estimate,
+    count_tokens,
+    encoding_for_model,
     estimate_tokens,
     estimate_tokens_for_chunks,
     tokens_to_chars_estimate,
+    truncate_to_tokens,
 )
 
 __all__ = [
     "KnowledgeBaseVerifier",
     "chars_to_tokens_estimate",
+    "count_tokens",
     "create_error_response",
     "create_success_response",
+    "encoding_for_model",
     "estimate_tokens",
     "estimate_tokens_for_chunks",
     "tokens_to_chars_estimate",
+    "truncate_to_tokens",
 ]
 
 
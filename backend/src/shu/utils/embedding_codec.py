@@ -2,7 +2,9 @@
 
 Used by both the Document models (serialize_for_export / build_import_record)
 and the KB import service to convert between Python float lists and compact
-base64-encoded strings suitable for JSONL archives.
+base64-encoded strings suitable for JSONL archives. The COPY-based export
+path converts PostgreSQL's binary ``real[]`` send format straight to the same
+encoding without materializing a float list.
 """
 
 import base64
@@ -38,3 +40,30 @@ def decode_embedding(data: str | None) -> list[float] | None:
     if data is None:
         return None
     return np.frombuffer(base64.b64decode(data), dtype=np.float32).tolist()
+
+
+_PG_FLOAT4_ARRAY_ELEMENT = np.dtype([("length", ">i4"), ("value", ">f4")])
+
+
+def encode_pg_float4_array(data: bytes) -> str:
+    """Base64-encode a binary-format ``real[]`` value as little-endian float32.
+
+    Produces the same string as ``encode_embedding`` for the vector the
+    array holds, so COPY exports stay readable by ``decode_embedding``.
+
+    Args:
+        data: One-dimensional, NULL-free ``real[]`` in PostgreSQL binary
+            send format (e.g. ``embedding::real[]`` from a binary COPY).
+
+    Returns:
+        Base64-encoded string.
+
+    """
+    ndim, has_nulls = np.frombuffer(data, dtype=">i4", count=2)
+    if ndim == 0:
+        return ""
+    if ndim != 1 or has_nulls:
+        raise ValueError("Expected a one-dimensional real[] without NULLs")
+    # Header: ndim, has_nulls, element oid, then (length, lower bound) per dim.
+    elements = np.frombuffer(data, dtype=_PG_FLOAT4_ARRAY_ELEMENT, offset=20)
+    return base64.b64encode(elements["value"].astype("<f4").tobytes()).decode("ascii")
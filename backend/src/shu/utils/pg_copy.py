@@ -0,0 +1,94 @@
+"""Incremental decoder for PostgreSQL binary ``COPY ... TO STDOUT`` output.
+
+asyncpg hands ``copy_from_query(..., format="binary")`` output to a callback
+in arbitrary chunks; ``BinaryCopyDecoder`` reassembles them into tuples of
+raw field values (``bytes``, or ``None`` for SQL NULL). Field payloads stay
+in PostgreSQL's binary send format — the caller decodes them per column.
+"""
+
+import struct
+from datetime import UTC, datetime, timedelta
+
+_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_HEADER_SIZE = len(_SIGNATURE) + 8  # signature + flags + extension length
+_INT16 = struct.Struct(">h")
+_INT32 = struct.Struct(">i")
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+class BinaryCopyDecoder:
+    """Reassemble binary COPY tuples from a stream of chunks."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._header_seen = False
+        self._trailer_seen = False
+
+    def feed(self, data: bytes) -> list[tuple[bytes | None, ...]]:
+        """Add a chunk and return every tuple it completes."""
+        buf = self._buf
+        buf += data
+        pos = 0
+        if not self._header_seen:
+            if len(buf) < _HEADER_SIZE:
+                return []
+            if buf[: len(_SIGNATURE)] != _SIGNATURE:
+                raise ValueError("Not a binary COPY stream")
+            pos = _HEADER_SIZE + _INT32.unpack_from(buf, _HEADER_SIZE - 4)[0]
+            if len(buf) < pos:
+                return []
+            self._header_seen = True
+
+        rows: list[tuple[bytes | None, ...]] = []
+        size = len(buf)
+        while not self._trailer_seen and size - pos >= 2:
+            (field_count,) = _INT16.unpack_from(buf, pos)
+            if field_count == -1:
+                self._trailer_seen = True
+                pos += 2
+                break
+            cursor = pos + 2
+            fields: list[bytes | None] = []
+            for _ in range(field_count):
+                if size - cursor < 4:
+                    break
+                (length,) = _INT32.unpack_from(buf, cursor)
+                cursor += 4
+                if length == -1:
+                    fields.append(None)
+                    continue
+                if size - cursor < length:
+                    break
+                fields.append(bytes(buf[cursor : cursor + length]))
+                cursor += length
+            if len(fields) < field_count:
+                break  # tuple continues in the next chunk
+            rows.append(tuple(fields))
+            pos = cursor
+        del buf[:pos]
+        return rows
+
+    def finish(self) -> None:
+        """Verify the stream ended cleanly on the COPY trailer."""
+        if not self._trailer_seen or self._buf:
+            raise ValueError("Binary COPY stream ended mid-tuple")
+
+
+def decode_text(value: bytes) -> str:
+    """Decode a text/varchar field."""
+    return value.decode("utf-8")
+
+
+def decode_int(value: bytes) -> int:
+    """Decode an int2/int4/int8 field."""
+    return int.from_bytes(value, "big", signed=True)
+
+
+def decode_float(value: bytes) -> float:
+    """Decode a float4/float8 field."""
+    return struct.unpack(">d" if len(value) == 8 else ">f", value)[0]
+
+
+def decode_timestamptz(value: bytes) -> datetime:
+    """Decode a timestamptz field (microseconds since 2000-01-01 UTC)."""
+    return _PG_EPOCH + timedelta(microseconds=decode_int(value))
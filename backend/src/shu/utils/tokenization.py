@@ -11,10 +11,17 @@ This provides reasonable estimates for most modern LLMs including:
 - Anthropic Claude (similar BPE tokenization, ~10-15% variance)
 - Other BPE-based models
 
-For production accuracy with specific models, consider using model-specific
-tokenizers or the provider's token counting API.
+Counts are model-aware: ``encoding_for_model`` maps model names to the
+encoding their tokenizer uses (o200k_base for the GPT-4o/o-series family),
+and models without a public BPE are approximated with the default. Results
+are memoized in a bounded LRU keyed by a hash of the text, so re-counting
+the same message or document across turns never re-encodes it. Token counts
+persisted on messages, documents and chunks use ``STORED_TOKEN_ENCODING``.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 
 from shu.core.logging import get_logger
@@ -24,9 +31,32 @@ logger = get_logger(__name__)
 # Default encoding for modern LLMs (GPT-4 tokenizer)
 DEFAULT_ENCODING = "cl100k_base"
 
+# Encoding of the token_count columns on messages, documents and chunks.
+STORED_TOKEN_ENCODING = DEFAULT_ENCODING
+
+# Tokenizer adapters: model-name prefix -> tiktoken encoding, most specific
+# first. Unlisted models (Claude, Gemini, Llama, ...) use the default.
+_MODEL_ENCODINGS: tuple[tuple[str, str], ...] = (
+    ("gpt-4o", "o200k_base"),
+    ("chatgpt-4o", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4.5", "o200k_base"),
+    ("gpt-5", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+    ("gpt-4", "cl100k_base"),
+    ("gpt-3.5", "cl100k_base"),
+)
+
 # Cache for tiktoken encoder to avoid repeated initialization
 _encoder_cache: dict = {}
 
+# LRU of token counts keyed by (encoding, content digest).
+_COUNT_CACHE_SIZE = 4096
+_count_cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_count_cache_lock = threading.Lock()
+
 
 @lru_cache(maxsize=4)
 def _get_encoder(encoding_name: str = DEFAULT_ENCODING):
@@ -54,6 +84,87 @@ def _get_encoder(encoding_name: str = DEFAULT_ENCODING):
         return None
 
 
+def encoding_for_model(model: str | None) -> str:
+    """Return the tiktoken encoding that best matches ``model``'s tokenizer.
+
+    Provider prefixes such as ``openai/`` are ignored. Unknown or missing
+    model names fall back to ``DEFAULT_ENCODING``.
+    """
+    if not model:
+        return DEFAULT_ENCODING
+    name = model.rsplit("/", 1)[-1].lower()
+    for prefix, encoding_name in _MODEL_ENCODINGS:
+        if name.startswith(prefix):
+            return encoding_name
+    return DEFAULT_ENCODING
+
+
+def count_tokens(text: str | None, *, model: str | None = None, encoding: str | None = None) -> int:
+    """Count the tokens in ``text`` for ``model`` (or an explicit ``encoding``).
+
+    Counts are cached by content hash, so repeated calls with the same text
+    (conversation history, document bodies) cost a hash instead of a BPE pass.
+    Without tiktoken the word-count heuristic is used, as in ``estimate_tokens``.
+    """
+    if not text:
+        return 0
+
+    encoding_name = encoding or encoding_for_model(model)
+    key = (encoding_name, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+        if cached is not None:
+            _count_cache.move_to_end(key)
+            return cached
+
+    count = _encode_count(text, encoding_name)
+    if count is None:
+        # Heuristic counts are not cached, so a tokenizer that becomes
+        # available (or stops failing) is used on the next call.
+        return _heuristic_count(text)
+    with _count_cache_lock:
+        _count_cache[key] = count
+        if len(_count_cache) > _COUNT_CACHE_SIZE:
+            _count_cache.popitem(last=False)
+    return count
+
+
+def _encode_count(text: str, encoding_name: str) -> int | None:
+    """Return the exact token count, or None when no encoder could produce one."""
+    encoder = _get_encoder(encoding_name)
+    if encoder is None:
+        return None
+    try:
+        return len(encoder.encode(text, disallowed_special=()))
+    except Exception as e:
+        logger.warning(f"tiktoken encoding failed, using heuristic: {e}")
+        return None
+
+
+def _heuristic_count(text: str) -> int:
+    # Fallback: word-count heuristic
+    # Average ~1.3 tokens per word for English text
+    return int(len(text.split()) * 1.3)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, *, model: str | None = None) -> str:
+    """Return the longest prefix of ``text`` that fits in ``max_tokens``.
+
+    Falls back to whole-word slicing (using the 1.3 tokens/word heuristic)
+    when tiktoken is unavailable.
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    encoder = _get_encoder(encoding_for_model(model))
+    if encoder is not None:
+        try:
+            tokens = encoder.encode(text, disallowed_special=())
+            return text if len(tokens) <= max_tokens else encoder.decode(tokens[:max_tokens])
+        except Exception as e:
+            logger.warning(f"tiktoken truncation failed, using heuristic: {e}")
+    return " ".join(text.split()[: int(max_tokens / 1.3)])
+
+
 def estimate_tokens(text: str, encoding: str | None = None) -> int:
     """Estimate the number of tokens in a text string.
 
@@ -74,21 +185,7 @@ def estimate_tokens(text: str, encoding: str | None = None) -> int:
         10
 
     """
-    if not text:
-        return 0
-
-    encoding_name = encoding or DEFAULT_ENCODING
-    encoder = _get_encoder(encoding_name)
-
-    if encoder is not None:
-        try:
-            return len(encoder.encode(text))
-        except Exception as e:
-            logger.warning(f"tiktoken encoding failed, using heuristic: {e}")
-
-    # Fallback: word-count heuristic
-    # Average ~1.3 tokens per word for English text
-    return int(len(text.split()) * 1.3)
+    return count_tokens(text, encoding=encoding)
 
 
 def estimate_tokens_for_chunks(chunks: list[str], encoding: str | None = None) -> int:
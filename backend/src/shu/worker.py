@@ -54,6 +54,7 @@ from .core.worker import Worker, WorkerConfig
 from .core.workload_routing import WorkloadType
 from .services.experience_service import ExperienceService
 from .services.ingestion_service import _ERR_FILE_STAGING
+from .services.usage_recording import get_usage_recorder
 
 logger = get_logger(__name__)
 
@@ -98,6 +99,51 @@ def parse_workload_types(workload_types_str: str) -> set[WorkloadType]:
     return workload_types
 
 
+def parse_workload_slots(workload_slots_str: str) -> dict[WorkloadType, int]:
+    """Parse a comma-separated NAME=slots string into per-workload job slots.
+
+    Args:
+        workload_slots_str: Comma-separated NAME=slots pairs
+            (e.g., "PROFILING=8,INGESTION=4"). Empty means no slot limits.
+
+    Returns:
+        Mapping of WorkloadType to the max concurrent jobs per worker.
+
+    Raises:
+        ValueError: If a pair is malformed, names an invalid workload type,
+            or has a negative slot count.
+
+    Example:
+        slots = parse_workload_slots("PROFILING=8")
+        # Returns: {WorkloadType.PROFILING: 8}
+
+    """
+    slots: dict[WorkloadType, int] = {}
+    for pair in workload_slots_str.split(","):
+        pair = pair.strip()  # noqa: PLW2901
+        if not pair:
+            continue
+
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid workload slot '{pair}'. Expected NAME=slots")
+        name = name.strip().upper()
+        try:
+            workload_type = WorkloadType[name]
+        except KeyError as err:
+            valid_types = [wt.name for wt in WorkloadType]
+            raise ValueError(f"Invalid workload type: {name}. Valid types are: {', '.join(valid_types)}") from err
+        try:
+            count = int(value.strip())
+        except ValueError as err:
+            raise ValueError(f"Invalid slot count for {name}: {value.strip()!r}") from err
+        if count < 0:
+            raise ValueError(f"Slot count for {name} must be non-negative, got {count}")
+        slots[workload_type] = count
+
+    return slots
+
+
 async def _run_extraction_pipeline(  # noqa: PLR0915
     job,
     *,
@@ -593,6 +639,9 @@ async def _handle_content_embed_job(job) -> None:  # noqa: PLR0915
                     document.title,  # type: ignore[arg-type]  # SQLAlchemy Column resolves at runtime
                     document.content,  # type: ignore[arg-type]
                     user_id=user_id,
+                    # Coalesces this document's chunks with those of other embed
+                    # jobs running concurrently in this process.
+                    batch_embeddings=True,
                 )
             except KnowledgeBaseNotFoundError as kb_err:
                 # KB was deleted between OCR and embed stages — permanent failure, no retry.
@@ -1394,14 +1443,18 @@ async def run_worker(  # noqa: PLR0915 — linear startup/shutdown sequence; spl
     poll_interval: float = 1.0,
     shutdown_timeout: float = 30.0,
     concurrency: int = 1,
+    jobs_per_worker: int = 1,
+    workload_slots: dict[WorkloadType, int] | None = None,
 ) -> None:
     """Run the worker loop with configurable concurrency.
 
     Args:
         workload_types: Set of workload types to consume.
-        poll_interval: Seconds between dequeue attempts when idle.
+        poll_interval: Max seconds to block waiting for jobs when idle.
         shutdown_timeout: Seconds to wait for current job on shutdown.
         concurrency: Number of concurrent worker tasks to run.
+        jobs_per_worker: Jobs each worker task runs concurrently.
+        workload_slots: Optional per-workload cap on each worker's concurrent jobs.
 
     """
     try:
@@ -1452,6 +1505,8 @@ async def run_worker(  # noqa: PLR0915 — linear startup/shutdown sequence; spl
         workload_types=workload_types,
         poll_interval=poll_interval,
         shutdown_timeout=shutdown_timeout,
+        max_concurrent_jobs=jobs_per_worker,
+        workload_slots=workload_slots or {},
     )
 
     # Create N concurrent workers
@@ -1466,6 +1521,7 @@ async def run_worker(  # noqa: PLR0915 — linear startup/shutdown sequence; spl
         "Starting dedicated workers",
         extra={
             "concurrency": concurrency,
+            "jobs_per_worker": jobs_per_worker,
             "workload_types": [wt.value for wt in workload_types],
             "poll_interval": poll_interval,
             "shutdown_timeout": shutdown_timeout,
@@ -1499,6 +1555,14 @@ async def run_worker(  # noqa: PLR0915 — linear startup/shutdown sequence; spl
             log_maintenance_task.cancel()
         if trim_task is not None and not trim_task.done():
             trim_task.cancel()
+        # Handlers record embedding/OCR/side-call usage fire-and-forget;
+        # write whatever is still buffered before the process exits.
+        usage_write_buffer = get_usage_recorder().write_buffer
+        if usage_write_buffer is not None:
+            try:
+                await usage_write_buffer.close()
+            except Exception as e:
+                logger.warning("Error flushing usage write buffer during shutdown: %s", e)
         logger.info("Workers shutdown complete")
 
 
@@ -1548,7 +1612,7 @@ Valid workload types:
         "--poll-interval",
         type=float,
         default=settings.worker_poll_interval,
-        help=f"Seconds between dequeue attempts when idle (default: {settings.worker_poll_interval})",
+        help=f"Max seconds to block waiting for jobs when idle (default: {settings.worker_poll_interval})",
     )
 
     parser.add_argument(
@@ -1565,6 +1629,20 @@ Valid workload types:
         help=f"Number of concurrent worker tasks (default: {settings.worker_concurrency})",
     )
 
+    parser.add_argument(
+        "--jobs-per-worker",
+        type=int,
+        default=settings.worker_jobs_per_worker,
+        help=f"Jobs each worker task runs concurrently (default: {settings.worker_jobs_per_worker})",
+    )
+
+    parser.add_argument(
+        "--workload-slots",
+        type=str,
+        default=settings.worker_workload_slots,
+        help="Per-workload cap on a worker's concurrent jobs (e.g., PROFILING=8,INGESTION=4)",
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -1599,6 +1677,12 @@ Valid workload types:
         logger.error("Invalid workload types: %s", e)
         sys.exit(1)
 
+    try:
+        workload_slots = parse_workload_slots(args.workload_slots)
+    except ValueError as e:
+        logger.error("Invalid workload slots: %s", e)
+        sys.exit(1)
+
     # Run worker
     try:
         asyncio.run(
@@ -1607,6 +1691,8 @@ Valid workload types:
                 poll_interval=args.poll_interval,
                 shutdown_timeout=args.shutdown_timeout,
                 concurrency=args.concurrency,
+                jobs_per_worker=args.jobs_per_worker,
+                workload_slots=workload_slots,
             )
         )
     except Exception as e:
@@ -0,0 +1,236 @@
+"""Microbenchmark for the per-request cost of Shu's HTTP middleware stack.
+
+Drives a minimal ASGI app in-process (no server, no sockets, no database)
+through three stacks and reports per-request overhead relative to the bare
+app:
+
+- ``bare``: no middleware.
+- ``base_http``: the same layers wrapped in Starlette's ``BaseHTTPMiddleware``
+  (how the stack ran before it moved to pure ASGI).
+- ``asgi``: the pure-ASGI stack as installed by ``shu.main.setup_middleware``.
+
+Two workloads are measured: a trivial JSON endpoint, and a long SSE stream
+(time to first chunk and total time for every chunk to reach the server).
+
+The authentication layer runs its full JWT path against a stub principal,
+and rate limiting uses an always-allow stub service, so only middleware
+overhead is timed.
+
+Usage:
+    python -m tests.benchmark.run_middleware_overhead
+    python -m tests.benchmark.run_middleware_overhead --requests 5000 --sse-events 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.types import ASGIApp
+
+from shu.auth.jwt_manager import JWTManager
+from shu.core.middleware import (
+    AuthenticationMiddleware,
+    MustChangePasswordMiddleware,
+    RateLimitMiddleware,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+    TimingMiddleware,
+)
+from shu.core.rate_limiting import RateLimitResult
+from shu.main import StripAPITrailingSlashMiddleware
+
+# Innermost first, matching the add_middleware order in setup_middleware
+# (each add wraps the previous, so the last entry is the outermost layer).
+_LAYERS: list[tuple[type, dict[str, Any]]] = [
+    (RequestIDMiddleware, {}),
+    (TimingMiddleware, {}),
+    (MustChangePasswordMiddleware, {}),
+    (AuthenticationMiddleware, {}),
+    (SecurityHeadersMiddleware, {}),
+    (StripAPITrailingSlashMiddleware, {"api_prefix": "/api/v1"}),
+    (RateLimitMiddleware, {}),
+]
+
+_STUB_USER = SimpleNamespace(
+    id="bench-user",
+    email="bench@example.com",
+    name="Bench",
+    role="admin",
+    is_active=True,
+    must_change_password=False,
+    password_changed_at=None,
+    last_login=None,
+)
+
+
+class _AllowAllRateLimits:
+    enabled = True
+
+    async def check_api_limit(self, identifier: str) -> RateLimitResult:
+        return RateLimitResult(allowed=True, remaining=999, limit=1000, reset_seconds=60)
+
+
+def _prepare(layer: Any) -> Any:
+    """Swap out the DB- and cache-backed pieces of a layer for stubs."""
+    if isinstance(layer, AuthenticationMiddleware):
+        _STUB_USER.last_login = datetime.now(UTC)
+
+        async def load_principal(*args: Any, **kwargs: Any) -> tuple[Any, None]:
+            return _STUB_USER, None
+
+        layer._load_principal = load_principal
+    elif isinstance(layer, RateLimitMiddleware):
+        layer._rate_limit_service = _AllowAllRateLimits()
+    return layer
+
+
+def _endpoint_app(sse_events: int) -> Starlette:
+    async def ping(request: Request) -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    async def stream(request: Request) -> StreamingResponse:
+        async def events():
+            for i in range(sse_events):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(routes=[Route("/api/v1/ping", ping), Route("/api/v1/stream", stream)])
+
+
+def build_stack(kind: str, sse_events: int) -> ASGIApp:
+    """Build the ``bare``, ``base_http`` or ``asgi`` stack around the benchmark app."""
+    app: ASGIApp = _endpoint_app(sse_events)
+    if kind == "bare":
+        return app
+    for cls, kwargs in _LAYERS:
+        if kind == "asgi":
+            app = _prepare(cls(app, **kwargs))
+        else:
+            layer = _prepare(cls(None, **kwargs))
+            app = BaseHTTPMiddleware(app, dispatch=layer.dispatch)
+    return app
+
+
+async def _drive(app: ASGIApp, path: str, headers: list[tuple[bytes, bytes]]) -> tuple[float, float, int]:
+    """Run one request; return (seconds to first body chunk, total seconds, status)."""
+    disconnect = asyncio.Event()
+    request_sent = False
+    first_chunk: float | None = None
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal first_chunk, status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and first_chunk is None and message.get("body"):
+            first_chunk = time.perf_counter()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 40000),
+    }
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    end = time.perf_counter()
+    disconnect.set()
+    return (first_chunk or end) - start, end - start, status
+
+
+async def _measure(app: ASGIApp, path: str, headers: list[tuple[bytes, bytes]], count: int) -> dict[str, float]:
+    for _ in range(min(50, count)):  # warm-up
+        await _drive(app, path, headers)
+    firsts, totals = [], []
+    for _ in range(count):
+        first, total, status = await _drive(app, path, headers)
+        if status != 200:
+            raise RuntimeError(f"{path} returned {status}")
+        firsts.append(first)
+        totals.append(total)
+    return {
+        "first_us": statistics.median(firsts) * 1e6,
+        "total_us": statistics.median(totals) * 1e6,
+        "p95_total_us": statistics.quantiles(totals, n=20)[-1] * 1e6 if len(totals) >= 20 else max(totals) * 1e6,
+    }
+
+
+async def run(requests: int, sse_events: int, sse_requests: int) -> dict[str, dict[str, dict[str, float]]]:
+    """Measure every stack on both workloads."""
+    token = JWTManager().create_access_token({"user_id": "bench-user", "email": "bench@example.com", "role": "admin"})
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for kind in ("bare", "base_http", "asgi"):
+        app = build_stack(kind, sse_events)
+        results[kind] = {
+            "ping": await _measure(app, "/api/v1/ping", headers, requests),
+            "sse": await _measure(app, "/api/v1/stream", headers, sse_requests),
+        }
+    return results
+
+
+def _report(results: dict[str, dict[str, dict[str, float]]], sse_events: int, emit: Callable[[str], None]) -> None:
+    bare = results["bare"]
+    emit(f"{'stack':<10} {'ping median':>12} {'overhead':>10} {'sse first':>11} {'sse total':>11} {'overhead':>10}")
+    for kind, workloads in results.items():
+        ping, sse = workloads["ping"], workloads["sse"]
+        emit(
+            f"{kind:<10} {ping['total_us']:>10.1f}us {ping['total_us'] - bare['ping']['total_us']:>8.1f}us "
+            f"{sse['first_us']:>9.1f}us {sse['total_us'] / 1000:>9.2f}ms "
+            f"{(sse['total_us'] - bare['sse']['total_us']) / 1000:>8.2f}ms"
+        )
+    emit(f"(SSE stream: {sse_events} events per request; medians, in-process, no network)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Shu middleware overhead microbenchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="Trivial-endpoint requests per stack")
+    parser.add_argument("--sse-events", type=int, default=1000, help="Events per SSE response")
+    parser.add_argument("--sse-requests", type=int, default=50, help="SSE requests per stack")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    # Per-request INFO logging (TimingMiddleware) would dominate the timings.
+    logging.disable(logging.INFO)
+    results = asyncio.run(run(args.requests, args.sse_events, args.sse_requests))
+    _report(results, args.sse_events, print)
+
+
+if __name__ == "__main__":
+    main()
@@ -290,6 +290,18 @@ class MockHostKb:
         self.ingested_emails.append(record)
         return {"ko_id": f"mock_ko_{message_id}"}
 
+    async def ingest_batch(self, knowledge_base_id: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Mock batch ingestion; routes each item to the matching single-item mock."""
+        results = []
+        for item in items:
+            fields = {k: v for k, v in item.items() if k != "kind"}
+            if item.get("kind") == "email":
+                fields.setdefault("body_text", None)
+                results.append(await self.ingest_email(knowledge_base_id, **fields))
+            else:
+                results.append(await self.ingest_text(knowledge_base_id, **fields))
+        return results
+
     async def ingest_thread(
         self,
         knowledge_base_id: str,
@@ -20,6 +20,9 @@ from shu.api.dependencies import get_db
 from shu.auth.rbac import get_current_user
 from shu.billing.cp_client import BillingState
 from shu.billing.entitlements import EntitlementSet, LimitSet
+from shu.core.stream_replay import InMemoryStreamReplayLog
+from shu.core.streaming import SSE_DONE_FRAME
+from shu.services.chat_streaming import ProviderResponseEvent
 
 
 def _disabled_billing_state(payment_failed_at: datetime) -> BillingState:
@@ -228,3 +231,71 @@ class TestSseInFlightInvariant:
         # mid-stream re-check. If a future change adds re-validation inside
         # the generator this count flips and the test fails loudly.
         assert call_count["n"] == 1
+
+
+class TestResumableStreams:
+    """Streams are served from the replay log so any node can resume or stop them."""
+
+    @pytest.fixture
+    def replay_log(self):
+        log = InMemoryStreamReplayLog(ttl_seconds=60, max_events=100)
+        with patch("shu.api.chat.get_stream_replay_log", AsyncMock(return_value=log)):
+            yield log
+
+    @staticmethod
+    async def _seed(log: InMemoryStreamReplayLog, owner: str, frames: list[str], complete: bool) -> None:
+        await log.open("stream-1", {"user_id": owner, "conversation_id": "conv-1"})
+        for seq, frame in enumerate(frames, start=1):
+            await log.append("stream-1", seq, frame)
+        if complete:
+            await log.close("stream-1")
+
+    def test_send_message_frames_carry_event_ids(self, replay_log, client_with_overrides, mock_chat_service):
+        client, _user = client_with_overrides
+
+        async def _events():
+            yield ProviderResponseEvent(type="content_delta", content="hi")
+
+        async def _send_message_stub(**_kwargs):
+            return _events()
+
+        from shu.api.chat import assert_subscription_active
+
+        mock_chat_service.send_message.side_effect = _send_message_stub
+        client.app.dependency_overrides[assert_subscription_active] = lambda: None
+        response = client.post("/api/v1/chat/conversations/conv-1/send", json={"message": "hello"})
+
+        assert response.text.startswith('id: 1\ndata: {"event": "content_delta"')
+        assert response.text.endswith(f"id: 2\n{SSE_DONE_FRAME}")
+
+    def test_resume_replays_after_last_event_id(self, replay_log, client_with_overrides):
+        client, _user = client_with_overrides
+        frames = ["data: a\n\n", "data: b\n\n", SSE_DONE_FRAME]
+        client.portal.call(self._seed, replay_log, "user-123", frames, True)
+
+        response = client.get("/api/v1/chat/streams/stream-1/events", headers={"Last-Event-ID": "1"})
+
+        assert response.status_code == 200
+        assert response.text == f"id: 2\ndata: b\n\nid: 3\n{SSE_DONE_FRAME}"
+
+    def test_resume_rejects_other_users_and_unknown_streams(self, replay_log, client_with_overrides):
+        client, _user = client_with_overrides
+        client.portal.call(self._seed, replay_log, "someone-else", [], False)
+
+        assert client.get("/api/v1/chat/streams/stream-1/events").status_code == 403
+        assert client.get("/api/v1/chat/streams/missing/events").status_code == 410
+
+    def test_terminate_forwards_to_the_producing_node(self, replay_log, client_with_overrides):
+        client, _user = client_with_overrides
+        client.portal.call(self._seed, replay_log, "user-123", ["data: a\n\n"], False)
+
+        response = client.post("/api/v1/chat/streams/stream-1/terminate")
+
+        assert response.status_code == 202
+        assert client.portal.call(replay_log.stop_requested, "stream-1") is True
+
+    def test_terminate_of_completed_stream_is_gone(self, replay_log, client_with_overrides):
+        client, _user = client_with_overrides
+        client.portal.call(self._seed, replay_log, "user-123", [SSE_DONE_FRAME], True)
+
+        assert client.post("/api/v1/chat/streams/stream-1/terminate").status_code == 410
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from shu.auth.password_auth import PasswordAuthService
+from shu.auth.password_hashing import get_password_hasher, hash_password
 
 DEFAULT_SPECIAL_CHARS = "!@#$%^&*()-_+="
 
@@ -217,9 +218,9 @@ class TestChangePassword:
     NEW_PASSWORD = "NewPass2!"
 
     @pytest.fixture
-    def known_hash(self, service_moderate: PasswordAuthService) -> str:
+    def known_hash(self) -> str:
         """Bcrypt hash for OLD_PASSWORD."""
-        return service_moderate._hash_password(self.OLD_PASSWORD)
+        return hash_password(self.OLD_PASSWORD, get_password_hasher().rounds)
 
     @pytest.fixture
     def mock_user(self, known_hash: str) -> MagicMock:
@@ -338,13 +339,13 @@ class TestResetPassword:
     """
 
     @pytest.fixture
-    def mock_user(self, service_moderate: PasswordAuthService) -> MagicMock:
+    def mock_user(self) -> MagicMock:
         """Mock password-authenticated user."""
         user = MagicMock()
         user.id = "user-456"
         user.email = "reset-target@example.com"
         user.auth_method = "password"
-        user.password_hash = service_moderate._hash_password("OldTempPass1!")
+        user.password_hash = hash_password("OldTempPass1!", get_password_hasher().rounds)
         user.must_change_password = False
         return user
 
@@ -393,8 +394,8 @@ class TestAuthenticateUserEmailVerificationGate:
     PASSWORD = "ValidPass1!"
 
     @pytest.fixture
-    def known_hash(self, service_moderate: PasswordAuthService) -> str:
-        return service_moderate._hash_password(self.PASSWORD)
+    def known_hash(self) -> str:
+        return hash_password(self.PASSWORD, get_password_hasher().rounds)
 
     @pytest.fixture
     def mock_user(self, known_hash: str) -> MagicMock:
@@ -512,6 +513,30 @@ class TestAuthenticateUserEmailVerificationGate:
         assert "inactive" in exc_info.value.detail.lower()
         assert "verify" not in exc_info.value.detail.lower()
 
+    @pytest.mark.asyncio
+    async def test_low_cost_hash_is_upgraded_without_touching_orm_attribute(
+        self, mock_settings_moderate, mock_user: MagicMock, mock_db: AsyncMock
+    ) -> None:
+        """A cost upgrade goes through a Core UPDATE, so the password_hash
+        validator (which signs the user out everywhere) never fires.
+        """
+        from sqlalchemy.sql.dml import Update
+
+        from shu.auth.password_hashing import hash_cost
+
+        legacy_hash = hash_password(self.PASSWORD, 4)
+        mock_user.password_hash = legacy_hash
+        service = self._service_with_backend(mock_settings_moderate, "disabled")
+
+        with self._patch_effective_backend("disabled"):
+            await service.authenticate_user("user@example.com", self.PASSWORD, mock_db)
+
+        updates = [c.args[0] for c in mock_db.execute.await_args_list if isinstance(c.args[0], Update)]
+        assert len(updates) == 1
+        new_hash = updates[0].compile().params["password_hash"]
+        assert hash_cost(new_hash) == 12
+        assert mock_user.password_hash == legacy_hash
+
 
 class TestCreateUserVerificationActivationComposition:
     """SHU-507: SHU_AUTO_ACTIVATE_USERS interacts with email-verification.
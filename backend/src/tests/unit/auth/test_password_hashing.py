@@ -0,0 +1,61 @@
+"""Unit tests for the bounded bcrypt hashing pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from shu.auth.password_hashing import PasswordHasher, PasswordHashingBusyError, hash_cost, hash_password
+
+
+@pytest.fixture
+def hasher():
+    pool = PasswordHasher(rounds=4, workers=1, max_queue=1)
+    yield pool
+    pool.shutdown()
+
+
+class TestPasswordHasher:
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_run_off_the_event_loop(self, hasher: PasswordHasher) -> None:
+        seen: list[str] = []
+        original = hasher._get_executor()
+        original.submit(lambda: seen.append(threading.current_thread().name)).result()
+
+        password_hash = await hasher.hash("Secret1!")
+
+        assert hash_cost(password_hash) == 4
+        assert await hasher.verify("Secret1!", password_hash) is True
+        assert await hasher.verify("wrong", password_hash) is False
+        assert seen[0].startswith("password-hash")
+        assert hasher.stats()["completed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_hash_burns_a_check_and_fails(self, hasher: PasswordHasher) -> None:
+        assert await hasher.verify("anything", None) is False
+        assert hash_cost(hasher._dummy_hash) == 4
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_sheds_with_503(self, hasher: PasswordHasher) -> None:
+        release = threading.Event()
+        blocked = [asyncio.ensure_future(hasher._run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        stats = hasher.stats()
+        assert (stats["in_flight"], stats["queued"]) == (1, 1)
+        with pytest.raises(PasswordHashingBusyError) as exc_info:
+            await hasher.hash("Secret1!")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert hasher.stats()["rejected"] == 1
+        assert hasher.stats()["queued"] == 0
+
+    def test_needs_rehash_only_below_configured_cost(self) -> None:
+        hasher = PasswordHasher(rounds=5, workers=1, max_queue=0)
+
+        assert hasher.needs_rehash(hash_password("pw", 4)) is True
+        assert hasher.needs_rehash(hash_password("pw", 5)) is False
+        assert hasher.needs_rehash("not-a-bcrypt-hash") is False
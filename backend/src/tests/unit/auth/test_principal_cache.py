@@ -0,0 +1,228 @@
+"""Tests for shu.auth.principal_cache.
+
+Covers the snapshot round-trip (secrets never cached, datetimes restored),
+lookup by user id and by API-key email, the TTL=0 kill switch, the
+commit-time invalidation listeners, and ``fetch_user`` reusing the
+middleware's snapshot instead of issuing a SELECT.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import inspect
+
+from shu.auth import principal_cache as principal_cache_module
+from shu.auth.dependencies import CredentialResolution, fetch_user
+from shu.auth.models import User
+from shu.auth.principal_cache import PrincipalCache
+from shu.core.cache_backend import InMemoryCacheBackend
+from shu.models.user_preferences import UserPreferences
+
+TENANT = "00000000-0000-0000-0000-000000000001"
+
+
+def _user(**overrides) -> User:
+    values = {
+        "id": "user-1",
+        "tenant_id": TENANT,
+        "email": "Ada@Example.com",
+        "name": "Ada",
+        "role": "regular_user",
+        "is_active": True,
+        "must_change_password": False,
+        "password_hash": "$2b$12$secret",
+        "email_verification_token_hash": "f" * 64,
+        "last_login": datetime(2026, 10, 1, 9, 30, tzinfo=UTC),
+        "password_changed_at": None,
+    }
+    values.update(overrides)
+    user = User(**values)
+    user.preferences = UserPreferences(id="prefs-1", tenant_id=TENANT, user_id="user-1", memory_depth=7)
+    return user
+
+
+def _cache(ttl_seconds: int = 60) -> PrincipalCache:
+    return PrincipalCache(cache_backend=InMemoryCacheBackend(), ttl_seconds=ttl_seconds)
+
+
+def _fake_session(*, new=(), dirty=(), deleted=()) -> SimpleNamespace:
+    return SimpleNamespace(
+        new=set(new),
+        dirty=set(dirty),
+        deleted=set(deleted),
+        info={},
+        is_modified=lambda obj: True,
+    )
+
+
+class TestSnapshot:
+    def test_secrets_are_never_cached(self):
+        snapshot = PrincipalCache.snapshot(_user())
+
+        assert "password_hash" not in snapshot["user"]
+        assert "email_verification_token_hash" not in snapshot["user"]
+        assert snapshot["user"]["last_login"] == "2026-10-01T09:30:00+00:00"
+        assert snapshot["preferences"]["memory_depth"] == 7
+
+    def test_materialize_restores_a_detached_user(self):
+        user = PrincipalCache.materialize(PrincipalCache.snapshot(_user()))
+
+        state = inspect(user)
+        assert state.detached
+        assert state.identity == ("user-1",)
+        assert user.email == "Ada@Example.com"
+        assert user.last_login == datetime(2026, 10, 1, 9, 30, tzinfo=UTC)
+        assert user.preferences.memory_depth == 7
+        assert "password_hash" not in state.dict
+
+    def test_preferences_left_unloaded_when_not_eager_loaded(self):
+        user = _user()
+        del user.preferences
+        inspect(user).dict.pop("preferences", None)
+
+        snapshot = PrincipalCache.snapshot(user)
+
+        assert "preferences" not in snapshot
+        assert "preferences" not in inspect(PrincipalCache.materialize(snapshot)).dict
+
+
+class TestGetSet:
+    @pytest.mark.asyncio
+    async def test_round_trip_by_user_id(self):
+        cache = _cache()
+
+        stored = await cache.set(TENANT, _user())
+        fetched = await cache.get(TENANT, user_id="user-1")
+
+        assert fetched == stored
+        assert await cache.get("other-tenant", user_id="user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_api_key_lookup_by_email_is_case_insensitive(self):
+        cache = _cache()
+
+        await cache.set(TENANT, _user(), email="ada@example.com")
+
+        fetched = await cache.get(TENANT, email="ADA@example.com")
+        assert fetched["user"]["id"] == "user-1"
+        assert await cache.get(TENANT, email="someone@example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_the_cache(self):
+        cache = _cache(ttl_seconds=0)
+
+        assert await cache.set(TENANT, _user()) is None
+        assert await cache.get(TENANT, user_id="user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_the_snapshot(self):
+        cache = _cache()
+        await cache.set(TENANT, _user())
+
+        await cache.invalidate(TENANT, "user-1")
+
+        assert await cache.get(TENANT, user_id="user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_non_orm_user_is_not_cached(self):
+        cache = _cache()
+
+        assert await cache.set(TENANT, SimpleNamespace(id="user-1")) is None
+        assert await cache.get(TENANT, user_id="user-1") is None
+
+
+class TestInvalidationListeners:
+    def test_role_change_is_collected(self):
+        user = PrincipalCache.materialize(PrincipalCache.snapshot(_user()))
+        user.role = "admin"
+        session = _fake_session(dirty=[user])
+
+        principal_cache_module._collect_principal_invalidations(session, None)
+
+        assert session.info[principal_cache_module._INVALIDATIONS_KEY] == {(TENANT, "user-1")}
+
+    def test_last_login_bump_is_ignored(self):
+        user = PrincipalCache.materialize(PrincipalCache.snapshot(_user()))
+        user.last_login = datetime.now(UTC)
+        session = _fake_session(dirty=[user])
+
+        principal_cache_module._collect_principal_invalidations(session, None)
+
+        assert principal_cache_module._INVALIDATIONS_KEY not in session.info
+
+    def test_preference_and_deleted_user_changes_are_collected(self):
+        prefs = UserPreferences(id="prefs-2", tenant_id=TENANT, user_id="user-2")
+        deleted = PrincipalCache.materialize(PrincipalCache.snapshot(_user(id="user-3")))
+        session = _fake_session(new=[prefs], deleted=[deleted])
+
+        principal_cache_module._collect_principal_invalidations(session, None)
+
+        assert session.info[principal_cache_module._INVALIDATIONS_KEY] == {
+            (TENANT, "user-2"),
+            (TENANT, "user-3"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_and_rollback_discards(self):
+        cache = _cache()
+        await cache.set(TENANT, _user())
+        committed = _fake_session()
+        committed.info[principal_cache_module._INVALIDATIONS_KEY] = {(TENANT, "user-1")}
+        rolled_back = _fake_session()
+        rolled_back.info[principal_cache_module._INVALIDATIONS_KEY] = {(TENANT, "user-1")}
+
+        with patch.object(principal_cache_module, "get_principal_cache", return_value=cache):
+            principal_cache_module._discard_principal_invalidations(rolled_back)
+            principal_cache_module._schedule_principal_invalidations(committed)
+            await asyncio.gather(*principal_cache_module._pending_invalidations)
+
+        assert rolled_back.info == {}
+        assert await cache.get(TENANT, user_id="user-1") is None
+
+    def test_core_update_pairs_survive_the_flush_listener(self):
+        session = _fake_session()
+
+        principal_cache_module.invalidate_on_commit(session, [(TENANT, "user-4")])
+        principal_cache_module._collect_principal_invalidations(session, None)
+
+        assert session.info[principal_cache_module._INVALIDATIONS_KEY] == {(TENANT, "user-4")}
+
+
+class TestFetchUser:
+    @pytest.mark.asyncio
+    async def test_reuses_middleware_snapshot_without_a_select(self):
+        cache = _cache()
+        snapshot = await cache.set(TENANT, _user())
+        request = SimpleNamespace(state=SimpleNamespace(principal=snapshot))
+        db = MagicMock()
+        db.execute = AsyncMock()
+        db.merge = AsyncMock(side_effect=lambda obj, load: obj)
+
+        with patch("shu.auth.dependencies.get_principal_cache", return_value=cache):
+            user = await fetch_user(request, CredentialResolution(source="jwt", user_id="user-1"), TENANT, db)
+
+        assert user.id == "user-1"
+        db.merge.assert_awaited_once()
+        assert db.merge.await_args.kwargs == {"load": False}
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_inactive_cached_user_is_rejected(self):
+        cache = _cache()
+        await cache.set(TENANT, _user(is_active=False))
+        request = SimpleNamespace(state=SimpleNamespace())
+        db = MagicMock()
+        db.merge = AsyncMock(side_effect=lambda obj, load: obj)
+
+        with (
+            patch("shu.auth.dependencies.get_principal_cache", return_value=cache),
+            pytest.raises(Exception) as exc_info,
+        ):
+            await fetch_user(request, CredentialResolution(source="jwt", user_id="user-1"), TENANT, db)
+
+        assert exc_info.value.status_code == 401
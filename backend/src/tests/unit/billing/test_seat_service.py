@@ -499,6 +499,22 @@ class TestCancelPendingRelease:
         db.execute.assert_awaited()
         state_service.update.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_cleared_users_are_evicted_from_principal_cache_on_commit(self):
+        """The bulk clear is a Core UPDATE, so it queues the cache eviction itself."""
+        service, stripe_client, _ = _make_services(quantity=5, target_quantity=5)
+        stripe_client.release_subscription_schedule = AsyncMock()
+
+        active_patch, limit_patch = _patch_seat_module()
+        db = _make_db()
+        db.info = {}
+        db.execute.return_value.all.return_value = [MagicMock(tenant_id="tenant-1", id="user-7")]
+
+        with active_patch, limit_patch:
+            await service.cancel_pending_release(db)
+
+        assert db.info["shu_principal_invalidations"] == {("tenant-1", "user-7")}
+
     @pytest.mark.asyncio
     async def test_skips_release_when_no_schedule_attached(self):
         """If no schedule is attached, still bulk-clear flags defensively."""
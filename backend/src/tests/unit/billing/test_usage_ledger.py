@@ -0,0 +1,105 @@
+"""Unit tests for the running hard-cap usage ledger."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shu.billing import usage_ledger
+from shu.billing.usage_ledger import period_cost, record_billable_cost, reset_usage_ledger_fast_path, to_nanos
+from shu.core.cache_backend import InMemoryCacheBackend
+
+_PERIOD = datetime(2026, 5, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def ledger():
+    backend = InMemoryCacheBackend(cleanup_interval_seconds=0)
+    settings = SimpleNamespace(usage_ledger_reconcile_seconds=300, usage_ledger_fast_path_seconds=0)
+    reset_usage_ledger_fast_path()
+    with (
+        patch.object(usage_ledger, "get_billing_settings", return_value=settings),
+        patch.object(usage_ledger, "get_cache_backend", AsyncMock(return_value=backend)),
+    ):
+        yield SimpleNamespace(backend=backend, settings=settings)
+    reset_usage_ledger_fast_path()
+
+
+async def _cost(aggregate, period=_PERIOD, cap=Decimal("50")):
+    return await period_cost(period, aggregate, cap=cap, markup=Decimal("1"))
+
+
+class TestUsageLedger:
+    def test_to_nanos_rounds_up(self) -> None:
+        assert to_nanos(Decimal("1.5")) == 1_500_000_000
+        assert to_nanos(Decimal("0.0000000001")) == 1
+
+    @pytest.mark.asyncio
+    async def test_seeds_once_then_tracks_recorded_costs(self, ledger) -> None:
+        aggregate = AsyncMock(return_value=Decimal("10"))
+
+        assert await _cost(aggregate) == Decimal("10")
+        await record_billable_cost(Decimal("2.25"))
+        await record_billable_cost(Decimal("0"))
+
+        assert await _cost(aggregate) == Decimal("12.25")
+        aggregate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_new_period_reconciles(self, ledger) -> None:
+        aggregate = AsyncMock(side_effect=[Decimal("10"), Decimal("0")])
+
+        await _cost(aggregate)
+        await record_billable_cost(Decimal("1"))
+
+        assert await _cost(aggregate, period=datetime(2026, 6, 1, tzinfo=UTC)) == Decimal("0")
+        assert aggregate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_counter_reset_forces_reconcile(self, ledger) -> None:
+        aggregate = AsyncMock(side_effect=[Decimal("10"), Decimal("11")])
+        await record_billable_cost(Decimal("1"))
+        await _cost(aggregate)
+
+        await ledger.backend.delete("billing:ledger:00000000-0000-0000-0000-000000000001:spend")
+
+        assert await _cost(aggregate) == Decimal("11")
+        assert aggregate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fast_path_only_far_below_cap(self, ledger) -> None:
+        ledger.settings.usage_ledger_fast_path_seconds = 60
+        aggregate = AsyncMock(return_value=Decimal("10"))
+
+        await _cost(aggregate)
+        await record_billable_cost(Decimal("30"))
+        assert await _cost(aggregate) == Decimal("10")  # served in-process
+
+        reset_usage_ledger_fast_path()
+        assert await _cost(aggregate) == Decimal("40")
+        await record_billable_cost(Decimal("5"))
+        assert await _cost(aggregate) == Decimal("45")  # near the cap: always re-read
+
+    @pytest.mark.asyncio
+    async def test_cache_outage_falls_back_to_aggregate(self, ledger) -> None:
+        aggregate = AsyncMock(return_value=Decimal("7"))
+
+        with patch.object(usage_ledger, "get_cache_backend", AsyncMock(side_effect=ConnectionError)):
+            await record_billable_cost(Decimal("1"))  # swallowed
+            assert await _cost(aggregate) == Decimal("7")
+            assert await _cost(aggregate) == Decimal("7")
+
+        assert aggregate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_ledger_always_aggregates(self) -> None:
+        aggregate = AsyncMock(return_value=Decimal("3"))
+        settings = SimpleNamespace(usage_ledger_reconcile_seconds=0)
+
+        with patch.object(usage_ledger, "get_billing_settings", return_value=settings):
+            await _cost(aggregate)
+            await _cost(aggregate)
+
+        assert aggregate.await_count == 2
@@ -0,0 +1,203 @@
+"""Tests for the pure-ASGI middleware pipeline in shu.core.middleware.
+
+Verifies the stack keeps the old ``BaseHTTPMiddleware`` semantics (headers,
+short-circuits, shared request state) while streaming responses pass
+through chunk by chunk instead of being re-buffered per layer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from shu.core.middleware import (
+    ASGIMiddleware,
+    MustChangePasswordMiddleware,
+    RateLimitMiddleware,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+    TimingMiddleware,
+)
+from shu.core.rate_limiting import RateLimitResult
+from shu.main import StripAPITrailingSlashMiddleware
+from shu.plugins.request_limits import RequestSizeLimitMiddleware
+
+
+async def _echo_state(request: Request) -> JSONResponse:
+    return JSONResponse({"path": request.url.path, "request_id": request.state.request_id})
+
+
+async def _stream(request: Request) -> StreamingResponse:
+    async def events():
+        for i in range(3):
+            yield f"data: {i}\n\n"
+            await asyncio.sleep(0)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+async def _upload(request: Request) -> JSONResponse:
+    return JSONResponse({"size": len(await request.body())})
+
+
+def _app() -> Starlette:
+    return Starlette(
+        routes=[
+            Route("/api/v1/echo", _echo_state),
+            Route("/api/v1/stream", _stream),
+            Route("/api/v1/plugins/upload", _upload, methods=["POST"]),
+        ]
+    )
+
+
+class _BlockEverything(ASGIMiddleware):
+    async def before_request(self, request: Request) -> JSONResponse | None:
+        return JSONResponse({"blocked": True}, status_code=403)
+
+
+class _StubRateLimitService:
+    enabled = True
+
+    def __init__(self, allowed: bool) -> None:
+        self.allowed = allowed
+
+    async def check_api_limit(self, identifier: str) -> RateLimitResult:
+        return RateLimitResult(allowed=self.allowed, remaining=4, limit=5, reset_seconds=30, retry_after_seconds=30)
+
+
+def test_header_hooks_apply_and_state_is_shared_across_layers():
+    app = _app()
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(TimingMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+
+    response = TestClient(app).get("/api/v1/echo", headers={"X-Request-ID": "req-42"})
+
+    assert response.status_code == 200
+    assert response.json()["request_id"] == "req-42"
+    assert response.headers["X-Request-ID"] == "req-42"
+    assert response.headers["X-Response-Time"].endswith("s")
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_short_circuit_response_still_gets_outer_headers():
+    app = _app()
+    app.add_middleware(_BlockEverything)
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+
+    response = TestClient(app).get("/api/v1/echo")
+
+    assert response.status_code == 403
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert "X-Request-ID" in response.headers
+
+
+def test_streaming_body_passes_through_chunk_by_chunk():
+    app = _app()
+    for middleware in (SecurityHeadersMiddleware, MustChangePasswordMiddleware, TimingMiddleware, RequestIDMiddleware):
+        app.add_middleware(middleware)
+    sent: list[dict] = []
+
+    async def run() -> None:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/stream",
+            "raw_path": b"/api/v1/stream",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "server": ("testserver", 80),
+            "client": ("testclient", 1234),
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+
+    asyncio.run(run())
+
+    chunks = [m["body"] for m in sent if m["type"] == "http.response.body" and m.get("body")]
+    assert chunks == [b"data: 0\n\n", b"data: 1\n\n", b"data: 2\n\n"]
+    start = next(m for m in sent if m["type"] == "http.response.start")
+    assert b"x-request-id" in {k for k, _ in start["headers"]}
+
+
+def test_rate_limit_headers_added_and_429_short_circuits():
+    allowed_app = _app()
+    allowed_app.add_middleware(RequestIDMiddleware)
+    allowed_app.add_middleware(RateLimitMiddleware)
+    client = TestClient(allowed_app)
+    client.get("/api/v1/echo")  # build the stack
+    rate_limiter = _find_layer(allowed_app, RateLimitMiddleware)
+
+    rate_limiter._rate_limit_service = _StubRateLimitService(allowed=True)
+    ok = client.get("/api/v1/echo")
+    rate_limiter._rate_limit_service = _StubRateLimitService(allowed=False)
+    limited = client.get("/api/v1/echo")
+
+    assert ok.headers["RateLimit-Limit"] == "5"
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "30"
+
+
+def test_trailing_slash_is_stripped_from_api_paths():
+    app = _app()
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(StripAPITrailingSlashMiddleware, api_prefix="/api/v1")
+
+    response = TestClient(app).get("/api/v1/echo/", follow_redirects=False)
+
+    assert response.status_code == 200
+    assert response.json()["path"] == "/api/v1/echo"
+
+
+def test_request_size_limit_replays_small_bodies_and_rejects_large_ones():
+    app = _app()
+    app.add_middleware(RequestSizeLimitMiddleware, max_bytes=16, path_prefix="/api/v1/plugins")
+    client = TestClient(app)
+
+    small = client.post("/api/v1/plugins/upload", content=b"x" * 10)
+    large = client.post("/api/v1/plugins/upload", content=b"x" * 32)
+
+    assert small.json() == {"size": 10}
+    assert large.status_code == 413
+    assert large.json()["error"] == "REQUEST_TOO_LARGE"
+
+
+def test_dispatch_skips_own_response_hook_on_short_circuit():
+    class _Tagging(_BlockEverything):
+        def on_response_start(self, request, status_code, headers):
+            headers["X-Tagged"] = "yes"
+
+    async def call_next(request):
+        raise AssertionError("should not be called")
+
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""})
+    response = asyncio.run(_Tagging(app=SimpleNamespace()).dispatch(request, call_next))
+
+    assert response.status_code == 403
+    assert "X-Tagged" not in response.headers
+
+
+def _find_layer(app: Starlette, cls: type) -> ASGIMiddleware:
+    layer = app.middleware_stack
+    while layer is not None and not isinstance(layer, cls):
+        layer = getattr(layer, "app", None)
+    assert layer is not None, f"{cls.__name__} not found in middleware stack"
+    return layer
@@ -5,7 +5,9 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.pool import QueuePool
 
 from shu.core import database
 from shu.core.exceptions import DatabaseSessionError
@@ -16,7 +18,9 @@ from shu.core.tenant import (
 )
 
 
-def _stub_settings(*, use_pgbouncer: bool) -> SimpleNamespace:
+def _stub_settings(
+    *, use_pgbouncer: bool, pre_ping_idle_seconds: float = 0, tenant_binding: str = "transaction"
+) -> SimpleNamespace:
     return SimpleNamespace(
         database_pool_size=20,
         database_max_overflow=30,
@@ -24,6 +28,8 @@ def _stub_settings(*, use_pgbouncer: bool) -> SimpleNamespace:
         database_pool_recycle=3600,
         debug=False,
         use_pgbouncer=use_pgbouncer,
+        db_tenant_binding=tenant_binding,
+        database_pre_ping_idle_seconds=pre_ping_idle_seconds,
     )
 
 
@@ -57,6 +63,61 @@ class TestGetAsyncEnginePgBouncer:
 
         assert mock_engine.call_args.kwargs["connect_args"] == {}
 
+    def test_idle_pre_ping_replaces_ping_on_every_checkout(self) -> None:
+        with (
+            patch.object(database, "create_async_engine", return_value=MagicMock()) as mock_engine,
+            patch.object(database, "get_database_url", return_value="postgresql+asyncpg://u:p@h/db"),
+            patch.object(
+                database, "get_settings", return_value=_stub_settings(use_pgbouncer=False, pre_ping_idle_seconds=30)
+            ),
+            patch.object(database, "_install_idle_pre_ping") as install,
+        ):
+            engine = database.get_async_engine()
+
+        assert mock_engine.call_args.kwargs["pool_pre_ping"] is False
+        install.assert_called_once_with(engine, 30)
+
+
+class TestIdlePrePing:
+    """Checkout pings only connections that sat idle past the threshold."""
+
+    def _engine(self):
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0)
+        database._install_idle_pre_ping(SimpleNamespace(sync_engine=engine), 30)
+        return engine
+
+    def _backdate_checkin(self, engine, seconds: float) -> None:
+        with engine.connect() as conn:
+            record = conn.connection._connection_record
+        record.info[database._LAST_CHECKIN_KEY] -= seconds
+
+    def test_recently_used_connection_is_not_pinged(self) -> None:
+        engine = self._engine()
+        with patch.object(engine.dialect, "do_ping") as do_ping:
+            for _ in range(3):
+                with engine.connect():
+                    pass
+
+        do_ping.assert_not_called()
+
+    def test_idle_connection_is_pinged(self) -> None:
+        engine = self._engine()
+        self._backdate_checkin(engine, 60)
+
+        with patch.object(engine.dialect, "do_ping", return_value=True) as do_ping, engine.connect():
+            pass
+
+        do_ping.assert_called_once()
+
+    def test_failed_ping_replaces_the_connection(self) -> None:
+        engine = self._engine()
+        with engine.connect() as conn:
+            stale = conn.connection.dbapi_connection
+        self._backdate_checkin(engine, 60)
+
+        with patch.object(engine.dialect, "do_ping", side_effect=RuntimeError("gone")), engine.connect() as conn:
+            assert conn.connection.dbapi_connection is not stale
+
 
 def _patch_engine_with_query_result(monkeypatch, *, query_result):
     """Wire get_async_engine() to return a mock whose conn.execute resolves to query_result.
@@ -246,6 +307,62 @@ class TestSetTenantOnBeginHook:
         conn.execute.assert_not_called()
 
 
+class TestConnectionTenantBinding:
+    """Connection binding keeps app.tenant_id session-wide and skips redundant writes."""
+
+    def setup_method(self) -> None:
+        database.reset_round_trip_stats()
+
+    def _conn(self) -> MagicMock:
+        conn = _pg_conn_mock()
+        conn.connection.info = {}
+        conn.connection.dbapi_connection.run_async.side_effect = lambda fn: fn(conn.driver)
+        return conn
+
+    def _begin(self, conn: MagicMock, tid: str | None) -> None:
+        token = tenant_context.set(tid)
+        try:
+            with patch.object(database, "_connection_bound_engine", conn.engine):
+                database._set_tenant_on_begin(conn)
+        finally:
+            tenant_context.reset(token)
+
+    def test_same_tenant_skips_set_config(self) -> None:
+        conn = self._conn()
+
+        for _ in range(3):
+            self._begin(conn, "tenant-X")
+
+        conn.driver.execute.assert_called_once_with("SELECT set_config('app.tenant_id', $1, false)", "tenant-X")
+        conn.execute.assert_not_called()
+        stats = database.get_round_trip_stats()
+        assert (stats["tenant_guc_set"], stats["tenant_guc_skipped"]) == (1, 2)
+
+    def test_tenant_switch_and_clear_rewrite_the_guc(self) -> None:
+        conn = self._conn()
+
+        self._begin(conn, "tenant-X")
+        self._begin(conn, "tenant-Y")
+        self._begin(conn, None)
+        self._begin(conn, None)
+
+        calls = [c.args for c in conn.driver.execute.call_args_list]
+        assert calls[1][1] == "tenant-Y"
+        assert calls[2] == ("RESET app.tenant_id",)
+        assert len(calls) == 3
+
+    def test_pgbouncer_forces_transaction_binding(self) -> None:
+        engine = MagicMock()
+        engine.sync_engine.dialect.driver = "asyncpg"
+
+        database._configure_tenant_binding(engine, _stub_settings(use_pgbouncer=True, tenant_binding="connection"))
+        assert database._connection_bound_engine is None
+
+        database._configure_tenant_binding(engine, _stub_settings(use_pgbouncer=False, tenant_binding="connection"))
+        assert database._connection_bound_engine is engine.sync_engine
+        database._connection_bound_engine = None
+
+
 class TestRejectUnsafeSetGuard:
     """Coverage for ``_reject_unsafe_set`` — the debug-only guard against
     raw ``SET app.tenant_id`` (the legitimate path is set_config in the
@@ -0,0 +1,140 @@
+"""Unit tests for the cross-request embedding micro-batcher."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from shu.core import embedding_batcher
+from shu.core.embedding_batcher import EmbeddingBatcher, get_batching_embedding_service
+from shu.core.tenant import tenant_context
+
+
+class _FakeService:
+    """Embeds each text as ``[len(text)]`` and records every call."""
+
+    dimension = 1
+    model_name = "fake-model"
+
+    def __init__(self, fail_on: str | None = None):
+        self.calls: list[tuple[list[str], str | None]] = []
+        self.fail_on = fail_on
+
+    async def embed_texts(self, texts, *, user_id=None):
+        self.calls.append((list(texts), user_id))
+        if self.fail_on in texts:
+            raise RuntimeError("provider rejected input")
+        return [[float(len(t))] for t in texts]
+
+    async def embed_query(self, text, *, user_id=None):
+        return [0.0]
+
+    async def embed_queries(self, texts, *, user_id=None):
+        return [[0.0] for _ in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_full_batch():
+    service = _FakeService()
+    batcher = EmbeddingBatcher(service, batch_size=4, max_wait=10.0)
+
+    results = await asyncio.gather(
+        batcher.embed_texts(["a", "bb"], user_id="u1"),
+        batcher.embed_texts(["ccc", "dddd"], user_id="u1"),
+    )
+
+    assert results == [[[1.0], [2.0]], [[3.0], [4.0]]]
+    assert service.calls == [(["a", "bb", "ccc", "dddd"], "u1")]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_after_max_wait():
+    service = _FakeService()
+    batcher = EmbeddingBatcher(service, batch_size=32, max_wait=0.01)
+
+    result = await asyncio.wait_for(batcher.embed_texts(["a", "bb"]), timeout=1.0)
+
+    assert result == [[1.0], [2.0]]
+    assert len(service.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_never_exceed_batch_size():
+    service = _FakeService()
+    batcher = EmbeddingBatcher(service, batch_size=3, max_wait=0.01)
+
+    await asyncio.gather(*(batcher.embed_texts(["x", "y"]) for _ in range(4)))
+
+    assert all(len(texts) <= 3 for texts, _ in service.calls)
+    assert sum(len(texts) for texts, _ in service.calls) == 8
+
+
+@pytest.mark.asyncio
+async def test_large_request_bypasses_queue():
+    service = _FakeService()
+    batcher = EmbeddingBatcher(service, batch_size=2, max_wait=10.0)
+
+    assert await batcher.embed_texts(["a", "b", "c"]) == [[1.0], [1.0], [1.0]]
+    assert service.calls == [(["a", "b", "c"], None)]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_not_mixed_across_users_or_tenants():
+    service = _FakeService()
+    batcher = EmbeddingBatcher(service, batch_size=8, max_wait=0.01)
+
+    async def embed_as(tenant, user):
+        token = tenant_context.set(tenant)
+        try:
+            return await batcher.embed_texts(["t"], user_id=user)
+        finally:
+            tenant_context.reset(token)
+
+    await asyncio.gather(embed_as("t1", "u1"), embed_as("t1", "u2"), embed_as("t2", "u1"), embed_as("t1", "u1"))
+
+    assert sorted((len(texts), user) for texts, user in service.calls) == [(1, "u1"), (1, "u2"), (2, "u1")]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_per_request():
+    service = _FakeService(fail_on="bad")
+    batcher = EmbeddingBatcher(service, batch_size=4, max_wait=10.0)
+
+    good, bad = await asyncio.gather(
+        batcher.embed_texts(["ok", "fine"]),
+        batcher.embed_texts(["bad", "x"]),
+        return_exceptions=True,
+    )
+
+    assert good == [[2.0], [4.0]]
+    assert isinstance(bad, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_get_batching_embedding_service_respects_settings():
+    service = _FakeService()
+    embedding_batcher.reset_embedding_batcher()
+    try:
+        with (
+            patch("shu.core.embedding_service.get_embedding_service", return_value=service),
+            patch(
+                "shu.core.embedding_batcher.get_settings_instance",
+                return_value=SimpleNamespace(embedding_batch_max_wait_ms=0, embedding_batch_size=32),
+            ),
+        ):
+            assert await get_batching_embedding_service() is service
+
+        with (
+            patch("shu.core.embedding_service.get_embedding_service", return_value=service),
+            patch(
+                "shu.core.embedding_batcher.get_settings_instance",
+                return_value=SimpleNamespace(embedding_batch_max_wait_ms=25, embedding_batch_size=32),
+            ),
+        ):
+            first = await get_batching_embedding_service()
+            assert isinstance(first, EmbeddingBatcher)
+            assert first.service is service
+            assert await get_batching_embedding_service() is first
+    finally:
+        embedding_batcher.reset_embedding_batcher()
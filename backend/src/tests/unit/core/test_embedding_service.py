@@ -25,6 +25,7 @@ from shu.core.embedding_service import (
     get_embedding_service,
     get_embedding_service_stats,
     reset_embedding_service,
+    shared_query_embeddings,
 )
 from shu.core.external_model_resolver import ResolvedExternalModel
 
@@ -264,6 +265,51 @@ class TestDIWiring:
         assert mod._embedding_service is None
 
 
+class TestSharedQueryEmbeddings:
+    """get_embedding_service() inside shared_query_embeddings() embeds each query once."""
+
+    def setup_method(self):
+        reset_embedding_service()
+
+    def teardown_method(self):
+        reset_embedding_service()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_embedding(self):
+        import asyncio
+
+        import shu.core.embedding_service as mod
+
+        base = _make_mock_service()
+        base.embed_query = AsyncMock(return_value=[0.1, 0.2])
+        mod._embedding_service = base
+
+        with shared_query_embeddings():
+            service = await get_embedding_service()
+            results = await asyncio.gather(*(service.embed_query("same query") for _ in range(5)))
+            await service.embed_query("other query")
+
+        assert results == [[0.1, 0.2]] * 5
+        assert base.embed_query.await_count == 2
+        assert service.model_name == base.model_name
+
+    @pytest.mark.asyncio
+    async def test_outside_scope_returns_singleton_and_failures_are_not_shared(self):
+        import shu.core.embedding_service as mod
+
+        base = _make_mock_service()
+        base.embed_query = AsyncMock(side_effect=[RuntimeError("boom"), [0.3]])
+        mod._embedding_service = base
+
+        assert await get_embedding_service() is base
+
+        with shared_query_embeddings():
+            service = await get_embedding_service()
+            with pytest.raises(RuntimeError):
+                await service.embed_query("q")
+            assert await service.embed_query("q") == [0.3]
+
+
 # ---------------------------------------------------------------------------
 # Service resolution (local vs external)
 # ---------------------------------------------------------------------------
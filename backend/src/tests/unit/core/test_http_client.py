@@ -0,0 +1,115 @@
+"""Unit tests for the process-wide provider client pool."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from shu.core.http_client import ProviderClientPool
+
+_TIMEOUT = httpx.Timeout(5.0)
+
+
+@pytest.mark.asyncio
+async def test_same_provider_and_credentials_share_a_client():
+    pool = ProviderClientPool()
+    first = pool.get_client("https://api.example.com/v1", {"Authorization": "Bearer a"}, _TIMEOUT)
+    second = pool.get_client("https://api.example.com/v1", {"Authorization": "Bearer a"}, _TIMEOUT)
+
+    assert first is second
+    assert pool.stats()[0]["borrows"] == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_different_credentials_get_separate_clients():
+    pool = ProviderClientPool()
+    first = pool.get_client("https://api.example.com/v1", {"Authorization": "Bearer a"}, _TIMEOUT)
+    second = pool.get_client("https://api.example.com/v1", {"Authorization": "Bearer b"}, _TIMEOUT)
+
+    assert first is not second
+    assert len(pool.stats()) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_closed_client_is_replaced():
+    pool = ProviderClientPool()
+    first = pool.get_client("https://api.example.com/v1", {}, _TIMEOUT)
+    await first.aclose()
+
+    second = pool.get_client("https://api.example.com/v1", {}, _TIMEOUT)
+
+    assert second is not first
+    assert not second.is_closed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_close_closes_every_client():
+    pool = ProviderClientPool()
+    client = pool.get_client("https://api.example.com/v1", {}, _TIMEOUT)
+
+    await pool.close()
+
+    assert client.is_closed
+    assert pool.stats() == []
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_when_h2_is_missing(monkeypatch):
+    pool = ProviderClientPool()
+    monkeypatch.setattr(pool._settings, "llm_http2_enabled", True)
+    monkeypatch.setattr("shu.core.http_client.importlib.util.find_spec", lambda name: None)
+
+    pool.get_client("https://api.example.com/v1", {}, _TIMEOUT)
+
+    assert pool.stats()[0]["http2"] is False
+    await pool.close()
+
+
+def test_loop_change_closes_clients_from_a_finished_loop():
+    pool = ProviderClientPool()
+
+    async def borrow() -> httpx.AsyncClient:
+        return pool.get_client("https://api.example.com/v1", {}, _TIMEOUT)
+
+    stale = asyncio.run(borrow())
+
+    async def borrow_again() -> httpx.AsyncClient:
+        client = await borrow()
+        await asyncio.gather(*pool._closing)
+        return client
+
+    fresh = asyncio.run(borrow_again())
+
+    assert stale.is_closed
+    assert fresh is not stale
+    asyncio.run(pool.close())
+
+
+def test_loop_change_closes_clients_on_a_loop_still_running():
+    pool = ProviderClientPool()
+    old_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+
+        async def borrow() -> httpx.AsyncClient:
+            return pool.get_client("https://api.example.com/v1", {}, _TIMEOUT)
+
+        stale = asyncio.run_coroutine_threadsafe(borrow(), old_loop).result(timeout=5)
+        asyncio.run(borrow())
+
+        # The close is handed to the old loop's thread.
+        deadline = time.monotonic() + 5
+        while not stale.is_closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stale.is_closed
+    finally:
+        old_loop.call_soon_threadsafe(old_loop.stop)
+        thread.join(timeout=5)
+        old_loop.close()
+    asyncio.run(pool.close())
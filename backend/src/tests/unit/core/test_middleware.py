@@ -53,7 +53,7 @@ async def _ok_handler(request: Request) -> Response:
 @pytest.fixture
 def middleware() -> MustChangePasswordMiddleware:
     """Create a MustChangePasswordMiddleware instance."""
-    # BaseHTTPMiddleware requires an app; we pass a no-op since we call
+    # The middleware wraps an ASGI app; we pass a no-op since we call
     # dispatch() directly with our own call_next.
     return MustChangePasswordMiddleware(app=AsyncMock())
 
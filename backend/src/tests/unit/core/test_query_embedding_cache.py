@@ -0,0 +1,99 @@
+"""Unit tests for the two-tier query-embedding cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shu.core import query_embedding_cache
+from shu.core.cache_backend import InMemoryCacheBackend
+from shu.core.query_embedding_cache import (
+    cached_query_embedding,
+    clear_query_embedding_cache,
+    pack_vector,
+    query_embedding_cache_stats,
+    unpack_vector,
+)
+from shu.core.tenant import tenant_context
+
+
+@pytest.fixture
+def shared():
+    backend = InMemoryCacheBackend(cleanup_interval_seconds=0)
+    settings = SimpleNamespace(
+        query_embedding_cache_enabled=True, query_embedding_cache_size=2, query_embedding_cache_ttl=60
+    )
+    clear_query_embedding_cache()
+    with (
+        patch.object(query_embedding_cache, "get_settings_instance", return_value=settings),
+        patch.object(query_embedding_cache, "get_cache_backend", AsyncMock(return_value=backend)),
+    ):
+        yield backend
+    clear_query_embedding_cache()
+
+
+def _embedder(vector=(0.5, -1.25, 2.0)):
+    return AsyncMock(return_value=list(vector))
+
+
+class TestQueryEmbeddingCache:
+    def test_pack_round_trips_float32(self) -> None:
+        assert unpack_vector(pack_vector([0.5, -1.25, 3.0])) == [0.5, -1.25, 3.0]
+        assert len(pack_vector([0.0] * 8)) == 32
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_hits_local_tier(self, shared) -> None:
+        embed = _embedder()
+
+        first = await cached_query_embedding("m", "what is shu", lambda: embed())
+        second = await cached_query_embedding("m", "  what   is shu ", lambda: embed())
+
+        assert first == second == [0.5, -1.25, 2.0]
+        embed.assert_awaited_once()
+        assert query_embedding_cache_stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_process_reuses_shared_tier(self, shared) -> None:
+        await cached_query_embedding("m", "q", _embedder())
+        clear_query_embedding_cache()  # a fresh worker: empty local tier
+        embed = _embedder()
+
+        assert await cached_query_embedding("m", "q", embed) == [0.5, -1.25, 2.0]
+        embed.assert_not_awaited()
+        assert query_embedding_cache_stats()["shared_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_model_and_tenant_are_part_of_the_key(self, shared) -> None:
+        embed = _embedder()
+
+        await cached_query_embedding("m", "q", embed)
+        await cached_query_embedding("other-model", "q", embed)
+        token = tenant_context.set("another-tenant")
+        try:
+            await cached_query_embedding("m", "q", embed)
+        finally:
+            tenant_context.reset(token)
+
+        assert embed.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_local_tier_is_bounded_lru(self, shared) -> None:
+        with patch.object(query_embedding_cache, "get_cache_backend", AsyncMock(side_effect=ConnectionError)):
+            for text in ("a", "b", "c"):
+                await cached_query_embedding("m", text, _embedder())
+            embed = _embedder()
+            await cached_query_embedding("m", "a", embed)
+
+        assert query_embedding_cache_stats()["local_entries"] == 2
+        embed.assert_awaited_once()  # "a" was evicted and the shared tier is down
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_embeds(self) -> None:
+        embed = _embedder()
+        settings = MagicMock(query_embedding_cache_enabled=False)
+
+        with patch.object(query_embedding_cache, "get_settings_instance", return_value=settings):
+            await cached_query_embedding("m", "q", embed)
+            await cached_query_embedding("m", "q", embed)
+
+        assert embed.await_count == 2
@@ -8,6 +8,7 @@ Feature: queue-backend-interface
 """
 
 import asyncio
+import json
 import logging
 import time
 from datetime import UTC, datetime
@@ -102,8 +103,11 @@ class MockRedisClientForQueue:
             return None
         return self._lists[key].pop()
 
-    async def brpop(self, key: str, timeout: int = 0) -> tuple | None:
-        """Blocking pop from the right of a list."""
+    async def brpop(self, key: str | list[str], timeout: float = 0) -> tuple | None:
+        """Blocking pop from the right of a list (or the first non-empty of several)."""
+        if isinstance(key, list):
+            return await self._brpop_any(key, timeout)
+
         # Try immediate pop first
         if self._lists.get(key):
             value = self._lists[key].pop()
@@ -134,6 +138,15 @@ class MockRedisClientForQueue:
 
         return None
 
+    async def _brpop_any(self, keys: list[str], timeout: float) -> tuple | None:
+        deadline = time.time() + (timeout or 30)
+        while time.time() < deadline:
+            for key in keys:
+                if self._lists.get(key):
+                    return (key, self._lists[key].pop())
+            await asyncio.sleep(0.01)
+        return None
+
     async def lrange(self, key: str, start: int, end: int) -> list:
         """Get a range of elements from a list."""
         if key not in self._lists:
@@ -228,6 +241,96 @@ class MockRedisClientForQueue:
                 deleted += 1
         return deleted
 
+    async def blmove(self, source: str, destination: str, timeout: float, src: str, dest: str) -> str | None:
+        """Blocking move between lists; only the same-list tail rotation is supported."""
+        assert (source, src, dest) == (destination, "RIGHT", "RIGHT")
+        result = await self.brpop(source, timeout=timeout)
+        if result is None:
+            return None
+        self._lists.setdefault(source, []).append(result[1])
+        return result[1]
+
+    # Server-side scripts, emulated in Python
+    def register_script(self, source: str) -> "MockScript":
+        """Register one of the backend's Lua scripts."""
+        impl = {
+            queue_backend_module._ENQUEUE_SCRIPT: self._enqueue_script,
+            queue_backend_module._ENQUEUE_MANY_SCRIPT: self._enqueue_many_script,
+            queue_backend_module._DEQUEUE_SCRIPT: self._dequeue_script,
+            queue_backend_module._SWEEP_SCRIPT: self._sweep_script,
+        }[source]
+        return MockScript(impl)
+
+    async def _enqueue_script(self, keys: list[str], args: list) -> int:
+        queue_key, ready_key = keys
+        job_json, cap = args[0], int(args[1])
+        await self.lpush(queue_key, job_json)
+        await self.lpush(ready_key, "1")
+        del self._lists[ready_key][cap:]
+        return 1
+
+    async def _enqueue_many_script(self, keys: list[str], args: list) -> int:
+        queue_key, ready_key = keys
+        cap, payloads = int(args[0]), args[1:]
+        for job_json in payloads:
+            await self.lpush(queue_key, job_json)
+        for _ in range(min(len(payloads), cap)):
+            await self.lpush(ready_key, "1")
+        if ready_key in self._lists:
+            del self._lists[ready_key][cap:]
+        return len(payloads)
+
+    async def _dequeue_script(self, keys: list[str], args: list) -> list | None:
+        queue_key, processing_key = keys
+        now, job_prefix = float(args[0]), args[1]
+        raw = await self.rpop(queue_key)
+        if raw is None:
+            return None
+        try:
+            obj = json.loads(raw)
+            assert isinstance(obj, dict) and isinstance(obj["id"], str)
+        except (ValueError, AssertionError, KeyError):
+            return [0, raw]
+        obj["attempts"] = obj.get("attempts", 0) + 1
+        job_json = json.dumps(obj)
+        visibility = obj.get("visibility_timeout", 300)
+        await self.zadd(processing_key, {obj["id"]: now + visibility})
+        await self.set(job_prefix + obj["id"], job_json, ex=visibility + 60)
+        return [1, job_json]
+
+    async def _sweep_script(self, keys: list[str], args: list) -> list[int]:
+        queue_key, processing_key, scheduled_key, ready_key = keys
+        now, job_prefix, limit, cap = float(args[0]), args[1], int(args[2]), int(args[3])
+        restored = 0
+        for job_id in (await self.zrangebyscore(processing_key, "-inf", now))[:limit]:
+            job_json = await self.get(job_prefix + job_id)
+            if job_json:
+                await self.rpush(queue_key, job_json)
+                restored += 1
+            await self.zrem(processing_key, job_id)
+            await self.delete(job_prefix + job_id)
+        ready = (await self.zrangebyscore(scheduled_key, "-inf", now))[:limit]
+        for job_json in ready:
+            await self.lpush(queue_key, job_json)
+            await self.zrem(scheduled_key, job_json)
+        for _ in range(min(restored + len(ready), cap)):
+            await self.lpush(ready_key, "1")
+        if ready_key in self._lists:
+            del self._lists[ready_key][cap:]
+        return [restored, len(ready)]
+
+
+class MockScript:
+    """Callable returned by ``MockRedisClientForQueue.register_script``."""
+
+    def __init__(self, impl):
+        self._impl = impl
+        self.calls = 0
+
+    async def __call__(self, keys: list[str], args: list) -> Any:
+        self.calls += 1
+        return await self._impl(keys, args)
+
 
 # =============================================================================
 # Hypothesis Strategies for Job Generation
@@ -1473,6 +1576,181 @@ class TestRedisQueueBackendSpecific:
             await redis_queue_backend.schedule(job, delay_seconds=-1)
 
 
+class TestRedisAtomicDequeue:
+    """Dequeue is one atomic script call; restore/promotion runs as a rate-limited sweep."""
+
+    @pytest.mark.asyncio
+    async def test_dequeue_registers_job_in_one_script_call(self):
+        client = MockRedisClientForQueue()
+        backend = RedisQueueBackend(client, sweep_interval_seconds=60)
+        job = Job(queue_name="q", payload={"items": []}, visibility_timeout=30)
+        await backend.enqueue(job)
+
+        dequeued = await backend.dequeue("q")
+
+        assert dequeued.id == job.id
+        assert dequeued.attempts == 1
+        assert dequeued.payload == {"items": []}
+        assert backend._scripts[queue_backend_module._DEQUEUE_SCRIPT].calls == 1
+        assert job.id in client._zsets[backend._processing_key("q")]
+        assert Job.from_json(await client.get(backend._job_key("q", job.id))).attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_is_rate_limited_per_queue(self):
+        client = MockRedisClientForQueue()
+        backend = RedisQueueBackend(client, sweep_interval_seconds=60)
+        await backend.enqueue(Job(queue_name="q", payload={}))
+        dequeued = await backend.dequeue("q")
+        await client.zadd(backend._processing_key("q"), {dequeued.id: time.time() - 1})
+
+        # Within the interval the expired job is not restored yet.
+        assert await backend.dequeue("q") is None
+        assert backend._scripts[queue_backend_module._SWEEP_SCRIPT].calls == 1
+
+        backend._last_sweep["q"] -= 60
+        redelivered = await backend.dequeue("q")
+        assert redelivered.id == dequeued.id
+        assert redelivered.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_payload_is_dropped(self):
+        client = MockRedisClientForQueue()
+        backend = RedisQueueBackend(client)
+        await client.lpush(backend._queue_key("q"), "not json")
+
+        assert await backend.dequeue("q") is None
+        assert await client.llen(backend._queue_key("q")) == 0
+
+    @pytest.mark.asyncio
+    async def test_blocking_dequeue_wakes_on_enqueue(self):
+        backend = RedisQueueBackend(MockRedisClientForQueue())
+        job = Job(queue_name="q", payload={})
+
+        async def enqueue_later() -> None:
+            await asyncio.sleep(0.05)
+            await backend.enqueue(job)
+
+        enqueue_task = asyncio.create_task(enqueue_later())
+        dequeued = await backend.dequeue("q", timeout_seconds=2)
+        await enqueue_task
+
+        assert dequeued is not None
+        assert dequeued.id == job.id
+        assert await backend.pending_count("q") == 0
+
+    @pytest.mark.asyncio
+    async def test_blocking_dequeue_times_out(self):
+        backend = RedisQueueBackend(MockRedisClientForQueue())
+        assert await backend.dequeue("q", timeout_seconds=1) is None
+
+
+@pytest.fixture
+def fake_redis_client():
+    """An in-process Redis that runs the backend's Lua scripts for real."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+class TestRedisDequeueScript:
+    """_DEQUEUE_SCRIPT itself, run by a Lua interpreter rather than MockScript."""
+
+    @pytest.mark.asyncio
+    async def test_only_the_top_level_attempts_is_bumped(self, fake_redis_client):
+        backend = RedisQueueBackend(fake_redis_client)
+        payload = {"attempts": 5, "note": '"attempts": 7', "nested": {"attempts": 9}}
+        job = Job(queue_name="q", payload=payload, attempts=2, visibility_timeout=30)
+        await backend.enqueue(job)
+
+        dequeued = await backend.dequeue("q")
+
+        assert dequeued.id == job.id
+        assert dequeued.attempts == 3
+        assert dequeued.payload == payload
+        stored = Job.from_json(await fake_redis_client.get(backend._job_key("q", job.id)))
+        assert stored.attempts == 3
+        assert stored.payload == payload
+        assert await fake_redis_client.zscore(backend._processing_key("q"), job.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_malformed_payload_is_dropped(self, fake_redis_client):
+        backend = RedisQueueBackend(fake_redis_client)
+        await fake_redis_client.lpush(backend._queue_key("q"), '["no", "id"]')
+
+        assert await backend.dequeue("q") is None
+        assert await fake_redis_client.llen(backend._queue_key("q")) == 0
+
+
+class TestEnqueueMany:
+    """Batch enqueue preserves per-queue FIFO order and costs one call per queue."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_dequeue_in_order_across_queues(self, queue_backend: QueueBackend):
+        jobs = [Job(queue_name="a" if i % 2 else "b", payload={"i": i}) for i in range(6)]
+
+        assert await queue_backend.enqueue_many(jobs) == 6
+
+        for name in ("a", "b"):
+            expected = [j.payload["i"] for j in jobs if j.queue_name == name]
+            got = [(await queue_backend.dequeue(name)).payload["i"] for _ in expected]
+            assert got == expected
+            assert await queue_backend.dequeue(name) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_uses_one_script_call_per_queue(self):
+        client = MockRedisClientForQueue()
+        backend = RedisQueueBackend(client)
+
+        await backend.enqueue_many([Job(queue_name="q", payload={"i": i}) for i in range(100)])
+
+        assert backend._scripts[queue_backend_module._ENQUEUE_MANY_SCRIPT].calls == 1
+        assert len(client._lists[backend._queue_key("q")]) == 100
+        assert len(client._lists[backend._ready_key("q")]) == RedisQueueBackend._READY_TOKEN_CAP
+
+    @pytest.mark.asyncio
+    async def test_serialization_failure_enqueues_nothing(self, queue_backend: QueueBackend):
+        jobs = [Job(queue_name="q", payload={"ok": 1}), Job(queue_name="q", payload={"bad": object()})]
+
+        with pytest.raises(QueueOperationError):
+            await queue_backend.enqueue_many(jobs)
+
+        assert await queue_backend.pending_count("q") == 0
+
+
+class TestWaitForJobs:
+    """wait_for_jobs blocks across several queues without claiming a job."""
+
+    @pytest.mark.asyncio
+    async def test_wakes_on_enqueue_to_any_queue(self, queue_backend: QueueBackend):
+        job = Job(queue_name="b", payload={})
+
+        async def enqueue_later() -> None:
+            await asyncio.sleep(0.05)
+            await queue_backend.enqueue(job)
+
+        enqueue_task = asyncio.create_task(enqueue_later())
+        assert await queue_backend.wait_for_jobs(["a", "b"], 2.0) is True
+        await enqueue_task
+
+        # The job was not claimed by the wait.
+        dequeued = await queue_backend.dequeue("b")
+        assert dequeued is not None
+        assert dequeued.id == job.id
+
+    @pytest.mark.asyncio
+    async def test_times_out_when_queues_stay_empty(self, queue_backend: QueueBackend):
+        assert await queue_backend.wait_for_jobs(["a", "b"], 0.1) is False
+
+    @pytest.mark.asyncio
+    async def test_redis_wake_up_tokens_are_capped(self):
+        client = MockRedisClientForQueue()
+        backend = RedisQueueBackend(client)
+        for _ in range(backend._READY_TOKEN_CAP + 10):
+            await backend.enqueue(Job(queue_name="q", payload={}))
+
+        assert await client.llen(backend._ready_key("q")) == backend._READY_TOKEN_CAP
+
+
 # =============================================================================
 # Property 4: Factory Returns Singleton
 # =============================================================================
@@ -2233,6 +2511,8 @@ def _factory_settings(
         redis_enabled=bool(redis_url),
         tenant_id=tenant_id,
         deployment_mode=deployment_mode,
+        queue_sweep_interval_seconds=1.0,
+        queue_redis_structure="lists",
     )
 
 
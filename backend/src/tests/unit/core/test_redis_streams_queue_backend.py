@@ -0,0 +1,429 @@
+"""Unit tests for RedisStreamsQueueBackend.
+
+Runs against an in-process emulation of the Redis stream, list and sorted-set
+commands the backend uses, with the backend's Lua scripts re-implemented in
+Python the same way test_queue_backend.py does for RedisQueueBackend. The
+reclaim script is also run as-is on fakeredis, where its Lua can execute.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from shu.core import queue_backend as queue_backend_module
+from shu.core.queue_backend import (
+    Job,
+    QueueBackend,
+    QueueOperationError,
+    RedisStreamsQueueBackend,
+    get_queue_backend,
+    reset_queue_backend,
+)
+
+
+def _seq(entry_id: str) -> int:
+    return int(entry_id.split("-")[0])
+
+
+class MockRedisStreamsClient:
+    """Emulates the stream, list and sorted-set commands of an async Redis client.
+
+    Idle times come from ``now_ms``, which tests advance explicitly.
+    """
+
+    def __init__(self) -> None:
+        self.now_ms = 0
+        self._next_seq = 1
+        # stream key -> list of (entry id, fields), oldest first
+        self.streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
+        # stream key -> {"last": seq, "pel": {entry id: [consumer, delivered at ms]}}
+        self.groups: dict[str, dict[str, Any]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    # Streams
+    async def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False) -> bool:
+        if name in self.groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        self.streams.setdefault(name, [])
+        self.groups[name] = {"name": groupname, "last": _seq(id), "pel": {}}
+        return True
+
+    def _xadd(self, name: str, job_json: str) -> str:
+        entry_id = f"{self._next_seq}-0"
+        self._next_seq += 1
+        self.streams.setdefault(name, []).append((entry_id, {"job": job_json}))
+        return entry_id
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None) -> list:
+        ((name, cursor),) = streams.items()
+        assert cursor == ">"
+        deadline = time.monotonic() + (5 if block == 0 else (block or 0) / 1000)
+        while True:
+            if name not in self.groups:
+                raise Exception("NOGROUP No such key or consumer group")
+            group = self.groups[name]
+            fresh = [e for e in self.streams.get(name, []) if _seq(e[0]) > group["last"]][: count or None]
+            if fresh:
+                for entry_id, _ in fresh:
+                    group["pel"][entry_id] = [consumername, self.now_ms]
+                group["last"] = _seq(fresh[-1][0])
+                return [[name, fresh]]
+            if block is None or time.monotonic() >= deadline:
+                return []
+            await asyncio.sleep(0.01)
+
+    async def xpending(self, name: str, groupname: str) -> dict:
+        return {"pending": len(self.groups[name]["pel"])}
+
+    async def xlen(self, name: str) -> int:
+        return len(self.streams.get(name, []))
+
+    async def xinfo_groups(self, name: str) -> list[dict]:
+        group = self.groups[name]
+        return [{"name": group["name"], "last-delivered-id": f"{group['last']}-0"}]
+
+    async def xrange(self, name: str, min: str = "-", max: str = "+", count: int | None = None) -> list:
+        assert min.startswith("(") and max == "+"
+        after = _seq(min[1:])
+        return [e for e in self.streams.get(name, []) if _seq(e[0]) > after][: count or None]
+
+    # Lists and sorted sets
+    async def brpop(self, keys: list[str], timeout: float = 0) -> tuple | None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for key in keys:
+                if self.lists.get(key):
+                    return key, self.lists[key].pop()
+            await asyncio.sleep(0.01)
+        return None
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    # Server-side scripts, emulated in Python
+    def register_script(self, source: str) -> Any:
+        impl = {
+            queue_backend_module._STREAM_ENQUEUE_SCRIPT: self._enqueue_script,
+            queue_backend_module._STREAM_SETTLE_SCRIPT: self._settle_script,
+            queue_backend_module._STREAM_PROMOTE_SCRIPT: self._promote_script,
+            queue_backend_module._STREAM_RECLAIM_SCRIPT: self._reclaim_script,
+            queue_backend_module._STREAM_EXTEND_SCRIPT: self._extend_script,
+        }[source]
+
+        async def call(keys: list[str], args: list) -> Any:
+            return impl(keys, args)
+
+        return call
+
+    def _wake(self, key: str, n: int, cap: int) -> None:
+        tokens = self.lists.setdefault(key, [])
+        tokens[:0] = ["1"] * min(n, cap)
+        del tokens[cap:]
+
+    def _enqueue_script(self, keys: list[str], args: list) -> int:
+        stream_key, ready_key = keys
+        for job_json in args[1:]:
+            self._xadd(stream_key, job_json)
+        self._wake(ready_key, len(args) - 1, int(args[0]))
+        return len(args) - 1
+
+    def _settle_script(self, keys: list[str], args: list) -> list[int]:
+        stream_key, ready_key = keys
+        pel = self.groups[stream_key]["pel"]
+        acked = requeued = 0
+        for entry_id, job_json in zip(args[2::2], args[3::2], strict=True):
+            if pel.pop(entry_id, None) is not None:
+                acked += 1
+                if job_json:
+                    self._xadd(stream_key, job_json)
+                    requeued += 1
+            self.streams[stream_key] = [e for e in self.streams[stream_key] if e[0] != entry_id]
+        self._wake(ready_key, requeued, int(args[1]))
+        return [acked, requeued]
+
+    def _promote_script(self, keys: list[str], args: list) -> int:
+        scheduled_key, stream_key, ready_key = keys
+        scheduled = self.zsets.get(scheduled_key, {})
+        due = [job_json for job_json, score in scheduled.items() if score <= float(args[0])][: int(args[1])]
+        for job_json in due:
+            self._xadd(stream_key, job_json)
+            del scheduled[job_json]
+        self._wake(ready_key, len(due), int(args[2]))
+        return len(due)
+
+    def _reclaim_script(self, keys: list[str], args: list) -> list:
+        _, consumer, floor, cursor, count = args
+        pel = self.groups[keys[0]]["pel"]
+        entries = dict(self.streams.get(keys[0], []))
+        after = -1 if cursor == "-" else _seq(cursor.lstrip("("))  # the backend only resumes exclusively
+        candidates = [
+            entry_id
+            for entry_id in sorted(pel, key=_seq)
+            if _seq(entry_id) > after and self.now_ms - pel[entry_id][1] >= floor
+        ][:count]
+        claimed = []
+        for entry_id in candidates:
+            job_json = (entries.get(entry_id) or {}).get("job", "")
+            threshold = floor
+            try:
+                threshold = max(floor, json.loads(job_json)["visibility_timeout"] * 1000)
+            except (ValueError, KeyError, TypeError):
+                pass
+            if self.now_ms - pel[entry_id][1] >= threshold:
+                pel[entry_id] = [consumer, self.now_ms]
+                claimed += [entry_id, job_json]
+        return ["-" if len(candidates) < count else f"({candidates[-1]}", claimed]
+
+    def _extend_script(self, keys: list[str], args: list) -> int:
+        _, consumer, entry_id, threshold, extra = args
+        pending = self.groups[keys[0]]["pel"].get(entry_id)
+        if pending is None or pending[0] != consumer:
+            return 0
+        remaining = max(threshold - (self.now_ms - pending[1]), 0) + extra
+        pending[1] = self.now_ms - max(threshold - remaining, 0)
+        return 1
+
+
+@pytest.fixture
+def client() -> MockRedisStreamsClient:
+    return MockRedisStreamsClient()
+
+
+def _backend(client: MockRedisStreamsClient, consumer: str = "worker-1") -> RedisStreamsQueueBackend:
+    return RedisStreamsQueueBackend(client, claim_idle_seconds=60, consumer_name=consumer)
+
+
+class TestRedisStreamsQueueBackend:
+    def test_implements_protocol(self, client) -> None:
+        assert isinstance(_backend(client), QueueBackend)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_dequeue_acknowledge(self, client) -> None:
+        backend = _backend(client)
+        job = Job(queue_name="q", payload={"key": "value"})
+        await backend.enqueue(job)
+        assert (await backend.pending_count("q"), await backend.active_count("q")) == (1, 0)
+
+        dequeued = await backend.dequeue("q")
+        assert dequeued.id == job.id
+        assert dequeued.payload == {"key": "value"}
+        assert dequeued.attempts == 1
+        assert (await backend.pending_count("q"), await backend.active_count("q")) == (0, 1)
+
+        assert await backend.acknowledge(dequeued) is True
+        assert await backend.acknowledge(dequeued) is False
+        assert await backend.total_count("q") == 0
+        assert await backend.dequeue("q") is None
+
+    @pytest.mark.asyncio
+    async def test_reject_requeues_until_max_attempts(self, client) -> None:
+        backend = _backend(client)
+        await backend.enqueue(Job(queue_name="q", payload={}, max_attempts=2))
+
+        first = await backend.dequeue("q")
+        assert await backend.reject(first) is True
+        second = await backend.dequeue("q")
+        assert second.attempts == 2
+        assert await backend.reject(second) is True
+
+        assert await backend.dequeue("q") is None
+        assert await backend.total_count("q") == 0
+
+    @pytest.mark.asyncio
+    async def test_abandoned_delivery_is_reclaimed_with_attempt_counted(self, client) -> None:
+        dead = _backend(client, "dead-worker")
+        live = _backend(client, "live-worker")
+        await dead.enqueue(Job(queue_name="q", payload={}, visibility_timeout=60))
+        lost = await dead.dequeue("q")
+
+        client.now_ms += 59_000
+        assert await live.dequeue("q") is None  # not idle long enough yet
+
+        client.now_ms += 1_000
+        reclaimed = await live.dequeue("q")
+        assert reclaimed.id == lost.id
+        assert reclaimed.attempts == 2
+        # The original worker's late acknowledgement no longer counts.
+        assert await dead.acknowledge(lost) is False
+        assert await live.acknowledge(reclaimed) is True
+        assert await live.total_count("q") == 0
+
+    @pytest.mark.asyncio
+    async def test_extend_visibility_defers_reclaim(self, client) -> None:
+        worker = _backend(client, "worker")
+        other = _backend(client, "other")
+        await worker.enqueue(Job(queue_name="q", payload={}, visibility_timeout=60))
+        job = await worker.dequeue("q")
+
+        client.now_ms += 50_000
+        assert await worker.extend_visibility(job, additional_seconds=30) is True
+        client.now_ms += 30_000
+        assert await other.dequeue("q") is None
+
+        client.now_ms += 10_000
+        assert (await other.dequeue("q")).id == job.id
+        assert await worker.extend_visibility(job, additional_seconds=30) is False
+
+    @pytest.mark.asyncio
+    async def test_long_visibility_timeout_outlasts_claim_threshold(self, client) -> None:
+        worker = _backend(client, "worker")
+        other = _backend(client, "other")
+        await worker.enqueue(Job(queue_name="q", payload={}, visibility_timeout=3600))
+        job = await worker.dequeue("q")
+
+        client.now_ms += 61_000
+        assert await other.dequeue("q") is None  # past the claim threshold, inside the job's timeout
+
+        client.now_ms += 3_500_000 - 61_000
+        assert await worker.extend_visibility(job, additional_seconds=120) is True
+        client.now_ms += 200_000
+        assert await other.dequeue("q") is None
+
+        client.now_ms += 20_000
+        assert (await other.dequeue("q")).id == job.id
+
+    @pytest.mark.asyncio
+    async def test_scheduled_job_promoted_when_due(self, client) -> None:
+        backend = _backend(client)
+        job = Job(queue_name="q", payload={})
+        await backend.schedule(job, delay_seconds=30)
+        assert await backend.dequeue("q") is None
+
+        scheduled = client.zsets[backend._scheduled_key("q")]
+        scheduled[job.to_json()] = time.time() - 1
+        assert (await backend.dequeue("q")).id == job.id
+
+    @pytest.mark.asyncio
+    async def test_malformed_entry_is_dropped(self, client) -> None:
+        backend = _backend(client)
+        await backend._ensure_group("q")
+        client._xadd(backend._stream_key("q"), "not json")
+
+        assert await backend.dequeue("q") is None
+        assert await backend.total_count("q") == 0
+
+    @pytest.mark.asyncio
+    async def test_peek_lists_only_undelivered_jobs(self, client) -> None:
+        backend = _backend(client)
+        jobs = [Job(queue_name="q", payload={"n": n}) for n in range(3)]
+        await backend.enqueue_many(jobs)
+        await backend.dequeue("q")
+
+        assert [job.id for job in await backend.peek("q")] == [jobs[1].id, jobs[2].id]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_rejects_unserializable_batch(self, client) -> None:
+        backend = _backend(client)
+        with pytest.raises(QueueOperationError):
+            await backend.enqueue_many([Job(queue_name="q", payload={}), Job(queue_name="q", payload={"x": object()})])
+        assert client.streams == {}
+
+    @pytest.mark.asyncio
+    async def test_blocking_dequeue_and_wait_for_jobs(self, client) -> None:
+        backend = _backend(client)
+        job = Job(queue_name="q", payload={})
+
+        async def enqueue_later() -> None:
+            await asyncio.sleep(0.05)
+            await backend.enqueue(job)
+
+        task = asyncio.create_task(enqueue_later())
+        assert await backend.wait_for_jobs(["other", "q"], 2.0) is True
+        await task
+        assert (await backend.dequeue("q", timeout_seconds=1)).id == job.id
+        assert await backend.dequeue("q", timeout_seconds=0.05) is None
+
+
+@pytest.fixture
+def fake_redis_client():
+    """An in-process Redis that runs the backend's Lua scripts for real."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+class TestStreamReclaimScript:
+    """_STREAM_RECLAIM_SCRIPT itself, run by a Lua interpreter rather than the Python emulation above."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_pending_entries(self, fake_redis_client) -> None:
+        redis = fake_redis_client
+        reclaim = redis.register_script(queue_backend_module._STREAM_RECLAIM_SCRIPT)
+        await redis.xgroup_create("s", "g", id="0", mkstream=True)
+        short, deleted, malformed, long = [
+            await redis.xadd("s", {"job": job_json})
+            for job_json in (
+                json.dumps({"visibility_timeout": 0}),
+                json.dumps({"visibility_timeout": 0}),
+                "not json",
+                json.dumps({"visibility_timeout": 3600}),
+            )
+        ]
+        await redis.xreadgroup("g", "dead", {"s": ">"})
+        await redis.xdel("s", deleted)
+        await asyncio.sleep(0.05)
+        fresh = await redis.xadd("s", {"job": "{}"})
+        await redis.xreadgroup("g", "dead", {"s": ">"})
+
+        # A full page resumes exclusively after its last entry; a deleted
+        # entry is claimed with '' as its JSON (and dropped by XCLAIM).
+        cursor, claimed = await reclaim(keys=["s"], args=["g", "live", 20, "-", 2])
+        assert cursor == f"({deleted}"
+        assert claimed == [short, json.dumps({"visibility_timeout": 0}), deleted, ""]
+
+        # Unparseable jobs use the floor; a job's own longer timeout keeps it
+        # with its worker. The fresh delivery is not idle long enough to be
+        # scanned at all, so this page is short and the scan wraps around.
+        cursor, claimed = await reclaim(keys=["s"], args=["g", "live", 20, cursor, 3])
+        assert cursor == "-"
+        assert claimed == [malformed, "not json"]
+
+        owners = {p["message_id"]: p["consumer"] for p in await redis.xpending_range("s", "g", "-", "+", 10)}
+        assert owners == {short: "live", malformed: "live", long: "dead", fresh: "dead"}
+
+    @pytest.mark.asyncio
+    async def test_backend_reclaims_abandoned_delivery(self, fake_redis_client) -> None:
+        dead = RedisStreamsQueueBackend(fake_redis_client, claim_idle_seconds=0, consumer_name="dead")
+        live = RedisStreamsQueueBackend(fake_redis_client, claim_idle_seconds=0, consumer_name="live")
+        await dead.enqueue(Job(queue_name="q", payload={"items": []}, visibility_timeout=0))
+        lost = await dead.dequeue("q")
+        await asyncio.sleep(0.01)
+
+        reclaimed = await live.dequeue("q")
+        assert reclaimed.id == lost.id
+        assert reclaimed.attempts == 2
+        assert await dead.acknowledge(lost) is False
+        assert await live.acknowledge(reclaimed) is True
+
+
+class TestStreamsBackendSelection:
+    @pytest.mark.asyncio
+    async def test_factory_returns_streams_backend_when_configured(self, client) -> None:
+        settings = SimpleNamespace(
+            redis_enabled=True,
+            queue_redis_structure="streams",
+            queue_sweep_interval_seconds=1.0,
+            queue_stream_claim_idle_seconds=120,
+        )
+
+        async def shared_client() -> MockRedisStreamsClient:
+            return client
+
+        reset_queue_backend()
+        try:
+            with (
+                patch("shu.core.config.get_settings_instance", return_value=settings),
+                patch.object(queue_backend_module, "_get_shared_redis_client", shared_client),
+            ):
+                backend = await get_queue_backend()
+            assert isinstance(backend, RedisStreamsQueueBackend)
+            assert backend._claim_idle_ms == 120_000
+        finally:
+            reset_queue_backend()
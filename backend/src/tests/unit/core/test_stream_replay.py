@@ -0,0 +1,191 @@
+"""Tests for shu.core.stream_replay.
+
+Covers the pump/tail pair (sequence ids, resume after ``Last-Event-ID``,
+producer outliving a dropped reader, always-terminated logs), the
+cross-node stop flag, and the Redis Streams implementation against a
+minimal in-process Redis stand-in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from shu.core import stream_replay
+from shu.core.stream_replay import (
+    InMemoryStreamReplayLog,
+    RedisStreamReplayLog,
+    StreamReplayLog,
+    start_replay_pump,
+    tail_replay,
+)
+from shu.core.streaming import SSE_DONE_FRAME
+
+
+class MockRedisStreamsClient:
+    """Just enough of redis.asyncio for the replay log (strings, XADD/XREAD)."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return key in self.values or key in self.streams
+
+    async def xadd(self, key, fields, id, maxlen=None, approximate=True):
+        entries = self.streams.setdefault(key, [])
+        entries.append((id, dict(fields)))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return id
+
+    async def xread(self, streams, count=None, block=None):
+        ((key, last_id),) = streams.items()
+        after = int(last_id.split("-")[0])
+        entries = [e for e in self.streams.get(key, []) if int(e[0].split("-")[0]) > after][:count]
+        return [[key, entries]] if entries else []
+
+
+async def _frames(*payloads: str, delay: float = 0.0):
+    for payload in payloads:
+        if delay:
+            await asyncio.sleep(delay)
+        yield f"data: {payload}\n\n"
+    yield SSE_DONE_FRAME
+
+
+async def _collect(replay_log: StreamReplayLog, stream_id: str, after_seq: int = 0) -> list[str]:
+    return [frame async for frame in tail_replay(replay_log, stream_id, after_seq)]
+
+
+def _memory_log(**overrides) -> InMemoryStreamReplayLog:
+    return InMemoryStreamReplayLog(**{"ttl_seconds": 60, "max_events": 100, **overrides})
+
+
+class TestPumpAndTail:
+    @pytest.mark.asyncio
+    async def test_tail_tags_frames_with_sequence_ids(self):
+        replay_log = _memory_log()
+        await replay_log.open("s1", {"user_id": "u1"})
+
+        start_replay_pump(replay_log, "s1", _frames('{"a":1}', '{"a":2}', delay=0.01), on_stop=lambda: None)
+        frames = await _collect(replay_log, "s1")
+
+        assert frames == [
+            'id: 1\ndata: {"a":1}\n\n',
+            'id: 2\ndata: {"a":2}\n\n',
+            f"id: 3\n{SSE_DONE_FRAME}",
+        ]
+        assert (await replay_log.get_meta("s1"))["complete"] is True
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_event_id(self):
+        replay_log = _memory_log()
+        await replay_log.open("s1", {"user_id": "u1"})
+        await start_replay_pump(replay_log, "s1", _frames("a", "b", "c"), on_stop=lambda: None)
+
+        frames = await _collect(replay_log, "s1", after_seq=2)
+
+        assert frames == ["id: 3\ndata: c\n\n", f"id: 4\n{SSE_DONE_FRAME}"]
+
+    @pytest.mark.asyncio
+    async def test_producer_outlives_a_dropped_reader(self):
+        replay_log = _memory_log()
+        await replay_log.open("s1", {"user_id": "u1"})
+        disconnected = []
+        pump = start_replay_pump(replay_log, "s1", _frames("a", "b", "c", delay=0.01), on_stop=lambda: None)
+
+        tail = tail_replay(replay_log, "s1", on_disconnect=lambda: disconnected.append(True))
+        first = await anext(tail)
+        await tail.aclose()
+        await pump
+
+        assert first == "id: 1\ndata: a\n\n"
+        assert disconnected == [True]
+        assert (await _collect(replay_log, "s1", after_seq=1))[-1] == f"id: 4\n{SSE_DONE_FRAME}"
+
+    @pytest.mark.asyncio
+    async def test_failing_producer_still_terminates_the_log(self):
+        async def broken():
+            yield "data: a\n\n"
+            raise RuntimeError("boom")
+
+        replay_log = _memory_log()
+        await replay_log.open("s1", {"user_id": "u1"})
+        await start_replay_pump(replay_log, "s1", broken(), on_stop=lambda: None)
+
+        assert await _collect(replay_log, "s1") == ["id: 1\ndata: a\n\n", f"id: 2\n{SSE_DONE_FRAME}"]
+
+    @pytest.mark.asyncio
+    async def test_expired_stream_ends_the_tail(self):
+        replay_log = _memory_log()
+
+        assert await _collect(replay_log, "missing") == [SSE_DONE_FRAME]
+
+    def test_zero_ttl_disables_replay(self):
+        assert not _memory_log(ttl_seconds=0).enabled
+
+
+class TestStopFlag:
+    @pytest.mark.asyncio
+    async def test_stop_request_reaches_the_producer(self):
+        replay_log = _memory_log()
+        await replay_log.open("s1", {"user_id": "u1"})
+        stopped = asyncio.Event()
+
+        async def endless():
+            while not stopped.is_set():
+                yield "data: tick\n\n"
+                await asyncio.sleep(0.005)
+
+        with patch.object(stream_replay, "_STOP_POLL_INTERVAL_SECONDS", 0.01):
+            pump = start_replay_pump(replay_log, "s1", endless(), on_stop=stopped.set)
+            await replay_log.request_stop("s1")
+            await asyncio.wait_for(pump, timeout=2)
+
+        assert stopped.is_set()
+        assert (await replay_log.get_meta("s1"))["complete"] is True
+
+
+class TestRedisStreamReplayLog:
+    @pytest.mark.asyncio
+    async def test_round_trip_through_redis_streams(self):
+        client = MockRedisStreamsClient()
+        replay_log = RedisStreamReplayLog(client, ttl_seconds=60, max_events=100, namespace="ns")
+        await replay_log.open("s1", {"user_id": "u1"})
+
+        await start_replay_pump(replay_log, "s1", _frames("a", "b"), on_stop=lambda: None)
+
+        assert [entry_id for entry_id, _ in client.streams["ns:chat_stream:s1:events"]] == ["1-0", "2-0", "3-0"]
+        assert json.loads(client.values["ns:chat_stream:s1:meta"]) == {"user_id": "u1", "complete": True}
+        assert client.ttls["ns:chat_stream:s1:events"] == 60
+        assert await _collect(replay_log, "s1", after_seq=1) == ["id: 2\ndata: b\n\n", f"id: 3\n{SSE_DONE_FRAME}"]
+
+    @pytest.mark.asyncio
+    async def test_stop_flag_is_shared_through_redis(self):
+        client = MockRedisStreamsClient()
+        producer_node = RedisStreamReplayLog(client, ttl_seconds=60, max_events=100)
+        other_node = RedisStreamReplayLog(client, ttl_seconds=60, max_events=100)
+        await producer_node.open("s1", {"user_id": "u1"})
+
+        await other_node.request_stop("s1")
+
+        assert await producer_node.stop_requested("s1") is True
+        assert isinstance(producer_node, StreamReplayLog)
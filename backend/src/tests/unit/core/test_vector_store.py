@@ -45,6 +45,9 @@ class TestVectorStoreProtocol:
             async def search(self, collection, query_vector, *, db, **kwargs):
                 return []
 
+            async def search_best_per_group(self, collection, query_vector, *, db, group_column, group_ids, **kwargs):
+                return {}
+
             async def store_embeddings(self, collection, entries, *, db):
                 return 0
 
@@ -207,6 +210,60 @@ class TestPgVectorStoreSearch:
         assert "documents" in sql_text
 
 
+class TestPgVectorStoreSearchBestPerGroup:
+    """Test the grouped best-match search."""
+
+    @pytest.mark.asyncio
+    async def test_returns_best_hit_per_group_in_one_query(self):
+        store = PgVectorStore()
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [("chunk-1", "doc-1", 0.9), ("chunk-7", "doc-2", 0.4)]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        results = await store.search_best_per_group(
+            "chunks",
+            query_vector=[0.1] * 384,
+            db=mock_db,
+            group_column="document_id",
+            group_ids=["doc-1", "doc-2", "doc-3"],
+            extra_where="chunk_metadata->>'chunk_type' != 'title'",
+        )
+
+        assert mock_db.execute.call_count == 1
+        sql_text = str(mock_db.execute.call_args[0][0])
+        params = mock_db.execute.call_args[0][1]
+        assert "document_id = ANY(:group_ids)" in sql_text
+        assert "PARTITION BY document_id" in sql_text
+        assert "chunk_type" in sql_text
+        assert params["group_ids"] == ["doc-1", "doc-2", "doc-3"]
+        assert results == {
+            "doc-1": VectorSearchResult(id="chunk-1", score=0.9),
+            "doc-2": VectorSearchResult(id="chunk-7", score=0.4),
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_group_ids_skips_query(self):
+        store = PgVectorStore()
+        mock_db = AsyncMock()
+
+        results = await store.search_best_per_group(
+            "chunks", query_vector=[0.1], db=mock_db, group_column="document_id", group_ids=[]
+        )
+
+        assert results == {}
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_group_column_raises(self):
+        store = PgVectorStore()
+
+        with pytest.raises(ValueError, match="Group column 'title' not allowed"):
+            await store.search_best_per_group(
+                "chunks", query_vector=[0.1], db=AsyncMock(), group_column="title", group_ids=["x"]
+            )
+
+
 # -- Store -------------------------------------------------------------------
 
 
@@ -308,6 +308,48 @@ async def test_worker_waits_when_no_jobs_available():
     assert processed_jobs[0].id == job.id
 
 
+@pytest.mark.asyncio
+async def test_idle_worker_picks_up_new_job_before_poll_interval():
+    """An idle worker blocks on its queues and starts a new job immediately, not after poll_interval."""
+    backend = InMemoryQueueBackend()
+    started = asyncio.Event()
+
+    async def job_handler(job: Job) -> None:
+        started.set()
+
+    config = WorkerConfig(workload_types={WorkloadType.INGESTION, WorkloadType.PROFILING}, poll_interval=10.0)
+    worker = Worker(backend, config, job_handler)
+    worker_task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0.05)  # Let the worker go idle
+
+    await enqueue_job(backend, WorkloadType.PROFILING, payload={"action": "test"})
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    worker._running = False
+    worker_task.cancel()
+    try:
+        await worker_task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_does_not_wait_on_queues_at_capacity():
+    """Queues whose workload type is at capacity are left out of the blocking wait."""
+    from shu.core.worker import WorkloadCapacityLimiter
+
+    backend = AsyncMock()
+    backend.wait_for_jobs = AsyncMock(return_value=False)
+    limiter = WorkloadCapacityLimiter(limits={WorkloadType.INGESTION_OCR: 1})
+    await limiter.acquire(WorkloadType.INGESTION_OCR)
+    config = WorkerConfig(workload_types={WorkloadType.INGESTION_OCR, WorkloadType.INGESTION}, poll_interval=0.5)
+    worker = Worker(backend, config, AsyncMock(), capacity_limiter=limiter)
+
+    await worker._wait_for_work(sorted(wt.queue_name for wt in config.workload_types))
+
+    backend.wait_for_jobs.assert_awaited_once_with([WorkloadType.INGESTION.queue_name], 0.5)
+
+
 @pytest.mark.asyncio
 async def test_worker_graceful_shutdown_finishes_current_job():
     """
@@ -722,6 +764,93 @@ async def test_workload_capacity_limiter_shared_across_workers():
     assert total_processed == 5, f"Processed {total_processed} jobs, expected 5"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_worker_runs_jobs_in_parallel():
+    """A worker with max_concurrent_jobs > 1 keeps several jobs in flight at once."""
+    backend = InMemoryQueueBackend()
+    in_flight = 0
+    peak = 0
+    release = asyncio.Event()
+    completed: list[str] = []
+
+    async def handler(job: Job) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await release.wait()
+        in_flight -= 1
+        completed.append(job.id)
+
+    for i in range(4):
+        await enqueue_job(backend, WorkloadType.PROFILING, payload={"index": i})
+
+    config = WorkerConfig(workload_types={WorkloadType.PROFILING}, poll_interval=0.1, max_concurrent_jobs=3)
+    worker = Worker(backend, config, handler)
+    worker_task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0.2)
+
+    assert peak == 3
+    assert len(worker._active_jobs) == 3
+
+    # Shutdown waits for the in-flight jobs instead of abandoning them
+    worker._running = False
+    release.set()
+    await asyncio.wait_for(worker_task, timeout=2.0)
+
+    assert len(completed) >= 3
+    assert worker._active_jobs == {}
+    assert worker._acquired_capacity == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_worker_honours_workload_slots():
+    """Per-workload slots cap one type while other types use the remaining slots."""
+    backend = InMemoryQueueBackend()
+    running: dict[str, int] = {"profiling": 0, "ingestion": 0}
+    peaks: dict[str, int] = {"profiling": 0, "ingestion": 0}
+    release = asyncio.Event()
+
+    async def handler(job: Job) -> None:
+        kind = job.payload["kind"]
+        running[kind] += 1
+        peaks[kind] = max(peaks[kind], running[kind])
+        await release.wait()
+        running[kind] -= 1
+
+    for _ in range(4):
+        await enqueue_job(backend, WorkloadType.PROFILING, payload={"kind": "profiling"})
+    for _ in range(2):
+        await enqueue_job(backend, WorkloadType.INGESTION, payload={"kind": "ingestion"})
+
+    config = WorkerConfig(
+        workload_types={WorkloadType.PROFILING, WorkloadType.INGESTION},
+        poll_interval=0.1,
+        max_concurrent_jobs=4,
+        workload_slots={WorkloadType.PROFILING: 2},
+    )
+    worker = Worker(backend, config, handler)
+    worker_task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0.3)
+
+    assert peaks == {"profiling": 2, "ingestion": 2}
+
+    release.set()
+    await asyncio.sleep(0.3)
+    worker._running = False
+    await asyncio.wait_for(worker_task, timeout=2.0)
+
+    assert await backend.pending_count(WorkloadType.PROFILING.queue_name) == 0
+    assert worker._slots.get_available(WorkloadType.PROFILING) == 2
+
+
+def test_worker_config_rejects_invalid_concurrency():
+    """max_concurrent_jobs must be at least 1 and slot counts non-negative."""
+    with pytest.raises(ValueError, match="max_concurrent_jobs"):
+        WorkerConfig(workload_types={WorkloadType.PROFILING}, max_concurrent_jobs=0)
+    with pytest.raises(ValueError, match="workload_slots"):
+        WorkerConfig(workload_types={WorkloadType.PROFILING}, workload_slots={WorkloadType.PROFILING: -1})
+
+
 @pytest.mark.asyncio
 async def test_workload_type_from_queue_name():
     """Test WorkloadType.from_queue_name() reverse lookup."""
@@ -16,7 +16,7 @@ import pytest
 
 from shu.core.config import Settings
 from shu.core.workload_routing import WorkloadType
-from shu.worker import parse_workload_types, run_worker
+from shu.worker import parse_workload_slots, parse_workload_types, run_worker
 
 # =============================================================================
 # Test Fixtures
@@ -172,6 +172,20 @@ def test_settings_worker_concurrency_high_value():
         assert settings.worker_concurrency == 16
 
 
+def test_settings_worker_jobs_per_worker_default():
+    """
+    Test that worker_jobs_per_worker defaults to 1 (one job at a time).
+    """
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop('SHU_WORKER_JOBS_PER_WORKER', None)
+
+        from shu.core.config import Settings
+        settings = Settings()
+
+        assert settings.worker_jobs_per_worker == 1
+        assert settings.worker_workload_slots == ""
+
+
 # =============================================================================
 # Worker Entrypoint Tests
 # =============================================================================
@@ -266,6 +280,30 @@ def test_parse_workload_types_duplicate():
     assert result == {WorkloadType.INGESTION, WorkloadType.PROFILING}
 
 
+def test_parse_workload_slots():
+    """
+    Test parsing per-workload slot limits, case-insensitively and with spaces.
+    """
+    result = parse_workload_slots(" profiling=8, INGESTION = 4 ")
+    assert result == {WorkloadType.PROFILING: 8, WorkloadType.INGESTION: 4}
+
+
+def test_parse_workload_slots_empty():
+    """
+    Test that an empty string means no slot limits.
+    """
+    assert parse_workload_slots("") == {}
+
+
+@pytest.mark.parametrize("value", ["PROFILING", "PROFILING=x", "PROFILING=-1", "BOGUS=2"])
+def test_parse_workload_slots_invalid(value):
+    """
+    Test that malformed pairs, bad counts and unknown types are rejected.
+    """
+    with pytest.raises(ValueError):
+        parse_workload_slots(value)
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -348,6 +386,8 @@ async def test_workers_enabled_with_concurrency():
     mock_settings.worker_concurrency = 3
     mock_settings.worker_poll_interval = 1.0
     mock_settings.worker_shutdown_timeout = 30.0
+    mock_settings.worker_jobs_per_worker = 1
+    mock_settings.worker_workload_slots = ""
     mock_settings.version = "test"
     mock_settings.environment = "test"
     mock_settings.debug = False
@@ -13,7 +13,7 @@ from hypothesis import strategies as st
 
 from shu.core.queue_backend import EnqueueError, InMemoryQueueBackend
 from shu.core.tenant import tenant_context
-from shu.core.workload_routing import WorkloadType, enqueue_job
+from shu.core.workload_routing import WorkloadType, enqueue_job, enqueue_jobs
 
 # =============================================================================
 # Property 5: WorkloadType Routing Correctness
@@ -337,3 +337,30 @@ class TestEnqueueRefusesMissingTenant:
             tenant_context.reset(token)
 
         assert job.tenant_id == "tenant-from-context"
+
+
+class TestEnqueueJobs:
+    """Batch counterpart of enqueue_job."""
+
+    @pytest.mark.asyncio
+    async def test_enqueues_one_job_per_payload_in_order(self) -> None:
+        backend = InMemoryQueueBackend()
+        token = tenant_context.set("tenant-A")
+        try:
+            jobs = await enqueue_jobs(backend, WorkloadType.INGESTION_EMBED, [{"n": 1}, {"n": 2}], max_attempts=3)
+        finally:
+            tenant_context.reset(token)
+
+        assert [j.payload for j in jobs] == [{"n": 1}, {"n": 2}]
+        assert all(j.tenant_id == "tenant-A" and j.max_attempts == 3 for j in jobs)
+        first = await backend.dequeue(WorkloadType.INGESTION_EMBED.queue_name)
+        assert first.id == jobs[0].id
+
+    @pytest.mark.asyncio
+    async def test_raises_without_tenant(self) -> None:
+        token = tenant_context.set(None)
+        try:
+            with pytest.raises(EnqueueError, match="without tenant_id"):
+                await enqueue_jobs(InMemoryQueueBackend(), WorkloadType.INGESTION, [{"x": 1}])
+        finally:
+            tenant_context.reset(token)
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import os
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -118,3 +118,59 @@ def test_validate_required_field_still_enforced():
     assert exc_info.value.status_code == 422, (
         "Missing required field 'op' must raise HTTP 422"
     )
+
+
+def test_validate_compiles_schema_once_per_op():
+    """The schema is resolved and compiled on first use, then reused."""
+    import jsonschema
+
+    from shu.plugins.schema import clear_compiled_schemas
+
+    executor = _make_executor()
+    plugin = _make_plugin(_SCHEMA)
+    plugin.version = "1.0"
+    validator_cls = jsonschema.validators.validator_for(_SCHEMA)
+
+    with patch.object(validator_cls, "check_schema", wraps=validator_cls.check_schema) as check_schema:
+        for _ in range(3):
+            executor._validate(plugin, {"op": "list"}, "list")
+        with pytest.raises(HTTPException):
+            executor._validate(plugin, {"op": 5}, "list")
+
+    assert plugin.get_schema_for_op.call_count == 1
+    assert check_schema.call_count == 1
+    clear_compiled_schemas()
+
+
+def test_clear_compiled_schemas_picks_up_new_schema():
+    """Clearing the cache (as PluginRegistry.refresh does) re-resolves the schema."""
+    from shu.plugins.schema import clear_compiled_schemas
+
+    executor = _make_executor()
+    plugin = _make_plugin(_SCHEMA)
+    plugin.version = "1.0"
+    executor._validate(plugin, {"op": "list"}, "list")
+
+    plugin.get_schema_for_op.return_value = {**_SCHEMA, "required": ["op", "query_filter"]}
+    executor._validate(plugin, {"op": "list"}, "list")  # still the cached schema
+
+    clear_compiled_schemas()
+    with pytest.raises(HTTPException):
+        executor._validate(plugin, {"op": "list"}, "list")
+    clear_compiled_schemas()
+
+
+def test_validate_output_uses_compiled_schema():
+    executor = _make_executor()
+    plugin = _make_plugin(_SCHEMA)
+    plugin.name = "output-plugin"
+    plugin.version = "1.0"
+    plugin.get_output_schema.return_value = {"type": "object", "required": ["items"]}
+
+    executor._validate_output(plugin, {"items": []})
+    with pytest.raises(HTTPException) as exc_info:
+        executor._validate_output(plugin, {})
+
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.detail["message"].startswith("'items' is a required property")
+    assert plugin.get_output_schema.call_count == 1
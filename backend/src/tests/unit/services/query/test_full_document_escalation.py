@@ -0,0 +1,75 @@
+"""Full-document escalation in ``QueryServiceBase._maybe_escalate_full_documents``.
+
+Documents without a stored token count are counted, and over-cap documents
+truncated, on a worker thread rather than on the event loop.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shu.services.query import base as query_base
+from shu.services.query.base import QueryServiceBase
+
+
+def _service(*documents) -> QueryServiceBase:
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(documents)
+    db.execute.return_value = result
+    return QueryServiceBase(db=db, config_manager=MagicMock())
+
+
+def _document(doc_id: str, content: str, token_count: int | None) -> SimpleNamespace:
+    return SimpleNamespace(id=doc_id, title=doc_id, content=content, token_count=token_count)
+
+
+@pytest.mark.asyncio
+async def test_uncounted_document_is_counted_and_truncated_off_the_loop():
+    service = _service(_document("d1", "word " * 50, None))
+    loop_thread = threading.get_ident()
+    threads: list[int] = []
+
+    def count_tokens(text):
+        threads.append(threading.get_ident())
+        return 50
+
+    def truncate_to_tokens(text, cap):
+        threads.append(threading.get_ident())
+        return text[:cap]
+
+    with (
+        patch.object(query_base, "count_tokens", count_tokens),
+        patch.object(query_base, "truncate_to_tokens", truncate_to_tokens),
+    ):
+        escalation = await service._maybe_escalate_full_documents(
+            SimpleNamespace(id="kb-1"),
+            {"fetch_full_documents": True, "full_doc_token_cap": 10},
+            "query",
+            [{"document_id": "d1"}],
+        )
+
+    doc = escalation["docs"][0]
+    assert doc["token_count_estimated"] == 50
+    assert doc["token_cap_enforced"] is True
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_stored_token_count_skips_tokenization():
+    service = _service(_document("d1", "short", 3))
+
+    with patch.object(asyncio, "to_thread", AsyncMock()) as to_thread:
+        escalation = await service._maybe_escalate_full_documents(
+            SimpleNamespace(id="kb-1"),
+            {"fetch_full_documents": True, "full_doc_token_cap": 10},
+            "query",
+            [{"document_id": "d1"}],
+        )
+
+    to_thread.assert_not_awaited()
+    assert escalation["docs"][0]["content"] == "short"
@@ -0,0 +1,81 @@
+"""Unit tests for the structured multi-surface result formatter."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from shu.core.vector_store import VectorSearchResult
+from shu.services.retrieval.protocol import ContributingChunk, FusedResult
+from shu.services.retrieval.result_formatter import format_results
+
+
+def _chunk(chunk_type: str | None = None, score: float = 0.5) -> ContributingChunk:
+    return ContributingChunk(
+        chunk_id=uuid4(),
+        chunk_index=0,
+        surface="chunk_vector",
+        score=score,
+        snippet="snippet",
+        content="content",
+        chunk_metadata={"chunk_type": chunk_type} if chunk_type else None,
+    )
+
+
+def _fused(chunks: list[ContributingChunk]) -> FusedResult:
+    return FusedResult(
+        document_id=uuid4(),
+        document_title="Doc",
+        final_score=0.8,
+        surface_scores={"chunk_vector": 0.8},
+        contributing_chunks=chunks,
+    )
+
+
+class TestFormatResultsPromotion:
+    @pytest.mark.asyncio
+    async def test_title_only_documents_are_promoted_in_one_batch(self):
+        title_only_a = _fused([_chunk("title")])
+        title_only_b = _fused([_chunk("title")])
+        with_content = _fused([_chunk()])
+        promoted_id = str(uuid4())
+
+        vector_store = MagicMock()
+        vector_store.search = AsyncMock()
+        vector_store.search_best_per_group = AsyncMock(
+            return_value={str(title_only_a.document_id): VectorSearchResult(id=promoted_id, score=0.7)}
+        )
+        rows = MagicMock()
+        rows.all.return_value = [(promoted_id, 4, "best content", "a summary")]
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=rows)
+
+        docs = await format_results([title_only_a, with_content, title_only_b], [0.1], vector_store, db)
+
+        vector_store.search.assert_not_called()
+        vector_store.search_best_per_group.assert_awaited_once()
+        kwargs = vector_store.search_best_per_group.await_args.kwargs
+        assert kwargs["group_column"] == "document_id"
+        assert kwargs["group_ids"] == [str(title_only_a.document_id), str(title_only_b.document_id)]
+        assert db.execute.await_count == 1
+
+        promoted = docs[0].chunks
+        assert len(promoted) == 1
+        assert promoted[0].promoted is True
+        assert promoted[0].chunk_index == 4
+        assert promoted[0].content == "best content"
+        assert promoted[0].score == 0.7
+        assert docs[1].chunks[0].promoted is False
+        assert docs[2].chunks == []
+
+    @pytest.mark.asyncio
+    async def test_no_promotion_queries_when_content_matched(self):
+        vector_store = MagicMock()
+        vector_store.search_best_per_group = AsyncMock()
+        db = AsyncMock()
+
+        docs = await format_results([_fused([_chunk()])], [0.1], vector_store, db)
+
+        assert len(docs[0].chunks) == 1
+        vector_store.search_best_per_group.assert_not_called()
+        db.execute.assert_not_called()
@@ -9,6 +9,7 @@ with Hypothesis.
 """
 
 import uuid
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -20,7 +21,10 @@ from hypothesis.strategies import composite
 
 from shu.core.exceptions import ConversationNotFoundError, NotFoundError, ShuException
 from shu.models.llm_provider import Conversation
+from shu.services import context_window_manager
 from shu.services.chat_service import ChatService
+from shu.services.chat_types import ChatContext, ChatMessage
+from shu.services.side_call_service import SideCallResult
 
 
 @composite
@@ -1503,3 +1507,86 @@ class TestChatServiceExplicitKnowledgeBaseAccess:
 
             mock_kb_service.check_kb_read_access.assert_not_called()
             assert ctx.knowledge_base_ids == []
+
+
+class TestChatServiceContextSummaryPersistence:
+    """The rolling context summary must outlive the request session it was built on."""
+
+    @pytest.mark.asyncio
+    async def test_summary_is_reused_on_the_next_turn(self, monkeypatch) -> None:
+        conversation_id = str(uuid.uuid4())
+        user_id = str(uuid.uuid4())
+        row: dict[str, Any] = {"meta": None}  # the conversations row as committed
+
+        summary_session = AsyncMock()
+        summary_session.execute.side_effect = lambda stmt: row.update(meta=stmt.compile().params["meta"])
+
+        @asynccontextmanager
+        async def summary_session_factory():
+            yield summary_session
+
+        monkeypatch.setattr(context_window_manager, "get_async_session_local", lambda: summary_session_factory)
+
+        side_call = AsyncMock(side_effect=lambda **_: SideCallResult(content=f"summary {side_call.await_count}"))
+        history = [
+            ChatMessage(id=f"m{i}", role="user", content="word " * 10, created_at=None, attachments=[], metadata={})
+            for i in range(5)
+        ]
+
+        async def send_turn() -> None:
+            mock_db = AsyncMock()
+            chat_service = ChatService(mock_db, MagicMock())
+            # Each turn reloads the conversation from what was committed.
+            conversation = MagicMock(spec=Conversation)
+            conversation.id = conversation_id
+            conversation.user_id = user_id
+            conversation.meta = row["meta"]
+            mock_result = MagicMock()
+            mock_result.scalar_one.return_value = conversation
+            mock_db.execute.return_value = mock_result
+
+            chat_service.get_conversation_by_id = AsyncMock(return_value=conversation)
+            chat_service.add_message = AsyncMock(return_value=MagicMock(content="hello"))
+            chat_service.get_conversation_messages = AsyncMock(return_value=list(history))
+            chat_service._resolve_ensemble_configurations = AsyncMock(return_value=[MagicMock()])
+            chat_service.context_preferences_resolver.resolve_user_context_preferences = AsyncMock(
+                return_value={"memory_depth": 2}
+            )
+            chat_service.llm_service.get_provider_by_id = AsyncMock(return_value=MagicMock(is_active=True))
+            chat_service.llm_service.get_model_by_name = AsyncMock(return_value=MagicMock(is_active=True))
+            chat_service._compute_tools_enabled = MagicMock(return_value=False)
+            chat_service._compute_kb_include_references_map = AsyncMock(return_value={})
+
+            manager = chat_service.context_window_manager
+            manager.side_call_service = MagicMock(call=side_call)
+            manager.recent_message_limit = 2
+
+            async def build_message_context(*, conversation, conversation_messages, **_):
+                messages = await manager.manage_context_window(
+                    conversation_messages, conversation=conversation, max_tokens=10
+                )
+                return ChatContext(system_prompt=None, messages=messages), []
+
+            chat_service.message_context_builder.build_message_context = build_message_context
+
+            current_user = MagicMock()
+            current_user.id = user_id
+            with patch("shu.services.chat_service.serialize_message_for_sse", return_value={}):
+                await chat_service.send_message(
+                    conversation_id=conversation_id,
+                    user_message="hello",
+                    current_user=current_user,
+                )
+
+        await send_turn()
+        history.extend(
+            ChatMessage(id=f"n{i}", role="user", content="word " * 10, created_at=None, attachments=[], metadata={})
+            for i in range(2)
+        )
+        await send_turn()
+
+        assert side_call.await_count == 2
+        second_prompt = side_call.await_args_list[-1].kwargs["message_sequence"][0]["content"]
+        assert "summary 1" in second_prompt
+        assert second_prompt.count("User: ") == 2  # only the messages aged out since turn one
+        assert row["meta"][context_window_manager.CONTEXT_SUMMARY_META_KEY]["text"] == "summary 2"
@@ -0,0 +1,155 @@
+"""Unit tests for the structure-aware chunker engine."""
+
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shu.services.chunking import (
+    CHUNKING_STRATEGIES,
+    FixedWidthChunker,
+    MarkdownHeadingChunker,
+    ParagraphChunker,
+    SentenceChunker,
+    TokenBudgetChunker,
+    get_chunker,
+)
+from shu.services.rag_processing_service import RAGProcessingService
+
+SAMPLE = (
+    "# Overview\n\n"
+    "Shu ingests documents from many feeds. Each document is chunked before embedding! "
+    "Does chunking split sentences? It should not.\n\n"
+    "## Details\n\n"
+    "Paragraph two has a single sentence that is moderately long and descriptive.\n\n"
+    "Short closing paragraph."
+)
+
+
+def _legacy_chunk_text(text: str, size: int, overlap: int) -> list[str]:
+    """The original fixed-width slicing loop, kept as a parity oracle."""
+    chunks, start = [], 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        chunks.append(text[start:end])
+        if end == len(text):
+            break
+        start += size - overlap
+    return chunks
+
+
+class TestOffsets:
+    @pytest.mark.parametrize("strategy", sorted(CHUNKING_STRATEGIES))
+    def test_spans_map_exactly_to_source_text(self, strategy):
+        for span in get_chunker(strategy, 80, 20).iter_spans(SAMPLE):
+            assert SAMPLE[span.start : span.end] == span.text
+            assert span.text == span.text.strip() or strategy == "fixed"
+
+    @pytest.mark.parametrize("strategy", sorted(CHUNKING_STRATEGIES))
+    def test_spans_cover_all_content_in_order(self, strategy):
+        spans = list(get_chunker(strategy, 80, 20).iter_spans(SAMPLE))
+        starts = [s.start for s in spans]
+        assert starts == sorted(starts)
+        covered = set()
+        for s in spans:
+            covered.update(range(s.start, s.end))
+        assert all(i in covered for i, ch in enumerate(SAMPLE) if not ch.isspace())
+
+    def test_iter_spans_is_lazy(self):
+        spans = SentenceChunker(50, 0).iter_spans(SAMPLE)
+        assert isinstance(spans, types.GeneratorType)
+        assert next(spans).start == 0
+
+
+class TestFixedWidth:
+    @pytest.mark.parametrize(("size", "overlap"), [(100, 20), (37, 5), (1000, 200)])
+    def test_matches_legacy_chunk_text(self, size, overlap):
+        text = SAMPLE * 7
+        assert [s.text for s in FixedWidthChunker(size, overlap).iter_spans(text)] == _legacy_chunk_text(
+            text, size, overlap
+        )
+
+
+class TestBoundaries:
+    def test_sentence_chunks_end_on_sentence_boundaries(self):
+        for span in SentenceChunker(90, 0).iter_spans(SAMPLE):
+            assert len(span.text) <= 90
+            assert span.text[-1] in ".!?" or span.text.startswith("#")
+
+    def test_sentence_overlap_carries_whole_sentences(self):
+        text = "Alpha one. Beta two. Gamma three. Delta four."
+        spans = [s.text for s in SentenceChunker(25, 12).iter_spans(text)]
+        assert spans == ["Alpha one. Beta two.", "Beta two. Gamma three.", "Gamma three. Delta four."]
+
+    def test_paragraph_chunker_packs_paragraphs(self):
+        text = "One.\n\nTwo.\n\nThree is longer than the others."
+        spans = [s.text for s in ParagraphChunker(12, 0).iter_spans(text)]
+        assert spans[0] == "One.\n\nTwo."
+        assert all(len(s) <= 12 for s in spans)
+
+    def test_oversized_unit_falls_back_to_finer_strategy(self):
+        paragraph = "Sentence number one. Sentence number two. Sentence number three."
+        spans = [s.text for s in ParagraphChunker(45, 0).iter_spans(paragraph)]
+        assert spans == ["Sentence number one. Sentence number two.", "Sentence number three."]
+
+    def test_markdown_chunker_starts_chunks_at_headings(self):
+        spans = [s.text for s in MarkdownHeadingChunker(200, 0).iter_spans(SAMPLE)]
+        assert spans[0].startswith("# Overview")
+        assert spans[1].startswith("## Details")
+
+    def test_token_budget_respects_token_limit(self):
+        with patch("shu.services.chunking.estimate_tokens", side_effect=lambda t: len(t.split())):
+            chunker = TokenBudgetChunker(40, 0)  # 10-token budget
+            spans = list(chunker.iter_spans(SAMPLE))
+        assert chunker.chunk_size == 10
+        assert all(len(s.text.split()) <= 10 for s in spans)
+
+
+class TestRegistry:
+    def test_none_selects_fixed(self):
+        assert isinstance(get_chunker(None, 100, 10), FixedWidthChunker)
+
+    def test_unknown_strategy_raises(self):
+        with pytest.raises(ValueError, match="Unknown chunking strategy"):
+            get_chunker("semantic", 100, 10)
+
+    def test_overlap_must_be_smaller_than_size(self):
+        with pytest.raises(ValueError):
+            SentenceChunker(100, 100)
+
+
+class TestBuildChunks:
+    def _kb(self, strategy):
+        kb = MagicMock()
+        kb.id = "kb-1"
+        kb.chunk_size = 80
+        kb.chunk_overlap = 10
+        kb.chunking_strategy = strategy
+        kb.get_rag_config.return_value = {}
+        return kb
+
+    def _config_manager(self, title_chunk_enabled):
+        manager = MagicMock()
+        manager.get_title_chunk_enabled.return_value = title_chunk_enabled
+        manager.get_title_weighting_enabled.return_value = True
+        return manager
+
+    def test_inlined_title_keeps_source_offsets(self):
+        rag = RAGProcessingService(MagicMock())
+        chunks = rag.build_chunks(
+            "doc-1", self._kb("sentence"), SAMPLE, document_title="T", config_manager=self._config_manager(False)
+        )
+        assert chunks[0].content.startswith("Document Title: T\n\n")
+        for chunk in chunks:
+            source = SAMPLE[chunk.start_char : chunk.end_char]
+            assert chunk.content.endswith(source)
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+
+    def test_separate_title_chunk_is_prepended(self):
+        rag = RAGProcessingService(MagicMock())
+        chunks = rag.build_chunks(
+            "doc-1", self._kb("paragraph"), SAMPLE, document_title="T", config_manager=self._config_manager(True)
+        )
+        assert chunks[0].chunk_metadata["chunk_type"] == "title"
+        assert chunks[1].start_char == 0
+        assert chunks[1].content == SAMPLE[chunks[1].start_char : chunks[1].end_char]
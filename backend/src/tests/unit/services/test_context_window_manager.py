@@ -0,0 +1,199 @@
+"""
+Unit tests for ContextWindowManager's persisted rolling summary.
+
+Tests cover:
+- The first overflow summarizes the aged-out history and checkpoints it on conversation.meta
+- Later turns fold only newly aged-out messages into the stored summary
+- A turn with nothing newly aged out reuses the summary without a side call
+- Regeneration / variant switches invalidate the stored summary
+- Stored message token counts are used instead of re-tokenizing
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shu.services import context_window_manager
+from shu.services.chat_types import ChatMessage
+from shu.services.context_window_manager import CONTEXT_SUMMARY_META_KEY, ContextWindowManager
+from shu.services.side_call_service import SideCallResult
+
+
+def _message(message_id: str | None, content: str = "word " * 10) -> ChatMessage:
+    return ChatMessage(id=message_id, role="user", content=content, created_at=None, attachments=[], metadata={})
+
+
+def _history(count: int, prefix: str = "m") -> list[ChatMessage]:
+    return [_message(f"{prefix}{i}") for i in range(count)]
+
+
+def _manager() -> tuple[ContextWindowManager, AsyncMock, AsyncMock]:
+    side_call = MagicMock()
+    side_call.call = AsyncMock(side_effect=lambda **_: SideCallResult(content=f"summary {side_call.call.await_count}"))
+    db_session = AsyncMock()
+    manager = ContextWindowManager(
+        llm_service=MagicMock(),
+        db_session=db_session,
+        config_manager=MagicMock(),
+        side_call_service=side_call,
+        recent_message_limit=2,
+    )
+    return manager, side_call.call, db_session
+
+
+@pytest.fixture(autouse=True)
+def persisted(monkeypatch) -> list[dict]:
+    """Capture the meta written by _store_summary's own short-lived session."""
+    writes: list[dict] = []
+    session = AsyncMock()
+    session.execute.side_effect = lambda stmt: writes.append(stmt.compile().params["meta"])
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    monkeypatch.setattr(context_window_manager, "get_async_session_local", lambda: session_factory)
+    return writes
+
+
+def _prompt(call) -> str:
+    return call.kwargs["message_sequence"][0]["content"]
+
+
+async def _manage(manager, messages, conversation):
+    return await manager.manage_context_window(messages, conversation=conversation, max_tokens=10)
+
+
+class TestRollingSummary:
+    @pytest.mark.asyncio
+    async def test_first_overflow_summarizes_and_checkpoints(self, persisted):
+        manager, side_call, db_session = _manager()
+        conversation = SimpleNamespace(id="c1", meta=None)
+
+        managed = await _manage(manager, _history(5), conversation)
+
+        assert managed[0].content == "[Previous conversation summary]: summary 1"
+        assert [m.id for m in managed[1:]] == ["m3", "m4"]
+        stored = conversation.meta[CONTEXT_SUMMARY_META_KEY]
+        assert stored["text"] == "summary 1"
+        assert stored["last_message_id"] == "m2"
+        assert stored["message_count"] == 3
+        assert persisted == [conversation.meta]
+        db_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_later_turn_folds_in_only_new_messages(self):
+        manager, side_call, _ = _manager()
+        conversation = SimpleNamespace(id="c1", meta={"title_locked": True})
+        history = _history(5)
+        await _manage(manager, history, conversation)
+
+        history += _history(2, prefix="n")
+        managed = await _manage(manager, history, conversation)
+
+        prompt = _prompt(side_call.await_args_list[-1])
+        assert "summary 1" in prompt
+        assert prompt.count("User: ") == 2  # m3 and m4 only
+        assert managed[0].content.endswith("summary 2")
+        assert conversation.meta[CONTEXT_SUMMARY_META_KEY]["last_message_id"] == "m4"
+        assert conversation.meta["title_locked"] is True
+
+    @pytest.mark.asyncio
+    async def test_unchanged_history_reuses_summary_without_side_call(self):
+        manager, side_call, _ = _manager()
+        conversation = SimpleNamespace(id="c1", meta=None)
+        history = _history(5)
+        await _manage(manager, history, conversation)
+
+        managed = await _manage(manager, history, conversation)
+
+        assert side_call.await_count == 1
+        assert managed[0].content.endswith("summary 1")
+
+    @pytest.mark.asyncio
+    async def test_replaced_message_invalidates_summary(self):
+        manager, side_call, _ = _manager()
+        conversation = SimpleNamespace(id="c1", meta=None)
+        history = _history(5)
+        await _manage(manager, history, conversation)
+
+        # Regenerating m1 (or switching to another variant of it) swaps its id.
+        history[1] = _message("m1-regenerated")
+        await _manage(manager, history, conversation)
+
+        prompt = _prompt(side_call.await_args_list[-1])
+        assert "summary 1" not in prompt
+        assert prompt.count("User: ") == 3
+        assert conversation.meta[CONTEXT_SUMMARY_META_KEY]["text"] == "summary 2"
+
+    @pytest.mark.asyncio
+    async def test_unpersisted_messages_are_not_checkpointed(self, persisted):
+        manager, side_call, db_session = _manager()
+        conversation = SimpleNamespace(id="c1", meta=None)
+        history = [_message(None) for _ in range(5)]
+
+        await _manage(manager, history, conversation)
+        await _manage(manager, history, conversation)
+
+        assert side_call.await_count == 2
+        assert conversation.meta is None
+        assert persisted == []
+        db_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_summary_write_leaves_caller_session_untouched(self):
+        manager, _, db_session = _manager()
+        pending = object()
+        db_session.new = {pending}
+        db_session.commit.side_effect = RuntimeError("commit failed")
+        db_session.flush.side_effect = RuntimeError("flush failed")
+        conversation = SimpleNamespace(id="c1", meta=None)
+
+        await _manage(manager, _history(5), conversation)
+
+        assert conversation.meta[CONTEXT_SUMMARY_META_KEY]["text"] == "summary 1"
+        assert db_session.new == {pending}
+        db_session.commit.assert_not_awaited()
+        db_session.flush.assert_not_awaited()
+        db_session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_checkpoint_write_still_returns_summary(self, monkeypatch):
+        manager, _, _ = _manager()
+        monkeypatch.setattr(context_window_manager, "get_async_session_local", MagicMock(side_effect=RuntimeError))
+        conversation = SimpleNamespace(id="c1", meta=None)
+
+        managed = await _manage(manager, _history(5), conversation)
+
+        assert managed[0].content.endswith("summary 1")
+
+
+class TestTokenAccounting:
+    @pytest.mark.asyncio
+    async def test_stored_token_counts_skip_tokenization(self):
+        manager, side_call, _ = _manager()
+        history = [_message(f"m{i}") for i in range(3)]
+        for msg in history:
+            msg.token_count = 3
+
+        with patch.object(context_window_manager, "count_tokens") as count_tokens:
+            managed = await _manage(manager, history, SimpleNamespace(id="c1", meta=None))
+
+        count_tokens.assert_not_called()
+        side_call.assert_not_awaited()
+        assert managed == history
+
+    @pytest.mark.asyncio
+    async def test_other_tokenizers_recount(self):
+        manager, _, _ = _manager()
+        history = [_message("m0")]
+        history[0].token_count = 3
+
+        with patch.object(context_window_manager, "count_tokens", return_value=1) as count_tokens:
+            await manager.manage_context_window(
+                history, conversation=SimpleNamespace(id="c1", meta=None), max_tokens=10, model_name="gpt-4o"
+            )
+
+        count_tokens.assert_called_with(history[0].content, model="gpt-4o")
@@ -1,10 +1,14 @@
 """Unit tests for DocumentService."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from shu.models.document import DocumentChunk
 from shu.services.document_service import DocumentService
+from shu.services.rag_processing_service import chunk_content_hash
+from shu.utils.tokenization import count_tokens
 
 
 class TestProcessAndUpdateChunks:
@@ -42,6 +46,9 @@ class TestProcessAndUpdateChunks:
         ), patch(
             "shu.services.rag_processing_service.RAGProcessingService.process_document",
             new=process_document_mock,
+        ), patch(
+            "shu.services.document_service.get_settings_instance",
+            return_value=SimpleNamespace(incremental_chunk_embedding=False),
         ):
             result = await service.process_and_update_chunks(
                 knowledge_base_id="kb-1",
@@ -52,10 +59,124 @@ class TestProcessAndUpdateChunks:
 
         fetch_raw_mock.assert_awaited_once_with("kb-1")
         private_fetch_mock.assert_not_awaited()
-        document.update_content_stats.assert_called_once_with(2, 11, 0)
+        document.update_content_stats.assert_called_once_with(2, 11, 0, count_tokens("hello world"))
         assert result == (2, 11, 0)
 
 
+def _planned_chunk(idx: int, content: str, start: int) -> DocumentChunk:
+    return DocumentChunk(
+        document_id="doc-1",
+        knowledge_base_id="kb-1",
+        chunk_index=idx,
+        content=content,
+        char_count=len(content),
+        word_count=len(content.split()),
+        start_char=start,
+        end_char=start + len(content),
+        chunk_metadata={"chunk_type": "content", "title_weighting_enabled": True},
+    )
+
+
+def _fingerprint(chunk: DocumentChunk, *, model: str = "model-a", content: str | None = None):
+    return SimpleNamespace(
+        id=f"chunk-{chunk.chunk_index}",
+        chunk_index=chunk.chunk_index,
+        start_char=chunk.start_char,
+        end_char=chunk.end_char,
+        embedding_model=model,
+        chunk_metadata=chunk.chunk_metadata,
+        has_embedding=True,
+        content_hash=chunk_content_hash(content if content is not None else chunk.content),
+    )
+
+
+class TestIncrementalChunkSync:
+    """Re-syncs only embed and write chunks whose text or position changed."""
+
+    async def _run(self, planned, stored):
+        db = AsyncMock()
+        db.add = MagicMock()
+        service = DocumentService(db)
+
+        document = MagicMock()
+        document.id = "doc-1"
+        document.update_content_stats = MagicMock()
+
+        embedding_service = MagicMock()
+        embedding_service.model_name = "model-a"
+        embedding_service.embed_texts = AsyncMock(side_effect=lambda texts, **_: [[0.1, 0.2] for _ in texts])
+
+        with patch(
+            "shu.services.knowledge_base_service.KnowledgeBaseService.fetch_raw_knowledge_base",
+            new=AsyncMock(return_value=MagicMock(id="kb-1")),
+        ), patch(
+            "shu.core.embedding_service.get_embedding_service",
+            new=AsyncMock(return_value=embedding_service),
+        ), patch(
+            "shu.services.rag_processing_service.RAGProcessingService.build_chunks",
+            return_value=planned,
+        ), patch.object(
+            DocumentService,
+            "_load_chunk_fingerprints",
+            new=AsyncMock(return_value={fp.chunk_index: fp for fp in stored}),
+        ):
+            result = await service.process_and_update_chunks(
+                knowledge_base_id="kb-1", document=document, title="T", content="aaa bbb ccc"
+            )
+        return db, embedding_service, result
+
+    @pytest.mark.asyncio
+    async def test_unchanged_document_embeds_and_writes_nothing(self) -> None:
+        planned = [_planned_chunk(0, "aaa", 0), _planned_chunk(1, "bbb", 3)]
+        db, embedding_service, result = await self._run(planned, [_fingerprint(c) for c in planned])
+
+        embedding_service.embed_texts.assert_not_called()
+        db.add.assert_not_called()
+        db.execute.assert_not_called()
+        assert result == (3, 11, 2)
+
+    @pytest.mark.asyncio
+    async def test_only_changed_chunk_is_embedded_and_updated_in_place(self) -> None:
+        planned = [_planned_chunk(0, "aaa", 0), _planned_chunk(1, "bXb", 3)]
+        stored = [_fingerprint(planned[0]), _fingerprint(planned[1], content="bbb")]
+        db, embedding_service, _ = await self._run(planned, stored)
+
+        embedding_service.embed_texts.assert_awaited_once()
+        assert embedding_service.embed_texts.call_args.args[0] == ["bXb"]
+        db.add.assert_not_called()
+        db.execute.assert_awaited_once()
+        updates = db.execute.call_args.args[1]
+        assert [u["id"] for u in updates] == ["chunk-1"]
+        assert updates[0]["content"] == "bXb"
+        assert updates[0]["token_count"] == count_tokens("bXb")  # counted alongside the embedding
+        assert updates[0]["summary"] is None
+
+    @pytest.mark.asyncio
+    async def test_model_change_forces_reembed(self) -> None:
+        planned = [_planned_chunk(0, "aaa", 0)]
+        db, embedding_service, _ = await self._run(planned, [_fingerprint(planned[0], model="old-model")])
+
+        assert embedding_service.embed_texts.call_args.args[0] == ["aaa"]
+
+    @pytest.mark.asyncio
+    async def test_new_chunks_inserted_and_trailing_chunks_deleted(self) -> None:
+        grown = [_planned_chunk(0, "aaa", 0), _planned_chunk(1, "bbb", 3)]
+        db, embedding_service, _ = await self._run(grown, [_fingerprint(grown[0])])
+
+        assert embedding_service.embed_texts.call_args.args[0] == ["bbb"]
+        db.add.assert_called_once_with(grown[1])
+        assert grown[1].embedding_model == "model-a"
+
+        shrunk = [_planned_chunk(0, "aaa", 0)]
+        db, embedding_service, _ = await self._run(
+            shrunk, [_fingerprint(shrunk[0]), _fingerprint(_planned_chunk(1, "bbb", 3))]
+        )
+
+        embedding_service.embed_texts.assert_not_called()
+        db.execute.assert_awaited_once()
+        assert "DELETE" in str(db.execute.call_args.args[0]).upper()
+
+
 # SHU-776: document_count_limit enforcement on create_document. The gate runs
 # only for genuinely new documents — an existing (idempotent) row returns
 # first, leaving the count unchanged. Self-hosted (no cache) bypasses entirely.
@@ -189,6 +189,27 @@ class TestEmbedQuery:
         payload = mock_client.post.call_args[1]["json"]
         assert payload["input"] == [{"content": [{"type": "text", "text": "search query"}]}]
 
+    @pytest.mark.asyncio
+    async def test_repeated_query_is_served_from_cache(self):
+        """A second identical query skips the API call (and its usage row)."""
+        from shu.core import query_embedding_cache
+
+        settings = MagicMock(
+            query_embedding_cache_enabled=True, query_embedding_cache_size=8, query_embedding_cache_ttl=0
+        )
+        query_embedding_cache.clear_query_embedding_cache()
+        with (
+            patch.object(query_embedding_cache, "get_settings_instance", return_value=settings),
+            _patched_httpx(_mock_embeddings_response([[0.5, 0.25]])) as mock_client,
+        ):
+            svc = _make_service(query_prefix="query: ")
+            first = await svc.embed_query("search query")
+            second = await svc.embed_query("search query")
+        query_embedding_cache.clear_query_embedding_cache()
+
+        assert first == second == [0.5, 0.25]
+        assert mock_client.post.await_count == 1
+
 
 class TestEmbedQueries:
     @pytest.mark.asyncio
@@ -0,0 +1,168 @@
+"""
+Unit tests for ingestion_service.ingest_batch.
+
+Covers:
+- Unchanged documents are skipped from a single prefetch, without any write
+- New documents share one INSERT, changed ones one executemany UPDATE
+- Every embed job goes out in a single enqueue_many call
+- Duplicate source_ids within a batch: last occurrence wins
+- Email items are normalized to text and embedded through the queue
+- An enqueue failure marks the batch's documents ERROR (retryable) and re-raises
+"""
+
+import hashlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.sql.dml import Insert, Update
+
+from shu.core.queue_backend import InMemoryQueueBackend
+from shu.core.workload_routing import WorkloadType
+from shu.services.ingestion_service import _ERR_ENQUEUE_EMBEDDING, ingest_batch
+
+
+def _existing(source_id: str, content: str, status: str = "content_processed"):
+    doc = MagicMock()
+    doc.id = f"doc-{source_id}"
+    doc.source_id = source_id
+    doc.source_url = None
+    doc.source_hash = None
+    doc.source_modified_at = None
+    doc.content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    doc.processing_status = status
+    doc.processing_error = None
+    doc.word_count = doc.character_count = doc.chunk_count = 1
+    doc.is_processed = status == "content_processed"
+    doc.has_error = status == "error"
+    return doc
+
+
+def _inserted_rows(stmt) -> list[dict]:
+    return [{getattr(col, "key", col): value for col, value in row.items()} for row in stmt._multi_values[0]]
+
+
+class _FakeSession:
+    """Records statements; answers the prefetch SELECT and the INSERT ... RETURNING."""
+
+    def __init__(self, existing):
+        self.existing = existing
+        self.statements: list[tuple] = []
+        self.commit = AsyncMock()
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        result = MagicMock()
+        if isinstance(stmt, Insert):
+            result.all.return_value = [(row["id"], row["source_id"]) for row in _inserted_rows(stmt)]
+        elif not isinstance(stmt, Update):
+            result.scalars.return_value = list(self.existing)
+        return result
+
+    def of_type(self, kind):
+        return [(stmt, params) for stmt, params in self.statements if isinstance(stmt, kind)]
+
+
+def _text(source_id: str, content: str) -> dict:
+    return {"title": source_id, "content": content, "source_id": source_id}
+
+
+async def _run(db, items, queue):
+    with (
+        patch("shu.utils.KnowledgeBaseVerifier.verify_exists", AsyncMock()),
+        patch("shu.billing.enforcement.assert_document_count_under_limit", AsyncMock()) as cap,
+        patch("shu.core.queue_backend.get_queue_backend", AsyncMock(return_value=queue)),
+    ):
+        results = await ingest_batch(db, "kb-1", items, plugin_name="mail", user_id="u1")
+    return results, cap
+
+
+class TestIngestBatch:
+    @pytest.mark.asyncio
+    async def test_skips_inserts_updates_and_enqueues_once(self):
+        db = _FakeSession([_existing("same", "unchanged"), _existing("edited", "old body")])
+        queue = InMemoryQueueBackend(cleanup_interval_seconds=0)
+        items = [_text("same", "unchanged"), _text("edited", "new body"), _text("new-1", "a"), _text("new-2", "b")]
+
+        with patch.object(queue, "enqueue_many", wraps=queue.enqueue_many) as enqueue_many:
+            results, cap = await _run(db, items, queue)
+
+        assert [r["skipped"] for r in results] == [True, False, False, False]
+        assert results[0]["skip_reason"] == "hash_match"
+        assert results[1]["document_id"] == "doc-edited"
+        assert {r["status"] for r in results[1:]} == {"embedding"}
+
+        ((insert, _),) = db.of_type(Insert)
+        assert [row["source_id"] for row in _inserted_rows(insert)] == ["new-1", "new-2"]
+        assert cap.await_count == 2
+        bulk_updates = [params for _, params in db.of_type(Update) if params]
+        assert len(bulk_updates) == 1 and len(bulk_updates[0]) == 1
+        assert bulk_updates[0][0]["id"] == "doc-edited"
+        assert bulk_updates[0][0]["content"] == "new body"
+
+        enqueue_many.assert_awaited_once()
+        queued = [job.payload["document_id"] for job in enqueue_many.await_args.args[0]]
+        assert queued == [r["document_id"] for r in results[1:]]
+        assert await queue.pending_count(WorkloadType.INGESTION_EMBED.queue_name) == 3
+
+    @pytest.mark.asyncio
+    async def test_all_unchanged_writes_nothing(self):
+        db = _FakeSession([_existing("same", "unchanged")])
+        queue = InMemoryQueueBackend(cleanup_interval_seconds=0)
+
+        results, _ = await _run(db, [_text("same", "unchanged")], queue)
+
+        assert results[0]["skipped"] is True
+        assert len(db.statements) == 1
+        db.commit.assert_not_awaited()
+        assert await queue.pending_count(WorkloadType.INGESTION_EMBED.queue_name) == 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_source_id_last_occurrence_wins(self):
+        db = _FakeSession([])
+        queue = InMemoryQueueBackend(cleanup_interval_seconds=0)
+
+        results, _ = await _run(db, [_text("dup", "first"), _text("dup", "second")], queue)
+
+        ((insert, _),) = db.of_type(Insert)
+        assert [row["content"] for row in _inserted_rows(insert)] == ["second"]
+        assert results[0]["skip_reason"] == "superseded_in_batch"
+        assert results[0]["document_id"] == results[1]["document_id"]
+        assert results[0]["ko_id"] == results[1]["ko_id"]
+
+    @pytest.mark.asyncio
+    async def test_email_items_are_normalized(self):
+        db = _FakeSession([])
+        queue = InMemoryQueueBackend(cleanup_interval_seconds=0)
+        email = {
+            "kind": "email",
+            "subject": "Hello",
+            "sender": "a@example.com",
+            "recipients": {"to": ["b@example.com"]},
+            "date": None,
+            "message_id": "msg-1",
+            "thread_id": "t-1",
+            "body_text": "Body",
+        }
+
+        await _run(db, [email], queue)
+
+        ((insert, _),) = db.of_type(Insert)
+        row = _inserted_rows(insert)[0]
+        assert row["source_id"] == "msg-1"
+        assert row["file_type"] == "email"
+        assert row["content"] == "Subject: Hello\nFrom: a@example.com\nTo: b@example.com\n\nBody"
+        assert row["extraction_metadata"]["thread_id"] == "t-1"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_failure_marks_documents_error(self):
+        db = _FakeSession([])
+        queue = MagicMock()
+        queue.enqueue_many = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        with pytest.raises(ConnectionError):
+            await _run(db, [_text("a", "x"), _text("b", "y")], queue)
+
+        status_update = db.of_type(Update)[-1][0]
+        values = {col.key: val.value for col, val in status_update._values.items()}
+        assert values["processing_status"] == "error"
+        assert values["processing_error"].startswith(_ERR_ENQUEUE_EMBEDDING)
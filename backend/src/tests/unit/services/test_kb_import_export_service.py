@@ -4,15 +4,16 @@ import io
 import json
 import math
 import os
+import struct
 import zipfile
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from shu.core.exceptions import ValidationError
 from shu.models.document import Document, DocumentChunk, DocumentQuery
-from shu.services.kb_import_export_service import KBImportExportService
+from shu.services.kb_import_export_service import _EXPORT_COLUMNS, KBImportExportService
 from shu.utils.embedding_codec import decode_embedding, encode_embedding
 
 
@@ -71,6 +72,7 @@ def _mock_document(export_index: int = 0) -> MagicMock:
     doc.word_count = 50
     doc.character_count = 300
     doc.chunk_count = 2
+    doc.token_count = 70
     doc.extraction_method = "pymupdf"
     doc.extraction_engine = None
     doc.extraction_confidence = 0.95
@@ -334,6 +336,7 @@ def _mock_kb() -> MagicMock:
     kb.embedding_model = "test-model"
     kb.chunk_size = 512
     kb.chunk_overlap = 64
+    kb.chunking_strategy = None
     kb.get_rag_config.return_value = {"search_type": "hybrid", "version": "1.0"}
     return kb
 
@@ -524,6 +527,150 @@ class TestExportKB:
                 os.remove(temp_path)
 
 
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+def _pg_binary_field(kind: str, value) -> bytes | None:
+    """Encode a serialized export value the way a binary COPY sends it."""
+    if value is None:
+        return None
+    if kind == "text":
+        return value.encode()
+    if kind == "int":
+        return struct.pack(">i", value)
+    if kind == "float":
+        return struct.pack(">d", value)
+    if kind == "json":
+        return json.dumps(value).encode()
+    if kind == "timestamp":
+        delta = datetime.fromisoformat(value) - _PG_EPOCH
+        return struct.pack(">q", delta // timedelta(microseconds=1))
+    floats = decode_embedding(value)
+    return struct.pack(">iiiii", 1, 0, 700, len(floats), 1) + b"".join(struct.pack(">if", 4, f) for f in floats)
+
+
+def _pg_copy_stream(rows: list[tuple[bytes | None, ...]]) -> bytes:
+    """Build a binary COPY stream from raw field tuples."""
+    out = bytearray(b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0))
+    for row in rows:
+        out += struct.pack(">h", len(row))
+        for field in row:
+            out += struct.pack(">i", -1) if field is None else struct.pack(">i", len(field)) + field
+    out += struct.pack(">h", -1)
+    return bytes(out)
+
+
+def _copy_rows(model: type, key: str, serialized: dict) -> tuple[bytes | None, ...]:
+    return (key.encode(), *(_pg_binary_field(kind, serialized[col]) for col, kind in _EXPORT_COLUMNS[model]))
+
+
+def _make_copy_db(tables: dict[str, list[tuple[bytes | None, ...]]]) -> tuple[AsyncMock, MagicMock]:
+    """Build an asyncpg-flavoured session whose driver serves binary COPY output per table."""
+    driver = MagicMock()
+
+    async def copy_from_query(query, *args, output, format):
+        assert format == "binary"
+        table = query.split(" FROM ")[1].split()[0]
+        stream = _pg_copy_stream(tables.get(table, []))
+        for i in range(0, len(stream), 7):  # odd chunking splits tuples mid-field
+            await output(stream[i : i + 7])
+
+    driver.copy_from_query = AsyncMock(side_effect=copy_from_query)
+    driver.copy_records_to_table = AsyncMock()
+
+    raw = MagicMock()
+    raw.driver_connection = driver
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+
+    db = AsyncMock()
+    db.bind.dialect.driver = "asyncpg"
+    db.connection = AsyncMock(return_value=connection)
+    return db, driver
+
+
+class TestCopyExportImport:
+    """Tests for the asyncpg COPY export and import paths."""
+
+    @pytest.mark.parametrize(
+        ("model", "build"),
+        [(Document, _mock_document), (DocumentChunk, _mock_chunk), (DocumentQuery, _mock_query)],
+    )
+    def test_copy_columns_match_serializers(self, model, build) -> None:
+        keys = list(model.serialize_for_export(build(), 0, no_embeddings=False))
+        assert keys == ["export_index", *(col for col, _ in _EXPORT_COLUMNS[model])]
+
+    @pytest.mark.asyncio
+    async def test_copy_export_matches_orm_serialization(self) -> None:
+        doc, chunk, query = _mock_document(), _mock_chunk(), _mock_query()
+        expected_doc = Document.serialize_for_export(doc, 0, no_embeddings=False)
+        expected_chunk = DocumentChunk.serialize_for_export(chunk, 0, no_embeddings=False)
+        expected_query = DocumentQuery.serialize_for_export(query, 0, no_embeddings=False)
+
+        db, driver = _make_copy_db(
+            {
+                "documents": [_copy_rows(Document, "doc-1", expected_doc)],
+                "document_chunks": [
+                    _copy_rows(DocumentChunk, "doc-1", expected_chunk),
+                    _copy_rows(DocumentChunk, "doc-gone", expected_chunk),
+                ],
+                "document_queries": [_copy_rows(DocumentQuery, "doc-1", expected_query)],
+            }
+        )
+        kb_service = AsyncMock()
+        kb_service.get_knowledge_base = AsyncMock(return_value=_mock_kb())
+
+        service = KBImportExportService(db, kb_service)
+        temp_path, _ = await service.export_kb("kb-1", "user-1")
+
+        try:
+            with zipfile.ZipFile(temp_path, "r") as zf:
+                assert json.loads(zf.read("documents.jsonl")) == expected_doc
+                assert json.loads(zf.read("chunks.jsonl")) == expected_chunk
+                assert json.loads(zf.read("queries.jsonl")) == expected_query
+                assert json.loads(zf.read("manifest.json"))["counts"] == {"documents": 1, "chunks": 1, "queries": 1}
+        finally:
+            os.remove(temp_path)
+        db.execute.assert_not_called()
+        assert all(call.args[1] == "kb-1" for call in driver.copy_from_query.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_copy_export_no_embeddings_skips_vector_columns(self) -> None:
+        db, driver = _make_copy_db({})
+        kb_service = AsyncMock()
+        kb_service.get_knowledge_base = AsyncMock(return_value=_mock_kb())
+
+        service = KBImportExportService(db, kb_service)
+        temp_path, _ = await service.export_kb("kb-1", "user-1", no_embeddings=True)
+        os.remove(temp_path)
+
+        chunk_query = driver.copy_from_query.call_args_list[1].args[0]
+        assert "NULL::real[], summary" in chunk_query
+        assert "embedding::real[]" not in chunk_query
+
+    @pytest.mark.asyncio
+    async def test_copy_import_stages_batch_then_inserts(self) -> None:
+        db, driver = _make_copy_db({})
+        service = KBImportExportService(db, MagicMock())
+        row = {"chunk_index": 0, "topics": ["a"], "embedding": encode_embedding([0.5, 0.25])}
+        record = DocumentChunk.build_import_record(row, "doc-1", "kb-1", skip_embeddings=False)
+
+        await service._insert_batch(DocumentChunk, [record])
+
+        create_sql, insert_sql = (str(call.args[0]) for call in db.execute.call_args_list)
+        assert "CREATE TEMP TABLE _kb_import_stage ON COMMIT DROP" in create_sql
+        assert "embedding::real[] AS embedding" in create_sql
+        assert insert_sql.startswith("INSERT INTO document_chunks")
+        assert "embedding::vector" in insert_sql
+
+        kwargs = driver.copy_records_to_table.call_args.kwargs
+        staged = dict(zip(kwargs["columns"], kwargs["records"][0], strict=True))
+        assert staged["topics"] == '["a"]'
+        assert staged["embedding"] == [0.5, 0.25]
+        assert staged["summary_embedding"] is None
+        db.commit.assert_awaited_once()
+
+
 def _make_export_archive(
     docs: list[dict] | None = None,
     chunks: list[dict] | None = None,
@@ -92,7 +92,7 @@ def _trivial_validator(_password: str) -> list[str]:
     return []
 
 
-def _trivial_hasher(password: str) -> str:
+async def _trivial_hasher(password: str) -> str:
     """Test-only hasher that prefixes the plaintext for visibility."""
     return f"hashed:{password}"
 
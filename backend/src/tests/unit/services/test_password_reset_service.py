@@ -47,7 +47,7 @@ def _accept_all_password(_p: str) -> list[str]:
     return []
 
 
-def _hash_password(p: str) -> str:
+async def _hash_password(p: str) -> str:
     return f"hashed:{p}"
 
 
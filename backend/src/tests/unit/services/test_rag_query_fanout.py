@@ -0,0 +1,138 @@
+"""Multi-KB fan-out in ``rag_query_processing.query_knowledge_bases``.
+
+Several KBs are queried concurrently, each on its own session, with the
+query embedded once; results keep the caller's KB order.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shu.core.embedding_service import get_embedding_service
+from shu.schemas.query import QueryRequest
+from shu.services import rag_query_processing
+from shu.services.rag_query_processing import query_knowledge_bases
+
+
+def _build_request(_kb_id, _rag_config, query_text):
+    return QueryRequest(query=query_text, query_type="hybrid", limit=10)
+
+
+def _config_manager(concurrency: int) -> MagicMock:
+    config_manager = MagicMock()
+    config_manager.settings = SimpleNamespace(rag_kb_query_concurrency=concurrency)
+    return config_manager
+
+
+def _kb_service_factory(min_words_by_kb: dict[str, int] | None = None):
+    def factory(_session, _config_manager):
+        async def get_rag_config(kb_id):
+            cfg = MagicMock()
+            cfg.model_dump = MagicMock(
+                return_value={"minimum_query_words": (min_words_by_kb or {}).get(kb_id, 1)}
+            )
+            return cfg
+
+        svc = MagicMock()
+        svc.get_rag_config = get_rag_config
+        return svc
+
+    return factory
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield object()
+
+
+class TestQueryKnowledgeBasesFanOut:
+    @pytest.mark.asyncio
+    async def test_kbs_run_concurrently_and_share_one_query_embedding(self):
+        in_flight = 0
+        peak = 0
+        embed_query = AsyncMock(return_value=[0.5])
+
+        def query_service_factory(_session, _config_manager):
+            async def query_documents(kb_id, request, *, user_id=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                service = await get_embedding_service()
+                await service.embed_query(request.query, user_id=user_id)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"results": [{"document_id": f"{kb_id}-doc"}]}
+
+            svc = MagicMock()
+            svc.query_documents = query_documents
+            return svc
+
+        base_service = MagicMock()
+        base_service.embed_query = embed_query
+
+        with patch.object(rag_query_processing, "KnowledgeBaseService", side_effect=_kb_service_factory()), \
+             patch.object(rag_query_processing, "QueryService", side_effect=query_service_factory), \
+             patch.object(rag_query_processing, "get_async_session_local", return_value=_fake_session), \
+             patch("shu.core.embedding_service._embedding_service", base_service):
+            responses = await query_knowledge_bases(
+                config_manager=_config_manager(3),
+                query_service=MagicMock(),
+                kb_service=MagicMock(),
+                knowledge_base_ids=["kb-1", "kb-2", "kb-3", "kb-4"],
+                query_text="quarterly revenue forecast",
+                request_builder=_build_request,
+                diagnostics={},
+            )
+
+        assert [r["knowledge_base_id"] for r in responses] == ["kb-1", "kb-2", "kb-3", "kb-4"]
+        assert peak == 3
+        embed_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skipped_kbs_are_recorded_and_omitted(self):
+        query_service = MagicMock()
+        query_service.query_documents = AsyncMock(return_value={"results": []})
+        diagnostics: dict = {}
+
+        with patch.object(
+            rag_query_processing, "KnowledgeBaseService", side_effect=_kb_service_factory({"kb-2": 10})
+        ), patch.object(rag_query_processing, "QueryService", return_value=query_service), \
+             patch.object(rag_query_processing, "get_async_session_local", return_value=_fake_session):
+            responses = await query_knowledge_bases(
+                config_manager=_config_manager(4),
+                query_service=MagicMock(),
+                kb_service=MagicMock(),
+                knowledge_base_ids=["kb-1", "kb-2"],
+                query_text="quarterly revenue forecast",
+                request_builder=_build_request,
+                diagnostics=diagnostics,
+            )
+
+        assert [r["knowledge_base_id"] for r in responses] == ["kb-1"]
+        assert diagnostics["skipped"] == {"kb-2": "insufficient_meaningful_words"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_of_one_uses_the_callers_services(self):
+        query_service = MagicMock()
+        query_service.query_documents = AsyncMock(return_value={"results": []})
+        kb_service = MagicMock()
+        kb_service.get_rag_config = _kb_service_factory()(None, None).get_rag_config
+
+        with patch.object(rag_query_processing, "get_async_session_local") as session_local:
+            responses = await query_knowledge_bases(
+                config_manager=_config_manager(1),
+                query_service=query_service,
+                kb_service=kb_service,
+                knowledge_base_ids=["kb-1", "kb-2"],
+                query_text="quarterly revenue forecast",
+                request_builder=_build_request,
+                diagnostics=None,
+            )
+
+        assert len(responses) == 2
+        assert query_service.query_documents.await_count == 2
+        session_local.assert_not_called()
+
@@ -18,18 +18,21 @@ Deliberately not tested here (unit-scope):
 
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from shu.core.tenant import tenant_context
 from shu.models.llm_provider import LLMModel, LLMProvider
-from shu.services.usage_recording import CostResolver, UsageRecorder
+from shu.services.usage_recording import CostResolver, UsageRecorder, UsageWriteBuffer
 
 
 class _FakeProvider:
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, *, is_system_managed: bool = False) -> None:
         self.name = name
+        self.is_system_managed = is_system_managed
 
 
 class _FakeModel:
@@ -371,6 +374,24 @@ class TestUsageRecorderCostDelegation:
         assert fake.calls[0]["total_cost"] == Decimal("0")
 
 
+class TestUsageRecorderLedger:
+    """Billable rows feed the hard-cap usage ledger with their resolved cost."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("system_managed", "expected"), [(True, Decimal("0.75")), (False, Decimal("0"))])
+    async def test_records_resolved_cost_for_system_managed_providers(self, system_managed, expected):
+        session = _make_session(
+            provider=_FakeProvider("OpenRouter", is_system_managed=system_managed),
+            model=_FakeModel("example/model"),
+        )
+        recorder = UsageRecorder(cost_resolver=_FakeResolver((Decimal("0.5"), Decimal("0.25"), Decimal("0.75"))))
+
+        with patch("shu.services.usage_recording.record_billable_cost", AsyncMock()) as ledger:
+            await recorder.record(provider_id="prov-1", model_id="model-1", request_type="chat", session=session)
+
+        ledger.assert_awaited_once_with(expected)
+
+
 class TestUsageRecorderTotalTokens:
     """total_tokens is a derived column: if the caller leaves it at 0,
     the recorder computes it from input_tokens + output_tokens so admin
@@ -496,6 +517,129 @@ class TestUsageRecorderFailureContract:
         )
 
 
+class _BatchSessions:
+    """Stand-in for ``get_async_session_local()`` that records each committed batch.
+
+    A commit fails when its batch contains a row whose request_type is
+    "poison", which is how the per-row retry path is exercised.
+    """
+
+    def __init__(self, provider: _FakeProvider, model: _FakeModel) -> None:
+        self.provider = provider
+        self.model = model
+        self.batches: list[tuple[str | None, list]] = []
+        self.gets = 0
+
+    def __call__(self):
+        return self._open
+
+    def _open(self):
+        sessions = self
+        pending: list = []
+
+        async def _get(cls, _obj_id):
+            sessions.gets += 1
+            return sessions.provider if cls is LLMProvider else sessions.model
+
+        async def _commit():
+            if any(record.request_type == "poison" for record in pending):
+                raise RuntimeError("constraint violation")
+            sessions.batches.append((tenant_context.get(None), list(pending)))
+
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=_get)
+        session.add_all = MagicMock(side_effect=pending.extend)
+        session.commit = AsyncMock(side_effect=_commit)
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=session)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+
+class TestUsageWriteBuffer:
+    """Fire-and-forget rows are batched into multi-row inserts."""
+
+    @pytest.fixture
+    def sessions(self, monkeypatch):
+        sessions = _BatchSessions(
+            _FakeProvider("OpenRouter", is_system_managed=True),
+            _FakeModel("example/model", cost_per_input_unit=Decimal("0.001")),
+        )
+        monkeypatch.setattr("shu.services.usage_recording.get_async_session_local", sessions)
+        return sessions
+
+    @staticmethod
+    def _recorder(**overrides) -> UsageRecorder:
+        options = {"max_rows": 3, "flush_interval": 60.0, "lookup_ttl": 60.0, **overrides}
+        return UsageRecorder(write_buffer=UsageWriteBuffer(**options))
+
+    @staticmethod
+    async def _record(recorder: UsageRecorder, request_type: str = "embedding") -> None:
+        await recorder.record(provider_id="prov-1", model_id="model-1", request_type=request_type, input_tokens=10)
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_writes_one_batch_with_cached_lookups(self, sessions):
+        recorder = self._recorder()
+
+        with patch("shu.services.usage_recording.record_billable_cost", AsyncMock()) as ledger:
+            for _ in range(3):
+                await self._record(recorder)
+
+        assert len(sessions.batches) == 1
+        assert len(sessions.batches[0][1]) == 3
+        assert sessions.batches[0][1][0].total_cost == Decimal("0.010")
+        assert sessions.gets == 2  # one provider + one model lookup for the whole batch
+        assert ledger.await_count == 3
+        assert recorder.write_buffer.stats()["pending_rows"] == 0
+
+    @pytest.mark.asyncio
+    async def test_time_threshold_flushes_partial_batch(self, sessions):
+        recorder = self._recorder(flush_interval=0.01)
+
+        await self._record(recorder)
+        assert sessions.batches == []
+        await asyncio.sleep(0.05)
+
+        assert len(sessions.batches) == 1
+        assert recorder.write_buffer.stats()["flushed_rows"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_rows(self, sessions):
+        recorder = self._recorder()
+
+        await self._record(recorder)
+        await recorder.write_buffer.close()
+
+        assert len(sessions.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retries_rows_and_counts_drops(self, sessions):
+        recorder = self._recorder()
+
+        await self._record(recorder)
+        await self._record(recorder, request_type="poison")
+        await self._record(recorder)
+
+        assert [len(rows) for _, rows in sessions.batches] == [1, 1]
+        stats = recorder.write_buffer.stats()
+        assert stats["dropped_rows"] == 1
+        assert stats["flushed_rows"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rows_are_written_under_their_callers_tenant(self, sessions):
+        recorder = self._recorder(max_rows=10)
+
+        await self._record(recorder)
+        token = tenant_context.set("tenant-b")
+        try:
+            await self._record(recorder)
+        finally:
+            tenant_context.reset(token)
+        await recorder.write_buffer.flush()
+
+        assert sorted(tid for tid, _ in sessions.batches) == sorted([tenant_context.get(None), "tenant-b"])
+
+
 class TestGetUsageRecorder:
     """The singleton accessor returns the same instance and matches the
     codebase's ``get_X()`` pattern for services."""
@@ -0,0 +1,53 @@
+"""Unit tests for the binary COPY decoder and real[] embedding encoding."""
+
+import struct
+
+import pytest
+
+from shu.utils.embedding_codec import encode_embedding, encode_pg_float4_array
+from shu.utils.pg_copy import BinaryCopyDecoder, decode_float, decode_int, decode_text
+
+_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_TRAILER = struct.pack(">h", -1)
+
+
+def _tuple(*fields: bytes | None) -> bytes:
+    out = struct.pack(">h", len(fields))
+    for field in fields:
+        out += struct.pack(">i", -1) if field is None else struct.pack(">i", len(field)) + field
+    return out
+
+
+class TestBinaryCopyDecoder:
+    def test_reassembles_tuples_fed_byte_by_byte(self) -> None:
+        stream = _HEADER + _tuple(b"doc", None, struct.pack(">i", 7)) + _tuple(b"", struct.pack(">d", 1.5), None)
+        stream += _TRAILER
+        decoder = BinaryCopyDecoder()
+
+        rows = [row for i in range(len(stream)) for row in decoder.feed(stream[i : i + 1])]
+        decoder.finish()
+
+        assert rows == [(b"doc", None, struct.pack(">i", 7)), (b"", struct.pack(">d", 1.5), None)]
+        assert decode_text(rows[0][0]) == "doc"
+        assert decode_int(rows[0][2]) == 7
+        assert decode_float(rows[1][1]) == 1.5
+
+    def test_truncated_stream_fails_finish(self) -> None:
+        decoder = BinaryCopyDecoder()
+        assert decoder.feed(_HEADER + _tuple(b"abc")[:-1]) == []
+        with pytest.raises(ValueError, match="mid-tuple"):
+            decoder.finish()
+
+    def test_rejects_non_binary_stream(self) -> None:
+        with pytest.raises(ValueError, match="Not a binary COPY"):
+            BinaryCopyDecoder().feed(b"id\ttitle\n" * 4)
+
+
+class TestEncodePgFloat4Array:
+    def test_matches_encode_embedding(self) -> None:
+        values = [0.1, -2.5, 3.75]
+        array = struct.pack(">iiiii", 1, 0, 700, len(values), 1) + b"".join(struct.pack(">if", 4, v) for v in values)
+        assert encode_pg_float4_array(array) == encode_embedding(values)
+
+    def test_empty_array(self) -> None:
+        assert encode_pg_float4_array(struct.pack(">iii", 0, 0, 700)) == encode_embedding([])
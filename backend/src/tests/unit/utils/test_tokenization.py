@@ -1,10 +1,17 @@
 """Unit tests for tokenization utilities."""
 
+from unittest.mock import patch
+
+from shu.utils import tokenization
 from shu.utils.tokenization import (
+    DEFAULT_ENCODING,
     chars_to_tokens_estimate,
+    count_tokens,
+    encoding_for_model,
     estimate_tokens,
     estimate_tokens_for_chunks,
     tokens_to_chars_estimate,
+    truncate_to_tokens,
 )
 
 
@@ -149,3 +156,58 @@ class TestProfilingUseCases:
 
         threshold = 4000  # Default profiling threshold
         assert tokens > threshold, "Large doc should exceed threshold"
+
+
+class TestModelAwareCounting:
+    """Tests for per-model encodings, the count cache and truncation."""
+
+    def test_encoding_for_model(self):
+        """Model names map to their tokenizer's encoding; unknown models use the default."""
+        assert encoding_for_model("gpt-4o-mini") == "o200k_base"
+        assert encoding_for_model("openai/o3-mini") == "o200k_base"
+        assert encoding_for_model("gpt-4-turbo") == "cl100k_base"
+        assert encoding_for_model("claude-3-5-sonnet") == DEFAULT_ENCODING
+        assert encoding_for_model(None) == DEFAULT_ENCODING
+
+    def test_count_is_cached_by_content(self):
+        """Counting the same text twice only encodes it once per encoding."""
+        text = "cached token count " * 20
+        with (
+            patch.dict(tokenization._count_cache, clear=True),
+            patch.object(tokenization, "_encode_count", return_value=42) as encode,
+        ):
+            assert count_tokens(text) == 42
+            assert count_tokens(text) == 42
+            assert count_tokens(text, model="gpt-4o") == 42
+
+        assert encode.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """The least recently used count is evicted past the cache size."""
+        with (
+            patch.dict(tokenization._count_cache, clear=True),
+            patch.object(tokenization, "_COUNT_CACHE_SIZE", 2),
+            patch.object(tokenization, "_encode_count", return_value=1),
+        ):
+            for text in ("a", "b", "c"):
+                count_tokens(text)
+            assert len(tokenization._count_cache) == 2
+
+    def test_heuristic_count_is_not_cached(self):
+        """Word-count fallbacks never shadow the real encoder's count."""
+        text = "one two three four five six seven eight nine ten"
+        with patch.dict(tokenization._count_cache, clear=True):
+            with patch.object(tokenization, "_get_encoder", return_value=None):
+                assert count_tokens(text) == 13
+            assert not tokenization._count_cache
+
+            with patch.object(tokenization, "_encode_count", return_value=10):
+                assert count_tokens(text) == 10
+            assert len(tokenization._count_cache) == 1
+
+    def test_truncate_to_tokens_without_tiktoken(self):
+        """The heuristic fallback keeps whole words within the budget."""
+        with patch.object(tokenization, "_get_encoder", return_value=None):
+            assert truncate_to_tokens("one two three four five", 4) == "one two three"
+            assert truncate_to_tokens("short", 100) == "short"
+            assert truncate_to_tokens("anything", 0) == ""
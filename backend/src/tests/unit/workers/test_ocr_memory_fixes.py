@@ -27,6 +27,7 @@ def _make_extractor(ocr_render_scale: float = 2.0, ocr_page_timeout: int = 30):
     mock_settings.ocr_render_scale = ocr_render_scale
     mock_settings.ocr_page_timeout = ocr_page_timeout
     mock_settings.ocr_max_concurrent_jobs = 1
+    mock_settings.ocr_page_concurrency = 1
 
     mock_config_manager = MagicMock()
     mock_config_manager.settings = mock_settings
@@ -52,7 +53,6 @@ class TestImgArrayReleasedAfterThreadStart:
         reference via its default-arg binding.
         """
         import numpy as np
-        from PIL import Image
 
         extractor = _make_extractor()
 
@@ -74,21 +74,15 @@ class TestImgArrayReleasedAfterThreadStart:
         original_id = id(real_array)
 
         mock_page = MagicMock()
-        mock_pix = MagicMock()
-        mock_pix.tobytes.return_value = b"fake"
-
         mock_doc = MagicMock()
         mock_doc.__len__ = MagicMock(return_value=1)
         mock_doc.__getitem__ = MagicMock(return_value=mock_page)
-        mock_page.get_pixmap.return_value = mock_pix
-
-        mock_pil_image = Image.fromarray(real_array)
+        mock_page.get_pixmap.return_value = MagicMock()
 
         with (
             patch.object(extractor, "get_ocr_instance", new=AsyncMock(return_value=mock_ocr)),
             patch.object(extractor, "is_job_cancelled", return_value=False),
-            patch("PIL.Image.open", return_value=mock_pil_image),
-            patch("numpy.array", return_value=real_array),
+            patch("shu.processors.text_extractor._pixmap_to_array", return_value=real_array),
         ):
             task = asyncio.create_task(
                 extractor._process_pdf_with_ocr_direct(mock_doc, "test.pdf", None)
@@ -154,31 +148,22 @@ class TestRenderScaleFromConfig:
         """
         When ocr_render_scale=1.5, get_pixmap must be called with fitz.Matrix(1.5, 1.5).
         """
-        import numpy as np
-        from PIL import Image
-
         extractor = _make_extractor(ocr_render_scale=1.5)
 
-        mock_page = MagicMock()
-        mock_pix = MagicMock()
-        mock_pix.tobytes.return_value = b"fake"
+        import fitz
 
+        mock_page = MagicMock()
         mock_doc = MagicMock()
         mock_doc.__len__ = MagicMock(return_value=1)
         mock_doc.__getitem__ = MagicMock(return_value=mock_page)
-        mock_page.get_pixmap.return_value = mock_pix
+        mock_page.get_pixmap.return_value = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 10, 10), False)
 
         mock_ocr = MagicMock()
         mock_ocr.readtext.return_value = [([0, 0, 10, 10], "hello", 0.9)]
 
-        dummy_array = np.zeros((10, 10, 3), dtype=np.uint8)
-        mock_pil_image = Image.fromarray(dummy_array)
-
         with (
             patch.object(extractor, "get_ocr_instance", new=AsyncMock(return_value=mock_ocr)),
             patch.object(extractor, "is_job_cancelled", return_value=False),
-            patch("PIL.Image.open", return_value=mock_pil_image),
-            patch("numpy.array", return_value=dummy_array),
         ):
             await extractor._process_pdf_with_ocr_direct(mock_doc, "test.pdf", None)
 
@@ -191,3 +176,36 @@ class TestRenderScaleFromConfig:
         assert abs(matrix_arg.a - 1.5) < 1e-6, (
             f"Expected fitz.Matrix scale 1.5, got matrix.a={matrix_arg.a}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Pixmaps reach EasyOCR without a PNG round-trip
+# ---------------------------------------------------------------------------
+
+class TestPixmapToArray:
+    """_pixmap_to_array must view the pixmap samples directly, with the right shape."""
+
+    def test_rgb_pixmap_becomes_hwc_view(self):
+        import fitz
+        import numpy as np
+
+        from shu.processors.text_extractor import _pixmap_to_array
+
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 4, 3), False)
+        pix.set_pixel(1, 2, (10, 20, 30))
+
+        arr = _pixmap_to_array(pix)
+
+        assert arr.shape == (3, 4, 3)
+        assert arr.dtype == np.uint8
+        assert tuple(arr[2, 1]) == (10, 20, 30)
+        assert np.shares_memory(arr, np.frombuffer(pix.samples_mv, dtype=np.uint8))
+
+    def test_grayscale_pixmap_becomes_2d(self):
+        import fitz
+
+        from shu.processors.text_extractor import _pixmap_to_array
+
+        pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 5, 2), False)
+
+        assert _pixmap_to_array(pix).shape == (2, 5)
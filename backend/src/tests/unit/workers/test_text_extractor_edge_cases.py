@@ -24,6 +24,7 @@ def _make_extractor(
     ocr_render_scale: float = 2.0,
     ocr_page_timeout: int = 60,
     ocr_max_concurrent_jobs: int = 1,
+    ocr_page_concurrency: int = 1,
 ):
     """Build a TextExtractor with a mock ConfigurationManager via real __init__."""
     from shu.processors.text_extractor import TextExtractor
@@ -32,6 +33,7 @@ def _make_extractor(
     mock_settings.ocr_render_scale = ocr_render_scale
     mock_settings.ocr_page_timeout = ocr_page_timeout
     mock_settings.ocr_max_concurrent_jobs = ocr_max_concurrent_jobs
+    mock_settings.ocr_page_concurrency = ocr_page_concurrency
 
     config_manager = MagicMock()
     config_manager.settings = mock_settings
@@ -44,6 +46,7 @@ def _make_extractor_raw(
     ocr_render_scale: float = 2.0,
     ocr_page_timeout: int = 60,
     ocr_max_concurrent_jobs: int = 1,
+    ocr_page_concurrency: int = 1,
 ):
     """Build a TextExtractor via __new__ (bypasses __init__) for internal-method tests."""
     from shu.processors.text_extractor import TextExtractor
@@ -52,6 +55,7 @@ def _make_extractor_raw(
     mock_settings.ocr_render_scale = ocr_render_scale
     mock_settings.ocr_page_timeout = ocr_page_timeout
     mock_settings.ocr_max_concurrent_jobs = ocr_max_concurrent_jobs
+    mock_settings.ocr_page_concurrency = ocr_page_concurrency
 
     config_manager = MagicMock()
     config_manager.settings = mock_settings
@@ -68,9 +72,7 @@ def _mock_fitz_doc(num_pages: int = 1):
     pages = []
     for _ in range(num_pages):
         page = MagicMock()
-        pix = MagicMock()
-        pix.tobytes.return_value = _png_bytes()
-        page.get_pixmap.return_value = pix
+        page.get_pixmap.return_value = _pixmap()
         pages.append(page)
 
     doc = MagicMock()
@@ -79,17 +81,13 @@ def _mock_fitz_doc(num_pages: int = 1):
     return doc
 
 
-def _png_bytes() -> bytes:
-    """Return a tiny valid PNG image as bytes."""
-    import io
+def _pixmap():
+    """Return a tiny blank RGB pixmap, as rendered by page.get_pixmap()."""
+    import fitz
 
-    import numpy as np
-    from PIL import Image
-
-    arr = np.zeros((2, 2, 3), dtype=np.uint8)
-    buf = io.BytesIO()
-    Image.fromarray(arr).save(buf, format="PNG")
-    return buf.getvalue()
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 2, 2), False)
+    pix.clear_with(255)
+    return pix
 
 
 def _load_ocr_capability_module():
@@ -309,6 +307,73 @@ class TestPerPageOcrEdgeCases:
         assert "page2text" in text
 
 
+    @pytest.mark.asyncio
+    async def test_pages_ocr_concurrently_and_reassemble_in_order(self):
+        """Pages in flight overlap, and output keeps page order even when later pages finish first."""
+        import threading
+        import time
+
+        extractor, _ = _make_extractor_raw(ocr_page_concurrency=3)
+        doc = _mock_fitz_doc(4)
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        calls = 0
+
+        def readtext_side_effect(img):
+            nonlocal in_flight, peak, calls
+            assert img.shape == (2, 2, 3)
+            with lock:
+                calls += 1
+                page = calls
+                in_flight += 1
+                peak = max(peak, in_flight)
+            # Earlier pages take longer, so completion order is reversed
+            time.sleep(0.3 - 0.05 * page)
+            with lock:
+                in_flight -= 1
+            return [([0, 0, 10, 10], f"page{page}", 0.9)]
+
+        mock_ocr = MagicMock()
+        mock_ocr.readtext.side_effect = readtext_side_effect
+        progress = MagicMock()
+
+        with patch.object(extractor, "get_ocr_instance", new=AsyncMock(return_value=mock_ocr)):
+            text, method, confidence = await extractor._process_pdf_with_ocr_direct(doc, "test.pdf", progress)
+
+        assert text.split("\n") == ["page1", "page2", "page3", "page4"]
+        assert peak == 3
+        assert confidence == pytest.approx(0.9)
+        completions = [c.args for c in progress.call_args_list if len(c.args) == 4]
+        assert [args[0] for args in completions] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_rendering_remaining_pages(self):
+        """Once the job is cancelled, no further pages are rendered."""
+        extractor, _ = _make_extractor_raw(ocr_page_concurrency=2)
+        extractor._current_sync_job_id = "job-1"
+        doc = _mock_fitz_doc(5)
+
+        mock_ocr = MagicMock()
+
+        def readtext_side_effect(_img):
+            extractor.cancel_job_ocr("job-1")
+            return [([0, 0, 10, 10], "text", 0.9)]
+
+        mock_ocr.readtext.side_effect = readtext_side_effect
+
+        try:
+            with patch.object(extractor, "get_ocr_instance", new=AsyncMock(return_value=mock_ocr)):
+                await extractor._process_pdf_with_ocr_direct(doc, "test.pdf")
+        finally:
+            extractor.cleanup_job_cancellation("job-1")
+            extractor.cleanup_job_threads("job-1")
+
+        rendered = sum(doc[i].get_pixmap.call_count for i in range(5))
+        assert rendered <= 2
+
+
 # ===========================================================================
 # 3. OcrCapability integration
 # ===========================================================================